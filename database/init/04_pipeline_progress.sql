@@ -0,0 +1,7 @@
+-- Latest pipeline progress event per channel, shared by all web workers.
+-- Live updates are delivered with LISTEN/NOTIFY on the same channel name.
+CREATE TABLE IF NOT EXISTS pipeline_progress (
+    channel VARCHAR(63) PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
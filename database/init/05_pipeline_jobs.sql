@@ -0,0 +1,36 @@
+-- Durable pipeline job queue drained by `python -m src.worker`
+CREATE TABLE IF NOT EXISTS pipeline_jobs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    config JSONB NOT NULL,
+    -- Set while the job is queued or running: at most one active run
+    dedupe_key VARCHAR(100) UNIQUE,
+    total_papers INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    skipped_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_pipeline_jobs_created_at ON pipeline_jobs(created_at);
+
+-- One fetch task per job, then one process task per batch of papers
+CREATE TABLE IF NOT EXISTS pipeline_tasks (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    job_id UUID NOT NULL REFERENCES pipeline_jobs(id) ON DELETE CASCADE,
+    kind VARCHAR(20) NOT NULL,
+    payload JSONB NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    locked_by VARCHAR(100),
+    locked_at TIMESTAMP,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_pipeline_tasks_job_id ON pipeline_tasks(job_id);
+CREATE INDEX IF NOT EXISTS idx_pipeline_tasks_claim ON pipeline_tasks(status, created_at);
@@ -0,0 +1,15 @@
+-- Admin dashboard settings, one row per key
+CREATE TABLE IF NOT EXISTS admin_config (
+    key VARCHAR(100) PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Bumped on every save so web workers know when to reload their snapshot
+CREATE TABLE IF NOT EXISTS admin_config_version (
+    id INTEGER PRIMARY KEY,
+    version BIGINT NOT NULL
+);
+
+INSERT INTO admin_config_version (id, version) VALUES (1, 0)
+ON CONFLICT (id) DO NOTHING;
@@ -0,0 +1,18 @@
+-- GIN indexes for array membership queries on papers.
+-- Queries must use the array operators (@>, &&) to hit these indexes.
+
+CREATE INDEX IF NOT EXISTS idx_papers_categories_gin ON papers USING GIN (categories);
+
+-- Author search is case-insensitive, so index a lower-cased copy of the
+-- array. Expression indexes require an IMMUTABLE function.
+CREATE OR REPLACE FUNCTION lower_text_array(text[])
+RETURNS text[]
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+STRICT
+AS $$
+    SELECT ARRAY(SELECT lower(item) FROM unnest($1) AS item)
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_papers_authors_lower_gin ON papers USING GIN (lower_text_array(authors));
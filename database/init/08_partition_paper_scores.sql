@@ -0,0 +1,143 @@
+-- Partition paper_scores by month of created_at.
+--
+-- Every rescoring run adds a full row per paper, while reads only look at
+-- recent runs. Monthly partitions keep hot indexes small and let old months
+-- be rolled up and detached (see src/infrastructure/partitions.py).
+--
+-- papers is deliberately not partitioned: a partitioned table's unique
+-- constraints must include the partition key, which would drop the global
+-- uniqueness of arxiv_id and break the foreign keys from summaries and
+-- paper_scores to papers(id).
+
+-- 1. Move an existing unpartitioned table out of the way
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' AND c.relname = 'paper_scores' AND c.relkind = 'r'
+    ) THEN
+        DROP VIEW IF EXISTS top_scored_papers;
+        ALTER TABLE paper_scores RENAME TO paper_scores_legacy;
+        ALTER TABLE paper_scores_legacy RENAME CONSTRAINT paper_scores_pkey TO paper_scores_legacy_pkey;
+        ALTER INDEX IF EXISTS idx_paper_scores_paper_id RENAME TO idx_paper_scores_legacy_paper_id;
+        ALTER INDEX IF EXISTS idx_paper_scores_total_score RENAME TO idx_paper_scores_legacy_total_score;
+        ALTER INDEX IF EXISTS idx_paper_scores_created_at RENAME TO idx_paper_scores_legacy_created_at;
+    END IF;
+END $$;
+
+-- 2. Partitioned table; the primary key must include the partition key
+CREATE TABLE IF NOT EXISTS paper_scores (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    paper_id UUID REFERENCES papers(id) ON DELETE CASCADE,
+    total_score FLOAT NOT NULL,
+    llm_score FLOAT,
+    keyword_score FLOAT,
+    citation_score FLOAT,
+    temporal_score FLOAT,
+    author_score FLOAT,
+    explanation TEXT,
+    components JSONB,
+    metadata JSONB,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- Catches rows outside every monthly partition; kept empty in normal operation
+CREATE TABLE IF NOT EXISTS paper_scores_default PARTITION OF paper_scores DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_paper_scores_paper_id ON paper_scores(paper_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_paper_scores_total_score ON paper_scores(total_score DESC);
+CREATE INDEX IF NOT EXISTS idx_paper_scores_created_at ON paper_scores(created_at DESC);
+
+-- 3. Create the partition for one month, moving any rows that already
+--    landed in the default partition. Returns NULL if it already exists.
+CREATE OR REPLACE FUNCTION create_paper_scores_partition(p_month DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    start_date DATE := date_trunc('month', p_month)::date;
+    end_date DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::date;
+    part_name TEXT := 'paper_scores_' || to_char(date_trunc('month', p_month), 'YYYY_MM');
+    has_default_rows BOOLEAN;
+BEGIN
+    IF to_regclass('public.' || part_name) IS NOT NULL
+       OR to_regclass('archive.' || part_name) IS NOT NULL THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT EXISTS (
+        SELECT 1 FROM paper_scores_default
+        WHERE created_at >= start_date AND created_at < end_date
+    ) INTO has_default_rows;
+
+    IF has_default_rows THEN
+        ALTER TABLE paper_scores DETACH PARTITION paper_scores_default;
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE %I PARTITION OF paper_scores FOR VALUES FROM (%L) TO (%L)',
+        part_name, start_date, end_date
+    );
+
+    IF has_default_rows THEN
+        EXECUTE format(
+            'INSERT INTO %I SELECT * FROM paper_scores_default WHERE created_at >= %L AND created_at < %L',
+            part_name, start_date, end_date
+        );
+        DELETE FROM paper_scores_default WHERE created_at >= start_date AND created_at < end_date;
+        ALTER TABLE paper_scores ATTACH PARTITION paper_scores_default DEFAULT;
+    END IF;
+
+    RETURN part_name;
+END $$;
+
+-- 4. Partitions for existing data and the next three months, then copy
+DO $$
+DECLARE
+    first_month DATE := date_trunc('month', CURRENT_DATE)::date;
+    cur_month DATE;
+BEGIN
+    IF to_regclass('public.paper_scores_legacy') IS NOT NULL THEN
+        SELECT LEAST(first_month, COALESCE(date_trunc('month', MIN(created_at))::date, first_month))
+        INTO first_month
+        FROM paper_scores_legacy;
+    END IF;
+
+    cur_month := first_month;
+    WHILE cur_month <= (date_trunc('month', CURRENT_DATE) + INTERVAL '3 months')::date LOOP
+        PERFORM create_paper_scores_partition(cur_month);
+        cur_month := (cur_month + INTERVAL '1 month')::date;
+    END LOOP;
+
+    IF to_regclass('public.paper_scores_legacy') IS NOT NULL THEN
+        INSERT INTO paper_scores (
+            id, paper_id, total_score, llm_score, keyword_score, citation_score,
+            temporal_score, author_score, explanation, components, metadata, created_at
+        )
+        SELECT
+            id, paper_id, total_score, llm_score, keyword_score, citation_score,
+            temporal_score, author_score, explanation, components, metadata,
+            COALESCE(created_at, CURRENT_TIMESTAMP)
+        FROM paper_scores_legacy;
+        DROP TABLE paper_scores_legacy;
+    END IF;
+END $$;
+
+-- 5. Detached cold partitions are moved here and stay queryable
+CREATE SCHEMA IF NOT EXISTS archive;
+
+-- 6. Recreate the view dropped in step 1
+CREATE OR REPLACE VIEW top_scored_papers AS
+SELECT
+    p.*,
+    ps.total_score,
+    ps.explanation as score_explanation,
+    s.summary,
+    s.key_points
+FROM papers p
+JOIN paper_scores ps ON p.id = ps.paper_id
+LEFT JOIN summaries s ON p.id = s.paper_id
+WHERE ps.total_score > 0.6
+ORDER BY ps.total_score DESC, p.published_date DESC;
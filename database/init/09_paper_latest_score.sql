@@ -0,0 +1,53 @@
+-- One row per paper with its latest scoring run.
+-- Upserted in the same transaction as each batch of paper_scores writes
+-- (src/infrastructure/scores.py), so top-N feeds read one index range
+-- instead of sorting every scoring run.
+CREATE TABLE IF NOT EXISTS paper_latest_score (
+    paper_id UUID PRIMARY KEY REFERENCES papers(id) ON DELETE CASCADE,
+    score_id UUID NOT NULL,
+    total_score FLOAT NOT NULL,
+    llm_score FLOAT,
+    keyword_score FLOAT,
+    citation_score FLOAT,
+    temporal_score FLOAT,
+    author_score FLOAT,
+    explanation TEXT,
+    published_date DATE NOT NULL,
+    scored_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_paper_latest_score_top
+    ON paper_latest_score (total_score DESC, published_date DESC);
+
+-- Backfill from the existing scoring history
+INSERT INTO paper_latest_score (
+    paper_id, score_id, total_score, llm_score, keyword_score, citation_score,
+    temporal_score, author_score, explanation, published_date, scored_at
+)
+SELECT DISTINCT ON (ps.paper_id)
+    ps.paper_id, ps.id, ps.total_score, ps.llm_score, ps.keyword_score, ps.citation_score,
+    ps.temporal_score, ps.author_score, ps.explanation, p.published_date, ps.created_at
+FROM paper_scores ps
+JOIN papers p ON p.id = ps.paper_id
+ORDER BY ps.paper_id, ps.created_at DESC, ps.id DESC
+ON CONFLICT (paper_id) DO NOTHING;
+
+-- One row per paper: latest score and latest summary
+CREATE OR REPLACE VIEW top_scored_papers AS
+SELECT
+    p.*,
+    ls.total_score,
+    ls.explanation as score_explanation,
+    s.summary,
+    s.key_points
+FROM paper_latest_score ls
+JOIN papers p ON p.id = ls.paper_id
+LEFT JOIN LATERAL (
+    SELECT summary, key_points
+    FROM summaries
+    WHERE summaries.paper_id = p.id
+    ORDER BY created_at DESC
+    LIMIT 1
+) s ON true
+WHERE ls.total_score > 0.6
+ORDER BY ls.total_score DESC, ls.published_date DESC;
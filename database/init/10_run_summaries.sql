@@ -0,0 +1,19 @@
+-- One row per scoring run (main_v2 or rescoring) with its score distribution,
+-- so historical run statistics are read without rescanning papers.
+-- Written from CurationReport.summary() (src/infrastructure/run_summaries.py).
+CREATE TABLE IF NOT EXISTS run_summaries (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    source VARCHAR(20) NOT NULL,
+    papers INTEGER NOT NULL DEFAULT 0,
+    mean_score FLOAT,
+    score_stddev FLOAT,
+    score_p50 FLOAT,
+    score_p90 FLOAT,
+    components JSONB,
+    categories JSONB,
+    top_papers JSONB,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_run_summaries_finished_at ON run_summaries(finished_at);
@@ -0,0 +1,25 @@
+-- One row per finished pipeline run (src.main or an admin-triggered worker job)
+-- with outcome counts, throughput, time per stage, external calls and
+-- statement cache hit rates, for sizing batch settings and concurrency.
+-- Written by src/infrastructure/pipeline_runs.py.
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    source VARCHAR(20) NOT NULL,
+    -- Worker runs are recorded once per job
+    job_id UUID UNIQUE,
+    status VARCHAR(20) NOT NULL,
+    fetched INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    skipped_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0,
+    papers_per_minute FLOAT,
+    stage_seconds JSONB,
+    external_calls JSONB,
+    cache_hit_rates JSONB,
+    settings JSONB,
+    error TEXT,
+    started_at TIMESTAMP NOT NULL,
+    finished_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_pipeline_runs_finished_at ON pipeline_runs(finished_at);
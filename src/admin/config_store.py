@@ -0,0 +1,168 @@
+"""Cached admin configuration backed by the ``admin_config`` table."""
+
+import copy
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    BigInteger, Column, DateTime, Integer, MetaData, String, Table, Text, func, select, update
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'days_back': 7,
+    'max_results': 10,
+    'categories': ['cs.CL', 'cs.AI', 'cs.LG'],
+    'keywords': ['LLM', 'language model', 'transformer', 'GPT', 'BERT'],
+    'batch_size': 5,
+    'min_relevance_score': 0.4
+}
+
+INT_KEYS = ('days_back', 'max_results', 'batch_size')
+FLOAT_KEYS = ('min_relevance_score',)
+JSON_KEYS = ('categories', 'keywords')
+
+metadata = MetaData()
+
+admin_config = Table(
+    'admin_config', metadata,
+    Column('key', String(100), primary_key=True),
+    Column('value', Text, nullable=False),
+    Column('updated_at', DateTime, server_default=func.current_timestamp())
+)
+
+# Single row bumped on every save; readers compare it to their snapshot
+admin_config_version = Table(
+    'admin_config_version', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('version', BigInteger, nullable=False)
+)
+
+
+def encode_value(value: Any) -> str:
+    """Encode a config value for storage."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
+def decode_value(key: str, value: str) -> Any:
+    """Decode a stored config value."""
+    if key in INT_KEYS:
+        return int(value)
+    if key in FLOAT_KEYS:
+        return float(value)
+    if key in JSON_KEYS:
+        return json.loads(value)
+    return value
+
+
+class AdminConfigStore:
+    """In-process snapshot of the admin configuration.
+
+    The snapshot is tagged with the version row. Reads within ``ttl``
+    seconds are served from memory; after that a single primary-key
+    lookup of the version decides whether the table is read again.
+
+    The store does not create its tables on first use: they are created
+    by ``ensure_schema``, which ``python -m src.maintenance migrate``
+    runs, so migrate once before the admin blueprint serves requests.
+    """
+
+    def __init__(self, engine, ttl: float = 5.0):
+        """Initialize config store.
+
+        Args:
+            engine: SQLAlchemy engine
+            ttl: Seconds a snapshot is trusted without checking the version
+        """
+        self.engine = engine
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+
+    def ensure_schema(self) -> None:
+        """Create the config tables and the version row if missing."""
+        metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            if conn.execute(select(admin_config_version.c.id)).first() is None:
+                conn.execute(admin_config_version.insert().values(id=1, version=0))
+
+    def get(self) -> Dict[str, Any]:
+        """Return the current configuration merged over the defaults."""
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now - self._checked_at < self.ttl:
+                return copy.deepcopy(self._snapshot)
+
+            try:
+                with self.engine.connect() as conn:
+                    version = self._read_version(conn)
+                    if self._snapshot is None or version != self._version:
+                        self._snapshot = self._load(conn)
+                        self._version = version
+                self._checked_at = now
+            except Exception as e:
+                logger.warning(f"Could not load admin config: {e}")
+                if self._snapshot is None:
+                    return copy.deepcopy(DEFAULT_CONFIG)
+
+            return copy.deepcopy(self._snapshot)
+
+    def save(self, config_data: Dict[str, Any]) -> None:
+        """Persist configuration in one upsert and bump the version.
+
+        Args:
+            config_data: Keys and values to store
+        """
+        rows = [{'key': key, 'value': encode_value(value)} for key, value in config_data.items()]
+        if not rows:
+            return
+
+        insert = self._insert()
+        stmt = insert.values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[admin_config.c.key],
+            set_={'value': stmt.excluded.value, 'updated_at': func.current_timestamp()}
+        )
+
+        with self._lock, self.engine.begin() as conn:
+            conn.execute(stmt)
+            conn.execute(
+                update(admin_config_version)
+                .where(admin_config_version.c.id == 1)
+                .values(version=admin_config_version.c.version + 1)
+            )
+            self._snapshot = self._load(conn)
+            self._version = self._read_version(conn)
+            self._checked_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force the next read to check the version row."""
+        with self._lock:
+            self._checked_at = 0.0
+
+    def _insert(self):
+        if self.engine.dialect.name == 'sqlite':
+            return sqlite.insert(admin_config)
+        return postgresql.insert(admin_config)
+
+    @staticmethod
+    def _read_version(conn) -> Optional[int]:
+        return conn.execute(
+            select(admin_config_version.c.version).where(admin_config_version.c.id == 1)
+        ).scalar()
+
+    @staticmethod
+    def _load(conn) -> Dict[str, Any]:
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        for key, value in conn.execute(select(admin_config.c.key, admin_config.c.value)):
+            config[key] = decode_value(key, value)
+        return config
@@ -1,14 +1,18 @@
 import arxiv
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, timedelta
 import logging
 
+from src.utils.metrics import metrics
+
 logger = logging.getLogger(__name__)
 
 class ArxivClient:
-    def __init__(self, categories: List[str], keywords: List[str]):
+    def __init__(self, categories: List[str], keywords: List[str],
+                 client: Optional[arxiv.Client] = None):
         self.categories = categories
         self.keywords = keywords
+        self.client = client or arxiv.Client()
 
     def build_query(self, days_back: int = 7) -> str:
         """Construit une requête ArXiv pour les papiers récents"""
@@ -19,6 +23,10 @@ class ArxivClient:
 
     def fetch_recent_papers(self, max_results: int = 50, days_back: int = 7) -> List[Dict]:
         """Récupère les papiers récents depuis ArXiv"""
+        return list(self.iter_recent_papers(max_results, days_back))
+
+    def iter_recent_papers(self, max_results: int = 50, days_back: int = 7) -> Iterator[Dict]:
+        """Itère sur les papiers récents au fil des pages, sans garder la liste complète"""
         query = self.build_query(days_back)
 
         search = arxiv.Search(
@@ -28,8 +36,10 @@ class ArxivClient:
             sort_order=arxiv.SortOrder.Descending
         )
 
-        papers = []
-        for result in search.results():
+        results = metrics.track_iteration(
+            self.client.results(search), "external_request", service="arxiv", operation="search"
+        )
+        for result in results:
             paper_data = {
                 'arxiv_id': result.entry_id.split('/')[-1],
                 'title': result.title,
@@ -39,7 +49,5 @@ class ArxivClient:
                 'categories': result.categories,
                 'pdf_url': result.pdf_url
             }
-            papers.append(paper_data)
             logger.info(f"Fetched paper: {paper_data['title']}")
-
-        return papers
\ No newline at end of file
+            yield paper_data
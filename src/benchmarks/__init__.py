@@ -0,0 +1,18 @@
+"""Benchmarks and load tools run against synthetic data and local stubs."""
+
+from .corpus import CorpusSpec, generate_corpus
+from .stubs import (
+    StubArxivServer, StubHuggingFaceServer, StubKeycloakServer, StubOllamaServer, StubResponse,
+    StubServer
+)
+
+__all__ = [
+    'CorpusSpec',
+    'generate_corpus',
+    'StubArxivServer',
+    'StubHuggingFaceServer',
+    'StubKeycloakServer',
+    'StubOllamaServer',
+    'StubResponse',
+    'StubServer'
+]
@@ -0,0 +1,345 @@
+"""API latency benchmark for the Flask web app.
+
+Seeds SQLite databases with synthetic papers at each requested size,
+mints RS256 tokens against a local Keycloak JWKS stub, and fires
+concurrent requests through the WSGI app (one test client per thread, as
+gunicorn's threaded workers would). Each endpoint is reported with
+requests/sec, latency percentiles, error count and SQL queries per
+request.
+
+    python -m src.benchmarks.api --sizes 10000 100000 --requests 2000 --concurrency 8 \
+        --output bench/api.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from uuid import uuid4
+
+from flask import Flask
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..core.config import (
+    ArxivConfig, Config, DatabaseConfig, HuggingFaceConfig, KeycloakConfig, OllamaConfig,
+    ProcessingConfig
+)
+from ..infrastructure.engines import get_engine
+from ..infrastructure.models import PaperModel, SummaryModel
+from ..infrastructure.scores import write_scores
+from ..maintenance import migrate
+from ..web.app import create_app
+from .corpus import CorpusSpec, generate_corpus
+from .scoring import current_commit, percentile
+from .stubs import StubKeycloakServer
+
+logger = logging.getLogger(__name__)
+
+# Path to whether the endpoint needs a bearer token; queries are the
+# defaults the frontend sends
+ENDPOINTS = {
+    "/api/papers": True,
+    "/api/stats": True,
+    "/api/public/papers": False,
+    "/health": False
+}
+
+DEFAULT_SIZES = (10000, 100000)
+WARMUP_REQUESTS = 10
+SEED_BATCH = 1000
+
+
+@dataclass
+class EndpointResult:
+    """Throughput, latency and query count of one endpoint under load."""
+    requests: int
+    errors: int
+    seconds: float
+    requests_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    queries_per_request: float
+
+
+class QueryCounter:
+    """Counts SQL statements executed by each thread, on every engine."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def take(self) -> int:
+        """Statements run by this thread since the last call."""
+        count = getattr(self._local, "count", 0)
+        self._local.count = 0
+        return count
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.count = getattr(self._local, "count", 0) + 1
+
+    @contextmanager
+    def listening(self) -> Iterator["QueryCounter"]:
+        """Count statements while the block runs."""
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        try:
+            yield self
+        finally:
+            event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+def seed_database(database_url: str, spec: CorpusSpec, summary_rate: float = 0.8,
+                  score_rate: float = 0.9) -> int:
+    """Create the schema and insert a synthetic corpus.
+
+    Papers go in with bulk inserts, ``SEED_BATCH`` per transaction; scores
+    go through ``write_scores`` so ``paper_latest_score`` is filled as the
+    pipeline fills it.
+
+    Args:
+        database_url: Empty database
+        spec: Corpus to insert
+        summary_rate: Share of papers with a summary
+        score_rate: Share of papers with a score
+
+    Returns:
+        int: Number of papers inserted
+    """
+    engine = get_engine(database_url)
+    migrate(engine)
+    rng = random.Random(spec.seed)
+    corpus = generate_corpus(spec)
+    inserted = 0
+
+    while True:
+        batch = list(islice(corpus, SEED_BATCH))
+        if not batch:
+            return inserted
+        papers, summaries, scores = [], [], []
+        for paper in batch:
+            paper_id = uuid4()
+            papers.append({
+                "id": paper_id, "arxiv_id": paper.arxiv_id, "title": paper.title,
+                "authors": paper.authors, "abstract": paper.abstract,
+                "published_date": paper.published_date.date(), "categories": paper.categories,
+                "pdf_url": paper.pdf_url
+            })
+            if rng.random() < summary_rate:
+                summaries.append({
+                    "id": uuid4(), "paper_id": paper_id, "summary": paper.abstract[:400],
+                    "key_points": paper.abstract.split(". ")[:3], "relevance_score": rng.random(),
+                    "model_used": "facebook/bart-large-cnn"
+                })
+            if rng.random() < score_rate:
+                total = rng.random()
+                scores.append({
+                    "paper_id": paper_id, "total_score": total, "llm_score": total,
+                    "keyword_score": rng.random(), "citation_score": rng.random(),
+                    "temporal_score": rng.random(), "author_score": rng.random(),
+                    "explanation": "Synthetic score", "components": {}, "metadata": {}
+                })
+        with Session(engine) as session, session.begin():
+            session.execute(insert(PaperModel), papers)
+            if summaries:
+                session.execute(insert(SummaryModel), summaries)
+            write_scores(session, scores)
+        inserted += len(batch)
+
+
+def build_app(database_url: str, keycloak: StubKeycloakServer) -> Flask:
+    """The production app factory, pointed at a seeded database and the JWKS stub."""
+    config = Config(
+        database=DatabaseConfig(url=database_url),
+        arxiv=ArxivConfig(categories=[], keywords=[]),
+        huggingface=HuggingFaceConfig(api_key="benchmark"),
+        ollama=OllamaConfig(),
+        processing=ProcessingConfig(),
+        keycloak=KeycloakConfig(
+            url=keycloak.url, realm=keycloak.realm, client_id=keycloak.client_id,
+            client_secret="", frontend_client_id="arxiv-frontend"
+        )
+    )
+    return create_app(config)
+
+
+def fire(app: Flask, path: str, requests: int, concurrency: int, tokens: Sequence[str] = (),
+         counter: Optional[QueryCounter] = None) -> EndpointResult:
+    """Send ``requests`` GETs to one endpoint from ``concurrency`` threads.
+
+    Args:
+        app: WSGI app under test
+        path: Request path and query
+        requests: Total number of requests
+        concurrency: Number of client threads
+        tokens: Bearer tokens used round-robin; none for public endpoints
+        counter: Query counter that is listening, if queries are counted
+
+    Returns:
+        EndpointResult: Throughput, latency percentiles, errors (status >=
+        400) and queries per request
+    """
+    shares = [
+        requests // concurrency + (1 if i < requests % concurrency else 0)
+        for i in range(concurrency)
+    ]
+
+    def client_thread(share: int, offset: int):
+        client = app.test_client()
+        samples = []
+        for i in range(share):
+            headers = {"Accept-Encoding": "gzip"}
+            if tokens:
+                headers["Authorization"] = f"Bearer {tokens[(offset + i) % len(tokens)]}"
+            if counter:
+                counter.take()
+            start = time.perf_counter()
+            response = client.get(path, headers=headers)
+            latency = time.perf_counter() - start
+            samples.append((latency, response.status_code >= 400, counter.take() if counter else 0))
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(client_thread, share, sum(shares[:i]))
+            for i, share in enumerate(shares) if share
+        ]
+        samples = [sample for future in futures for sample in future.result()]
+    seconds = time.perf_counter() - started
+
+    latencies = sorted(sample[0] for sample in samples)
+    count = len(samples)
+    if not count:
+        return EndpointResult(0, 0, round(seconds, 4), 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    return EndpointResult(
+        requests=count,
+        errors=sum(1 for sample in samples if sample[1]),
+        seconds=round(seconds, 4),
+        requests_per_sec=round(count / seconds, 1) if seconds else 0.0,
+        mean_ms=round(sum(latencies) / count * 1000, 3),
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p95_ms=round(percentile(latencies, 95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+        max_ms=round(latencies[-1] * 1000, 3),
+        queries_per_request=round(sum(sample[2] for sample in samples) / count, 2)
+    )
+
+
+def run_benchmark(sizes: Sequence[int] = DEFAULT_SIZES, requests: int = 1000, concurrency: int = 8,
+                  endpoints: Optional[List[str]] = None, users: int = 20, key_bits: int = 2048,
+                  seed: int = CorpusSpec.seed) -> Dict[str, Any]:
+    """Benchmark API endpoints at each database size.
+
+    Args:
+        sizes: Numbers of stored papers to seed, one database each
+        requests: Requests per endpoint and size
+        concurrency: Client threads per endpoint
+        endpoints: Paths from ``ENDPOINTS``; all by default
+        users: Distinct researchers to mint tokens for
+        key_bits: RSA key size of the JWKS stub
+        seed: Corpus seed
+
+    Returns:
+        Dict[str, Any]: JSON-ready report with environment, settings and,
+        per size, seeding time and per-endpoint results
+    """
+    unknown = set(endpoints or ()) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown endpoints: {sorted(unknown)} (expected some of {sorted(ENDPOINTS)})"
+        )
+
+    results = {}
+    counter = QueryCounter()
+    with StubKeycloakServer(key_bits=key_bits) as keycloak, \
+            tempfile.TemporaryDirectory(prefix="api-bench-") as workdir:
+        tokens = [keycloak.mint_token(f"researcher{i}") for i in range(users)]
+        for size in sizes:
+            url = f"sqlite:///{Path(workdir) / f'papers-{size}.db'}"
+            started = time.perf_counter()
+            seed_database(url, CorpusSpec(papers=size, seed=seed))
+            seed_seconds = time.perf_counter() - started
+            logger.info(f"Seeded {size} papers in {seed_seconds:.1f}s")
+
+            app = build_app(url, keycloak)
+            measured = {}
+            for path in endpoints or list(ENDPOINTS):
+                path_tokens = tokens if ENDPOINTS[path] else ()
+                fire(app, path, WARMUP_REQUESTS, 1, path_tokens)
+                with counter.listening():
+                    result = fire(app, path, requests, concurrency, path_tokens, counter)
+                measured[path] = asdict(result)
+                logger.info(
+                    f"{size} papers {path}: {result.requests_per_sec:.0f} req/s, "
+                    f"p50 {result.p50_ms:.1f}ms, p99 {result.p99_ms:.1f}ms, "
+                    f"{result.queries_per_request:g} queries/req, {result.errors} errors"
+                )
+            results[str(size)] = {"seed_seconds": round(seed_seconds, 2), "endpoints": measured}
+            get_engine(url).dispose()
+        jwks_requests = keycloak.requests
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "requests": requests,
+        "concurrency": concurrency,
+        "users": users,
+        "jwks_requests": jwks_requests,
+        "sizes": results
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark API latency at several database sizes")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="Numbers of stored papers to benchmark at")
+    parser.add_argument('--requests', type=int, default=1000, help="Requests per endpoint and size")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent client threads")
+    parser.add_argument('--endpoint', action='append', dest='endpoints', choices=sorted(ENDPOINTS),
+                        help="Endpoint to benchmark (repeatable); all by default")
+    parser.add_argument('--users', type=int, default=20,
+                        help="Distinct researchers to mint tokens for")
+    parser.add_argument('--key-bits', type=int, default=2048, help="RSA key size of the JWKS stub")
+    parser.add_argument('--seed', type=int, default=CorpusSpec.seed, help="Corpus seed")
+    parser.add_argument('--output', type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.setLevel(logging.INFO)
+
+    report = run_benchmark(
+        args.sizes, args.requests, args.concurrency, args.endpoints, users=args.users,
+        key_bits=args.key_bits, seed=args.seed
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote benchmark report to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
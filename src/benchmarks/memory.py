@@ -0,0 +1,231 @@
+"""Peak memory of pipeline and rescoring runs across corpus sizes.
+
+Runs a workload once per corpus size, each in a fresh interpreter, and
+reports the child's peak RSS. Runs stream papers, so peak RSS should stay
+flat as the corpus grows; the run fails when it grows by more than
+``--tolerance-mb`` from the smallest to the largest size.
+
+- ``rescore``: ``PaperRescorer`` over a seeded SQLite database (scored
+  without the LLM scorer, which would dominate large runs)
+- ``main_v2``: ``ArxivCurationPipeline.process_papers_async`` over a
+  stream of synthetic papers, with HuggingFace and Ollama stubs
+
+    python -m src.benchmarks.memory --workload rescore --sizes 1000 10000 100000
+    python -m src.benchmarks.memory --workload main_v2 --sizes 200 2000 --memory-budget-mb 256
+
+Databases are seeded by the parent, so seeding does not count towards
+the child's peak.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from ..infrastructure.engines import get_engine
+from ..maintenance import migrate
+from ..utils.memory import peak_rss_mb, rss_mb
+from .corpus import CorpusSpec, generate_corpus
+from .scoring import current_commit
+
+logger = logging.getLogger(__name__)
+
+WORKLOADS = ("rescore", "main_v2")
+DEFAULT_SIZES = {"rescore": (1000, 10000), "main_v2": (200, 2000)}
+DEFAULT_TOLERANCE_MB = 20.0
+HF_MODEL = "facebook/bart-large-cnn"
+
+
+def paper_stream(spec: CorpusSpec) -> Iterator[Dict[str, Any]]:
+    """Synthetic papers shaped like ``ArxivClient.iter_recent_papers`` output."""
+    for paper in generate_corpus(spec):
+        yield {
+            "arxiv_id": paper.arxiv_id,
+            "title": paper.title,
+            "authors": paper.authors,
+            "abstract": paper.abstract,
+            "published_date": paper.published_date.date(),
+            "categories": paper.categories,
+            "pdf_url": paper.pdf_url
+        }
+
+
+def run_rescore(database_url: str, spec: CorpusSpec, memory_budget_mb: float) -> int:
+    """Rescore every paper of a seeded database; returns papers scored."""
+    from ..config import Config
+    from ..rescore_papers import PaperRescorer
+    from ..scoring import get_default_config
+
+    scoring_config = replace(
+        get_default_config(), use_llm=False, llm_weight=0.0, keyword_weight=0.5
+    )
+    config = Config(database_url=database_url, memory_budget_mb=memory_budget_mb)
+    rescorer = PaperRescorer(config, scoring_config)
+    return asyncio.run(rescorer.rescore_all_papers()).count
+
+
+def run_main_v2(database_url: str, spec: CorpusSpec, memory_budget_mb: float) -> int:
+    """Score, store and summarize a stream of papers; returns papers curated."""
+    from ..config import Config
+    from ..main_v2 import ArxivCurationPipeline
+    from ..scoring import get_default_config
+    from .stubs import StubHuggingFaceServer, StubOllamaServer
+
+    with StubHuggingFaceServer() as huggingface, StubOllamaServer() as ollama:
+        config = Config(
+            database_url=database_url, hf_token="benchmark", hf_model=HF_MODEL,
+            hf_api_url=f"{huggingface.url}/models/{{model}}", paper_delay=0.0,
+            ollama_host=ollama.url, memory_budget_mb=memory_budget_mb
+        )
+        scoring_config = get_default_config()
+        scoring_config.ollama_host = ollama.url
+        pipeline = ArxivCurationPipeline(config, scoring_config)
+        report = asyncio.run(pipeline.process_papers_async(paper_stream(spec)))
+    return report.count
+
+
+RUNNERS = {"rescore": run_rescore, "main_v2": run_main_v2}
+
+
+def seed(workload: str, database_url: str, spec: CorpusSpec) -> None:
+    """Prepare the database a workload starts from."""
+    if workload == "rescore":
+        from .api import seed_database
+        seed_database(database_url, spec)
+    else:
+        migrate(get_engine(database_url))
+    get_engine(database_url).dispose()
+
+
+def measure_child(workload: str, database_url: str, papers: int, seed_value: int,
+                  memory_budget_mb: float) -> Dict[str, Any]:
+    """Run one workload in a fresh interpreter and return its measurements."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "src.benchmarks.memory", "--child", workload,
+         "--database-url", database_url, "--sizes", str(papers), "--seed", str(seed_value),
+         "--memory-budget-mb", str(memory_budget_mb)],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parents[2]
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"{workload} run over {papers} papers failed: {completed.stderr.strip()[-2000:]}"
+        )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(workload: str = "rescore", sizes: Optional[Sequence[int]] = None,
+                  memory_budget_mb: float = 0.0, tolerance_mb: float = DEFAULT_TOLERANCE_MB,
+                  seed_value: int = CorpusSpec.seed) -> Dict[str, Any]:
+    """Measure a workload's peak RSS at each corpus size.
+
+    Args:
+        workload: One of ``WORKLOADS``
+        sizes: Corpus sizes, smallest first; ``DEFAULT_SIZES`` by default
+        memory_budget_mb: Memory budget given to the runs; 0 disables it
+        tolerance_mb: Allowed peak RSS growth from the smallest to the
+            largest size
+        seed_value: Corpus seed
+
+    Returns:
+        Dict[str, Any]: JSON-ready report with, per size, papers processed,
+        seconds, baseline and peak RSS, plus the growth and whether it is
+        within tolerance
+    """
+    if workload not in RUNNERS:
+        raise ValueError(f"Unknown workload: {workload} (expected one of {WORKLOADS})")
+    sizes = sorted(sizes or DEFAULT_SIZES[workload])
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="memory-bench-") as workdir:
+        for size in sizes:
+            url = f"sqlite:///{Path(workdir) / f'{workload}-{size}.db'}"
+            seed(workload, url, CorpusSpec(papers=size, seed=seed_value))
+            results[str(size)] = measure_child(workload, url, size, seed_value, memory_budget_mb)
+            logger.info(
+                f"{workload} over {size} papers: peak RSS {results[str(size)]['peak_rss_mb']} MiB"
+            )
+
+    peaks = [results[str(size)]["peak_rss_mb"] for size in sizes]
+    growth = round(peaks[-1] - peaks[0], 1) if None not in peaks else None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "workload": workload,
+        "memory_budget_mb": memory_budget_mb,
+        "tolerance_mb": tolerance_mb,
+        "sizes": results,
+        "peak_growth_mb": growth,
+        "flat": growth is not None and growth <= tolerance_mb
+    }
+
+
+def child(workload: str, database_url: str, papers: int, seed_value: int,
+          memory_budget_mb: float) -> Dict[str, Any]:
+    """Body of the child process: run the workload and measure it."""
+    baseline = rss_mb()
+    started = time.perf_counter()
+    spec = CorpusSpec(papers=papers, seed=seed_value)
+    processed = RUNNERS[workload](database_url, spec, memory_budget_mb)
+    return {
+        "papers": papers,
+        "processed": processed,
+        "seconds": round(time.perf_counter() - started, 3),
+        "baseline_rss_mb": baseline,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point; exits 1 when peak RSS grows beyond the tolerance."""
+    parser = argparse.ArgumentParser(description="Measure peak memory of runs across corpus sizes")
+    parser.add_argument('--workload', choices=WORKLOADS, default="rescore", help="Run to measure")
+    parser.add_argument('--sizes', type=int, nargs='+', help="Corpus sizes")
+    parser.add_argument('--memory-budget-mb', type=float, default=0.0,
+                        help="Memory budget of the runs")
+    parser.add_argument('--tolerance-mb', type=float, default=DEFAULT_TOLERANCE_MB,
+                        help="Allowed peak RSS growth across sizes")
+    parser.add_argument('--seed', type=int, default=CorpusSpec.seed, help="Corpus seed")
+    parser.add_argument('--output', type=Path, help="Write the JSON report here")
+    parser.add_argument('--child', choices=WORKLOADS, help=argparse.SUPPRESS)
+    parser.add_argument('--database-url', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        logging.basicConfig(level=logging.ERROR)
+        measured = child(
+            args.child, args.database_url, args.sizes[0], args.seed, args.memory_budget_mb
+        )
+        print(json.dumps(measured))
+        return 0
+
+    logging.basicConfig(
+        level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.setLevel(logging.INFO)
+
+    report = run_benchmark(
+        args.workload, args.sizes, args.memory_budget_mb, args.tolerance_mb, args.seed
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote benchmark report to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0 if report["flat"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
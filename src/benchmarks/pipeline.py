@@ -0,0 +1,368 @@
+"""End-to-end pipeline load benchmark.
+
+Runs each pipeline against local stand-ins for arXiv, HuggingFace and
+Ollama, on a fresh SQLite database, and reports papers/min, CPU time, peak
+RSS and a per-stage breakdown taken from the metrics registry:
+
+- ``pipeline_service``: the layered ``PipelineService`` (``python -m src.main``)
+- ``main_v2``: the scoring pipeline ``main_v2.ArxivCurationPipeline``
+- ``admin_worker``: a job queued as the admin trigger does, drained by a
+  ``PipelineWorker``
+
+    python -m src.benchmarks.pipeline --papers 500 --hf-latency 0.2 --output bench/pipeline.json
+
+Each driver imports its own stack inside the function, since the legacy
+and layered stacks reuse class names. The stubs serve from threads of
+this process, so CPU time includes their (small) share. The delay between
+papers defaults to zero here; pass ``--paper-delay 2`` to measure the
+configured production pacing.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from ..infrastructure.engines import get_engine
+from ..maintenance import migrate
+from ..utils.memory import peak_rss_mb
+from ..utils.metrics import metrics
+from .corpus import CorpusSpec
+from .scoring import current_commit
+from .stubs import StubArxivServer, StubHuggingFaceServer, StubOllamaServer
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ["cs.CL", "cs.AI", "cs.LG"]
+KEYWORDS = ["LLM", "language model", "transformer"]
+HF_MODEL = "facebook/bart-large-cnn"
+DAYS_BACK = 7
+
+
+class Stubs:
+    """The arXiv, HuggingFace and Ollama stand-ins for one pipeline run."""
+
+    def __init__(self, spec: CorpusSpec, hf_latency: float = 0.0, hf_warmup: int = 0,
+                 hf_estimated_time: float = 0.0, ollama_latency: float = 0.0,
+                 arxiv_latency: float = 0.0):
+        """Initialize stubs.
+
+        Args:
+            spec: Corpus served by the arXiv stub
+            hf_latency: Seconds the HuggingFace stub waits per request
+            hf_warmup: Leading HuggingFace requests answered with 503
+            hf_estimated_time: Load time reported in those 503 replies
+            ollama_latency: Seconds the Ollama stub waits per request
+            arxiv_latency: Seconds the arXiv stub waits per page
+        """
+        self.arxiv = StubArxivServer(spec, latency=arxiv_latency)
+        self.huggingface = StubHuggingFaceServer(hf_latency, hf_warmup, hf_estimated_time)
+        self.ollama = StubOllamaServer(latency=ollama_latency)
+
+    @property
+    def hf_api_url(self) -> str:
+        """Inference endpoint template for the HuggingFace clients."""
+        return f"{self.huggingface.url}/models/{{model}}"
+
+    def requests(self) -> Dict[str, int]:
+        """Requests served so far, per stub."""
+        return {
+            "arxiv": self.arxiv.requests,
+            "huggingface": self.huggingface.requests,
+            "ollama": self.ollama.requests
+        }
+
+    def __enter__(self) -> "Stubs":
+        for stub in (self.arxiv, self.huggingface, self.ollama):
+            stub.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for stub in (self.arxiv, self.huggingface, self.ollama):
+            stub.stop()
+
+
+def run_pipeline_service(stubs: Stubs, database_url: str, papers: int, paper_delay: float) -> None:
+    """Run ``PipelineService`` as ``python -m src.main`` wires it."""
+    from ..core.config import (
+        ArxivConfig, Config, DatabaseConfig, HuggingFaceConfig, KeycloakConfig, OllamaConfig,
+        ProcessingConfig
+    )
+    from ..main import initialize_components
+
+    config = Config(
+        database=DatabaseConfig(url=database_url),
+        arxiv=ArxivConfig(
+            categories=CATEGORIES, keywords=KEYWORDS, max_results=papers, rate_limit_delay=0
+        ),
+        huggingface=HuggingFaceConfig(
+            api_key="benchmark", model=HF_MODEL, api_url=stubs.hf_api_url
+        ),
+        ollama=OllamaConfig(host=stubs.ollama.url),
+        processing=ProcessingConfig(days_lookback=DAYS_BACK, paper_delay=paper_delay),
+        keycloak=KeycloakConfig(
+            url="", realm="", client_id="", client_secret="", frontend_client_id=""
+        )
+    )
+    _, curation_service, pipeline_service = initialize_components(config)
+    curation_service.arxiv_client.client = stubs.arxiv.client_for()
+    pipeline_service.run_pipeline()
+
+
+def run_main_v2(stubs: Stubs, database_url: str, papers: int, paper_delay: float) -> None:
+    """Fetch, score and summarize with ``main_v2.ArxivCurationPipeline``."""
+    from ..config import Config
+    from ..main_v2 import ArxivCurationPipeline
+    from ..scoring import get_default_config
+
+    config = Config(
+        database_url=database_url, hf_token="benchmark", hf_model=HF_MODEL,
+        hf_api_url=stubs.hf_api_url, arxiv_categories=CATEGORIES, arxiv_keywords=KEYWORDS,
+        arxiv_max_results=papers, paper_delay=paper_delay, ollama_host=stubs.ollama.url
+    )
+    scoring_config = get_default_config()
+    scoring_config.ollama_host = stubs.ollama.url
+    pipeline = ArxivCurationPipeline(config, scoring_config)
+    pipeline.arxiv_client.client = stubs.arxiv.client_for()
+
+    # run() minus the report, which only logs
+    fetched = metrics.track_iteration(
+        pipeline.arxiv_client.iter_recent_papers(max_results=papers, days_back=DAYS_BACK),
+        "pipeline_stage", stage="fetch"
+    )
+    with metrics.track("pipeline_stage", stage="process"):
+        asyncio.run(pipeline.process_papers_async(fetched))
+
+
+def run_admin_worker(stubs: Stubs, database_url: str, papers: int, paper_delay: float) -> None:
+    """Queue a job like the admin trigger and drain it with one worker.
+
+    Workers do not pause between papers, so ``paper_delay`` is unused.
+    """
+    from ..admin.config_store import DEFAULT_CONFIG
+    from ..arxiv_client import ArxivClient
+    from ..database import DatabaseManager
+    from ..hf_client import HuggingFaceClient
+    from ..infrastructure.job_queue import JobQueue
+    from ..infrastructure.progress import ProgressBus, ProgressTracker, create_progress_backend
+    from ..worker import PipelineWorker
+
+    engine = get_engine(database_url)
+    queue = JobQueue(engine)
+    bus = ProgressBus(create_progress_backend(engine))
+    job, _ = queue.enqueue(dict(
+        DEFAULT_CONFIG, categories=CATEGORIES, keywords=KEYWORDS, max_results=papers,
+        days_back=DAYS_BACK
+    ))
+    ProgressTracker(bus, run_id=str(job.id)).start("Pipeline queued, waiting for a worker...")
+
+    worker = PipelineWorker(
+        queue=queue,
+        db_manager=DatabaseManager(database_url),
+        hf_client=HuggingFaceClient(model=HF_MODEL, api_key="benchmark", api_url=stubs.hf_api_url),
+        bus=bus,
+        worker_id="benchmark",
+        arxiv_client_factory=lambda categories, keywords: ArxivClient(
+            categories, keywords, client=stubs.arxiv.client_for()
+        )
+    )
+    worker.run(once=True)
+
+
+PIPELINES: Dict[str, Callable[[Stubs, str, int, float], None]] = {
+    "pipeline_service": run_pipeline_service,
+    "main_v2": run_main_v2,
+    "admin_worker": run_admin_worker
+}
+
+
+def stage_breakdown(summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Regroup a metrics summary by metric and label values.
+
+    Args:
+        summary: Output of ``metrics.summary()``
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Timings (count, total seconds, mean and
+        max milliseconds) and counter values, keyed by metric name without
+        namespace, then by label values joined with ``/``
+    """
+    prefix = f"{metrics.namespace}_" if metrics.namespace else ""
+    breakdown: Dict[str, Dict[str, Any]] = {}
+    for name, entries in summary["metrics"].items():
+        short = name[len(prefix):] if name.startswith(prefix) else name
+        series = {}
+        for entry in entries:
+            key = "/".join(str(value) for value in entry["labels"].values()) or "all"
+            if "count" in entry:
+                series[key] = {
+                    "count": entry["count"],
+                    "seconds": entry["sum"],
+                    "mean_ms": round(entry["mean"] * 1000, 3),
+                    "max_ms": round(entry["max"] * 1000, 3)
+                }
+            else:
+                series[key] = entry["value"]
+        breakdown[short] = series
+    return breakdown
+
+
+def count_rows(database_url: str) -> Dict[str, int]:
+    """Papers and summaries stored by a run."""
+    with get_engine(database_url).connect() as conn:
+        return {
+            "papers_stored": conn.execute(text("SELECT COUNT(*) FROM papers")).scalar(),
+            "summaries_stored": conn.execute(text("SELECT COUNT(*) FROM summaries")).scalar()
+        }
+
+
+def measure_pipeline(name: str, stubs: Stubs, database_url: str, papers: int,
+                     paper_delay: float = 0.0) -> Dict[str, Any]:
+    """Run one pipeline and measure it.
+
+    Args:
+        name: Key of ``PIPELINES``
+        stubs: Running stubs
+        database_url: Migrated, empty database
+        papers: Papers to fetch
+        paper_delay: Seconds between papers, where the pipeline pauses
+
+    Returns:
+        Dict[str, Any]: Throughput, resource usage, stored rows, stub
+        requests and per-stage breakdown
+    """
+    metrics.reset()
+    served_before = stubs.arxiv.entries_served
+    cpu_before = time.process_time()
+    started = time.perf_counter()
+
+    PIPELINES[name](stubs, database_url, papers, paper_delay)
+
+    seconds = time.perf_counter() - started
+    cpu_seconds = time.process_time() - cpu_before
+    fetched = stubs.arxiv.entries_served - served_before
+    result = {
+        "papers": fetched,
+        "seconds": round(seconds, 3),
+        "papers_per_min": round(fetched / seconds * 60, 1) if seconds else 0.0,
+        "cpu_seconds": round(cpu_seconds, 3),
+        "cpu_percent": round(cpu_seconds / seconds * 100, 1) if seconds else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        **count_rows(database_url),
+        "stub_requests": stubs.requests(),
+        "stages": stage_breakdown(metrics.summary())
+    }
+    logger.info(
+        f"{name}: {result['papers_per_min']:.0f} papers/min over {fetched} papers, "
+        f"{result['summaries_stored']} summarized, CPU {result['cpu_percent']:.0f}%"
+    )
+    return result
+
+
+def run_benchmark(spec: CorpusSpec, pipelines: Optional[List[str]] = None,
+                  database_url: Optional[str] = None, paper_delay: float = 0.0,
+                  **stub_options) -> Dict[str, Any]:
+    """Benchmark pipelines end to end against local stubs.
+
+    Every pipeline gets fresh stubs, so each one meets a cold HuggingFace
+    model, and a fresh SQLite database unless ``database_url`` is given.
+
+    Args:
+        spec: Corpus served by the arXiv stub; every paper is fetched
+        pipelines: Names from ``PIPELINES`` to run; all by default
+        database_url: Existing empty database to use instead of SQLite
+            files; only meaningful with a single pipeline
+        paper_delay: Seconds between papers
+        **stub_options: Latency and warm-up settings passed to ``Stubs``
+
+    Returns:
+        Dict[str, Any]: JSON-ready report with environment, settings and
+        per-pipeline results
+    """
+    unknown = set(pipelines or ()) - set(PIPELINES)
+    if unknown:
+        raise ValueError(
+            f"Unknown pipelines: {sorted(unknown)} (expected some of {sorted(PIPELINES)})"
+        )
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pipeline-bench-") as workdir:
+        for name in pipelines or list(PIPELINES):
+            url = database_url or f"sqlite:///{Path(workdir) / f'{name}.db'}"
+            migrate(get_engine(url))
+            with Stubs(spec, **stub_options) as stubs:
+                results[name] = measure_pipeline(name, stubs, url, spec.papers, paper_delay)
+            if not database_url:
+                get_engine(url).dispose()
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": spec.to_dict(),
+        "paper_delay": paper_delay,
+        "stubs": stub_options,
+        "pipelines": results
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the curation pipelines end to end against local stubs"
+    )
+    parser.add_argument('--papers', type=int, default=200, help="Papers served by the arXiv stub")
+    parser.add_argument('--seed', type=int, default=CorpusSpec.seed, help="Corpus seed")
+    parser.add_argument('--pipeline', action='append', dest='pipelines', choices=sorted(PIPELINES),
+                        help="Pipeline to run (repeatable); all by default")
+    parser.add_argument('--database-url',
+                        help="Empty, migrated database to use instead of SQLite files")
+    parser.add_argument('--paper-delay', type=float, default=0.0, help="Seconds between papers")
+    parser.add_argument('--hf-latency', type=float, default=0.0,
+                        help="Seconds the HuggingFace stub waits per request")
+    parser.add_argument('--hf-warmup', type=int, default=1,
+                        help="Leading HuggingFace requests answered with 503")
+    parser.add_argument('--hf-estimated-time', type=float, default=0.0,
+                        help="Model load time reported in 503 replies")
+    parser.add_argument('--ollama-latency', type=float, default=0.0,
+                        help="Seconds the Ollama stub waits per request")
+    parser.add_argument('--arxiv-latency', type=float, default=0.0,
+                        help="Seconds the arXiv stub waits per page")
+    parser.add_argument('--output', type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    logger.setLevel(logging.INFO)
+
+    # Every served paper falls inside the pipelines' lookback window
+    spec = CorpusSpec(papers=args.papers, seed=args.seed, max_age_days=DAYS_BACK - 1)
+    report = run_benchmark(
+        spec, args.pipelines, database_url=args.database_url, paper_delay=args.paper_delay,
+        hf_latency=args.hf_latency, hf_warmup=args.hf_warmup,
+        hf_estimated_time=args.hf_estimated_time, ollama_latency=args.ollama_latency,
+        arxiv_latency=args.arxiv_latency
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote benchmark report to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""Scoring throughput benchmark.
+
+Scores a synthetic corpus with each scorer in ``src/scoring`` and with the
+default composite scorer, reporting papers/sec and latency percentiles.
+The LLM scorer talks to a local Ollama stub, so results measure this
+code rather than a model.
+
+    python -m src.benchmarks.scoring --papers 100000 --output bench/scoring.json
+    python -m src.benchmarks.scoring --papers 100000 --baseline bench/main.json
+
+With ``--baseline``, the run exits non-zero when any scorer's throughput
+drops by more than ``--tolerance`` against the earlier report.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..scoring import (
+    AuthorScorer, CitationScorer, KeywordScorer, LLMScorer, ScoringStrategy, TemporalScorer,
+    create_scorer, get_default_config
+)
+from .corpus import CorpusSpec, corpus_sample, generate_corpus
+from .stubs import StubOllamaServer
+
+logger = logging.getLogger(__name__)
+
+# Scorers that call the Ollama stub are capped at this many papers by default;
+# a loopback HTTP round-trip per paper would otherwise dominate large runs
+DEFAULT_LLM_PAPERS = 2000
+
+WARMUP_PAPERS = 50
+
+
+@dataclass
+class ScorerResult:
+    """Throughput and latency of one scorer over a corpus."""
+    papers: int
+    seconds: float
+    papers_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_latencies(cls, latencies: List[float], seconds: float) -> "ScorerResult":
+        """Summarize per-paper latencies (in seconds) and the total wall time."""
+        ordered = sorted(latencies)
+        count = len(ordered)
+        if not count:
+            return cls(0, seconds, 0.0, 0.0, 0.0, 0.0, 0.0)
+        return cls(
+            papers=count,
+            seconds=round(seconds, 4),
+            papers_per_sec=round(count / seconds, 1) if seconds else 0.0,
+            mean_ms=round(sum(ordered) / count * 1000, 4),
+            p50_ms=round(percentile(ordered, 50) * 1000, 4),
+            p99_ms=round(percentile(ordered, 99) * 1000, 4),
+            max_ms=round(ordered[-1] * 1000, 4)
+        )
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(len(ordered) * pct / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def measure(scorer: ScoringStrategy, papers: Iterable,
+                  context: Optional[Dict[str, Any]] = None) -> ScorerResult:
+    """Score every paper one after another, timing each call.
+
+    Args:
+        scorer: Scorer under test
+        papers: Papers to score
+        context: Scoring context passed to every call
+
+    Returns:
+        ScorerResult: Throughput and latency percentiles
+    """
+    latencies = []
+    clock = time.perf_counter
+    started = clock()
+    for paper in papers:
+        start = clock()
+        await scorer.score(paper, context)
+        latencies.append(clock() - start)
+    return ScorerResult.from_latencies(latencies, clock() - started)
+
+
+def build_scorers(ollama_host: str) -> Dict[str, Callable[[], ScoringStrategy]]:
+    """Factories for every benchmarked scorer, configured like production.
+
+    Args:
+        ollama_host: Base URL of the Ollama stub
+
+    Returns:
+        Dict[str, Callable[[], ScoringStrategy]]: Scorer name to factory
+    """
+    config = get_default_config()
+    config.ollama_host = ollama_host
+    return {
+        "keyword_scorer": lambda: KeywordScorer(
+            keywords=config.keywords, boost_terms=config.boost_terms
+        ),
+        "citation_scorer": lambda: CitationScorer(min_citations=config.min_citations),
+        "temporal_scorer": lambda: TemporalScorer(
+            trend_keywords=config.trend_keywords, peak_freshness_days=config.peak_freshness_days
+        ),
+        "author_scorer": lambda: AuthorScorer(
+            known_authors=config.known_authors, institution_scores=config.institution_scores
+        ),
+        "llm_scorer": lambda: LLMScorer(ollama_host=ollama_host, model="benchmark-stub"),
+        "default_composite": lambda: create_scorer(config)
+    }
+
+
+# Scorers whose calls go through the Ollama stub
+LLM_BACKED = {"llm_scorer", "default_composite"}
+
+
+def run_benchmark(spec: CorpusSpec, scorers: Optional[List[str]] = None,
+                  llm_papers: int = DEFAULT_LLM_PAPERS, llm_latency: float = 0.0) -> Dict[str, Any]:
+    """Benchmark scorers on a synthetic corpus.
+
+    Every scorer sees the same papers: the corpus is regenerated from its
+    seed for each one instead of being held in memory.
+
+    Args:
+        spec: Corpus to generate
+        scorers: Names from ``build_scorers`` to run; all by default
+        llm_papers: Paper cap for scorers that call the Ollama stub
+        llm_latency: Seconds the stub waits per request
+
+    Returns:
+        Dict[str, Any]: JSON-ready report with environment, corpus and
+        per-scorer results
+    """
+    config = get_default_config()
+    context = {"research_interests": config.keywords, "keywords": config.keywords}
+    warmup = corpus_sample(CorpusSpec(papers=WARMUP_PAPERS, seed=spec.seed + 1), WARMUP_PAPERS)
+    results = {}
+
+    with StubOllamaServer(latency=llm_latency) as stub:
+        factories = build_scorers(stub.url)
+        unknown = set(scorers or ()) - set(factories)
+        if unknown:
+            raise ValueError(
+                f"Unknown scorers: {sorted(unknown)} (expected some of {sorted(factories)})"
+            )
+
+        for name in scorers or list(factories):
+            scorer = factories[name]()
+            papers = spec.papers
+            if name in LLM_BACKED:
+                papers = min(papers, llm_papers)
+            corpus = generate_corpus(replace(spec, papers=papers))
+
+            asyncio.run(measure(scorer, warmup[:5] if name in LLM_BACKED else warmup, context))
+            result = asyncio.run(measure(scorer, corpus, context))
+            results[name] = asdict(result)
+            logger.info(
+                f"{name}: {result.papers_per_sec:.0f} papers/s, "
+                f"p50 {result.p50_ms:.3f}ms, p99 {result.p99_ms:.3f}ms over {result.papers} papers"
+            )
+        stub_requests = stub.requests
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": spec.to_dict(),
+        "llm_papers": llm_papers,
+        "llm_latency": llm_latency,
+        "stub_requests": stub_requests,
+        "scorers": results
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """List scorers whose throughput regressed against a baseline report.
+
+    Args:
+        baseline: Earlier report from ``run_benchmark``
+        current: New report
+        tolerance: Allowed relative drop in papers/sec
+
+    Returns:
+        List[str]: One line per regression; empty if none
+    """
+    regressions = []
+    for name, result in current["scorers"].items():
+        before = baseline.get("scorers", {}).get(name)
+        if not before or not before["papers_per_sec"]:
+            continue
+        change = result["papers_per_sec"] / before["papers_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append(
+                f"{name}: {before['papers_per_sec']:.0f} -> {result['papers_per_sec']:.0f} "
+                f"papers/s ({change:+.0%})"
+            )
+    return regressions
+
+
+def current_commit() -> Optional[str]:
+    """Short hash of the checked-out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark entry point."""
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(
+        description="Benchmark scoring throughput on a synthetic corpus"
+    )
+    parser.add_argument('--papers', type=int, default=defaults.papers, help="Corpus size")
+    parser.add_argument('--seed', type=int, default=defaults.seed, help="Corpus seed")
+    parser.add_argument('--abstract-words', type=int, nargs=2, default=defaults.abstract_words,
+                        metavar=('MIN', 'MAX'), help="Abstract length range in words")
+    parser.add_argument('--authors', type=int, nargs=2, default=defaults.authors,
+                        metavar=('MIN', 'MAX'), help="Author count range")
+    parser.add_argument('--keyword-density', type=float, default=defaults.keyword_density,
+                        help="Share of abstract words that are ML keywords")
+    parser.add_argument('--scorer', action='append', dest='scorers',
+                        help="Scorer to run (repeatable); all by default")
+    parser.add_argument('--llm-papers', type=int, default=DEFAULT_LLM_PAPERS,
+                        help="Paper cap for scorers calling the Ollama stub")
+    parser.add_argument('--llm-latency', type=float, default=0.0,
+                        help="Seconds the Ollama stub waits per request")
+    parser.add_argument('--output', type=Path, help="Write the JSON report here")
+    parser.add_argument('--baseline', type=Path, help="Earlier JSON report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="Allowed relative throughput drop against the baseline")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    spec = CorpusSpec(
+        papers=args.papers, seed=args.seed, abstract_words=tuple(args.abstract_words),
+        authors=tuple(args.authors), keyword_density=args.keyword_density
+    )
+    report = run_benchmark(
+        spec, args.scorers, llm_papers=args.llm_papers, llm_latency=args.llm_latency
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote benchmark report to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        regressions = compare(json.loads(args.baseline.read_text()), report, args.tolerance)
+        for line in regressions:
+            logger.error(f"Throughput regression: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Import-time report for the command-line entry points and web workers.
+
+Imports each entry point in a fresh interpreter under ``-X importtime``
+and reports the total import time, the heaviest top-level packages (by
+self time) and any module on the entry point's deny list. Each import is
+repeated and the fastest run kept, since the first run also pays for
+cold bytecode caches.
+
+    python -m src.benchmarks.startup --output bench/startup.json
+    python -m src.benchmarks.startup src.web_app --budget-ms 800
+
+The run exits non-zero when an entry point exceeds its budget or imports
+a denied module, so it doubles as a startup regression check.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .scoring import current_commit
+
+logger = logging.getLogger(__name__)
+
+# Modules an entry point must not import at startup: the LLM scorer's HTTP
+# stack, unused ML libraries, and for database-only processes the arXiv feed parser
+HEAVY_MODULES = ("aiohttp", "transformers", "huggingface_hub", "torch")
+ENTRYPOINTS = {
+    "src.main": HEAVY_MODULES,
+    "src.main_v2": HEAVY_MODULES,
+    "src.rescore_papers": HEAVY_MODULES + ("arxiv", "feedparser"),
+    "src.worker": HEAVY_MODULES,
+    "src.web_app": HEAVY_MODULES + ("arxiv", "feedparser"),
+    "src.maintenance": HEAVY_MODULES + ("arxiv", "feedparser", "requests")
+}
+
+DEFAULT_BUDGET_MS = 1500.0
+DEFAULT_REPEAT = 3
+TOP_PACKAGES = 10
+
+
+@dataclass
+class StartupResult:
+    """Import cost of one entry point."""
+    module: str
+    total_ms: float
+    modules: int
+    budget_ms: float
+    top_packages: Dict[str, float] = field(default_factory=dict)
+    denied: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Within budget and free of denied modules."""
+        return self.total_ms <= self.budget_ms and not self.denied
+
+
+def import_times(module: str, python: str = sys.executable) -> Dict[str, int]:
+    """Self import time of every module loaded by ``import module``.
+
+    Args:
+        module: Dotted module name
+        python: Interpreter to run
+
+    Returns:
+        Dict[str, int]: Microseconds of self time per imported module, plus
+        the cumulative time of ``module`` itself under the key ``module``
+    """
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parents[2]
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Importing {module} failed: {completed.stderr.strip().splitlines()[-1:]}"
+        )
+
+    times: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue
+        name = name.strip()
+        times[name] = int(cumulative) if name == module else int(own)
+    return times
+
+
+def measure(module: str, denied: Sequence[str] = (), budget_ms: float = DEFAULT_BUDGET_MS,
+            repeat: int = DEFAULT_REPEAT) -> StartupResult:
+    """Measure one entry point, keeping the fastest of ``repeat`` imports.
+
+    Args:
+        module: Dotted module name
+        denied: Top-level packages the import must not load
+        budget_ms: Allowed total import time
+        repeat: Number of fresh-interpreter imports
+
+    Returns:
+        StartupResult: Total time, heaviest packages and denied imports
+    """
+    best = min(
+        (import_times(module) for _ in range(max(1, repeat))), key=lambda times: times[module]
+    )
+    packages: Counter = Counter()
+    for name, micros in best.items():
+        if name != module:
+            packages[name.split(".")[0]] += micros
+    loaded = {name.split(".")[0] for name in best}
+    return StartupResult(
+        module=module,
+        total_ms=round(best[module] / 1000, 1),
+        modules=len(best),
+        budget_ms=budget_ms,
+        top_packages={
+            name: round(micros / 1000, 1)
+            for name, micros in packages.most_common(TOP_PACKAGES)
+        },
+        denied=sorted(name for name in denied if name in loaded)
+    )
+
+
+def run_report(modules: Optional[Sequence[str]] = None, budget_ms: float = DEFAULT_BUDGET_MS,
+               repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Measure entry points.
+
+    Args:
+        modules: Entry points; every one in ``ENTRYPOINTS`` by default
+        budget_ms: Allowed total import time per entry point
+        repeat: Fresh-interpreter imports per entry point
+
+    Returns:
+        Dict[str, Any]: JSON-ready report with environment and, per entry
+        point, its ``StartupResult`` and whether it passed
+    """
+    results = {}
+    for module in modules or list(ENTRYPOINTS):
+        result = measure(module, ENTRYPOINTS.get(module, HEAVY_MODULES), budget_ms, repeat)
+        results[module] = {**asdict(result), "ok": result.ok}
+        denied = f", denied: {', '.join(result.denied)}" if result.denied else ""
+        logger.info(
+            f"{module}: {result.total_ms:.0f}ms over {result.modules} modules "
+            f"(budget {budget_ms:.0f}ms){denied}"
+        )
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "entrypoints": results
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Report entry point; exits 1 when an entry point is over budget or imports a denied module."""
+    parser = argparse.ArgumentParser(description="Report import time of the entry points")
+    parser.add_argument('modules', nargs='*', help="Entry points to measure; all by default")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Allowed import time per entry point")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="Imports per entry point")
+    parser.add_argument('--output', type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    report = run_report(args.modules, args.budget_ms, args.repeat)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2))
+        logger.info(f"Wrote startup report to {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0 if all(result["ok"] for result in report["entrypoints"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""Local stand-ins for external services used by benchmarks.
+
+Each stub is a real HTTP server on 127.0.0.1, so clients exercise their
+actual request, timeout and parsing code; only the remote work is
+replaced by a fixed, optionally delayed response.
+"""
+
+import base64
+import json
+import math
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape, quoteattr
+
+import arxiv
+import rsa
+from jose import jwt
+
+from .corpus import CorpusSpec, generate_corpus
+
+
+@dataclass
+class StubResponse:
+    """Status, body and headers of one stub reply."""
+    status: int
+    body: bytes
+    content_type: str = "application/json"
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, status: int, payload: Any,
+             headers: Optional[Dict[str, str]] = None) -> "StubResponse":
+        """Reply with a JSON-encoded payload."""
+        return cls(status, json.dumps(payload).encode(), headers=headers or {})
+
+
+class StubServer:
+    """Threaded HTTP server answering requests from ``handle``.
+
+    Use as a context manager; ``url`` is valid while it is open.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """Initialize stub.
+
+        Args:
+            latency: Seconds to wait before answering each request
+        """
+        self.latency = latency
+        self.requests = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("Stub server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, method: str, path: str, body: bytes) -> StubResponse:
+        """Return the reply to one request."""
+        raise NotImplementedError
+
+    def start(self) -> "StubServer":
+        """Start serving on an ephemeral port."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                with stub._lock:
+                    stub.requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                reply = stub.handle(self.command, self.path, body)
+                self.send_response(reply.status)
+                self.send_header("Content-Type", reply.content_type)
+                self.send_header("Content-Length", str(len(reply.body)))
+                for name, value in reply.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(reply.body)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class StubOllamaServer(StubServer):
+    """Answers ``/api/generate`` like Ollama, with scores derived from the prompt.
+
+    JSON-format requests (the LLM scorer) get the structured scores it
+    parses; plain requests (the Ollama client) get a bare number.
+    """
+
+    def handle(self, method: str, path: str, body: bytes) -> StubResponse:
+        if method != "POST" or not path.startswith("/api/generate"):
+            return StubResponse.json(404, {"error": "not found"})
+        request = json.loads(body or b"{}")
+        # Stable per prompt, so repeated runs score identically
+        score = (zlib.crc32(request.get("prompt", "").encode()) % 1000) / 1000
+        if request.get("format") == "json":
+            response = json.dumps({
+                "relevance_score": score,
+                "novelty_score": score,
+                "technical_quality": 0.5,
+                "potential_impact": 0.5,
+                "explanation": "Stub score"
+            })
+        else:
+            response = f"{score:.3f}"
+        return StubResponse.json(
+            200, {"model": request.get("model"), "response": response, "done": True}
+        )
+
+
+class StubHuggingFaceServer(StubServer):
+    """Answers ``/models/<model>`` like the HuggingFace inference API.
+
+    The first ``warmup_requests`` requests get the 503 "model is loading"
+    reply, with ``estimated_time`` and ``Retry-After``, that a cold model
+    returns; later ones get a summary built from the input text.
+    """
+
+    def __init__(self, latency: float = 0.0, warmup_requests: int = 0, estimated_time: float = 0.0):
+        """Initialize stub.
+
+        Args:
+            latency: Seconds to wait before answering each request
+            warmup_requests: Number of leading requests answered with 503
+            estimated_time: Load time reported in 503 replies, in seconds
+        """
+        super().__init__(latency)
+        self.warmup_requests = warmup_requests
+        self.estimated_time = estimated_time
+        self.warmup_replies = 0
+
+    def handle(self, method: str, path: str, body: bytes) -> StubResponse:
+        if method != "POST" or not path.startswith("/models/"):
+            return StubResponse.json(404, {"error": "not found"})
+        with self._lock:
+            warming = self.warmup_replies < self.warmup_requests
+            if warming:
+                self.warmup_replies += 1
+        if warming:
+            model = path[len("/models/"):]
+            return StubResponse.json(
+                503,
+                {
+                    "error": f"Model {model} is currently loading",
+                    "estimated_time": self.estimated_time
+                },
+                # Retry-After only takes whole seconds
+                headers={"Retry-After": str(math.ceil(self.estimated_time))}
+            )
+
+        text = json.loads(body or b"{}").get("inputs", "")
+        # Lead of the abstract, long enough to yield key points
+        words = text.replace("\n", " ").split()
+        summary = " ".join(words[:60])
+        return StubResponse.json(
+            200, [{"summary_text": f"{summary}. The approach improves on prior work."}]
+        )
+
+
+ATOM_NAMESPACES = (
+    'xmlns="http://www.w3.org/2005/Atom" '
+    'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+    'xmlns:arxiv="http://arxiv.org/schemas/atom"'
+)
+
+
+class StubArxivServer(StubServer):
+    """Serves a synthetic corpus from ``/api/query`` as arXiv Atom feeds.
+
+    Pages follow ``start`` and ``max_results`` and ``id_list`` selects
+    papers by ID; ``search_query`` is ignored, so every search matches the
+    whole corpus, newest first. Point an ``arxiv.Client`` at it with
+    ``client_for``.
+    """
+
+    def __init__(self, spec: CorpusSpec, latency: float = 0.0):
+        """Initialize stub.
+
+        Args:
+            spec: Corpus to serve; held in memory, so keep it to what a
+                pipeline run can process
+            latency: Seconds to wait before answering each request
+        """
+        super().__init__(latency)
+        self.spec = spec
+        self.papers = sorted(
+            generate_corpus(spec), key=lambda paper: paper.published_date, reverse=True
+        )
+        self._by_id = {paper.arxiv_id: paper for paper in self.papers}
+        self.entries_served = 0
+
+    def client_for(self, page_size: int = 100) -> arxiv.Client:
+        """An ``arxiv.Client`` that queries this stub without rate-limit delays."""
+        client = arxiv.Client(page_size=page_size, delay_seconds=0, num_retries=0)
+        client.query_url_format = f"{self.url}/api/query?{{}}"
+        return client
+
+    def handle(self, method: str, path: str, body: bytes) -> StubResponse:
+        url = urlsplit(path)
+        if method != "GET" or url.path != "/api/query":
+            return StubResponse.json(404, {"error": "not found"})
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+
+        if params.get("id_list"):
+            matches = [self._by_id[i] for i in params["id_list"].split(",") if i in self._by_id]
+        else:
+            matches = self.papers
+        start = int(params.get("start", 0))
+        max_results = int(params.get("max_results", 10))
+        page = matches[start:start + max_results]
+        with self._lock:
+            self.entries_served += len(page)
+        body = self.feed(page, len(matches), start).encode()
+        return StubResponse(200, body, "application/atom+xml; charset=utf-8")
+
+    @staticmethod
+    def feed(papers: List[Any], total: int, start: int) -> str:
+        """Render papers as an arXiv API Atom feed."""
+        entries = []
+        for paper in papers:
+            published = paper.published_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            authors = "".join(
+                f"<author><name>{escape(name)}</name></author>" for name in paper.authors
+            )
+            categories = "".join(
+                f'<category term={quoteattr(category)} scheme="http://arxiv.org/schemas/atom"/>'
+                for category in paper.categories
+            )
+            entries.append(
+                f"<entry><id>http://arxiv.org/abs/{paper.arxiv_id}v1</id>"
+                f"<updated>{published}</updated><published>{published}</published>"
+                f"<title>{escape(paper.title)}</title><summary>{escape(paper.abstract)}</summary>"
+                f"{authors}"
+                f'<link href="http://arxiv.org/abs/{paper.arxiv_id}v1" rel="alternate" '
+                f'type="text/html"/>'
+                f'<link title="pdf" href="http://arxiv.org/pdf/{paper.arxiv_id}v1" rel="related" '
+                f'type="application/pdf"/>'
+                f'<arxiv:primary_category term={quoteattr(paper.categories[0])} '
+                f'scheme="http://arxiv.org/schemas/atom"/>'
+                f"{categories}</entry>"
+            )
+        return (
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<feed {ATOM_NAMESPACES}>'
+            f"<title>ArXiv Query</title><id>http://arxiv.org/api/stub</id>"
+            f"<opensearch:totalResults>{total}</opensearch:totalResults>"
+            f"<opensearch:startIndex>{start}</opensearch:startIndex>"
+            f"<opensearch:itemsPerPage>{len(papers)}</opensearch:itemsPerPage>"
+            f"{''.join(entries)}</feed>"
+        )
+
+
+class StubKeycloakServer(StubServer):
+    """Publishes a realm's JWKS and mints RS256 tokens it will accept.
+
+    Serves ``/realms/<realm>/protocol/openid-connect/certs`` with a key pair
+    generated at construction, so ``JWTService`` validates minted tokens
+    with its real signature, audience and issuer checks.
+    """
+
+    KEY_ID = "benchmark-key"
+
+    def __init__(self, realm: str = "arxiv-curator", client_id: str = "arxiv-backend",
+                 key_bits: int = 2048, latency: float = 0.0):
+        """Initialize stub.
+
+        Args:
+            realm: Keycloak realm name
+            client_id: Audience of minted tokens
+            key_bits: RSA key size; generating 2048-bit keys takes seconds
+            latency: Seconds to wait before answering each request
+        """
+        super().__init__(latency)
+        self.realm = realm
+        self.client_id = client_id
+        public_key, private_key = rsa.newkeys(key_bits)
+        self._private_pem = private_key.save_pkcs1().decode()
+        self.jwks = {"keys": [{
+            "kid": self.KEY_ID, "kty": "RSA", "alg": "RS256", "use": "sig",
+            "n": _b64_uint(public_key.n), "e": _b64_uint(public_key.e)
+        }]}
+
+    @property
+    def issuer(self) -> str:
+        """Issuer claim expected by ``JWTService``."""
+        return f"{self.url}/realms/{self.realm}"
+
+    def mint_token(self, username: str = "researcher", roles: Sequence[str] = ("user",),
+                   lifetime: int = 3600) -> str:
+        """Sign an access token for a user.
+
+        Args:
+            username: ``preferred_username`` and ``sub`` of the token
+            roles: Realm roles
+            lifetime: Seconds until the token expires
+
+        Returns:
+            str: Encoded JWT
+        """
+        now = int(time.time())
+        claims = {
+            "sub": username, "preferred_username": username, "email": f"{username}@example.org",
+            "realm_access": {"roles": list(roles)},
+            "aud": self.client_id, "iss": self.issuer, "iat": now, "exp": now + lifetime
+        }
+        return jwt.encode(
+            claims, self._private_pem, algorithm="RS256", headers={"kid": self.KEY_ID}
+        )
+
+    def handle(self, method: str, path: str, body: bytes) -> StubResponse:
+        if method == "GET" and path == f"/realms/{self.realm}/protocol/openid-connect/certs":
+            return StubResponse.json(200, self.jwks)
+        return StubResponse.json(404, {"error": "not found"})
+
+
+def _b64_uint(value: int) -> str:
+    """Base64url-encode an unsigned integer as JWK members expect."""
+    data = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
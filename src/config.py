@@ -9,6 +9,8 @@ class Config:
     # HuggingFace settings
     hf_token: str = os.getenv('HF_TOKEN', '')
     hf_model: str = os.getenv('HF_MODEL', 'deepseek-ai/DeepSeek-R1')
+    # Endpoint template with {model}; hosted API if empty
+    hf_api_url: str = os.getenv('HF_API_URL', '')
     
     # ArXiv settings
     arxiv_categories: List[str] = field(default_factory=lambda: ['cs.CL', 'cs.AI', 'cs.LG'])
@@ -17,6 +19,9 @@ class Config:
     
     # Processing settings
     batch_size: int = 5
+    paper_delay: float = float(os.getenv('PAPER_DELAY', '2'))  # seconds between papers
+    # Resident memory limit; 0 disables it
+    memory_budget_mb: float = float(os.getenv('MEMORY_BUDGET_MB', '0'))
     log_level: str = 'INFO'
     
     # Scoring settings
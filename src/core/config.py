@@ -15,6 +15,12 @@ class DatabaseConfig:
     pool_size: int = 5
     max_overflow: int = 10
     echo: bool = False
+    replica_urls: List[str] = field(default_factory=list)
+    replica_pool_size: int = 10
+    replica_max_overflow: int = 20
+    replica_retry_seconds: float = 30.0
+    replica_check_seconds: float = 10.0
+    replica_max_lag_seconds: float = 30.0
 
 
 @dataclass
@@ -34,6 +40,7 @@ class HuggingFaceConfig:
     max_length: int = 1024
     min_length: int = 56
     timeout: int = 30
+    api_url: Optional[str] = None  # endpoint template with {model}; hosted inference API by default
 
 
 @dataclass
@@ -52,6 +59,8 @@ class ProcessingConfig:
     days_lookback: int = 7
     retry_attempts: int = 3
     retry_delay: float = 5.0
+    paper_delay: float = 2.0  # seconds between papers
+    memory_budget_mb: float = 0.0  # resident memory limit for a run; 0 disables it
 
 
 @dataclass
@@ -103,7 +112,13 @@ class Config:
             url=database_url,
             pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
             max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
-            echo=os.getenv("DB_ECHO", "false").lower() == "true"
+            echo=os.getenv("DB_ECHO", "false").lower() == "true",
+            replica_urls=[url for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url],
+            replica_pool_size=int(os.getenv("DB_REPLICA_POOL_SIZE", "10")),
+            replica_max_overflow=int(os.getenv("DB_REPLICA_MAX_OVERFLOW", "20")),
+            replica_retry_seconds=float(os.getenv("DB_REPLICA_RETRY_SECONDS", "30")),
+            replica_check_seconds=float(os.getenv("DB_REPLICA_CHECK_SECONDS", "10")),
+            replica_max_lag_seconds=float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "30"))
         )
 
         arxiv = ArxivConfig(
@@ -118,7 +133,8 @@ class Config:
             model=os.getenv("HF_MODEL", "facebook/bart-large-cnn"),
             max_length=int(os.getenv("HF_MAX_LENGTH", "1024")),
             min_length=int(os.getenv("HF_MIN_LENGTH", "56")),
-            timeout=int(os.getenv("HF_TIMEOUT", "30"))
+            timeout=int(os.getenv("HF_TIMEOUT", "30")),
+            api_url=os.getenv("HF_API_URL") or None
         )
 
         ollama = OllamaConfig(
@@ -132,7 +148,9 @@ class Config:
             min_relevance_score=float(os.getenv("MIN_RELEVANCE_SCORE", "0.4")),
             days_lookback=int(os.getenv("DAYS_LOOKBACK", "7")),
             retry_attempts=int(os.getenv("RETRY_ATTEMPTS", "3")),
-            retry_delay=float(os.getenv("RETRY_DELAY", "5.0"))
+            retry_delay=float(os.getenv("RETRY_DELAY", "5.0")),
+            paper_delay=float(os.getenv("PAPER_DELAY", "2.0")),
+            memory_budget_mb=float(os.getenv("MEMORY_BUDGET_MB", "0"))
         )
 
         # Keycloak configuration
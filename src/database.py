@@ -1,31 +1,47 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Row, bindparam, select
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import IntegrityError
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 import logging
 
-from src.models import Base, Paper, Summary
+from src.models import Paper, Summary
+from src.types import array_contains_ci
+from src.domain.value_objects import PaperFilter
+from src.infrastructure.queries import (
+    PAPER_ID_BY_ARXIV_ID, categories_match, record_cache_lookup, select_papers, select_paper_count
+)
+from src.infrastructure.engines import get_engine
+from src.infrastructure.scores import write_scores
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
+# Hot lookups built once; executed with bound parameters
+PAPER_BY_ARXIV_ID = select(Paper).where(Paper.arxiv_id == bindparam("arxiv_id"))
+SUMMARY_EXISTS = select(Summary.id).where(Summary.paper_id == bindparam("paper_id")).limit(1)
+
 class DatabaseManager:
     def __init__(self, database_url: str):
-        self.engine = create_engine(database_url)
-        Base.metadata.create_all(self.engine)
+        # Shared per-URL engine; tables come from the migration step
+        self.engine = get_engine(database_url)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def get_session(self) -> Session:
         return self.SessionLocal()
 
+    @metrics.timed("db_operation", operation="save_paper")
     def save_paper(self, paper_data: Dict) -> Optional[Paper]:
         """Sauvegarde un papier dans la base de données"""
         session = self.get_session()
         try:
-            paper = Paper(**paper_data)
-            session.add(paper)
-            session.commit()
-            session.refresh(paper)
-            return paper
+            # A duplicate shows up as a failed span
+            with tracer.span("db.save_paper", arxiv_id=paper_data.get('arxiv_id', 'unknown')):
+                paper = Paper(**paper_data)
+                session.add(paper)
+                session.commit()
+                session.refresh(paper)
+                return paper
         except IntegrityError:
             session.rollback()
             # Le papier existe déjà
@@ -37,6 +53,7 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @metrics.timed("db_operation", operation="save_summary")
     def save_summary(self, paper_id: str, summary_data: Dict) -> Optional[Summary]:
         """Sauvegarde un résumé pour un papier"""
         session = self.get_session()
@@ -52,20 +69,59 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @metrics.timed("db_operation", operation="save_paper_scores")
+    def save_paper_scores(self, scores: List[Dict]) -> int:
+        """Save a batch of scoring runs and update each paper's latest score in one transaction"""
+        session = self.get_session()
+        try:
+            saved = write_scores(session, scores)
+            session.commit()
+            return saved
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error saving scores: {e}")
+            raise
+        finally:
+            session.close()
+
+    @metrics.timed("db_operation", operation="paper_exists")
     def paper_exists(self, arxiv_id: str) -> bool:
         """Vérifie si un papier existe déjà"""
         session = self.get_session()
         try:
-            exists = session.query(Paper).filter_by(arxiv_id=arxiv_id).first() is not None
-            return exists
+            with tracer.span("db.paper_exists", arxiv_id=arxiv_id) as span:
+                result = session.execute(PAPER_ID_BY_ARXIV_ID, {"arxiv_id": arxiv_id})
+                exists = result.first() is not None
+                cache_hit = record_cache_lookup(result, "paper_exists")
+                span.set_attributes(exists=exists, cache_hit=cache_hit)
+                return exists
         finally:
             session.close()
     
+    @metrics.timed("db_operation", operation="has_summary")
+    def has_summary(self, paper_id) -> bool:
+        """Check whether a paper already has a summary"""
+        session = self.get_session()
+        try:
+            with tracer.span("db.has_summary") as span:
+                result = session.execute(SUMMARY_EXISTS, {"paper_id": paper_id})
+                exists = result.first() is not None
+                cache_hit = record_cache_lookup(result, "has_summary")
+                span.set_attributes(exists=exists, cache_hit=cache_hit)
+                return exists
+        finally:
+            session.close()
+
+    @metrics.timed("db_operation", operation="get_paper_by_arxiv_id")
     def get_paper_by_arxiv_id(self, arxiv_id: str) -> Optional[Paper]:
         """Retrieve paper by arxiv_id"""
         session = self.get_session()
         try:
-            return session.query(Paper).filter_by(arxiv_id=arxiv_id).first()
+            with tracer.span("db.get_paper_by_arxiv_id", arxiv_id=arxiv_id) as span:
+                result = session.execute(PAPER_BY_ARXIV_ID, {"arxiv_id": arxiv_id})
+                cache_hit = record_cache_lookup(result, "get_paper_by_arxiv_id")
+                span.set_attribute("cache_hit", cache_hit)
+                return result.scalars().first()
         finally:
             session.close()
     
@@ -81,12 +137,74 @@ class DatabaseManager:
         finally:
             session.close()
     
-    def get_papers_by_category(self, category: str):
-        """Get papers by category"""
+    def iter_papers(self, paper_filter: Optional[PaperFilter] = None, chunk_size: int = 1000,
+                    limit: Optional[int] = None) -> Iterator[Row]:
+        """Stream papers matching a filter, newest first.
+
+        Rows are fetched ``chunk_size`` at a time through a server-side
+        cursor and yielded as lightweight tuples, so memory stays flat
+        however many papers there are.
+        """
+        stmt = select_papers(paper_filter, self.engine.dialect.name, limit=limit)
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=chunk_size).execute(stmt)
+            yield from metrics.track_iteration(result, "db_operation", operation="iter_papers")
+
+    @metrics.timed("db_operation", operation="count_papers")
+    def count_papers(self, paper_filter: Optional[PaperFilter] = None) -> int:
+        """Count papers matching a filter without loading them"""
+        with self.engine.connect() as conn:
+            stmt = select_paper_count(paper_filter, self.engine.dialect.name)
+            return conn.execute(stmt).scalar_one()
+
+    def get_papers_by_category(self, category: str, limit: Optional[int] = None,
+                               offset: int = 0) -> List[Paper]:
+        """Get papers tagged with a category, newest first"""
+        return self.get_papers_by_categories([category], limit=limit, offset=offset)
+
+    @metrics.timed("db_operation", operation="get_papers_by_categories")
+    def get_papers_by_categories(self, categories: Iterable[str], match_all: bool = False,
+                                 limit: Optional[int] = None, offset: int = 0) -> List[Paper]:
+        """Get papers in any (or, with match_all, every) of the given categories.
+
+        Uses the array operators ``&&`` / ``@>`` on PostgreSQL so the GIN
+        index on ``papers.categories`` is used, and the indexed
+        ``paper_categories`` table on SQLite.
+        """
+        categories = list(categories)
+        if not categories:
+            return []
+
         session = self.get_session()
         try:
-            return session.query(Paper).filter(
-                Paper.categories.contains([category])
-            ).all()
+            query = session.query(Paper).filter(
+                categories_match(
+                    categories, self.engine.dialect.name, match_all=match_all, paper=Paper
+                )
+            )
+            return self._page(query, limit, offset)
         finally:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    @metrics.timed("db_operation", operation="get_papers_by_author")
+    def get_papers_by_author(self, author: str, limit: Optional[int] = None,
+                             offset: int = 0) -> List[Paper]:
+        """Get papers by an author (case-insensitive exact name match), newest first"""
+        session = self.get_session()
+        try:
+            query = session.query(Paper).filter(
+                array_contains_ci(Paper.authors, author, self.engine.dialect.name)
+            )
+            return self._page(query, limit, offset)
+        finally:
+            session.close()
+
+    @staticmethod
+    def _page(query, limit: Optional[int], offset: int) -> List[Paper]:
+        """Apply a stable newest-first order and pagination"""
+        query = query.order_by(Paper.published_date.desc(), Paper.arxiv_id)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
@@ -1,14 +1,19 @@
 """Domain models and entities."""
 
 from .entities import Paper, Summary, PaperMetadata, SummaryResult
-from .value_objects import ArxivId, Score, Category
+from .report import CurationReport, ReportEntry, RunningStats
+from .value_objects import ArxivId, Score, Category, PaperFilter
 
 __all__ = [
     'Paper',
     'Summary',
     'PaperMetadata',
     'SummaryResult',
+    'CurationReport',
+    'ReportEntry',
+    'RunningStats',
     'ArxivId',
     'Score',
-    'Category'
+    'Category',
+    'PaperFilter'
 ]
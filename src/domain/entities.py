@@ -1,4 +1,9 @@
-"""Domain entities representing core business objects."""
+"""Domain entities representing core business objects.
+
+Entities are slotted dataclasses. The regular constructors validate their
+input; ``from_row`` constructors skip validation and are meant for trusted
+data read back from our own database.
+"""
 
 from dataclasses import dataclass, field
 from datetime import datetime, date
@@ -6,7 +11,7 @@ from typing import List, Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperMetadata:
     """Metadata for an ArXiv paper."""
     arxiv_id: str
@@ -27,9 +32,30 @@ class PaperMetadata:
             raise ValueError("At least one author is required")
         if not self.abstract:
             raise ValueError("Abstract is required")
+    
+    @classmethod
+    def from_row(cls, row) -> "PaperMetadata":
+        """Build metadata from a trusted paper row without validation.
+        
+        Args:
+            row: Any object exposing the paper columns as attributes
+                (database row, ORM paper or another metadata instance)
+            
+        Returns:
+            PaperMetadata: Metadata sharing the row's values
+        """
+        metadata = cls.__new__(cls)
+        metadata.arxiv_id = row.arxiv_id
+        metadata.title = row.title
+        metadata.authors = row.authors
+        metadata.abstract = row.abstract
+        metadata.published_date = row.published_date
+        metadata.categories = row.categories
+        metadata.pdf_url = row.pdf_url
+        return metadata
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Domain entity representing a research paper."""
     id: UUID = field(default_factory=uuid4)
@@ -56,9 +82,25 @@ class Paper:
             pdf_url=data["pdf_url"]
         )
         return cls(metadata=metadata)
+    
+    @classmethod
+    def from_row(cls, row) -> "Paper":
+        """Build a paper from a trusted database row without validation.
+        
+        Args:
+            row: Row with ``id``, ``created_at`` and the paper columns
+            
+        Returns:
+            Paper: Domain entity instance
+        """
+        paper = cls.__new__(cls)
+        paper.id = row.id
+        paper.metadata = PaperMetadata.from_row(row)
+        paper.created_at = row.created_at
+        return paper
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     """Result of paper summarization."""
     summary: str
@@ -72,9 +114,26 @@ class SummaryResult:
             raise ValueError("Summary is required")
         if not 0 <= self.relevance_score <= 1:
             raise ValueError("Relevance score must be between 0 and 1")
+    
+    @classmethod
+    def from_row(cls, row) -> "SummaryResult":
+        """Build a summary result from a trusted database row without validation.
+        
+        Args:
+            row: Row with the summary columns
+            
+        Returns:
+            SummaryResult: Summary result instance
+        """
+        result = cls.__new__(cls)
+        result.summary = row.summary
+        result.key_points = row.key_points
+        result.relevance_score = row.relevance_score
+        result.model_used = row.model_used
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     """Domain entity representing a paper summary."""
     id: UUID = field(default_factory=uuid4)
@@ -0,0 +1,194 @@
+"""Streaming aggregates for the end-of-run curation report."""
+
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Equal-width histogram bins over [0, 1] used for approximate quantiles
+QUANTILE_BINS = 100
+SUMMARY_QUANTILES = (0.5, 0.9, 0.99)
+# Categories kept in a report summary
+TOP_CATEGORIES = 20
+
+
+@dataclass(frozen=True)
+class ReportEntry:
+    """A curated paper as listed in the report."""
+    arxiv_id: str
+    title: str
+    score: float
+    explanation: str = ""
+    components: Dict[str, float] = field(default_factory=dict)
+
+
+class RunningStats:
+    """Count, mean, variance and approximate quantiles of scores in [0, 1].
+
+    Mean and variance are updated with Welford's algorithm. Quantiles are
+    read from a fixed histogram, so they are accurate to one bin width
+    (0.01 by default) and memory does not depend on the number of values.
+    """
+
+    def __init__(self, bins: int = QUANTILE_BINS):
+        """Initialize statistics.
+
+        Args:
+            bins: Number of histogram bins over [0, 1]
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._m2 = 0.0
+        self._bins = [0] * max(1, bins)
+
+    def add(self, value: float) -> None:
+        """Fold one value into the statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        # Values outside [0, 1] land in the first or last bin
+        self._bins[min(len(self._bins) - 1, max(0, int(value * len(self._bins))))] += 1
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0 for fewer than two values."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation."""
+        return self.variance ** 0.5
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile, interpolated within its histogram bin.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            float: Quantile, clamped to the observed range; 0 without values
+        """
+        if not self.count:
+            return 0.0
+        if q >= 1.0:
+            return self.max
+        rank = q * self.count
+        width = 1.0 / len(self._bins)
+        seen = 0
+        for index, in_bin in enumerate(self._bins):
+            if in_bin and seen + in_bin >= rank:
+                value = (index + (rank - seen) / in_bin) * width
+                return min(max(value, self.min), self.max)
+            seen += in_bin
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        """Compact JSON-ready summary: count, mean, stddev, range and quantiles."""
+        summary = {
+            "count": self.count,
+            "mean": round(self.mean, 4),
+            "stddev": round(self.stddev, 4),
+            "min": round(self.min, 4) if self.min is not None else None,
+            "max": round(self.max, 4) if self.max is not None else None
+        }
+        for q in SUMMARY_QUANTILES:
+            summary[f"p{round(q * 100)}"] = round(self.quantile(q), 4)
+        return summary
+
+
+class CurationReport:
+    """Top-K papers and running statistics, in memory independent of the number of papers.
+
+    Only the ``top_k`` best entries are retained; every other paper is
+    folded into the score, component and category aggregates as it is added.
+    """
+
+    def __init__(self, top_k: int = 10):
+        """Initialize report.
+
+        Args:
+            top_k: Number of best papers retained
+        """
+        self.top_k = top_k
+        self.scores = RunningStats()
+        self.components: Dict[str, RunningStats] = {}
+        self.categories: Counter = Counter()
+        # Min-heap of (score, -sequence, entry): the root is the entry to evict,
+        # and among equal scores the latest one goes first
+        self._heap: List[Tuple[float, int, ReportEntry]] = []
+        self._sequence = count()
+
+    def add(self, arxiv_id: str, title: str, score: float, explanation: str = "",
+            components: Optional[Mapping[str, Any]] = None, categories: Iterable[str] = ()) -> None:
+        """Fold one curated paper into the report.
+
+        Args:
+            arxiv_id: ArXiv ID
+            title: Paper title
+            score: Total score
+            explanation: Score explanation
+            components: Component scores, as numbers or ``{"score": ...}`` dicts
+            categories: ArXiv categories of the paper
+        """
+        values = {name: component_score(value) for name, value in (components or {}).items()}
+        self.scores.add(score)
+        for name, value in values.items():
+            self.components.setdefault(name, RunningStats()).add(value)
+        self.categories.update(categories)
+
+        if self.top_k <= 0:
+            return
+        key = (score, -next(self._sequence))
+        if len(self._heap) < self.top_k:
+            heapq.heappush(
+                self._heap, (*key, ReportEntry(arxiv_id, title, score, explanation, values))
+            )
+        elif key > self._heap[0][:2]:
+            heapq.heapreplace(
+                self._heap, (*key, ReportEntry(arxiv_id, title, score, explanation, values))
+            )
+
+    @property
+    def count(self) -> int:
+        """Number of papers added."""
+        return self.scores.count
+
+    @property
+    def mean_score(self) -> float:
+        """Mean total score, 0 for an empty report."""
+        return self.scores.mean
+
+    def component_means(self) -> Dict[str, float]:
+        """Mean of each component over the papers that reported it."""
+        return {name: stats.mean for name, stats in self.components.items()}
+
+    def top(self) -> List[ReportEntry]:
+        """Retained entries, best first."""
+        ranked = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [entry for _, _, entry in ranked]
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact JSON-ready summary of the report, as stored per run."""
+        return {
+            "papers": self.count,
+            "score": self.scores.to_dict(),
+            "components": {name: stats.to_dict() for name, stats in self.components.items()},
+            "categories": dict(self.categories.most_common(TOP_CATEGORIES)),
+            "top": [
+                {"arxiv_id": entry.arxiv_id, "title": entry.title, "score": round(entry.score, 4)}
+                for entry in self.top()
+            ]
+        }
+
+
+def component_score(value: Any) -> float:
+    """A component score given as a number or as a ``{"score": ...}`` dict."""
+    if isinstance(value, Mapping):
+        return float(value.get("score", 0.0))
+    return float(value)
@@ -1,7 +1,8 @@
 """Value objects for domain entities."""
 
 from dataclasses import dataclass
-from typing import Any
+from datetime import date, datetime
+from typing import Any, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -61,3 +62,22 @@ class Category:
     def get_subcategory(self) -> str:
         """Get subcategory (e.g., 'AI' from 'cs.AI')."""
         return self.value.split(".")[1]
+
+
+@dataclass(frozen=True)
+class PaperFilter:
+    """Value object describing which papers a query should return."""
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    categories: Tuple[str, ...] = ()
+    min_score: Optional[float] = None
+    created_after: Optional[datetime] = None
+    
+    def __post_init__(self):
+        """Validate filter bounds."""
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("date_from must not be after date_to")
+        if self.min_score is not None and not 0 <= self.min_score <= 1:
+            raise ValueError("min_score must be between 0 and 1")
+        # Accept any iterable of categories but store an immutable tuple
+        object.__setattr__(self, "categories", tuple(self.categories))
@@ -6,6 +6,9 @@ import json
 import time
 from abc import ABC, abstractmethod
 
+from src.utils.metrics import metrics
+from src.utils.tracing import tracer
+
 logger = logging.getLogger(__name__)
 
 class BaseSummarizer(ABC):
@@ -44,7 +47,9 @@ class BARTSummarizer(BaseSummarizer):
         }
     
     def _get_summary(self, text: str, max_retries: int = 3) -> Optional[str]:
+        span = tracer.current_span()
         for attempt in range(max_retries):
+            span.set_attribute("retry_count", attempt)
             try:
                 payload = {
                     "inputs": text,
@@ -55,21 +60,27 @@ class BARTSummarizer(BaseSummarizer):
                     }
                 }
                 
-                response = requests.post(
-                    self.api_url,
-                    headers=self.headers,
-                    json=payload,
-                    timeout=30
-                )
+                with metrics.track("external_request", service="huggingface",
+                                   operation="summarize"):
+                    response = requests.post(
+                        self.api_url,
+                        headers=self.headers,
+                        json=payload,
+                        timeout=30
+                    )
+                    if response.status_code != 503:
+                        response.raise_for_status()
                 
                 if response.status_code == 503:
-                    wait_time = 20 * (attempt + 1)
+                    wait_time = self._loading_wait(response, 20 * (attempt + 1))
                     logger.warning(f"Model is loading. Waiting {wait_time} seconds...")
+                    metrics.increment("external_request_errors_total", service="huggingface",
+                                      operation="summarize")
+                    metrics.increment("rate_limit_sleep_seconds_total", wait_time,
+                                      component="huggingface")
                     time.sleep(wait_time)
                     continue
                 
-                response.raise_for_status()
-                
                 result = response.json()
                 if isinstance(result, list) and len(result) > 0:
                     summary = result[0].get('summary_text', '')
@@ -81,11 +92,21 @@ class BARTSummarizer(BaseSummarizer):
             except Exception as e:
                 logger.error(f"Error getting summary: {e}")
                 if attempt < max_retries - 1:
+                    metrics.increment("rate_limit_sleep_seconds_total", 5, component="huggingface")
                     time.sleep(5)
                 continue
         
         return None
     
+    @staticmethod
+    def _loading_wait(response: requests.Response, default: float) -> float:
+        """Seconds to wait for a loading model, capped by the API's own estimate"""
+        try:
+            estimated = float(response.json().get('estimated_time'))
+        except (ValueError, TypeError, AttributeError):
+            return default
+        return max(0.0, min(default, estimated))
+    
     def _extract_key_points(self, abstract: str) -> List[str]:
         sentences = abstract.split('. ')
         key_points = []
@@ -168,14 +189,16 @@ RELEVANCE_SCORE: [score]/10"""
         pass
 
 class HuggingFaceClient:
-    def __init__(self, model: str = None, api_key: str = None):
+    API_URL = "https://api-inference.huggingface.co/models/{model}"
+
+    def __init__(self, model: str = None, api_key: str = None, api_url: str = None):
         self.model = model or os.getenv('HF_MODEL', 'facebook/bart-large-cnn')
         self.api_key = api_key or os.getenv('HF_TOKEN')
         
         if not self.api_key:
             raise ValueError("HuggingFace API key not found. Set HF_TOKEN environment variable.")
         
-        self.api_url = f"https://api-inference.huggingface.co/models/{self.model}"
+        self.api_url = (api_url or os.getenv('HF_API_URL') or self.API_URL).format(model=self.model)
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
@@ -191,7 +214,9 @@ class HuggingFaceClient:
     def summarize_paper(self, paper: Dict) -> Dict:
         """Génère un résumé structuré d'un papier"""
         try:
-            result = self.summarizer.summarize(paper)
+            with tracer.span("huggingface.summarize", model=self.model,
+                             arxiv_id=paper.get('arxiv_id', 'unknown')):
+                result = self.summarizer.summarize(paper)
             if result:
                 result['model_used'] = self.model
             return result
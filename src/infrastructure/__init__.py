@@ -1,9 +1,26 @@
-"""Infrastructure layer components."""
+"""Infrastructure layer components.
+
+The API clients are resolved on first access, so processes that only use
+the database (web workers, maintenance commands) skip ``arxiv`` and the
+HTTP client stacks.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from .database import DatabaseManager, DatabaseSession
-from .arxiv import ArxivClient
-from .huggingface import HuggingFaceClient
-from .ollama import OllamaClient
+
+if TYPE_CHECKING:
+    from .arxiv import ArxivClient
+    from .huggingface import HuggingFaceClient
+    from .ollama import OllamaClient
+
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    'ArxivClient': 'arxiv',
+    'HuggingFaceClient': 'huggingface',
+    'OllamaClient': 'ollama'
+}
 
 __all__ = [
     'DatabaseManager',
@@ -12,3 +29,16 @@ __all__ = [
     'HuggingFaceClient',
     'OllamaClient'
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
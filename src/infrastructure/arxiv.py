@@ -3,12 +3,13 @@
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 
 import arxiv
 
 from ..core.exceptions import ArxivClientError
 from ..core.config import ArxivConfig
+from ..utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,24 @@ class ArxivClient:
         Returns:
             List[Dict[str, Any]]: List of paper data dictionaries
             
+        Raises:
+            ArxivClientError: If fetching fails
+        """
+        papers = list(self.iter_recent_papers(days_back))
+        logger.info(f"Fetched {len(papers)} papers from ArXiv")
+        return papers
+    
+    def iter_recent_papers(self, days_back: int = 7) -> Iterator[Dict[str, Any]]:
+        """Yield recent papers from ArXiv as result pages arrive.
+        
+        Only the current page of results is held in memory.
+        
+        Args:
+            days_back: Number of days to look back
+            
+        Yields:
+            Dict[str, Any]: Paper data dictionary
+            
         Raises:
             ArxivClientError: If fetching fails
         """
@@ -64,8 +83,10 @@ class ArxivClient:
             )
             
             # Fetch results with rate limiting
-            papers = []
-            for result in self.client.results(search):
+            results = metrics.track_iteration(
+                self.client.results(search), "external_request", service="arxiv", operation="search"
+            )
+            for result in results:
                 paper_data = self._parse_paper(result)
                 
                 # Filter by date
@@ -74,13 +95,12 @@ class ArxivClient:
                     if paper_data["published_date"] < cutoff_date.date():
                         continue
                 
-                papers.append(paper_data)
+                yield paper_data
                 
                 # Rate limiting
                 time.sleep(self.config.rate_limit_delay)
-            
-            logger.info(f"Fetched {len(papers)} papers from ArXiv")
-            return papers
+                metrics.increment("rate_limit_sleep_seconds_total", self.config.rate_limit_delay,
+                                  component="arxiv")
             
         except Exception as e:
             logger.error(f"Failed to fetch papers from ArXiv: {e}")
@@ -119,7 +139,8 @@ class ArxivClient:
         """
         try:
             search = arxiv.Search(id_list=[arxiv_id])
-            results = list(self.client.results(search))
+            with metrics.track("external_request", service="arxiv", operation="fetch_by_id"):
+                results = list(self.client.results(search))
             
             if not results:
                 raise ArxivClientError(f"Paper not found: {arxiv_id}")
@@ -1,24 +1,75 @@
 """Database infrastructure using SQLAlchemy."""
 
+import itertools
 import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
-from typing import Optional, List, Generator
+from datetime import datetime, timedelta
+from typing import Any, ContextManager, Dict, Optional, List, Generator, Iterator, Tuple
 from uuid import UUID
 
-from sqlalchemy import create_engine, select, and_
+from sqlalchemy import Connection, select, and_, func, text, Row
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from ..core.exceptions import DatabaseError
 from ..core.config import DatabaseConfig
-from ..domain.entities import Paper, Summary, PaperMetadata, SummaryResult
-from .models import Base, PaperModel, SummaryModel
+from ..domain.entities import Paper, Summary, SummaryResult
+from ..domain.value_objects import PaperFilter
+from ..utils.metrics import metrics
+from ..utils.tracing import tracer
+from .engines import get_engine
+from .models import Base, PaperModel, SummaryModel, PaperLatestScoreModel
+from .queries import (
+    PAPER_BY_ARXIV_ID, PAPER_DETAIL_BY_ARXIV_ID, PAPER_ID_BY_ARXIV_ID, apply_paper_filter,
+    record_cache_lookup, select_paper_count, select_paper_details, select_papers
+)
+from .scores import write_scores
 
 logger = logging.getLogger(__name__)
 
+# Seconds since the last replayed transaction, or 0 when the replica has
+# replayed everything it received (an idle primary sends nothing new)
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+class Replica:
+    """A read replica engine and its health state."""
+    
+    def __init__(self, url: str, engine):
+        self.url = url
+        self.engine = engine
+        self.down_until = 0.0
+        self.lag_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+    
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+    @property
+    def display_url(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
 
 class DatabaseSession:
-    """Manages database sessions and connections."""
+    """Manages database sessions and connections.
+    
+    Writes always go to the primary. Read-only sessions are spread
+    round-robin over the configured replicas; a replica that fails to
+    connect, fails a read with an ``OperationalError`` or lags more than
+    ``replica_max_lag_seconds`` is skipped for ``replica_retry_seconds``,
+    and reads fall back to the primary when no replica is available. A
+    background thread checks every replica each ``replica_check_seconds``
+    and re-admits those that recovered.
+    """
     
     def __init__(self, config: DatabaseConfig):
         """Initialize database session manager.
@@ -27,20 +78,38 @@ class DatabaseSession:
             config: Database configuration
         """
         self.config = config
-        self.engine = create_engine(
+        self.engine = get_engine(
             config.url,
             pool_size=config.pool_size,
             max_overflow=config.max_overflow,
             echo=config.echo
         )
+        self.replicas = [
+            Replica(url, get_engine(
+                url,
+                pool_size=config.replica_pool_size,
+                max_overflow=config.replica_max_overflow,
+                echo=config.echo
+            ))
+            for url in config.replica_urls
+        ]
+        self._next_replica = itertools.count()
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
             bind=self.engine
         )
+        self._checks_lock = threading.Lock()
+        self._checks_pid: Optional[int] = None
+        self._closed = threading.Event()
+        self._start_replica_checks()
         
     def create_tables(self) -> None:
-        """Create database tables if they don't exist."""
+        """Create database tables if they don't exist.
+        
+        Part of the migration step (``python -m src.maintenance migrate``);
+        not called when serving.
+        """
         try:
             Base.metadata.create_all(bind=self.engine)
             logger.info("Database tables created successfully")
@@ -49,25 +118,143 @@ class DatabaseSession:
             raise DatabaseError(f"Failed to create tables: {e}") from e
 
     @contextmanager
-    def get_session(self) -> Generator[Session, None, None]:
+    def session_scope(self, readonly: bool = False) -> Generator[Session, None, None]:
         """Get a database session context manager.
         
+        Args:
+            readonly: Route the session to a replica and roll it back on
+                exit instead of committing
+            
         Yields:
             Session: Database session
             
         Raises:
             DatabaseError: If session creation fails
         """
-        session = self.SessionLocal()
+        replica, connection = (
+            self._read_connection() if readonly and self.replicas else (None, None)
+        )
+        if connection is not None:
+            session = self.SessionLocal(bind=connection)
+        else:
+            session = self.SessionLocal()
         try:
             yield session
-            session.commit()
+            if readonly:
+                session.rollback()
+            else:
+                session.commit()
         except SQLAlchemyError as e:
             session.rollback()
+            if replica is not None and isinstance(e, OperationalError):
+                self._mark_down(replica, e)
             logger.error(f"Database session error: {e}")
             raise DatabaseError(f"Database operation failed: {e}") from e
         finally:
             session.close()
+            if connection is not None:
+                connection.close()
+
+    def get_session(self) -> ContextManager[Session]:
+        """Get a read-write session on the primary (see ``session_scope``)."""
+        return self.session_scope()
+
+    def check_replicas(self) -> dict:
+        """Query every replica's replication lag and update its health.
+        
+        Replicas that answer within ``replica_max_lag_seconds`` are
+        re-admitted at once, without waiting for the retry delay.
+        
+        Returns:
+            dict: Replica URL (password hidden) to whether it is healthy
+        """
+        status = {}
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    replica.lag_seconds = self._replica_lag(conn)
+            except SQLAlchemyError as e:
+                self._mark_down(replica, e)
+            else:
+                if replica.lag_seconds > self.config.replica_max_lag_seconds:
+                    self._mark_down(replica, f"{replica.lag_seconds:.0f}s behind the primary")
+                else:
+                    replica.down_until = 0.0
+                    replica.error = None
+            status[replica.display_url] = replica.healthy
+        return status
+
+    def replica_status(self) -> Dict[str, Dict[str, Any]]:
+        """Health of every replica as of the last check, without querying.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Replica URL (password hidden) to its
+            ``healthy`` flag, ``lag_seconds`` and last ``error``
+        """
+        return {
+            replica.display_url: {
+                'healthy': replica.healthy,
+                'lag_seconds': replica.lag_seconds,
+                'error': replica.error
+            }
+            for replica in self.replicas
+        }
+
+    def dispose(self) -> None:
+        """Stop replica checks and close the connection pools of the primary and all replicas."""
+        self._closed.set()
+        self.engine.dispose()
+        for replica in self.replicas:
+            replica.engine.dispose()
+
+    def _read_connection(self) -> Tuple[Optional[Replica], Optional[Connection]]:
+        """Connect to the next healthy replica, or return Nones to use the primary."""
+        self._start_replica_checks()
+        start = next(self._next_replica)
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if not replica.healthy:
+                continue
+            try:
+                return replica, replica.engine.connect()
+            except SQLAlchemyError as e:
+                self._mark_down(replica, e)
+        logger.warning("No healthy read replica, reading from the primary")
+        return None, None
+
+    @staticmethod
+    def _replica_lag(conn: Connection) -> float:
+        if conn.dialect.name != "postgresql":
+            conn.execute(text("SELECT 1"))
+            return 0.0
+        return float(conn.execute(REPLICA_LAG_QUERY).scalar() or 0.0)
+
+    def _start_replica_checks(self) -> None:
+        # Threads do not survive a fork, so a forked worker starts its own
+        if not self.replicas or self._checks_pid == os.getpid() or self._closed.is_set():
+            return
+        with self._checks_lock:
+            if self._checks_pid == os.getpid():
+                return
+            self._checks_pid = os.getpid()
+            threading.Thread(
+                target=self._run_replica_checks, name="replica-checks", daemon=True
+            ).start()
+
+    def _run_replica_checks(self) -> None:
+        while not self._closed.wait(self.config.replica_check_seconds):
+            try:
+                self.check_replicas()
+            except Exception as e:
+                logger.warning(f"Replica health check failed: {e}")
+
+    def _mark_down(self, replica: Replica, error) -> None:
+        replica.down_until = time.monotonic() + self.config.replica_retry_seconds
+        replica.error = str(error)
+        logger.warning(
+            f"Read replica {replica.display_url} unavailable, "
+            f"retrying in {self.config.replica_retry_seconds:.0f}s: {error}"
+        )
 
 
 class DatabaseManager:
@@ -81,6 +268,7 @@ class DatabaseManager:
         """
         self.db_session = db_session
     
+    @metrics.timed("db_operation", operation="paper_exists")
     def paper_exists(self, arxiv_id: str) -> bool:
         """Check if a paper already exists in the database.
         
@@ -90,11 +278,44 @@ class DatabaseManager:
         Returns:
             bool: True if paper exists
         """
-        with self.db_session.get_session() as session:
-            stmt = select(PaperModel).where(PaperModel.arxiv_id == arxiv_id)
-            result = session.execute(stmt).scalar_one_or_none()
-            return result is not None
+        # Deduplication must see the latest writes, so this stays on the primary
+        with tracer.span("db.paper_exists", arxiv_id=arxiv_id) as span, \
+                self.db_session.get_session() as session:
+            result = session.execute(PAPER_ID_BY_ARXIV_ID, {"arxiv_id": arxiv_id})
+            exists = result.first() is not None
+            cache_hit = record_cache_lookup(result, "paper_exists")
+            span.set_attributes(exists=exists, cache_hit=cache_hit)
+            return exists
 
+    @metrics.timed("db_operation", operation="get_paper_by_arxiv_id")
+    def get_paper_by_arxiv_id(self, arxiv_id: str) -> Optional[Row]:
+        """Look up a paper and its latest score.
+        
+        Args:
+            arxiv_id: ArXiv paper ID
+            
+        Returns:
+            Optional[Row]: Paper columns plus ``relevance_score`` (None if
+            unscored), or None if the paper does not exist
+        """
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(PAPER_BY_ARXIV_ID, {"arxiv_id": arxiv_id}).first()
+
+    @metrics.timed("db_operation", operation="get_paper_detail")
+    def get_paper_detail(self, arxiv_id: str) -> Optional[Row]:
+        """Look up a paper with its latest summary and latest score.
+        
+        Args:
+            arxiv_id: ArXiv paper ID
+            
+        Returns:
+            Optional[Row]: Detail row (see ``queries.DETAIL_COLUMNS``), or
+            None if the paper does not exist
+        """
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(PAPER_DETAIL_BY_ARXIV_ID, {"arxiv_id": arxiv_id}).first()
+
+    @metrics.timed("db_operation", operation="save_paper")
     def save_paper(self, paper: Paper) -> Paper:
         """Save a paper to the database.
         
@@ -107,7 +328,8 @@ class DatabaseManager:
         Raises:
             DatabaseError: If save operation fails
         """
-        with self.db_session.get_session() as session:
+        with tracer.span("db.save_paper", arxiv_id=paper.metadata.arxiv_id), \
+                self.db_session.get_session() as session:
             # Convert domain entity to database model
             db_paper = PaperModel(
                 id=paper.id,
@@ -127,6 +349,7 @@ class DatabaseManager:
             logger.info(f"Saved paper: {paper.metadata.arxiv_id}")
             return paper
 
+    @metrics.timed("db_operation", operation="save_summary")
     def save_summary(self, summary: Summary) -> Summary:
         """Save a summary to the database.
         
@@ -157,41 +380,210 @@ class DatabaseManager:
             logger.info(f"Saved summary for paper: {summary.paper_id}")
             return summary
 
-    def get_recent_papers(self, days: int = 7) -> List[Paper]:
+    def get_recent_papers(self, days: int = 7, limit: Optional[int] = None) -> List[Paper]:
         """Get recent papers from the database.
         
         Args:
             days: Number of days to look back
+            limit: Optional maximum number of papers
             
         Returns:
             List[Paper]: List of recent papers
         """
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        rows = self.iter_papers(PaperFilter(created_after=cutoff_date), limit=limit)
+        return [Paper.from_row(row) for row in rows]
+
+    def iter_papers(
+        self,
+        paper_filter: Optional[PaperFilter] = None,
+        chunk_size: int = 1000,
+        limit: Optional[int] = None
+    ) -> Iterator[Row]:
+        """Stream papers matching a filter, newest first.
+        
+        Rows are fetched through a server-side cursor ``chunk_size`` at a
+        time and are never turned into ORM objects, so memory use does not
+        grow with the number of papers.
+        
+        Args:
+            paper_filter: Date, category, score and ingestion filters
+            chunk_size: Number of rows fetched per round-trip
+            limit: Optional maximum number of papers
+            
+        Yields:
+            Row: Paper columns (see ``queries.PAPER_COLUMNS``)
+        """
+        stmt = select_papers(paper_filter, self.db_session.engine.dialect.name, limit=limit)
+        with self.db_session.session_scope(readonly=True) as session:
+            result = session.execute(stmt.execution_options(yield_per=chunk_size))
+            yield from metrics.track_iteration(result, "db_operation", operation="iter_papers")
+
+    @metrics.timed("db_operation", operation="get_paper_details")
+    def get_paper_details(
+        self,
+        paper_filter: Optional[PaperFilter] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Row]:
+        """Get papers with their latest summary and latest score, newest first.
+        
+        Summaries and scores come back in the same query as the papers,
+        so the number of round-trips does not depend on the page size.
+        
+        Args:
+            paper_filter: Date, category, score and ingestion filters
+            limit: Optional maximum number of papers
+            offset: Number of papers to skip
+            
+        Returns:
+            List[Row]: Detail rows (see ``queries.DETAIL_COLUMNS``)
+        """
+        stmt = select_paper_details(
+            paper_filter, self.db_session.engine.dialect.name, limit=limit, offset=offset
+        )
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(stmt).all()
+
+    @metrics.timed("db_operation", operation="count_papers")
+    def count_papers(self, paper_filter: Optional[PaperFilter] = None) -> int:
+        """Count papers matching a filter without loading them.
+        
+        Args:
+            paper_filter: Date, category, score and ingestion filters
+            
+        Returns:
+            int: Number of matching papers
+        """
+        stmt = select_paper_count(paper_filter, self.db_session.engine.dialect.name)
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(stmt).scalar_one()
+
+    @metrics.timed("db_operation", operation="average_score")
+    def average_score(self) -> Optional[float]:
+        """Mean latest total score over scored papers.
+        
+        Returns:
+            Optional[float]: Average score, or None if no paper is scored
+        """
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(select(func.avg(PaperLatestScoreModel.total_score))).scalar_one()
+
+    def iter_export_rows(
+        self,
+        paper_filter: Optional[PaperFilter] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Row]:
+        """Stream papers joined with their latest summary and score.
+        
+        Rows are fetched through a server-side cursor ``chunk_size`` at a
+        time, so memory use does not grow with the number of papers.
+        
+        Args:
+            paper_filter: Date, category and score filters
+            chunk_size: Number of rows fetched per round-trip
+            
+        Yields:
+            Row: Flat export row (paper, summary and score columns)
+        """
+        paper_filter = paper_filter or PaperFilter()
+        
+        latest_summary = select(
+            SummaryModel.paper_id,
+            SummaryModel.summary,
+            SummaryModel.key_points,
+            SummaryModel.model_used,
+            func.row_number().over(
+                partition_by=SummaryModel.paper_id,
+                order_by=SummaryModel.created_at.desc()
+            ).label("rn")
+        ).subquery("latest_summary")
+        
+        stmt = select(
+            PaperModel.arxiv_id,
+            PaperModel.title,
+            PaperModel.authors,
+            PaperModel.abstract,
+            PaperModel.published_date,
+            PaperModel.categories,
+            PaperModel.pdf_url,
+            latest_summary.c.summary,
+            latest_summary.c.key_points,
+            latest_summary.c.model_used,
+            PaperLatestScoreModel.total_score,
+            PaperLatestScoreModel.llm_score,
+            PaperLatestScoreModel.keyword_score,
+            PaperLatestScoreModel.citation_score,
+            PaperLatestScoreModel.temporal_score,
+            PaperLatestScoreModel.author_score,
+            PaperLatestScoreModel.scored_at
+        ).outerjoin(
+            latest_summary,
+            and_(latest_summary.c.paper_id == PaperModel.id, latest_summary.c.rn == 1)
+        ).outerjoin(
+            PaperLatestScoreModel,
+            PaperLatestScoreModel.paper_id == PaperModel.id
+        )
+        
+        stmt = apply_paper_filter(stmt, paper_filter, self.db_session.engine.dialect.name)
+        stmt = stmt.order_by(PaperModel.published_date.desc(), PaperModel.arxiv_id)
+        
+        with self.db_session.session_scope(readonly=True) as session:
+            result = session.execute(stmt.execution_options(yield_per=chunk_size))
+            yield from metrics.track_iteration(result, "db_operation", operation="iter_export_rows")
+
+    @metrics.timed("db_operation", operation="save_paper_scores")
+    def save_paper_scores(self, scores: List[dict]) -> int:
+        """Save a batch of scoring runs and update the latest score per paper.
+        
+        Args:
+            scores: Score rows (see ``scores.write_scores``)
+            
+        Returns:
+            int: Number of scoring runs saved
+            
+        Raises:
+            DatabaseError: If the batch cannot be saved
+        """
         with self.db_session.get_session() as session:
-            from datetime import datetime, timedelta
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-            
-            stmt = select(PaperModel).where(
-                PaperModel.created_at >= cutoff_date
-            ).order_by(PaperModel.published_date.desc())
-            
-            db_papers = session.execute(stmt).scalars().all()
-            
-            papers = []
-            for db_paper in db_papers:
-                metadata = PaperMetadata(
-                    arxiv_id=db_paper.arxiv_id,
-                    title=db_paper.title,
-                    authors=db_paper.authors,
-                    abstract=db_paper.abstract,
-                    published_date=db_paper.published_date,
-                    categories=db_paper.categories,
-                    pdf_url=db_paper.pdf_url
-                )
-                paper = Paper(
-                    id=db_paper.id,
-                    metadata=metadata,
-                    created_at=db_paper.created_at
-                )
-                papers.append(paper)
-            
-            return papers
+            return write_scores(session, scores)
+
+    @metrics.timed("db_operation", operation="get_top_scored_papers")
+    def get_top_scored_papers(self, limit: int = 20, offset: int = 0,
+                              min_score: Optional[float] = None) -> List[Row]:
+        """Get papers ranked by their latest total score.
+        
+        Reads ``paper_latest_score`` in index order, so the cost depends
+        on ``limit`` rather than on the number of scoring runs.
+        
+        Args:
+            limit: Maximum number of papers
+            offset: Number of papers to skip
+            min_score: Optional minimum total score
+            
+        Returns:
+            List[Row]: Paper columns with the latest score columns
+        """
+        stmt = select(
+            PaperModel.id,
+            PaperModel.arxiv_id,
+            PaperModel.title,
+            PaperModel.authors,
+            PaperModel.published_date,
+            PaperModel.categories,
+            PaperModel.pdf_url,
+            PaperLatestScoreModel.total_score,
+            PaperLatestScoreModel.explanation,
+            PaperLatestScoreModel.scored_at
+        ).join(
+            PaperLatestScoreModel, PaperLatestScoreModel.paper_id == PaperModel.id
+        ).order_by(
+            PaperLatestScoreModel.total_score.desc(),
+            PaperLatestScoreModel.published_date.desc()
+        ).limit(limit).offset(offset)
+        
+        if min_score is not None:
+            stmt = stmt.where(PaperLatestScoreModel.total_score >= min_score)
+        
+        with self.db_session.session_scope(readonly=True) as session:
+            return session.execute(stmt).all()
@@ -0,0 +1,235 @@
+"""Process-wide registry of SQLAlchemy engines.
+
+Every entry point asks the registry for its engine instead of calling
+``create_engine``, so a process holds one pool per database URL (and
+PostgreSQL statement timeout) however many managers, stores and queues it
+builds. Engines are created with pre-ping, connection recycling and, on
+PostgreSQL, a statement timeout (plus server-side prepared statements
+with the psycopg 3 driver). SQLite
+connections get ``SQLITE_PRAGMAS``, and file databases run in WAL mode so
+readers never block the single writer. The registry counts connections
+per engine for monitoring.
+
+Schema creation is not done here; run ``python -m src.maintenance migrate``.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+
+logger = logging.getLogger(__name__)
+
+# Applied to every new SQLite connection
+SQLITE_PRAGMAS = {
+    "foreign_keys": "ON",
+    # Durable at checkpoints; safe with WAL and much cheaper than FULL
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    # Page cache and mmap stay at their defaults: both count towards every
+    # pooled connection's resident memory, and the OS already caches the file
+    "temp_store": "MEMORY"
+}
+
+
+@dataclass
+class PoolStats:
+    """Connection counters of one engine."""
+    url: str
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    connects: int
+    checkouts: int
+
+
+def display_url(url) -> str:
+    """A database URL with its password masked, for logs and metrics."""
+    return make_url(url).render_as_string(hide_password=True)
+
+
+class EngineRegistry:
+    """Creates engines on first use and shares them by URL and statement timeout."""
+
+    def __init__(self, pool_recycle: Optional[int] = None,
+                 statement_timeout_ms: Optional[int] = None,
+                 prepare_threshold: Optional[int] = None):
+        """Initialize registry.
+
+        Args:
+            pool_recycle: Seconds after which pooled connections are replaced
+                (default: ``DB_POOL_RECYCLE`` or 1800)
+            statement_timeout_ms: PostgreSQL statement timeout, 0 to disable
+                (default: ``DB_STATEMENT_TIMEOUT_MS`` or 30000)
+            prepare_threshold: Executions after which psycopg 3 prepares a
+                statement server-side (default: ``DB_PREPARE_THRESHOLD`` or 2)
+        """
+        self.pool_recycle = (
+            pool_recycle if pool_recycle is not None
+            else int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        )
+        self.statement_timeout_ms = (
+            statement_timeout_ms if statement_timeout_ms is not None
+            else int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+        )
+        self.prepare_threshold = (
+            prepare_threshold if prepare_threshold is not None
+            else int(os.getenv("DB_PREPARE_THRESHOLD", "2"))
+        )
+        self._engines: Dict[Tuple[str, Optional[int]], Engine] = {}
+        self._counters: Dict[Tuple[str, Optional[int]], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, pool_size: int = 5, max_overflow: int = 10, echo: bool = False,
+            statement_timeout_ms: Optional[int] = None) -> Engine:
+        """Get the engine for a URL, creating it on first use.
+
+        On PostgreSQL each statement timeout gets its own engine, since it
+        is set when connecting. Pool options only apply to the first call
+        for a URL and timeout; later calls share the existing engine.
+
+        Args:
+            url: Database URL
+            pool_size: Connections kept open
+            max_overflow: Extra connections allowed under load
+            echo: Log SQL statements
+            statement_timeout_ms: Override the registry statement timeout
+
+        Returns:
+            Engine: Shared engine
+        """
+        key = self._key(url, statement_timeout_ms)
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = self._create(url, key, pool_size, max_overflow, echo)
+                self._engines[key] = engine
+                logger.info(f"Created engine for {self._label(key)}")
+            return engine
+
+    def connect_args(self, url, statement_timeout_ms: Optional[int] = None) -> Dict[str, Any]:
+        """DB-API connect arguments of the engine for a URL.
+
+        Args:
+            url: Database URL
+            statement_timeout_ms: Override the registry statement timeout
+
+        Returns:
+            Dict[str, Any]: Statement timeout and, with psycopg 3, the
+            server-side prepare threshold; empty for other databases
+        """
+        parsed = make_url(url)
+        if parsed.get_backend_name() != "postgresql":
+            return {}
+
+        connect_args = {}
+        timeout = self._key(url, statement_timeout_ms)[1]
+        if timeout:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+        if parsed.get_driver_name() == "psycopg":
+            # psycopg 3 prepares a statement server-side once it has run this often
+            connect_args["prepare_threshold"] = self.prepare_threshold
+        return connect_args
+
+    def stats(self) -> Dict[str, PoolStats]:
+        """Connection counters of every registered engine.
+
+        Keyed by URL with the password hidden; PostgreSQL engines with a
+        statement timeout other than the registry's are marked with it.
+        """
+        stats = {}
+        for key, engine in list(self._engines.items()):
+            pool = engine.pool
+            counters = self._counters[key]
+            url = self._label(key)
+            stats[url] = PoolStats(
+                url=url,
+                pool_size=pool.size() if hasattr(pool, "size") else 0,
+                checked_out=pool.checkedout() if hasattr(pool, "checkedout") else 0,
+                checked_in=pool.checkedin() if hasattr(pool, "checkedin") else 0,
+                overflow=pool.overflow() if hasattr(pool, "overflow") else 0,
+                connects=counters["connects"],
+                checkouts=counters["checkouts"]
+            )
+        return stats
+
+    def dispose(self) -> None:
+        """Dispose and forget every engine (tests, forked workers)."""
+        with self._lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+            self._counters.clear()
+
+    def _key(self, url, statement_timeout_ms: Optional[int]) -> Tuple[str, Optional[int]]:
+        parsed = make_url(url)
+        timeout = None
+        if parsed.get_backend_name() == "postgresql":
+            timeout = int(self.statement_timeout_ms if statement_timeout_ms is None
+                          else statement_timeout_ms)
+        return parsed.render_as_string(hide_password=False), timeout
+
+    def _label(self, key: Tuple[str, Optional[int]]) -> str:
+        url, timeout = key
+        if timeout is None or timeout == self.statement_timeout_ms:
+            return display_url(url)
+        return f"{display_url(url)} (statement_timeout={timeout}ms)"
+
+    def _create(self, url: str, key: Tuple[str, Optional[int]], pool_size: int, max_overflow: int,
+                echo: bool) -> Engine:
+        parsed = make_url(url)
+        options = {"echo": echo, "pool_pre_ping": True, "pool_recycle": self.pool_recycle}
+
+        in_memory = parsed.database in (None, "", ":memory:")
+        if parsed.get_backend_name() == "sqlite":
+            # In-memory databases use a single-connection pool without sizing
+            if not in_memory:
+                options.update(pool_size=pool_size, max_overflow=max_overflow)
+        else:
+            options.update(pool_size=pool_size, max_overflow=max_overflow)
+
+        connect_args = self.connect_args(url, key[1])
+        if connect_args:
+            options["connect_args"] = connect_args
+
+        engine = create_engine(url, **options)
+        counters = self._counters[key] = {"connects": 0, "checkouts": 0}
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            counters["connects"] += 1
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+            counters["checkouts"] += 1
+
+        if parsed.get_backend_name() == "sqlite":
+            pragmas = dict(SQLITE_PRAGMAS)
+            if not in_memory:
+                pragmas = {"journal_mode": "WAL", **pragmas}
+
+            @event.listens_for(engine, "connect")
+            def _set_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+                cursor.close()
+
+        return engine
+
+
+registry = EngineRegistry()
+
+
+def get_engine(url: str, **options) -> Engine:
+    """Get the shared engine for a URL (see ``EngineRegistry.get``)."""
+    return registry.get(url, **options)
@@ -9,6 +9,8 @@ from requests.packages.urllib3.util.retry import Retry
 from ..core.exceptions import SummarizationError
 from ..core.config import HuggingFaceConfig
 from ..domain.entities import SummaryResult
+from ..utils.metrics import metrics
+from ..utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +34,14 @@ class HuggingFaceClient:
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            status_forcelist=[429, 500, 502, 503, 504],
+            # Inference calls are POSTs, which urllib3 does not retry by default
+            allowed_methods=None
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.api_url = (config.api_url or self.API_URL).format(model=config.model)
 
     def summarize_paper(self, paper_data: Dict[str, Any]) -> SummaryResult:
         """Summarize a research paper.
@@ -54,7 +60,6 @@ class HuggingFaceClient:
             text = self._prepare_text(paper_data)
             
             # Call HuggingFace API
-            api_url = self.API_URL.format(model=self.config.model)
             payload = {
                 "inputs": text,
                 "parameters": {
@@ -64,17 +69,23 @@ class HuggingFaceClient:
                 }
             }
             
-            response = self.session.post(
-                api_url,
-                headers=self.headers,
-                json=payload,
-                timeout=self.config.timeout
-            )
-            
-            if response.status_code != 200:
-                error_msg = f"API request failed: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                raise SummarizationError(error_msg)
+            with metrics.track("external_request", service="huggingface", operation="summarize"), \
+                    tracer.span("huggingface.summarize", model=self.config.model,
+                                arxiv_id=paper_data.get("arxiv_id", "unknown")) as span:
+                response = self.session.post(
+                    self.api_url,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=self.config.timeout
+                )
+                span.set_attributes(
+                    status_code=response.status_code, retry_count=self._retry_count(response)
+                )
+                
+                if response.status_code != 200:
+                    error_msg = f"API request failed: {response.status_code} - {response.text}"
+                    logger.error(error_msg)
+                    raise SummarizationError(error_msg)
 
             # Parse response
             result = response.json()
@@ -110,6 +121,12 @@ class HuggingFaceClient:
             logger.error(f"Unexpected error during summarization: {e}")
             raise SummarizationError(f"Summarization failed: {e}") from e
 
+    @staticmethod
+    def _retry_count(response: requests.Response) -> int:
+        """Number of retries the session adapter made before this response."""
+        retries = getattr(response.raw, "retries", None)
+        return len(retries.history) if isinstance(retries, Retry) else 0
+
     def _prepare_text(self, paper_data: Dict[str, Any]) -> str:
         """Prepare paper text for summarization.
         
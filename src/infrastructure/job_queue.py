@@ -0,0 +1,426 @@
+"""Durable pipeline job queue backed by the database.
+
+A job is split into tasks: one ``fetch`` task that lists papers, then one
+``process`` task per batch of papers. Workers claim tasks with
+``SELECT ... FOR UPDATE SKIP LOCKED`` and hold them under a lease; a task
+whose lease expires (worker crash or restart) is claimed again by the next
+worker, so a run always drains to completion.
+
+Finished jobs are kept for the admin dashboard until
+``python -m src.maintenance purge-jobs`` deletes them with their tasks.
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..core.exceptions import DatabaseError
+from .models import Base, PipelineJobModel, PipelineTaskModel
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_JOB_KEY = "pipeline"
+FINAL_JOB_STATUSES = ("completed", "failed")
+ACTIVE_TASK_STATUSES = ("pending", "running")
+
+
+@dataclass
+class PipelineJob:
+    """Snapshot of a pipeline job."""
+    id: UUID
+    status: str
+    config: Dict[str, Any]
+    total_papers: int
+    new_count: int
+    skipped_count: int
+    failed_count: int
+    error: Optional[str]
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+    @property
+    def processed(self) -> int:
+        """Papers with a final outcome so far."""
+        return self.new_count + self.skipped_count + self.failed_count
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job reached a final status."""
+        return self.status in FINAL_JOB_STATUSES
+
+    @classmethod
+    def from_model(cls, model: PipelineJobModel) -> "PipelineJob":
+        return cls(
+            id=model.id,
+            status=model.status,
+            config=model.config,
+            total_papers=model.total_papers,
+            new_count=model.new_count,
+            skipped_count=model.skipped_count,
+            failed_count=model.failed_count,
+            error=model.error,
+            created_at=model.created_at,
+            started_at=model.started_at,
+            finished_at=model.finished_at
+        )
+
+
+@dataclass
+class PipelineTask:
+    """A task claimed by a worker."""
+    id: UUID
+    job_id: UUID
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    worker_id: str
+
+
+class JobQueue:
+    """Queue of pipeline jobs and their tasks."""
+
+    def __init__(self, engine, lease_seconds: int = 300, max_attempts: int = 3):
+        """Initialize job queue.
+
+        Args:
+            engine: SQLAlchemy engine
+            lease_seconds: Seconds a claimed task stays locked without a heartbeat
+            max_attempts: Claims allowed per task before it is given up
+        """
+        self.engine = engine
+        self.lease = timedelta(seconds=lease_seconds)
+        self.max_attempts = max_attempts
+        self.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    def ensure_schema(self) -> None:
+        """Create the queue tables if they don't exist."""
+        Base.metadata.create_all(
+            bind=self.engine,
+            tables=[PipelineJobModel.__table__, PipelineTaskModel.__table__]
+        )
+
+    @contextmanager
+    def _transaction(self) -> Generator[Session, None, None]:
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Job queue error: {e}")
+            raise DatabaseError(f"Job queue operation failed: {e}") from e
+        finally:
+            session.close()
+
+    def enqueue(self, config: Dict[str, Any]) -> Tuple[PipelineJob, bool]:
+        """Queue a pipeline run unless one is already active.
+
+        Args:
+            config: Pipeline settings (categories, keywords, days_back, ...)
+
+        Returns:
+            Tuple[PipelineJob, bool]: The active job and whether it was created
+        """
+        try:
+            with self._transaction() as session:
+                active = self._active_job(session)
+                if active is not None:
+                    return PipelineJob.from_model(active), False
+
+                job = PipelineJobModel(status="queued", config=config, dedupe_key=ACTIVE_JOB_KEY)
+                session.add(job)
+                session.flush()
+                session.add(PipelineTaskModel(job_id=job.id, kind="fetch", payload={}))
+                created = PipelineJob.from_model(job)
+            logger.info(f"Queued pipeline job {created.id}")
+            return created, True
+        except DatabaseError as e:
+            if not isinstance(e.__cause__, IntegrityError):
+                raise
+            # Another process queued a job between our check and insert
+            with self._transaction() as session:
+                return PipelineJob.from_model(self._active_job(session)), False
+
+    def active_job(self) -> Optional[PipelineJob]:
+        """Return the queued or running job, if any."""
+        with self._transaction() as session:
+            job = self._active_job(session)
+            return PipelineJob.from_model(job) if job else None
+
+    def get_job(self, job_id: UUID) -> Optional[PipelineJob]:
+        """Return a job by ID."""
+        with self._transaction() as session:
+            job = session.get(PipelineJobModel, job_id)
+            return PipelineJob.from_model(job) if job else None
+
+    def depth(self) -> Dict[str, int]:
+        """Count pending and running tasks.
+
+        Finished tasks are left out so the count does not grow with the
+        job history.
+        """
+        with self._transaction() as session:
+            rows = session.execute(
+                select(PipelineTaskModel.status, func.count())
+                .where(PipelineTaskModel.status.in_(ACTIVE_TASK_STATUSES))
+                .group_by(PipelineTaskModel.status)
+            ).all()
+        depth = dict.fromkeys(ACTIVE_TASK_STATUSES, 0)
+        depth.update(rows)
+        return depth
+
+    def purge_finished(self, older_than: timedelta) -> int:
+        """Delete jobs that finished more than ``older_than`` ago.
+
+        Their tasks are removed by the foreign key cascade.
+
+        Args:
+            older_than: Age of the finished jobs to delete
+
+        Returns:
+            int: Jobs deleted
+        """
+        cutoff = datetime.utcnow() - older_than
+        with self._transaction() as session:
+            deleted = session.execute(
+                delete(PipelineJobModel)
+                .where(
+                    PipelineJobModel.status.in_(FINAL_JOB_STATUSES),
+                    PipelineJobModel.finished_at < cutoff
+                )
+                .execution_options(synchronize_session=False)
+            ).rowcount
+        logger.info(f"Purged {deleted} pipeline jobs finished before {cutoff:%Y-%m-%d %H:%M}")
+        return deleted
+
+    def claim(self, worker_id: str) -> Optional[PipelineTask]:
+        """Claim the oldest available task.
+
+        Pending tasks and running tasks whose lease expired are eligible.
+        Rows locked by other workers are skipped rather than waited on.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            Optional[PipelineTask]: Claimed task, or None if the queue is empty
+        """
+        while True:
+            with self._transaction() as session:
+                now = datetime.utcnow()
+                candidate = session.execute(
+                    select(PipelineTaskModel)
+                    .where(or_(
+                        PipelineTaskModel.status == "pending",
+                        and_(
+                            PipelineTaskModel.status == "running",
+                            PipelineTaskModel.locked_at < now - self.lease
+                        )
+                    ))
+                    .order_by(PipelineTaskModel.created_at)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                ).scalar_one_or_none()
+
+                if candidate is None:
+                    return None
+
+                if candidate.attempts >= self.max_attempts:
+                    error = candidate.error or "Lease expired too many times"
+                    self._give_up(session, candidate, error)
+                    continue
+
+                # Compare-and-set on attempts so the claim is also safe on
+                # databases without row locks (SQLite ignores FOR UPDATE)
+                claimed = session.execute(
+                    update(PipelineTaskModel)
+                    .where(
+                        PipelineTaskModel.id == candidate.id,
+                        PipelineTaskModel.attempts == candidate.attempts
+                    )
+                    .values(
+                        status="running",
+                        locked_by=worker_id,
+                        locked_at=now,
+                        attempts=PipelineTaskModel.attempts + 1
+                    )
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if not claimed:
+                    continue
+
+                session.execute(
+                    update(PipelineJobModel)
+                    .where(PipelineJobModel.id == candidate.job_id,
+                           PipelineJobModel.status == "queued")
+                    .values(status="running", started_at=now)
+                )
+                return PipelineTask(
+                    id=candidate.id,
+                    job_id=candidate.job_id,
+                    kind=candidate.kind,
+                    payload=candidate.payload,
+                    attempts=candidate.attempts + 1,
+                    worker_id=worker_id
+                )
+
+    def heartbeat(self, task: PipelineTask) -> bool:
+        """Extend the lease on a claimed task.
+
+        Returns:
+            bool: False if the lease was lost to another worker
+        """
+        with self._transaction() as session:
+            return bool(session.execute(
+                self._owned(task).values(locked_at=datetime.utcnow())
+            ).rowcount)
+
+    def add_batches(self, task: PipelineTask, items: List[Dict[str, Any]], batch_size: int) -> bool:
+        """Complete a fetch task by splitting its result into process tasks.
+
+        Args:
+            task: Claimed fetch task
+            items: JSON-serializable papers to process
+            batch_size: Papers per process task
+
+        Returns:
+            bool: False if the lease was lost and nothing was written
+        """
+        with self._transaction() as session:
+            if not self._finish_owned(session, task, "done"):
+                return False
+
+            session.add_all([
+                PipelineTaskModel(
+                    job_id=task.job_id, kind="process", payload={"papers": items[i:i + batch_size]}
+                )
+                for i in range(0, len(items), max(batch_size, 1))
+            ])
+            session.execute(
+                update(PipelineJobModel)
+                .where(PipelineJobModel.id == task.job_id)
+                .values(total_papers=len(items))
+            )
+            session.flush()
+            self._finish_job_if_drained(session, task.job_id)
+            return True
+
+    def complete(self, task: PipelineTask, new: int = 0, skipped: int = 0, failed: int = 0) -> bool:
+        """Complete a process task and add its outcomes to the job.
+
+        Returns:
+            bool: False if the lease was lost and the outcomes were discarded
+        """
+        with self._transaction() as session:
+            if not self._finish_owned(session, task, "done"):
+                return False
+            self._add_counts(session, task.job_id, new, skipped, failed)
+            self._finish_job_if_drained(session, task.job_id)
+            return True
+
+    def fail(self, task: PipelineTask, error: str) -> None:
+        """Release a task after an error, retrying it until attempts run out."""
+        with self._transaction() as session:
+            if task.attempts < self.max_attempts:
+                session.execute(
+                    self._owned(task).values(
+                        status="pending", locked_by=None, locked_at=None, error=error
+                    )
+                )
+                return
+
+            model = session.get(PipelineTaskModel, task.id)
+            if model is not None and model.locked_by == task.worker_id:
+                self._give_up(session, model, error)
+
+    def _active_job(self, session: Session) -> Optional[PipelineJobModel]:
+        return session.execute(
+            select(PipelineJobModel).where(PipelineJobModel.dedupe_key == ACTIVE_JOB_KEY)
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _owned(task: PipelineTask):
+        return update(PipelineTaskModel).where(
+            PipelineTaskModel.id == task.id,
+            PipelineTaskModel.status == "running",
+            PipelineTaskModel.locked_by == task.worker_id
+        ).execution_options(synchronize_session=False)
+
+    def _finish_owned(self, session: Session, task: PipelineTask, status: str) -> bool:
+        # The papers of a finished task are no longer needed; drop them from the row
+        finished = session.execute(
+            self._owned(task).values(
+                status=status, finished_at=datetime.utcnow(), error=None, payload={}
+            )
+        ).rowcount
+        if not finished:
+            logger.warning(f"Lost lease on task {task.id}; another worker will redo it")
+        return bool(finished)
+
+    def _give_up(self, session: Session, model: PipelineTaskModel, error: str) -> None:
+        logger.error(
+            f"Giving up on {model.kind} task {model.id} after {model.attempts} attempts: {error}"
+        )
+        model.status = "failed"
+        model.error = error
+        model.finished_at = datetime.utcnow()
+
+        if model.kind == "fetch":
+            session.execute(
+                update(PipelineJobModel)
+                .where(PipelineJobModel.id == model.job_id)
+                .values(error=error)
+            )
+        else:
+            self._add_counts(session, model.job_id, failed=len(model.payload.get("papers", [])))
+        session.flush()
+        self._finish_job_if_drained(session, model.job_id)
+
+    @staticmethod
+    def _add_counts(session: Session, job_id: UUID, new: int = 0, skipped: int = 0,
+                    failed: int = 0) -> None:
+        session.execute(
+            update(PipelineJobModel)
+            .where(PipelineJobModel.id == job_id)
+            .values(
+                new_count=PipelineJobModel.new_count + new,
+                skipped_count=PipelineJobModel.skipped_count + skipped,
+                failed_count=PipelineJobModel.failed_count + failed
+            )
+        )
+
+    @staticmethod
+    def _finish_job_if_drained(session: Session, job_id: UUID) -> None:
+        # Lock the job row so concurrent finishers agree on the last task
+        job = session.execute(
+            select(PipelineJobModel)
+            .where(PipelineJobModel.id == job_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).scalar_one()
+        if job.status in FINAL_JOB_STATUSES:
+            return
+
+        remaining = session.execute(
+            select(func.count())
+            .select_from(PipelineTaskModel)
+            .where(
+                PipelineTaskModel.job_id == job_id,
+                PipelineTaskModel.status.in_(("pending", "running"))
+            )
+        ).scalar()
+        if remaining:
+            return
+
+        job.status = "failed" if job.error else "completed"
+        job.dedupe_key = None
+        job.finished_at = datetime.utcnow()
+        logger.info(f"Pipeline job {job_id} {job.status}")
@@ -3,10 +3,13 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, String, Text, Date, Float, ForeignKey, DateTime, Table
+from sqlalchemy import (
+    DDL, Column, String, Text, Date, Float, ForeignKey, DateTime, Integer, Index, event
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+
+from ..types import UUID, ARRAY, JSONType
 
 Base = declarative_base()
 
@@ -15,7 +18,7 @@ class PaperModel(Base):
     """Database model for research papers."""
     __tablename__ = 'papers'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id = Column(UUID(), primary_key=True, default=uuid4)
     arxiv_id = Column(String(20), unique=True, nullable=False, index=True)
     title = Column(Text, nullable=False)
     authors = Column(ARRAY(Text), nullable=False)
@@ -29,12 +32,50 @@ class PaperModel(Base):
     summaries = relationship("SummaryModel", back_populates="paper", cascade="all, delete-orphan")
 
 
+class PaperCategoryModel(Base):
+    """One row per paper and category, used to filter by category on SQLite.
+
+    SQLite stores ``papers.categories`` as JSON text, which cannot be
+    indexed; triggers created with this table keep it in step with every
+    write to ``papers``. PostgreSQL filters the GIN-indexed array instead
+    and leaves this table empty.
+    """
+    __tablename__ = 'paper_categories'
+    __table_args__ = (
+        Index('idx_paper_categories_category', 'category', 'paper_id'),
+    )
+
+    paper_id = Column(UUID(), ForeignKey('papers.id', ondelete='CASCADE'), primary_key=True)
+    category = Column(String(50), primary_key=True)
+
+
+_INSERT_CATEGORIES = (
+    "INSERT OR IGNORE INTO paper_categories (paper_id, category) "
+    "SELECT NEW.id, value FROM json_each(NEW.categories);"
+)
+
+for _ddl in (
+    # Backfill papers that existed before the table
+    "INSERT OR IGNORE INTO paper_categories (paper_id, category) "
+    "SELECT papers.id, value FROM papers, json_each(papers.categories)",
+    f"CREATE TRIGGER IF NOT EXISTS papers_categories_insert AFTER INSERT ON papers "
+    f"BEGIN {_INSERT_CATEGORIES} END",
+    f"CREATE TRIGGER IF NOT EXISTS papers_categories_update AFTER UPDATE OF categories ON papers "
+    f"BEGIN DELETE FROM paper_categories WHERE paper_id = OLD.id; {_INSERT_CATEGORIES} END",
+    "CREATE TRIGGER IF NOT EXISTS papers_categories_delete AFTER DELETE ON papers "
+    "BEGIN DELETE FROM paper_categories WHERE paper_id = OLD.id; END",
+):
+    event.listen(
+        PaperCategoryModel.__table__, 'after_create', DDL(_ddl).execute_if(dialect='sqlite')
+    )
+
+
 class SummaryModel(Base):
     """Database model for paper summaries."""
     __tablename__ = 'summaries'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    paper_id = Column(UUID(as_uuid=True), ForeignKey('papers.id'), nullable=False, index=True)
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    paper_id = Column(UUID(), ForeignKey('papers.id'), nullable=False, index=True)
     summary = Column(Text, nullable=False)
     key_points = Column(ARRAY(Text))
     relevance_score = Column(Float)
@@ -43,3 +84,144 @@ class SummaryModel(Base):
 
     # Relationships
     paper = relationship("PaperModel", back_populates="summaries")
+
+
+class PaperScoreModel(Base):
+    """Database model for paper scoring runs (one row per scoring run)."""
+    __tablename__ = 'paper_scores'
+
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    paper_id = Column(UUID(), ForeignKey('papers.id', ondelete='CASCADE'), index=True)
+    total_score = Column(Float, nullable=False)
+    llm_score = Column(Float)
+    keyword_score = Column(Float)
+    citation_score = Column(Float)
+    temporal_score = Column(Float)
+    author_score = Column(Float)
+    explanation = Column(Text)
+    components = Column(JSONType)
+    metadata_ = Column('metadata', JSONType)
+    # Partition key on PostgreSQL (monthly ranges, see 08_partition_paper_scores.sql)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+
+class PipelineJobModel(Base):
+    """Database model for a queued or running pipeline run."""
+    __tablename__ = 'pipeline_jobs'
+
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    # queued, running, completed, failed
+    status = Column(String(20), nullable=False, default='queued')
+    config = Column(JSONType, nullable=False)
+    # Set while the job is active so only one run can be queued at a time
+    dedupe_key = Column(String(100), unique=True)
+    total_papers = Column(Integer, nullable=False, default=0)
+    new_count = Column(Integer, nullable=False, default=0)
+    skipped_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+
+class PipelineTaskModel(Base):
+    """Database model for one unit of work (fetch or batch of papers) of a job."""
+    __tablename__ = 'pipeline_tasks'
+    __table_args__ = (
+        Index('idx_pipeline_tasks_claim', 'status', 'created_at'),
+    )
+
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    job_id = Column(
+        UUID(), ForeignKey('pipeline_jobs.id', ondelete='CASCADE'), nullable=False, index=True
+    )
+    kind = Column(String(20), nullable=False)  # fetch, process
+    payload = Column(JSONType, nullable=False)
+    status = Column(String(20), nullable=False, default='pending')  # pending, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    locked_by = Column(String(100))
+    locked_at = Column(DateTime)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+
+class PipelineProgressModel(Base):
+    """Latest pipeline progress event per channel, shared by all web workers."""
+    __tablename__ = 'pipeline_progress'
+
+    # Also the LISTEN/NOTIFY channel name, hence PostgreSQL's identifier limit
+    channel = Column(String(63), primary_key=True)
+    payload = Column(Text, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class PipelineRunModel(Base):
+    """Outcome and resource use of one finished pipeline run, kept for capacity planning."""
+    __tablename__ = 'pipeline_runs'
+
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    source = Column(String(20), nullable=False)  # pipeline, worker
+    # Worker runs: the queued job, recorded once by whichever worker finishes it
+    job_id = Column(UUID(), unique=True)
+    status = Column(String(20), nullable=False)  # completed, failed
+    fetched = Column(Integer, nullable=False, default=0)
+    new_count = Column(Integer, nullable=False, default=0)
+    skipped_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    papers_per_minute = Column(Float)
+    # {stage: seconds}, {service: {count, seconds, mean_ms, errors}}, {operation: hit rate}
+    stage_seconds = Column(JSONType)
+    external_calls = Column(JSONType)
+    cache_hit_rates = Column(JSONType)
+    # Batch size, delays and lookback the run used
+    settings = Column(JSONType)
+    error = Column(Text)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=False, index=True)
+
+
+class RunSummaryModel(Base):
+    """Score distribution of one scoring run (main_v2 or rescoring), kept for history."""
+    __tablename__ = 'run_summaries'
+
+    id = Column(UUID(), primary_key=True, default=uuid4)
+    source = Column(String(20), nullable=False)  # main_v2, rescore
+    papers = Column(Integer, nullable=False, default=0)
+    mean_score = Column(Float)
+    score_stddev = Column(Float)
+    score_p50 = Column(Float)
+    score_p90 = Column(Float)
+    # CurationReport.summary() sections: per-component stats, category counts, top papers
+    components = Column(JSONType)
+    categories = Column(JSONType)
+    top_papers = Column(JSONType)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=False, index=True)
+
+
+class PaperLatestScoreModel(Base):
+    """Latest score per paper, maintained alongside every paper_scores write."""
+    __tablename__ = 'paper_latest_score'
+
+    paper_id = Column(UUID(), ForeignKey('papers.id', ondelete='CASCADE'), primary_key=True)
+    score_id = Column(UUID(), nullable=False)
+    total_score = Column(Float, nullable=False)
+    llm_score = Column(Float)
+    keyword_score = Column(Float)
+    citation_score = Column(Float)
+    temporal_score = Column(Float)
+    author_score = Column(Float)
+    explanation = Column(Text)
+    # Copied from papers so top-N feeds are a single index range scan
+    published_date = Column(Date, nullable=False)
+    scored_at = Column(DateTime, nullable=False)
+
+
+# Top-N feeds read this index in order
+Index(
+    'idx_paper_latest_score_top',
+    PaperLatestScoreModel.total_score.desc(),
+    PaperLatestScoreModel.published_date.desc()
+)
@@ -9,6 +9,8 @@ from requests.exceptions import RequestException
 
 from ..core.exceptions import SummarizationError
 from ..core.config import OllamaConfig
+from ..utils.metrics import metrics
+from ..utils.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -50,16 +52,20 @@ class OllamaClient:
                 }
             }
 
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                timeout=self.config.timeout
-            )
-            
-            if response.status_code != 200:
-                error_msg = f"Ollama API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                raise SummarizationError(error_msg)
+            with metrics.track("external_request", service="ollama", operation="analyze"), \
+                    tracer.span("ollama.analyze", model=self.config.model,
+                                arxiv_id=paper_data.get("arxiv_id", "unknown")) as span:
+                response = requests.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=self.config.timeout
+                )
+                span.set_attribute("status_code", response.status_code)
+                
+                if response.status_code != 200:
+                    error_msg = f"Ollama API error: {response.status_code} - {response.text}"
+                    logger.error(error_msg)
+                    raise SummarizationError(error_msg)
             
             result = response.json()
             analysis_text = result.get("response", "")
@@ -96,13 +102,19 @@ class OllamaClient:
                 }
             }
 
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                timeout=self.config.timeout
-            )
+            with metrics.track("external_request", service="ollama", operation="score"), \
+                    tracer.span("ollama.score", model=self.config.model,
+                                arxiv_id=paper_data.get("arxiv_id", "unknown")) as span:
+                response = requests.post(
+                    self.api_url,
+                    json=payload,
+                    timeout=self.config.timeout
+                )
+                span.set_attribute("status_code", response.status_code)
             
             if response.status_code != 200:
+                metrics.increment("external_request_errors_total", service="ollama",
+                                  operation="score")
                 logger.warning(f"Ollama scoring failed, using default score")
                 return 0.5
             
@@ -0,0 +1,179 @@
+"""Maintenance of the monthly ``paper_scores`` partitions.
+
+The partitioned table and ``create_paper_scores_partition()`` come from
+``database/init/08_partition_paper_scores.sql``. Run the retention job
+daily (``python -m src.maintenance retention``) to:
+
+1. create partitions for the coming months,
+2. roll old scoring runs up to the latest run per paper,
+3. detach partitions past the retention window into the ``archive`` schema.
+
+Papers whose latest score only exists in an archived partition read as
+unscored until they are rescored; archived partitions remain queryable as
+``archive.paper_scores_YYYY_MM``.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PATTERN = re.compile(r"^paper_scores_(\d{4})_(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing ``day``."""
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    """First day of the month ``months`` away from ``day``'s month."""
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month covered by a partition name, or None for other tables."""
+    match = PARTITION_PATTERN.match(name)
+    return date(int(match.group(1)), int(match.group(2)), 1) if match else None
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention run."""
+    created: List[str] = field(default_factory=list)
+    rolled_up: int = 0
+    archived: List[str] = field(default_factory=list)
+
+
+class PartitionManager:
+    """Creates, rolls up and archives ``paper_scores`` partitions."""
+
+    def __init__(self, engine, months_ahead: int = 3, rollup_after_months: int = 3,
+                 archive_after_months: int = 24, archive_schema: str = "archive"):
+        """Initialize partition manager.
+
+        Args:
+            engine: SQLAlchemy engine bound to PostgreSQL
+            months_ahead: Future monthly partitions to keep ready
+            rollup_after_months: Age after which superseded runs are deleted
+            archive_after_months: Age after which partitions are detached
+            archive_schema: Schema receiving detached partitions
+        """
+        self.engine = engine
+        self.months_ahead = months_ahead
+        self.rollup_after_months = rollup_after_months
+        self.archive_after_months = archive_after_months
+        self.archive_schema = archive_schema
+
+    @property
+    def supported(self) -> bool:
+        """Partitioning is only available on PostgreSQL."""
+        return self.engine.dialect.name == "postgresql"
+
+    def months_to_create(self, today: date) -> List[date]:
+        """Months from the current one up to ``months_ahead`` ahead."""
+        return [add_months(today, offset) for offset in range(self.months_ahead + 1)]
+
+    def cold_partitions(self, partitions: List[Tuple[str, date]], today: date) -> List[str]:
+        """Partitions entirely older than the archive window, oldest first."""
+        cutoff = add_months(today, -self.archive_after_months)
+        return [
+            name for name, month in sorted(partitions, key=lambda p: p[1])
+            if add_months(month, 1) <= cutoff
+        ]
+
+    def list_partitions(self) -> List[Tuple[str, date]]:
+        """Attached monthly partitions and the month each covers."""
+        with self.engine.connect() as conn:
+            names = conn.execute(text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'paper_scores'
+            """)).scalars()
+            return [(name, partition_month(name)) for name in names if partition_month(name)]
+
+    def ensure_partitions(self, today: Optional[date] = None) -> List[str]:
+        """Create missing partitions for the current and coming months.
+
+        Returns:
+            List[str]: Names of partitions that were created
+        """
+        if not self.supported:
+            return []
+
+        created = []
+        with self.engine.begin() as conn:
+            for month in self.months_to_create(today or date.today()):
+                name = conn.execute(
+                    text("SELECT create_paper_scores_partition(:month)"), {"month": month}
+                ).scalar()
+                if name:
+                    logger.info(f"Created partition {name}")
+                    created.append(name)
+        return created
+
+    def roll_up(self, today: Optional[date] = None) -> int:
+        """Delete scoring runs superseded by a newer run of the same paper.
+
+        Only runs older than ``rollup_after_months`` are touched, so recent
+        history stays available for comparisons.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        if not self.supported:
+            return 0
+
+        cutoff = add_months(today or date.today(), -self.rollup_after_months)
+        with self.engine.begin() as conn:
+            deleted = conn.execute(text("""
+                DELETE FROM paper_scores ps
+                WHERE ps.created_at < :cutoff
+                  AND EXISTS (
+                      SELECT 1 FROM paper_scores newer
+                      WHERE newer.paper_id = ps.paper_id
+                        AND (newer.created_at, newer.id) > (ps.created_at, ps.id)
+                  )
+            """), {"cutoff": cutoff}).rowcount
+        logger.info(f"Rolled up {deleted} superseded scoring runs older than {cutoff}")
+        return deleted
+
+    def archive(self, today: Optional[date] = None) -> List[str]:
+        """Detach cold partitions and move them into the archive schema.
+
+        Returns:
+            List[str]: Names of archived partitions
+        """
+        if not self.supported:
+            return []
+
+        archived = []
+        for name in self.cold_partitions(self.list_partitions(), today or date.today()):
+            with self.engine.begin() as conn:
+                conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.archive_schema}"'))
+                conn.execute(text(f'ALTER TABLE paper_scores DETACH PARTITION "{name}"'))
+                conn.execute(text(f'ALTER TABLE "{name}" SET SCHEMA "{self.archive_schema}"'))
+            logger.info(f"Archived partition {name} to {self.archive_schema}")
+            archived.append(name)
+        return archived
+
+    def run_retention(self, today: Optional[date] = None) -> RetentionReport:
+        """Create upcoming partitions, roll up old runs and archive cold months."""
+        if not self.supported:
+            logger.info("Partition maintenance skipped: database is not PostgreSQL")
+            return RetentionReport()
+
+        today = today or date.today()
+        return RetentionReport(
+            created=self.ensure_partitions(today),
+            rolled_up=self.roll_up(today),
+            archived=self.archive(today)
+        )
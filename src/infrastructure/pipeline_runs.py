@@ -0,0 +1,328 @@
+"""Pipeline run history, one row per finished run in ``pipeline_runs``.
+
+Besides outcome counts, each run stores what it cost, taken from the
+process metrics over the run: seconds per pipeline stage, calls and mean
+latency per external service, and the compiled statement cache hit rate
+per lookup.
+
+    run_metrics = RunMetrics()
+    ...  # run the pipeline
+    store.record("pipeline", started_at, status="completed", fetched=40, new=12, ...,
+                 **run_metrics.collect())
+
+``trends`` turns recent rows into throughput and latency series for the
+admin API.
+"""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Generator, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..core.exceptions import DatabaseError
+from ..utils.metrics import LabelValues, MetricsRegistry, metrics
+from .models import Base, PipelineRunModel
+
+logger = logging.getLogger(__name__)
+
+# Services whose latency the trends report
+TREND_SERVICES = ("huggingface", "ollama")
+
+
+def _difference(end: Dict[LabelValues, tuple],
+                start: Dict[LabelValues, tuple]) -> Dict[LabelValues, tuple]:
+    return {
+        key: (count - start.get(key, (0, 0.0))[0], total - start.get(key, (0, 0.0))[1])
+        for key, (count, total) in end.items()
+    }
+
+
+class RunMetrics:
+    """Metrics recorded since creation, read from the process-wide registry.
+
+    Values are per process: a run split across worker processes only sees
+    its own share.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics):
+        """Start measuring.
+
+        Args:
+            registry: Metrics registry the run records into
+        """
+        self.registry = registry
+        self._start = self._read()
+
+    def _read(self) -> Dict[str, Dict[LabelValues, tuple]]:
+        return {
+            "stages": self.registry.totals("pipeline_stage_seconds", "stage"),
+            "calls": self.registry.totals("external_request_seconds", "service"),
+            "errors": self.registry.totals("external_request_errors_total", "service"),
+            "cache": self.registry.totals("db_statement_cache_total", "operation", "result")
+        }
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Stage time, external calls and cache hit rates since creation.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: ``stage_seconds``, ``external_calls``
+            and ``cache_hit_rates``, as stored in ``pipeline_runs``
+        """
+        end = self._read()
+        delta = {
+            section: _difference(values, self._start[section]) for section, values in end.items()
+        }
+
+        external_calls = {}
+        for (service,), (count, seconds) in delta["calls"].items():
+            if count:
+                external_calls[service] = {
+                    "count": int(count),
+                    "seconds": round(seconds, 3),
+                    "mean_ms": round(seconds / count * 1000, 1),
+                    "errors": int(delta["errors"].get((service,), (0, 0.0))[0])
+                }
+
+        lookups: Dict[str, Dict[str, float]] = {}
+        for (operation, result), (count, _) in delta["cache"].items():
+            lookups.setdefault(operation, {})[result] = count
+        cache_hit_rates = {
+            operation: round(counts.get("hit", 0) / sum(counts.values()), 3)
+            for operation, counts in lookups.items() if sum(counts.values())
+        }
+
+        return {
+            "stage_seconds": {
+                stage: round(seconds, 3)
+                for (stage,), (count, seconds) in delta["stages"].items() if count
+            },
+            "external_calls": external_calls,
+            "cache_hit_rates": cache_hit_rates
+        }
+
+
+@dataclass
+class PipelineRun:
+    """Stored record of one pipeline run."""
+    id: UUID
+    source: str
+    job_id: Optional[UUID]
+    status: str
+    fetched: int
+    new_count: int
+    skipped_count: int
+    failed_count: int
+    papers_per_minute: Optional[float]
+    stage_seconds: Dict[str, float]
+    external_calls: Dict[str, Dict[str, float]]
+    cache_hit_rates: Dict[str, float]
+    settings: Dict[str, Any]
+    error: Optional[str]
+    started_at: datetime
+    finished_at: datetime
+
+    @property
+    def processed(self) -> int:
+        """Papers with a final outcome."""
+        return self.new_count + self.skipped_count + self.failed_count
+
+    @property
+    def duration_seconds(self) -> float:
+        """Wall-clock duration of the run."""
+        return (self.finished_at - self.started_at).total_seconds()
+
+    def latency_ms(self, service: str) -> Optional[float]:
+        """Mean latency of a service's calls during the run, if it was called."""
+        calls = self.external_calls.get(service)
+        return calls["mean_ms"] if calls else None
+
+    @classmethod
+    def from_model(cls, model: PipelineRunModel) -> "PipelineRun":
+        return cls(
+            id=model.id,
+            source=model.source,
+            job_id=model.job_id,
+            status=model.status,
+            fetched=model.fetched,
+            new_count=model.new_count,
+            skipped_count=model.skipped_count,
+            failed_count=model.failed_count,
+            papers_per_minute=model.papers_per_minute,
+            stage_seconds=model.stage_seconds or {},
+            external_calls=model.external_calls or {},
+            cache_hit_rates=model.cache_hit_rates or {},
+            settings=model.settings or {},
+            error=model.error,
+            started_at=model.started_at,
+            finished_at=model.finished_at
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for the admin API."""
+        return {
+            "id": str(self.id),
+            "source": self.source,
+            "job_id": str(self.job_id) if self.job_id else None,
+            "status": self.status,
+            "fetched": self.fetched,
+            "new": self.new_count,
+            "skipped": self.skipped_count,
+            "failed": self.failed_count,
+            "papers_per_minute": self.papers_per_minute,
+            "stage_seconds": self.stage_seconds,
+            "external_calls": self.external_calls,
+            "cache_hit_rates": self.cache_hit_rates,
+            "settings": self.settings,
+            "error": self.error,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat(),
+            "duration_seconds": round(self.duration_seconds, 1)
+        }
+
+
+class PipelineRunStore:
+    """Records pipeline runs and reports trends over them."""
+
+    def __init__(self, engine):
+        """Initialize pipeline run store.
+
+        Args:
+            engine: SQLAlchemy engine
+        """
+        self.engine = engine
+        self.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    def ensure_schema(self) -> None:
+        """Create the pipeline runs table if it doesn't exist."""
+        Base.metadata.create_all(bind=self.engine, tables=[PipelineRunModel.__table__])
+
+    @contextmanager
+    def _transaction(self) -> Generator[Session, None, None]:
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Pipeline run history error: {e}")
+            raise DatabaseError(f"Pipeline run history operation failed: {e}") from e
+        finally:
+            session.close()
+
+    def record(self, source: str, started_at: datetime, status: str = "completed",
+               fetched: int = 0, new: int = 0, skipped: int = 0, failed: int = 0,
+               finished_at: Optional[datetime] = None,
+               stage_seconds: Optional[Dict[str, float]] = None,
+               external_calls: Optional[Dict[str, Dict[str, float]]] = None,
+               cache_hit_rates: Optional[Dict[str, float]] = None,
+               settings: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None, job_id: Optional[UUID] = None) -> PipelineRun:
+        """Store a finished run.
+
+        Args:
+            source: Run kind, ``pipeline`` or ``worker``
+            started_at: Run start (UTC)
+            status: ``completed`` or ``failed``
+            fetched: Papers fetched from arXiv
+            new: Papers stored
+            skipped: Papers already known
+            failed: Papers that could not be processed
+            finished_at: Run end (UTC); now by default
+            stage_seconds: Seconds per pipeline stage
+            external_calls: Calls, seconds, mean latency and errors per service
+            cache_hit_rates: Statement cache hit rate per lookup
+            settings: Settings the run used (batch size, delays, ...)
+            error: Failure message
+            job_id: Queued job of a worker run; recorded at most once
+
+        Returns:
+            PipelineRun: Stored run
+
+        Raises:
+            DatabaseError: If the run cannot be stored, e.g. its job was already recorded
+        """
+        finished_at = finished_at or datetime.utcnow()
+        minutes = (finished_at - started_at).total_seconds() / 60
+        processed = new + skipped + failed
+        with self._transaction() as session:
+            model = PipelineRunModel(
+                source=source,
+                job_id=job_id,
+                status=status,
+                fetched=fetched,
+                new_count=new,
+                skipped_count=skipped,
+                failed_count=failed,
+                papers_per_minute=round(processed / minutes, 2) if minutes > 0 else None,
+                stage_seconds=stage_seconds or {},
+                external_calls=external_calls or {},
+                cache_hit_rates=cache_hit_rates or {},
+                settings=settings or {},
+                error=error,
+                started_at=started_at,
+                finished_at=finished_at
+            )
+            session.add(model)
+            session.flush()
+            run = PipelineRun.from_model(model)
+        logger.info(f"Recorded {source} pipeline run {run.id} ({status}, {processed} papers)")
+        return run
+
+    def recent(self, limit: int = 50, source: Optional[str] = None) -> List[PipelineRun]:
+        """Latest runs, newest first.
+
+        Args:
+            limit: Maximum number of runs
+            source: Only runs of this kind
+
+        Returns:
+            List[PipelineRun]: Runs
+        """
+        stmt = select(PipelineRunModel).order_by(PipelineRunModel.finished_at.desc()).limit(limit)
+        if source:
+            stmt = stmt.where(PipelineRunModel.source == source)
+        with self._transaction() as session:
+            return [PipelineRun.from_model(model) for model in session.execute(stmt).scalars()]
+
+    def trends(self, limit: int = 50, source: Optional[str] = None) -> Dict[str, Any]:
+        """Throughput and latency of recent runs, oldest first, with their averages.
+
+        Args:
+            limit: Maximum number of runs
+            source: Only runs of this kind
+
+        Returns:
+            Dict[str, Any]: ``points`` with, per run, papers/min, mean
+            HuggingFace and Ollama latency and the batch settings, and
+            ``averages`` of the throughput and latencies over those runs
+        """
+        runs = list(reversed(self.recent(limit, source)))
+        points = []
+        for run in runs:
+            point = {
+                "finished_at": run.finished_at.isoformat(),
+                "source": run.source,
+                "status": run.status,
+                "processed": run.processed,
+                "papers_per_minute": run.papers_per_minute,
+                "batch_size": run.settings.get("batch_size"),
+                "paper_delay": run.settings.get("paper_delay")
+            }
+            for service in TREND_SERVICES:
+                point[f"{service}_latency_ms"] = run.latency_ms(service)
+            points.append(point)
+
+        averages = {}
+        keys = ("papers_per_minute",) + tuple(
+            f"{service}_latency_ms" for service in TREND_SERVICES
+        )
+        for key in keys:
+            values = [point[key] for point in points if point[key] is not None]
+            averages[key] = round(sum(values) / len(values), 2) if values else None
+        return {"runs": len(points), "points": points, "averages": averages}
@@ -0,0 +1,533 @@
+"""Pipeline progress events published across worker processes."""
+
+import json
+import logging
+import os
+import select
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional, Iterator, Dict, Any, List, Tuple
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHANNEL = "pipeline_progress"
+# DB-API drivers PostgresProgressBackend can LISTEN with (psycopg needs 3.2+)
+LISTEN_DRIVERS = ("psycopg2", "psycopg")
+# Seconds the listener waits for notifications before checking for subscribers
+LISTEN_POLL_SECONDS = 5.0
+# Seconds before a listener whose connection failed reconnects
+LISTEN_RETRY_SECONDS = 5.0
+
+
+@dataclass
+class ProgressEvent:
+    """Snapshot of a pipeline run at a point in time."""
+    run_id: str
+    status: str  # idle, starting, running, completed, error
+    stage: str
+    message: str = ""
+    progress: int = 0  # 0-100
+    total: int = 0
+    processed: int = 0
+    new: int = 0
+    skipped: int = 0
+    failed: int = 0
+    arxiv_id: Optional[str] = None
+    throughput: float = 0.0  # papers per second
+    eta_seconds: Optional[float] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_json(self) -> str:
+        """Encode the event as compact JSON."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "ProgressEvent":
+        """Decode an event published by another process."""
+        return cls(**json.loads(payload))
+
+    def to_status(self) -> Dict[str, Any]:
+        """Legacy ``/admin/pipeline-status`` shape plus the new counters."""
+        return asdict(self)
+
+    def is_active(self, max_age: float = 600.0) -> bool:
+        """Whether a run is in progress and has reported recently.
+
+        Args:
+            max_age: Seconds after which a silent run is considered dead
+
+        Returns:
+            bool: True if the run is starting or running
+        """
+        return self.status in ("starting", "running") and time.time() - self.timestamp < max_age
+
+
+IDLE_EVENT = ProgressEvent(run_id="", status="idle", stage="idle")
+
+
+class ProgressBackend(ABC):
+    """Transport for progress events between processes."""
+
+    @abstractmethod
+    def publish(self, channel: str, payload: str) -> None:
+        """Publish a payload to every subscriber of a channel."""
+
+    @abstractmethod
+    def latest(self, channel: str) -> Optional[str]:
+        """Return the last payload published on a channel."""
+
+    @abstractmethod
+    def subscribe(self, channel: str, timeout: float) -> Iterator[Optional[str]]:
+        """Yield payloads as they arrive, or None after ``timeout`` seconds idle."""
+
+
+class _Subscribers:
+    """Open subscriptions of this process, per channel."""
+
+    def __init__(self):
+        self._channels: Dict[str, List[Tuple[deque, threading.Event]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, channel: str) -> Tuple[deque, threading.Event]:
+        entry = (deque(), threading.Event())
+        with self._lock:
+            self._channels.setdefault(channel, []).append(entry)
+        return entry
+
+    def remove(self, channel: str, entry: Tuple[deque, threading.Event]) -> None:
+        with self._lock:
+            self._channels[channel].remove(entry)
+
+    def count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._channels.get(channel, []))
+
+    def publish(self, channel: str, payload: str) -> None:
+        with self._lock:
+            for queue, ready in self._channels.get(channel, []):
+                queue.append(payload)
+                ready.set()
+
+    @staticmethod
+    def stream(entry: Tuple[deque, threading.Event], timeout: float) -> Iterator[Optional[str]]:
+        queue, ready = entry
+        while True:
+            if not queue and not ready.wait(timeout):
+                yield None
+                continue
+            ready.clear()
+            while queue:
+                yield queue.popleft()
+
+
+class InMemoryProgressBackend(ProgressBackend):
+    """Single-process backend, used in tests and the CLI."""
+
+    def __init__(self):
+        self._latest: Dict[str, str] = {}
+        self._subscribers = _Subscribers()
+
+    def publish(self, channel: str, payload: str) -> None:
+        self._latest[channel] = payload
+        self._subscribers.publish(channel, payload)
+
+    def latest(self, channel: str) -> Optional[str]:
+        return self._latest.get(channel)
+
+    def subscribe(self, channel: str, timeout: float) -> Iterator[Optional[str]]:
+        entry = self._subscribers.add(channel)
+        try:
+            yield from self._subscribers.stream(entry, timeout)
+        finally:
+            self._subscribers.remove(channel, entry)
+
+
+class LocalSocketProgressBackend(ProgressBackend):
+    """Fan-out over Unix datagram sockets for workers on one host.
+
+    Each subscriber binds a socket in a shared directory; publishers send
+    to every socket found there and keep the latest payload in a file.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize local socket backend.
+
+        Args:
+            directory: Shared directory for subscriber sockets
+        """
+        self.directory = Path(directory or Path(tempfile.gettempdir()) / "arxiv-curator-progress")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+
+    def publish(self, channel: str, payload: str) -> None:
+        data = payload.encode("utf-8")
+        latest_path = self.directory / f"{channel}.latest"
+        tmp_path = latest_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, latest_path)
+
+        for sock_path in self.directory.glob(f"{channel}.*.sock"):
+            try:
+                self._sender.sendto(data, str(sock_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Subscriber went away without cleaning up
+                sock_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not deliver progress event to {sock_path}: {e}")
+
+    def latest(self, channel: str) -> Optional[str]:
+        try:
+            return (self.directory / f"{channel}.latest").read_text("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def subscribe(self, channel: str, timeout: float) -> Iterator[Optional[str]]:
+        sock_path = self.directory / f"{channel}.{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(sock_path))
+        sock.settimeout(timeout)
+        try:
+            while True:
+                try:
+                    yield sock.recv(65536).decode("utf-8")
+                except socket.timeout:
+                    yield None
+        finally:
+            sock.close()
+            sock_path.unlink(missing_ok=True)
+
+
+class PostgresProgressBackend(ProgressBackend):
+    """LISTEN/NOTIFY backend shared by every worker using the database.
+
+    The latest payload is also stored in ``pipeline_progress`` (created by
+    ``python -m src.maintenance migrate``) so that a worker which was not
+    listening can still answer status requests. On other databases only
+    that row is kept; there is nothing to subscribe to.
+
+    Subscribers do not hold database connections: each process LISTENs on
+    one connection of its own, opened directly rather than from the
+    engine's pool, and a listener thread hands notifications to every open
+    subscription. The connection is closed once nobody is subscribed.
+    """
+
+    def __init__(self, engine):
+        """Initialize PostgreSQL backend.
+
+        Args:
+            engine: SQLAlchemy engine bound to PostgreSQL
+        """
+        self.engine = engine
+        self._subscribers = _Subscribers()
+        self._listeners: Dict[str, threading.Thread] = {}
+        self._listener_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, payload: str) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+                INSERT INTO pipeline_progress (channel, payload, updated_at)
+                VALUES (:channel, :payload, CURRENT_TIMESTAMP)
+                ON CONFLICT (channel)
+                DO UPDATE SET payload = EXCLUDED.payload, updated_at = EXCLUDED.updated_at
+            """), {"channel": channel, "payload": payload})
+            if conn.dialect.name == "postgresql":
+                conn.execute(text("SELECT pg_notify(:channel, :payload)"),
+                             {"channel": channel, "payload": payload})
+
+    def latest(self, channel: str) -> Optional[str]:
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT payload FROM pipeline_progress WHERE channel = :channel"),
+                {"channel": channel}
+            ).scalar()
+
+    def subscribe(self, channel: str, timeout: float) -> Iterator[Optional[str]]:
+        driver = self.engine.dialect.driver
+        if driver not in LISTEN_DRIVERS:
+            raise ValueError(
+                f"Progress subscriptions need the psycopg2 or psycopg driver, not {driver}; "
+                f"set PROGRESS_BACKEND=socket to use another driver"
+            )
+
+        entry = self._subscribers.add(channel)
+        try:
+            self._ensure_listener(channel)
+            yield from self._subscribers.stream(entry, timeout)
+        finally:
+            self._subscribers.remove(channel, entry)
+
+    def _ensure_listener(self, channel: str) -> None:
+        with self._lock:
+            if self._listener_pid != os.getpid():
+                # Threads do not survive a fork: a forked process starts its own
+                self._listeners, self._listener_pid = {}, os.getpid()
+            listener = self._listeners.get(channel)
+            if listener is None or not listener.is_alive():
+                listener = threading.Thread(
+                    target=self._listen, args=(channel,), name=f"progress-listener-{channel}",
+                    daemon=True
+                )
+                self._listeners[channel] = listener
+                listener.start()
+
+    def _listen(self, channel: str) -> None:
+        """Listener thread: relay notifications to this process's subscribers."""
+        notifies = (
+            self._notifies_psycopg if self.engine.dialect.driver == "psycopg"
+            else self._notifies_psycopg2
+        )
+        while True:
+            dbapi_conn = None
+            try:
+                dbapi_conn = self._connect()
+                with dbapi_conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{channel}"')
+                for payload in notifies(dbapi_conn, LISTEN_POLL_SECONDS):
+                    if payload is not None:
+                        self._subscribers.publish(channel, payload)
+                    elif self._stop_if_unused(channel):
+                        return
+            except Exception as e:
+                logger.warning(
+                    f"Progress listener on {channel} failed, "
+                    f"reconnecting in {LISTEN_RETRY_SECONDS:.0f}s: {e}"
+                )
+            finally:
+                if dbapi_conn is not None:
+                    try:
+                        dbapi_conn.close()
+                    except Exception:
+                        pass
+            if self._stop_if_unused(channel):
+                return
+            time.sleep(LISTEN_RETRY_SECONDS)
+
+    def _connect(self):
+        """Open a DB-API connection outside the engine's pool."""
+        dialect = self.engine.dialect
+        cargs, cparams = dialect.create_connect_args(self.engine.url)
+        dbapi_conn = dialect.connect(*cargs, **cparams)
+        dbapi_conn.autocommit = True
+        return dbapi_conn
+
+    def _stop_if_unused(self, channel: str) -> bool:
+        # Decided under the lock so a new subscriber either sees this
+        # listener running or starts the next one
+        with self._lock:
+            if self._subscribers.count(channel):
+                return False
+            if self._listeners.get(channel) is threading.current_thread():
+                del self._listeners[channel]
+            return True
+
+    @staticmethod
+    def _notifies_psycopg(dbapi_conn, timeout: float) -> Iterator[Optional[str]]:
+        while True:
+            idle = True
+            for notify in dbapi_conn.notifies(timeout=timeout):
+                idle = False
+                yield notify.payload
+            if idle:
+                yield None
+
+    @staticmethod
+    def _notifies_psycopg2(dbapi_conn, timeout: float) -> Iterator[Optional[str]]:
+        while True:
+            if not select.select([dbapi_conn], [], [], timeout)[0]:
+                yield None
+                continue
+            dbapi_conn.poll()
+            while dbapi_conn.notifies:
+                yield dbapi_conn.notifies.pop(0).payload
+
+
+class ProgressBus:
+    """Publishes and streams pipeline progress events."""
+
+    def __init__(self, backend: ProgressBackend, channel: str = DEFAULT_CHANNEL):
+        """Initialize progress bus.
+
+        Args:
+            backend: Event transport
+            channel: Channel name shared by publishers and subscribers
+        """
+        self.backend = backend
+        self.channel = channel
+
+    def publish(self, event: ProgressEvent) -> None:
+        """Publish an event; failures are logged, never raised."""
+        try:
+            self.backend.publish(self.channel, event.to_json())
+        except Exception as e:
+            logger.warning(f"Failed to publish progress event: {e}")
+
+    def latest(self) -> ProgressEvent:
+        """Return the most recent event, or an idle event."""
+        try:
+            payload = self.backend.latest(self.channel)
+        except Exception as e:
+            logger.warning(f"Failed to read latest progress event: {e}")
+            payload = None
+        return ProgressEvent.from_json(payload) if payload else IDLE_EVENT
+
+    def subscribe(self, timeout: float = 15.0) -> Iterator[Optional[ProgressEvent]]:
+        """Yield events as they are published, or None on idle timeout."""
+        for payload in self.backend.subscribe(self.channel, timeout):
+            yield ProgressEvent.from_json(payload) if payload else None
+
+
+def create_progress_backend(engine=None, kind: Optional[str] = None) -> ProgressBackend:
+    """Create the progress backend for this deployment.
+
+    Args:
+        engine: SQLAlchemy engine, used for the PostgreSQL backend
+        kind: ``postgres``, ``socket`` or ``memory``; defaults to the
+            ``PROGRESS_BACKEND`` environment variable, then to ``postgres``
+            when the engine is PostgreSQL and ``socket`` otherwise
+
+    Returns:
+        ProgressBackend: Configured backend
+    """
+    kind = kind or os.getenv("PROGRESS_BACKEND")
+    if not kind:
+        is_postgres = engine is not None and engine.dialect.name == "postgresql"
+        kind = "postgres" if is_postgres else "socket"
+
+    if kind == "postgres":
+        return PostgresProgressBackend(engine)
+    if kind == "socket":
+        return LocalSocketProgressBackend(os.getenv("PROGRESS_SOCKET_DIR"))
+    if kind == "memory":
+        return InMemoryProgressBackend()
+    raise ValueError(f"Unknown progress backend: {kind}")
+
+
+class ProgressTracker:
+    """Tracks counters for one pipeline run and publishes events."""
+
+    # Progress bands per stage, matching the dashboard's progress bar
+    STAGE_RANGES = {
+        "initializing": (5, 10),
+        "fetching": (20, 40),
+        "processing": (40, 90),
+        "completed": (100, 100),
+    }
+
+    def __init__(self, bus: ProgressBus, run_id: Optional[str] = None):
+        """Initialize progress tracker.
+
+        Args:
+            bus: Bus to publish events on
+            run_id: Run identifier; generated when omitted
+        """
+        self.bus = bus
+        self.run_id = run_id or uuid.uuid4().hex
+        self.stage = "initializing"
+        self.total = 0
+        self.processed = 0
+        self.new = 0
+        self.skipped = 0
+        self.failed = 0
+        self._processing_started: Optional[float] = None
+
+    def start(self, message: str) -> ProgressEvent:
+        """Announce that a run has been requested."""
+        self.stage = "initializing"
+        return self._emit("starting", message)
+
+    def start_stage(self, stage: str, message: str) -> ProgressEvent:
+        """Enter a pipeline stage."""
+        self.stage = stage
+        if stage == "processing":
+            self._processing_started = self._processing_started or time.time()
+        return self._emit("running", message)
+
+    def resume(self, total: int, new: int, skipped: int, failed: int,
+               started_at: Optional[float] = None) -> None:
+        """Restore counters of a run continued by another process.
+
+        Args:
+            total: Papers in the run
+            new: Papers summarized so far
+            skipped: Papers skipped so far
+            failed: Papers failed so far
+            started_at: Epoch seconds when processing started
+        """
+        self.total = total
+        self.new, self.skipped, self.failed = new, skipped, failed
+        self.processed = new + skipped + failed
+        self._processing_started = started_at
+
+    def set_total(self, total: int) -> None:
+        """Record how many papers this run will process."""
+        self.total = total
+
+    def paper_started(self, arxiv_id: str, title: str = "") -> ProgressEvent:
+        """Announce the paper being processed."""
+        message = f"Processing paper {self.processed + 1}/{self.total}: {title[:50]}..."
+        return self._emit("running", message, arxiv_id=arxiv_id)
+
+    def paper_finished(self, arxiv_id: str, outcome: str) -> ProgressEvent:
+        """Record a paper outcome (``new``, ``skipped`` or ``failed``)."""
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        self.processed += 1
+        return self._emit("running", f"Processed {self.processed}/{self.total}", arxiv_id=arxiv_id)
+
+    def complete(self, message: str) -> ProgressEvent:
+        """Mark the run as completed."""
+        self.stage = "completed"
+        return self._emit("completed", message)
+
+    def fail(self, message: str) -> ProgressEvent:
+        """Mark the run as failed."""
+        return self._emit("error", message, progress=0)
+
+    def throughput(self) -> float:
+        """Papers processed per second since processing started."""
+        if not self._processing_started or not self.processed:
+            return 0.0
+        elapsed = time.time() - self._processing_started
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until all papers are processed."""
+        rate = self.throughput()
+        if not rate or not self.total:
+            return None
+        return max(self.total - self.processed, 0) / rate
+
+    def _progress(self) -> int:
+        low, high = self.STAGE_RANGES.get(self.stage, (0, 0))
+        if self.stage == "processing" and self.total:
+            return low + int((self.processed / self.total) * (high - low))
+        return low
+
+    def _emit(self, status: str, message: str, arxiv_id: Optional[str] = None,
+              progress: Optional[int] = None) -> ProgressEvent:
+        event = ProgressEvent(
+            run_id=self.run_id,
+            status=status,
+            stage=self.stage,
+            message=message,
+            progress=self._progress() if progress is None else progress,
+            total=self.total,
+            processed=self.processed,
+            new=self.new,
+            skipped=self.skipped,
+            failed=self.failed,
+            arxiv_id=arxiv_id,
+            throughput=round(self.throughput(), 3),
+            eta_seconds=self.eta_seconds()
+        )
+        self.bus.publish(event)
+        return event
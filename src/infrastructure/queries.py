@@ -0,0 +1,240 @@
+"""Paper queries shared by the layered and legacy database managers.
+
+Statements are built on the Core tables so either manager can execute
+them; rows come back as lightweight named tuples instead of ORM objects.
+
+Hot single-row lookups are built once at import with bound parameters, so
+each call skips statement construction and cache-key generation and hits
+the engine's compiled cache directly.
+
+Detail statements return each paper with its latest summary and latest
+score in the same row, so views showing both never lazy-load the
+``summaries`` relationship per paper.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import Result, Select, bindparam, select, func
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.orm import aliased
+
+from ..domain.value_objects import PaperFilter
+from ..types import array_contains, array_overlap
+from ..utils.metrics import metrics
+from .models import PaperModel, PaperCategoryModel, PaperLatestScoreModel, SummaryModel
+
+PAPER_COLUMNS = (
+    PaperModel.id,
+    PaperModel.arxiv_id,
+    PaperModel.title,
+    PaperModel.authors,
+    PaperModel.abstract,
+    PaperModel.published_date,
+    PaperModel.categories,
+    PaperModel.pdf_url,
+    PaperModel.created_at
+)
+
+_newest_summary = aliased(SummaryModel, name="newest_summary")
+
+# Id of the newest summary of the paper in the enclosing query. Joining on
+# it works like a lateral join (one index probe per paper) on every dialect.
+LATEST_SUMMARY_ID = (
+    select(_newest_summary.id)
+    .where(_newest_summary.paper_id == PaperModel.id)
+    .order_by(_newest_summary.created_at.desc())
+    .limit(1)
+    .correlate(PaperModel)
+    .scalar_subquery()
+)
+
+DETAIL_COLUMNS = PAPER_COLUMNS + (
+    PaperLatestScoreModel.total_score.label("relevance_score"),
+    PaperLatestScoreModel.llm_score,
+    PaperLatestScoreModel.keyword_score,
+    PaperLatestScoreModel.citation_score,
+    PaperLatestScoreModel.temporal_score,
+    PaperLatestScoreModel.author_score,
+    PaperLatestScoreModel.explanation.label("score_explanation"),
+    PaperLatestScoreModel.scored_at,
+    SummaryModel.summary,
+    SummaryModel.key_points,
+    SummaryModel.model_used.label("summary_model"),
+    SummaryModel.created_at.label("summarized_at")
+)
+
+# Execute with {"arxiv_id": ...}
+PAPER_ID_BY_ARXIV_ID = select(PaperModel.id).where(PaperModel.arxiv_id == bindparam("arxiv_id"))
+
+PAPER_BY_ARXIV_ID = select(
+    *PAPER_COLUMNS,
+    PaperLatestScoreModel.total_score.label("relevance_score")
+).outerjoin(
+    PaperLatestScoreModel, PaperLatestScoreModel.paper_id == PaperModel.id
+).where(PaperModel.arxiv_id == bindparam("arxiv_id"))
+
+
+_SELECT_DETAILS = select(*DETAIL_COLUMNS).select_from(PaperModel).outerjoin(
+    PaperLatestScoreModel, PaperLatestScoreModel.paper_id == PaperModel.id
+).outerjoin(
+    SummaryModel, SummaryModel.id == LATEST_SUMMARY_ID
+)
+
+PAPER_DETAIL_BY_ARXIV_ID = _SELECT_DETAILS.where(PaperModel.arxiv_id == bindparam("arxiv_id"))
+
+
+def apply_paper_filter(stmt: Select, paper_filter: PaperFilter, dialect_name: str) -> Select:
+    """Add the WHERE clauses of a paper filter to a statement.
+
+    A ``min_score`` bound reads ``paper_latest_score``, which the statement
+    must already join.
+
+    Args:
+        stmt: Statement selecting from ``papers``
+        paper_filter: Date, category, score and ingestion filters
+        dialect_name: Dialect the statement will run on
+
+    Returns:
+        Select: Filtered statement
+    """
+    if paper_filter.date_from:
+        stmt = stmt.where(PaperModel.published_date >= paper_filter.date_from)
+    if paper_filter.date_to:
+        stmt = stmt.where(PaperModel.published_date <= paper_filter.date_to)
+    if paper_filter.created_after:
+        stmt = stmt.where(PaperModel.created_at >= paper_filter.created_after)
+    if paper_filter.categories:
+        stmt = stmt.where(categories_match(paper_filter.categories, dialect_name))
+    if paper_filter.min_score is not None:
+        stmt = stmt.where(PaperLatestScoreModel.total_score >= paper_filter.min_score)
+    return stmt
+
+
+def categories_match(categories: Iterable[str], dialect_name: str, match_all: bool = False,
+                     paper=PaperModel):
+    """Match papers in any (or, with ``match_all``, every) of the categories.
+
+    PostgreSQL tests the GIN-indexed ``categories`` array; SQLite looks the
+    categories up in the ``paper_categories`` side table instead of parsing
+    every row's JSON.
+
+    Args:
+        categories: Category names
+        dialect_name: Dialect the statement will run on
+        match_all: Require every category rather than any
+        paper: Mapped paper class (the legacy model maps the same table)
+
+    Returns:
+        Boolean clause for a statement selecting from ``papers``
+    """
+    categories = list(categories)
+    if dialect_name == 'postgresql':
+        predicate = array_contains if match_all else array_overlap
+        return predicate(paper.categories, categories, dialect_name)
+
+    matching = select(PaperCategoryModel.paper_id).where(
+        PaperCategoryModel.category.in_(categories)
+    )
+    if match_all:
+        matching = matching.group_by(PaperCategoryModel.paper_id).having(
+            func.count() == len(set(categories))
+        )
+    return paper.id.in_(matching)
+
+
+def select_papers(paper_filter: Optional[PaperFilter], dialect_name: str,
+                  limit: Optional[int] = None) -> Select:
+    """Select paper columns matching a filter, newest first.
+
+    Args:
+        paper_filter: Optional filter; None matches every paper
+        dialect_name: Dialect the statement will run on
+        limit: Optional maximum number of rows
+
+    Returns:
+        Select: Statement yielding ``PAPER_COLUMNS`` rows
+    """
+    paper_filter = paper_filter or PaperFilter()
+    stmt = _with_score_join(select(*PAPER_COLUMNS), paper_filter)
+    stmt = apply_paper_filter(stmt, paper_filter, dialect_name)
+    stmt = stmt.order_by(PaperModel.published_date.desc(), PaperModel.arxiv_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def select_paper_details(paper_filter: Optional[PaperFilter], dialect_name: str,
+                         limit: Optional[int] = None, offset: int = 0) -> Select:
+    """Select papers with their latest summary and score, newest first.
+
+    Args:
+        paper_filter: Optional filter; None matches every paper
+        dialect_name: Dialect the statement will run on
+        limit: Optional maximum number of rows
+        offset: Number of rows to skip
+
+    Returns:
+        Select: Statement yielding ``DETAIL_COLUMNS`` rows; summary and
+        score columns are None for papers without them
+    """
+    paper_filter = paper_filter or PaperFilter()
+    stmt = apply_paper_filter(_SELECT_DETAILS, paper_filter, dialect_name)
+    stmt = stmt.order_by(PaperModel.published_date.desc(), PaperModel.arxiv_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+def select_paper_count(paper_filter: Optional[PaperFilter], dialect_name: str) -> Select:
+    """Count the papers matching a filter.
+
+    Args:
+        paper_filter: Optional filter; None counts every paper
+        dialect_name: Dialect the statement will run on
+
+    Returns:
+        Select: Scalar count statement
+    """
+    paper_filter = paper_filter or PaperFilter()
+    stmt = _with_score_join(select(func.count()).select_from(PaperModel), paper_filter)
+    return apply_paper_filter(stmt, paper_filter, dialect_name)
+
+
+def _with_score_join(stmt: Select, paper_filter: PaperFilter) -> Select:
+    if paper_filter.min_score is None:
+        return stmt
+    return stmt.join(PaperLatestScoreModel, PaperLatestScoreModel.paper_id == PaperModel.id)
+
+
+def cache_hit(result: Result) -> bool:
+    """Whether the statement behind a result was found in the compiled cache.
+
+    Args:
+        result: Result of a Core or ORM execution
+
+    Returns:
+        bool: True if SQLAlchemy reused a cached compilation
+    """
+    # ORM executions wrap the cursor result as ``raw``
+    cursor = getattr(result, "raw", None) or result
+    context = getattr(cursor, "context", None)
+    return getattr(context, "cache_hit", None) == CacheStats.CACHE_HIT
+
+
+def record_cache_lookup(result: Result, operation: str) -> bool:
+    """``cache_hit`` of a lookup, also counted in ``db_statement_cache_total``.
+
+    Args:
+        result: Result of a Core or ORM execution
+        operation: Database manager operation, e.g. ``paper_exists``
+
+    Returns:
+        bool: True if SQLAlchemy reused a cached compilation
+    """
+    hit = cache_hit(result)
+    metrics.increment(
+        "db_statement_cache_total", operation=operation, result="hit" if hit else "miss"
+    )
+    return hit
@@ -0,0 +1,156 @@
+"""History of scoring runs, one compact row per run in ``run_summaries``."""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Generator, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..core.exceptions import DatabaseError
+from ..domain.report import CurationReport
+from .models import Base, RunSummaryModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunSummary:
+    """Stored summary of one scoring run."""
+    id: UUID
+    source: str
+    papers: int
+    mean_score: Optional[float]
+    score_stddev: Optional[float]
+    score_p50: Optional[float]
+    score_p90: Optional[float]
+    components: Dict[str, Dict[str, float]]
+    categories: Dict[str, int]
+    top_papers: List[Dict[str, Any]]
+    started_at: datetime
+    finished_at: datetime
+
+    @classmethod
+    def from_model(cls, model: RunSummaryModel) -> "RunSummary":
+        return cls(
+            id=model.id,
+            source=model.source,
+            papers=model.papers,
+            mean_score=model.mean_score,
+            score_stddev=model.score_stddev,
+            score_p50=model.score_p50,
+            score_p90=model.score_p90,
+            components=model.components or {},
+            categories=model.categories or {},
+            top_papers=model.top_papers or [],
+            started_at=model.started_at,
+            finished_at=model.finished_at
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready form for the admin API."""
+        return {
+            "id": str(self.id),
+            "source": self.source,
+            "papers": self.papers,
+            "mean_score": self.mean_score,
+            "score_stddev": self.score_stddev,
+            "score_p50": self.score_p50,
+            "score_p90": self.score_p90,
+            "components": self.components,
+            "categories": self.categories,
+            "top_papers": self.top_papers,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat(),
+            "duration_seconds": round((self.finished_at - self.started_at).total_seconds(), 1)
+        }
+
+
+class RunSummaryStore:
+    """Records and lists scoring run summaries."""
+
+    def __init__(self, engine):
+        """Initialize run summary store.
+
+        Args:
+            engine: SQLAlchemy engine
+        """
+        self.engine = engine
+        self.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    def ensure_schema(self) -> None:
+        """Create the run summaries table if it doesn't exist."""
+        Base.metadata.create_all(bind=self.engine, tables=[RunSummaryModel.__table__])
+
+    @contextmanager
+    def _transaction(self) -> Generator[Session, None, None]:
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Run summary error: {e}")
+            raise DatabaseError(f"Run summary operation failed: {e}") from e
+        finally:
+            session.close()
+
+    def record(self, report: CurationReport, source: str, started_at: datetime,
+               finished_at: Optional[datetime] = None) -> RunSummary:
+        """Store the summary of a finished run.
+
+        Args:
+            report: Report accumulated during the run
+            source: Run kind, e.g. ``main_v2`` or ``rescore``
+            started_at: Run start (UTC)
+            finished_at: Run end (UTC); now by default
+
+        Returns:
+            RunSummary: Stored summary
+        """
+        summary = report.summary()
+        score = summary["score"]
+        with self._transaction() as session:
+            model = RunSummaryModel(
+                source=source,
+                papers=summary["papers"],
+                mean_score=score["mean"] if report.count else None,
+                score_stddev=score["stddev"] if report.count else None,
+                score_p50=score["p50"] if report.count else None,
+                score_p90=score["p90"] if report.count else None,
+                components=summary["components"],
+                categories=summary["categories"],
+                top_papers=summary["top"],
+                started_at=started_at,
+                finished_at=finished_at or datetime.utcnow()
+            )
+            session.add(model)
+            session.flush()
+            stored = RunSummary.from_model(model)
+        logger.info(f"Recorded {source} run summary {stored.id} ({stored.papers} papers)")
+        return stored
+
+    def recent(self, limit: int = 20, source: Optional[str] = None) -> List[RunSummary]:
+        """Latest run summaries, newest first.
+
+        Args:
+            limit: Maximum number of runs
+            source: Only runs of this kind
+
+        Returns:
+            List[RunSummary]: Run summaries
+        """
+        stmt = select(RunSummaryModel).order_by(RunSummaryModel.finished_at.desc()).limit(limit)
+        if source:
+            stmt = stmt.where(RunSummaryModel.source == source)
+        with self._transaction() as session:
+            return [RunSummary.from_model(model) for model in session.execute(stmt).scalars()]
+
+    def latest(self, source: Optional[str] = None) -> Optional[RunSummary]:
+        """The most recent run summary, if any."""
+        runs = self.recent(limit=1, source=source)
+        return runs[0] if runs else None
@@ -0,0 +1,140 @@
+"""Batched score writes keeping ``paper_latest_score`` in step.
+
+Every scoring run is appended to ``paper_scores``; in the same transaction
+the per-paper projection is upserted, so readers that only need the
+current score never touch the run history.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .models import PaperModel, PaperScoreModel, PaperLatestScoreModel
+
+logger = logging.getLogger(__name__)
+
+SCORE_COLUMNS = (
+    'total_score', 'llm_score', 'keyword_score', 'citation_score',
+    'temporal_score', 'author_score', 'explanation'
+)
+
+paper_scores = PaperScoreModel.__table__
+paper_latest_score = PaperLatestScoreModel.__table__
+
+
+def score_row(paper_id, result) -> Dict[str, Any]:
+    """Build a ``paper_scores`` row from a scoring result.
+
+    Args:
+        paper_id: Scored paper ID
+        result: ScoringResult from a scoring strategy
+
+    Returns:
+        Dict[str, Any]: Row for write_scores
+    """
+    components = result.components or {}
+
+    def component(name):
+        value = components.get(name)
+        return value.get('score') if isinstance(value, dict) else value
+
+    return {
+        'paper_id': paper_id,
+        'total_score': result.score,
+        'llm_score': component('llm_scorer'),
+        'keyword_score': component('keyword_scorer'),
+        'citation_score': component('citation_scorer'),
+        'temporal_score': component('temporal_scorer'),
+        'author_score': component('author_scorer'),
+        'explanation': result.explanation,
+        'components': components,
+        'metadata': result.metadata
+    }
+
+
+def write_scores(session: Session, scores: List[Dict[str, Any]]) -> int:
+    """Append scoring runs and upsert the latest score per paper.
+
+    The caller owns the transaction; both tables are written through
+    ``session`` so they commit or roll back together.
+
+    Args:
+        session: Open database session
+        scores: Rows with ``paper_id`` (UUID or its string form),
+            ``total_score``, component scores, ``explanation``,
+            ``components``, ``metadata`` and optionally ``created_at``
+
+    Returns:
+        int: Number of scoring runs written
+    """
+    if not scores:
+        return 0
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            **score,
+            'id': score.get('id') or uuid4(),
+            'paper_id': as_uuid(score['paper_id']),
+            'created_at': score.get('created_at') or now
+        }
+        for score in scores
+    ]
+    session.execute(paper_scores.insert(), rows)
+
+    # One projection row per paper: the newest run of this batch
+    latest = {}
+    for row in rows:
+        current = latest.get(row['paper_id'])
+        if current is None or row['created_at'] >= current['created_at']:
+            latest[row['paper_id']] = row
+
+    published = dict(session.execute(
+        select(PaperModel.id, PaperModel.published_date).where(PaperModel.id.in_(list(latest)))
+    ).all())
+
+    missing = [paper_id for paper_id in latest if paper_id not in published]
+    if missing:
+        logger.warning(
+            f"Scores written for {len(missing)} unknown papers, not projected: "
+            f"{', '.join(str(paper_id) for paper_id in missing[:10])}"
+        )
+
+    projection = [
+        {
+            'paper_id': paper_id,
+            'score_id': row['id'],
+            **{column: row.get(column) for column in SCORE_COLUMNS},
+            'published_date': published[paper_id],
+            'scored_at': row['created_at']
+        }
+        for paper_id, row in latest.items()
+        if paper_id in published
+    ]
+    if projection:
+        # executemany: a multi-row VALUES would hit SQLite's bound-parameter limit
+        session.execute(_upsert_latest(session), projection)
+
+    return len(rows)
+
+
+def as_uuid(value) -> UUID:
+    """A paper ID as a UUID, whether given as a UUID or as its string form."""
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _upsert_latest(session: Session):
+    insert = sqlite.insert if session.get_bind().dialect.name == 'sqlite' else postgresql.insert
+    stmt = insert(paper_latest_score)
+    updated = ('score_id', *SCORE_COLUMNS, 'published_date', 'scored_at')
+    return stmt.on_conflict_do_update(
+        index_elements=[paper_latest_score.c.paper_id],
+        set_={column: stmt.excluded[column] for column in updated},
+        # A slower writer finishing late must not replace a newer score
+        where=paper_latest_score.c.scored_at <= stmt.excluded.scored_at
+    )
@@ -1,6 +1,8 @@
 """Main application entry point."""
 
+import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -13,8 +15,12 @@ from .infrastructure import (
     HuggingFaceClient,
     OllamaClient
 )
+from .infrastructure.pipeline_runs import PipelineRunStore
 from .services import CurationService, PipelineService
 from .utils.logging import setup_logging
+from .utils import profiling
+from .utils.metrics import metrics
+from .utils.tracing import configure_from_env
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +34,8 @@ def initialize_components(config: Config):
     Returns:
         tuple: Initialized components (db_manager, curation_service, pipeline_service)
     """
-    # Initialize database
+    # Initialize database (schema comes from `python -m src.maintenance migrate`)
     db_session = DatabaseSession(config.database)
-    db_session.create_tables()
     db_manager = DatabaseManager(db_session)
     
     # Initialize clients
@@ -55,17 +60,27 @@ def initialize_components(config: Config):
     
     pipeline_service = PipelineService(
         curation_service=curation_service,
-        processing_config=config.processing
+        processing_config=config.processing,
+        run_history=PipelineRunStore(db_session.engine)
     )
     
     return db_manager, curation_service, pipeline_service
 
-def main():
+def main(argv=None):
     """Main application entry point."""
+    parser = argparse.ArgumentParser(description="Run the ArXiv curation pipeline")
+    parser.add_argument('--memory-budget-mb', type=float,
+                        help="Resident memory limit for the run "
+                             "(default: MEMORY_BUDGET_MB; 0 disables it)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    
     try:
         # Load configuration
         config = Config.from_environment()
         config.validate()
+        if args.memory_budget_mb is not None:
+            config.processing.memory_budget_mb = args.memory_budget_mb
         
         # Setup logging
         setup_logging(config.log_level, config.log_dir)
@@ -74,14 +89,18 @@ def main():
         logger.info(f"Configuration loaded: {config.arxiv.categories}")
         
         # Initialize components
+        configure_from_env()
         db_manager, curation_service, pipeline_service = initialize_components(config)
         
         # Run pipeline
-        results = pipeline_service.run_pipeline()
+        summary_path = os.getenv("METRICS_SUMMARY_PATH")
+        with profiling.profiled_run(args, "pipeline", summary_path):
+            results = pipeline_service.run_pipeline()
         
         # Log results
         logger.info("Pipeline execution completed")
         logger.info(f"Results: {results}")
+        metrics.write_summary(summary_path)
         
         return 0
         
@@ -1,15 +1,27 @@
 """Updated ArXiv curation pipeline with advanced scoring system."""
 
+import argparse
 import logging
+import os
 import time
 import asyncio
-from typing import List, Dict, Optional
+from dataclasses import fields
+from typing import Dict, Iterable, Optional
 from datetime import datetime
 
 from src.config import Config
 from src.arxiv_client import ArxivClient
 from src.hf_client import HuggingFaceClient
 from src.database import DatabaseManager
+from src.core.exceptions import DatabaseError
+from src.domain.entities import PaperMetadata
+from src.domain.report import CurationReport
+from src.infrastructure.run_summaries import RunSummaryStore
+from src.utils import profiling
+from src.utils.memory import MemoryBudget
+from src.utils.metrics import metrics
+from src.utils.profiling import profiler
+from src.utils.tracing import configure_from_env, tracer
 from src.scoring import (
     ScoringConfig,
     create_scorer,
@@ -17,9 +29,11 @@ from src.scoring import (
     Paper
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ArXiv client paper keys that make up PaperMetadata
+PAPER_FIELDS = tuple(field.name for field in fields(PaperMetadata))
+
 
 class ArxivCurationPipeline:
     def __init__(self, config: Config, scoring_config: Optional[ScoringConfig] = None):
@@ -30,27 +44,18 @@ class ArxivCurationPipeline:
         self.arxiv_client = ArxivClient(config.arxiv_categories, config.arxiv_keywords)
         self.hf_client = HuggingFaceClient(
             model=config.hf_model,
-            api_key=config.hf_token
+            api_key=config.hf_token,
+            api_url=config.hf_api_url or None
         )
         self.db_manager = DatabaseManager(config.database_url)
+        self.run_summaries = RunSummaryStore(self.db_manager.engine)
+        self.memory_budget = MemoryBudget(config.memory_budget_mb)
         
         # Initialize scorer
         self.scorer = create_scorer(self.scoring_config)
     
     async def score_paper(self, paper_data: Dict) -> Dict:
         """Score a paper using the configured scoring system."""
-        # Convert to Paper object
-        paper = Paper(
-            arxiv_id=paper_data['arxiv_id'],
-            title=paper_data['title'],
-            abstract=paper_data.get('abstract', paper_data.get('summary', '')),
-            authors=paper_data.get('authors', []),
-            categories=paper_data.get('categories', []),
-            published_date=paper_data.get('published', datetime.now()),
-            pdf_url=paper_data.get('pdf_url', ''),
-            metadata=paper_data
-        )
-        
         # Create context from configuration
         context = {
             'research_interests': self.scoring_config.keywords,
@@ -59,6 +64,11 @@ class ArxivCurationPipeline:
         
         # Score the paper
         try:
+            # Validated like every other paper entering the domain
+            paper = Paper.from_row(
+                PaperMetadata(**{name: paper_data[name] for name in PAPER_FIELDS}),
+                metadata=paper_data
+            )
             result = await self.scorer.score(paper, context)
             return {
                 'score': result.score,
@@ -67,7 +77,7 @@ class ArxivCurationPipeline:
                 'metadata': result.metadata
             }
         except Exception as e:
-            logger.error(f"Error scoring paper {paper.arxiv_id}: {e}")
+            logger.error(f"Error scoring paper {paper_data['arxiv_id']}: {e}")
             return {
                 'score': 0.5,
                 'explanation': f"Scoring failed: {str(e)}",
@@ -75,97 +85,126 @@ class ArxivCurationPipeline:
                 'metadata': {'error': str(e)}
             }
     
-    async def process_papers_async(self, papers: List[Dict]) -> List[Dict]:
-        """Process papers asynchronously with scoring."""
-        results = []
+    async def process_papers_async(self, papers: Iterable[Dict],
+                                   report: Optional[CurationReport] = None) -> CurationReport:
+        """Process papers asynchronously with scoring.
+        
+        Papers are consumed one at a time and only folded into the report,
+        so memory does not grow with the number of papers.
+        """
+        report = report if report is not None else CurationReport()
         
         for paper_data in papers:
-            # Check if paper already exists
-            if self.db_manager.paper_exists(paper_data['arxiv_id']):
-                logger.info(f"Paper {paper_data['arxiv_id']} already exists, skipping...")
-                continue
+            with profiler.scope(), tracer.span("paper", arxiv_id=paper_data['arxiv_id']) as span:
+                # Check if paper already exists
+                if self.db_manager.paper_exists(paper_data['arxiv_id']):
+                    logger.info(f"Paper {paper_data['arxiv_id']} already exists, skipping...")
+                    span.set_attribute("outcome", "skipped")
+                    continue
             
-            # Score the paper
-            score_result = await self.score_paper(paper_data)
+                # Score the paper
+                score_result = await self.score_paper(paper_data)
+                span.set_attribute("score", score_result['score'])
             
-            logger.info(f"Paper: {paper_data['title'][:60]}...")
-            logger.info(f"  Score: {score_result['score']:.3f}")
-            # Format components for logging
-            comp_str = ', '.join(
-                f"{k}: {v:.2f}" if isinstance(v, (int, float)) 
-                else f"{k}: {v.get('score', 0):.2f}" 
-                for k, v in score_result['components'].items()
-            )
-            logger.info(f"  Components: {comp_str}")
+                logger.info(f"Paper: {paper_data['title'][:60]}...")
+                logger.info(f"  Score: {score_result['score']:.3f}")
+                # Format components for logging
+                comp_str = ', '.join(
+                    f"{k}: {v:.2f}" if isinstance(v, (int, float))
+                    else f"{k}: {v.get('score', 0):.2f}"
+                    for k, v in score_result['components'].items()
+                )
+                logger.info(f"  Components: {comp_str}")
             
-            # Only process papers above threshold
-            if score_result['score'] < self.config.min_relevance_score:
-                logger.info(f"  → Skipped (below threshold of {self.config.min_relevance_score})")
-                continue
+                # Only process papers above threshold
+                if score_result['score'] < self.config.min_relevance_score:
+                    logger.info(
+                        f"  → Skipped (below threshold of {self.config.min_relevance_score})"
+                    )
+                    span.set_attribute("outcome", "below_threshold")
+                    continue
             
-            # Save paper to database
-            paper = self.db_manager.save_paper(paper_data)
-            if not paper:
-                continue
+                # Save paper to database
+                paper = self.db_manager.save_paper(paper_data)
+                if not paper:
+                    span.set_attribute("outcome", "failed")
+                    continue
             
-            # Generate summary
-            logger.info(f"Generating summary for: {paper.title} (score: {score_result['score']:.2f})")
-            # Update paper_data to ensure it has 'summary' key for HF client
-            if 'summary' not in paper_data and 'abstract' in paper_data:
-                paper_data['summary'] = paper_data['abstract']
-            summary_data = self.hf_client.summarize_paper(paper_data)
+                # Generate summary
+                logger.info(
+                    f"Generating summary for: {paper.title} (score: {score_result['score']:.2f})"
+                )
+                # Update paper_data to ensure it has 'summary' key for HF client
+                if 'summary' not in paper_data and 'abstract' in paper_data:
+                    paper_data['summary'] = paper_data['abstract']
+                summary_data = self.hf_client.summarize_paper(paper_data)
             
-            if summary_data:
-                # Add scoring data to summary (only fields that exist in the model)
-                summary_data['relevance_score'] = score_result['score']
-                # Remove extra fields that don't exist in the Summary model
-                summary_data.pop('score_explanation', None)
-                summary_data.pop('score_components', None)
+                if summary_data:
+                    # Add scoring data to summary (only fields that exist in the model)
+                    summary_data['relevance_score'] = score_result['score']
+                    # Remove extra fields that don't exist in the Summary model
+                    summary_data.pop('score_explanation', None)
+                    summary_data.pop('score_components', None)
                 
-                self.db_manager.save_summary(paper.id, summary_data)
+                    self.db_manager.save_summary(paper.id, summary_data)
+                    span.set_attribute("outcome", "new")
                 
-                results.append({
-                    'paper': paper_data,
-                    'score': score_result,
-                    'summary': summary_data
-                })
+                    report.add(
+                        paper_data['arxiv_id'], paper_data['title'], score_result['score'],
+                        score_result['explanation'], score_result['components'],
+                        paper_data.get('categories', ())
+                    )
+            
+            self.memory_budget.tick()
             
             # Rate limiting
-            await asyncio.sleep(2)
+            if self.config.paper_delay:
+                await asyncio.sleep(self.config.paper_delay)
+                metrics.increment("rate_limit_sleep_seconds_total", self.config.paper_delay,
+                                  component="pipeline")
         
-        return results
+        return report
     
     def run(self, days_back: int = 7):
         """Run the complete pipeline with scoring."""
         logger.info("Starting ArXiv curation pipeline with advanced scoring...")
         logger.info(f"Using HuggingFace model: {self.config.hf_model}")
         logger.info(f"Minimum relevance score: {self.config.min_relevance_score}")
+        started_at = datetime.utcnow()
         
-        # 1. Fetch papers from ArXiv
-        papers = self.arxiv_client.fetch_recent_papers(
-            max_results=self.config.arxiv_max_results,
-            days_back=days_back
+        # 1. Stream papers from ArXiv; the fetch stage times only the waits for them
+        papers = metrics.track_iteration(
+            self.arxiv_client.iter_recent_papers(
+                max_results=self.config.arxiv_max_results,
+                days_back=days_back
+            ),
+            "pipeline_stage", stage="fetch"
         )
-        logger.info(f"Fetched {len(papers)} papers from ArXiv")
         
         # 2. Process papers with scoring (async)
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         
         try:
-            results = loop.run_until_complete(self.process_papers_async(papers))
+            with metrics.track("pipeline_stage", stage="process"):
+                report = loop.run_until_complete(self.process_papers_async(papers))
             
-            # 3. Generate report
-            self._generate_report(results)
+            # 3. Generate report and keep its summary for the run history
+            self._generate_report(report)
+            try:
+                self.run_summaries.record(report, "main_v2", started_at)
+            except DatabaseError as e:
+                logger.warning(f"Could not record run summary: {e}")
             
         finally:
             loop.close()
         
-        logger.info(f"Pipeline completed. Processed {len(results)} high-quality papers.")
+        logger.info(f"Pipeline completed. Processed {report.count} high-quality papers.")
+        metrics.write_summary(os.getenv('METRICS_SUMMARY_PATH'))
     
-    def _generate_report(self, results: List[Dict]):
-        """Generate a report of processed papers."""
-        if not results:
+    def _generate_report(self, report: CurationReport):
+        """Log the top papers and average scores of a run."""
+        if not report.count:
             logger.info("No papers met the relevance threshold.")
             return
         
@@ -173,49 +212,48 @@ class ArxivCurationPipeline:
         logger.info("CURATION REPORT")
         logger.info("="*80)
         
-        # Sort by score
-        results.sort(key=lambda x: x['score']['score'], reverse=True)
-        
-        for i, result in enumerate(results[:10], 1):  # Top 10
-            paper = result['paper']
-            score = result['score']
-            
-            logger.info(f"\n{i}. {paper['title']}")
-            logger.info(f"   ArXiv ID: {paper['arxiv_id']}")
-            logger.info(f"   Score: {score['score']:.3f} - {score['explanation']}")
+        for i, entry in enumerate(report.top(), 1):
+            logger.info(f"\n{i}. {entry.title}")
+            logger.info(f"   ArXiv ID: {entry.arxiv_id}")
+            logger.info(f"   Score: {entry.score:.3f} - {entry.explanation}")
             logger.info(f"   Components: " + ", ".join(
-                f"{k}: {v:.2f}" if isinstance(v, (int, float)) else f"{k}: {v['score']:.2f}"
-                for k, v in score['components'].items()
+                f"{k}: {v:.2f}" for k, v in entry.components.items()
             ))
         
         # Summary statistics
-        avg_score = sum(r['score']['score'] for r in results) / len(results)
-        logger.info(f"\nTotal papers processed: {len(results)}")
-        logger.info(f"Average relevance score: {avg_score:.3f}")
+        logger.info(f"\nTotal papers processed: {report.count}")
+        logger.info(f"Average relevance score: {report.mean_score:.3f} "
+                    f"(stddev {report.scores.stddev:.3f}, "
+                    f"median {report.scores.quantile(0.5):.3f}, "
+                    f"p90 {report.scores.quantile(0.9):.3f})")
         
-        # Component analysis
-        component_totals = {}
-        for result in results:
-            for comp, value in result['score']['components'].items():
-                if isinstance(value, dict) and 'score' in value:
-                    score_val = value['score']
-                else:
-                    score_val = value
-                
-                if comp not in component_totals:
-                    component_totals[comp] = []
-                component_totals[comp].append(score_val)
+        logger.info("\nComponent scores (mean / stddev / median):")
+        for comp, stats in report.components.items():
+            logger.info(
+                f"  {comp}: {stats.mean:.3f} / {stats.stddev:.3f} / {stats.quantile(0.5):.3f}"
+            )
         
-        logger.info("\nAverage component scores:")
-        for comp, scores in component_totals.items():
-            avg = sum(scores) / len(scores)
-            logger.info(f"  {comp}: {avg:.3f}")
+        if report.categories:
+            logger.info("\nPapers per category: " + ", ".join(
+                f"{category}: {papers}" for category, papers in report.categories.most_common(10)
+            ))
 
 
-def main():
+def main(argv=None):
     """Main entry point with configurable scoring."""
+    parser = argparse.ArgumentParser(description="Run the scoring curation pipeline")
+    parser.add_argument('--memory-budget-mb', type=float,
+                        help="Resident memory limit for the run "
+                             "(default: MEMORY_BUDGET_MB; 0 disables it)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    
     # Load base configuration
     config = Config()
+    if args.memory_budget_mb is not None:
+        config.memory_budget_mb = args.memory_budget_mb
     
     # Create custom scoring configuration
     # You can modify this based on your research interests
@@ -261,8 +299,10 @@ def main():
     )
     
     # Create and run pipeline
+    configure_from_env()
     pipeline = ArxivCurationPipeline(config, scoring_config)
-    pipeline.run(days_back=7)
+    with profiling.profiled_run(args, "main_v2", os.getenv('METRICS_SUMMARY_PATH')):
+        pipeline.run(days_back=7)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+"""Database maintenance tasks, meant to be run from cron.
+
+    python -m src.maintenance migrate
+    python -m src.maintenance retention
+    python -m src.maintenance ensure-partitions
+    python -m src.maintenance purge-jobs --days 30
+
+``migrate`` is the only place the application creates tables; run it
+once per deploy before starting the web app and workers.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from datetime import timedelta
+
+from .admin.config_store import AdminConfigStore
+from .config import Config
+from .infrastructure.engines import get_engine
+from .infrastructure.job_queue import JobQueue
+from .infrastructure.models import Base
+from .infrastructure.partitions import PartitionManager
+
+logger = logging.getLogger(__name__)
+
+
+def create_partition_manager(database_url: str) -> PartitionManager:
+    """Build a partition manager from environment settings."""
+    return PartitionManager(
+        # Roll-up and archival may run longer than the web statement timeout
+        get_engine(database_url, statement_timeout_ms=0),
+        months_ahead=int(os.getenv('PARTITION_MONTHS_AHEAD', '3')),
+        rollup_after_months=int(os.getenv('PARTITION_ROLLUP_MONTHS', '3')),
+        archive_after_months=int(os.getenv('PARTITION_ARCHIVE_MONTHS', '24'))
+    )
+
+
+def migrate(engine) -> None:
+    """Create every application table that does not exist yet.
+
+    On PostgreSQL the SQL files in ``database/init`` remain the source of
+    the schema (partitions, views, functions); this fills in any table they
+    do not cover and is the whole schema on SQLite.
+    """
+    Base.metadata.create_all(engine)
+    AdminConfigStore(engine).ensure_schema()
+    logger.info("Schema is up to date")
+
+
+def main() -> int:
+    """Maintenance entry point."""
+    parser = argparse.ArgumentParser(description="ArXiv Curator database maintenance")
+    parser.add_argument('task', choices=['migrate', 'retention', 'ensure-partitions', 'purge-jobs'],
+                        help="migrate: create missing tables; "
+                             "retention: create, roll up and archive partitions; "
+                             "ensure-partitions: only create upcoming partitions; "
+                             "purge-jobs: delete old finished pipeline jobs and their tasks")
+    parser.add_argument('--days', type=int, default=int(os.getenv('JOB_RETENTION_DAYS', '30')),
+                        help="purge-jobs: keep jobs finished within this many days "
+                             "(default: JOB_RETENTION_DAYS or 30)")
+    args = parser.parse_args()
+
+    config = Config()
+    logging.basicConfig(
+        level=getattr(logging, config.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if args.task == 'migrate':
+        migrate(get_engine(config.database_url, statement_timeout_ms=0))
+        return 0
+
+    if args.task == 'purge-jobs':
+        queue = JobQueue(get_engine(config.database_url, statement_timeout_ms=0))
+        queue.purge_finished(timedelta(days=args.days))
+        return 0
+
+    manager = create_partition_manager(config.database_url)
+    if args.task == 'ensure-partitions':
+        created = manager.ensure_partitions()
+        logger.info(f"Created {len(created)} partitions")
+        return 0
+
+    report = manager.run_retention()
+    logger.info(
+        f"Retention done: created {len(report.created)} partitions, "
+        f"rolled up {report.rolled_up} runs, archived {len(report.archived)} partitions"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,23 @@
 """Utility script to rescore existing papers in the database."""
 
+import argparse
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import List, Dict
 
 from src.config import Config
+from src.core.exceptions import DatabaseError
 from src.database import DatabaseManager
+from src.domain.report import CurationReport
+from src.infrastructure.run_summaries import RunSummaryStore
+from src.infrastructure.scores import score_row
+from src.utils import profiling
+from src.utils.memory import MemoryBudget
+from src.utils.metrics import metrics
+from src.utils.profiling import profiler
+from src.utils.tracing import configure_from_env, tracer
 from src.scoring import (
     ScoringConfig,
     create_scorer,
@@ -14,74 +25,84 @@ from src.scoring import (
     Paper
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Approximate in-memory size of one streamed paper row and one queued score row
+PAPER_ROW_KB = 4.0
+SCORE_ROW_KB = 2.0
+
 
 class PaperRescorer:
-    def __init__(self, config: Config, scoring_config: ScoringConfig = None):
+    def __init__(self, config: Config, scoring_config: ScoringConfig = None,
+                 score_batch_size: int = 50, read_chunk_size: int = 500):
         self.config = config
         self.scoring_config = scoring_config or get_default_config()
         self.db_manager = DatabaseManager(config.database_url)
+        self.run_summaries = RunSummaryStore(self.db_manager.engine)
         self.scorer = create_scorer(self.scoring_config)
+        # Chunks and batches shrink to fit a small memory budget; under
+        # pressure, queued scores are written early
+        self.memory_budget = MemoryBudget(config.memory_budget_mb)
+        self.memory_budget.on_pressure(self._flush_scores)
+        self.score_batch_size = self.memory_budget.batch_size(score_batch_size, SCORE_ROW_KB)
+        self.read_chunk_size = self.memory_budget.batch_size(read_chunk_size, PAPER_ROW_KB)
+        self._pending_scores: List[Dict] = []
     
-    async def rescore_all_papers(self):
-        """Rescore all papers in the database."""
-        # Get all papers
-        papers = self.db_manager.get_all_papers()
-        logger.info(f"Found {len(papers)} papers to rescore")
+    async def rescore_all_papers(self) -> CurationReport:
+        """Rescore all papers in the database and record the run's score distribution."""
+        started_at = datetime.utcnow()
+        report = CurationReport()
+        # Stream papers instead of loading the whole table
+        total = self.db_manager.count_papers()
+        logger.info(f"Found {total} papers to rescore")
         
         # Score each paper
         scored_count = 0
-        for paper_record in papers:
+        for paper_record in self.db_manager.iter_papers(chunk_size=self.read_chunk_size):
             try:
-                # Convert to Paper object
-                paper = Paper(
-                    arxiv_id=paper_record.arxiv_id,
-                    title=paper_record.title,
-                    abstract=paper_record.abstract,
-                    authors=paper_record.authors,
-                    categories=paper_record.categories,
-                    published_date=paper_record.published_date,
-                    pdf_url=paper_record.pdf_url
-                )
+                # Rows carry the scoring fields; no intermediate objects
+                paper = Paper.from_row(paper_record)
                 
                 # Score the paper
-                result = await self.scorer.score(paper)
+                with profiler.scope(), tracer.span("paper", arxiv_id=paper.arxiv_id) as span:
+                    result = await self.scorer.score(paper)
+                    span.set_attribute("score", result.score)
                 
                 # Save score to database
                 self._save_score(paper_record.id, result)
+                report.add(paper.arxiv_id, paper.title, result.score, result.explanation,
+                           result.components, paper.categories)
                 scored_count += 1
                 
                 if scored_count % 10 == 0:
-                    logger.info(f"Scored {scored_count}/{len(papers)} papers...")
+                    logger.info(f"Scored {scored_count}/{total} papers...")
                     
             except Exception as e:
                 logger.error(f"Error scoring paper {paper_record.arxiv_id}: {e}")
+            
+            self.memory_budget.tick()
         
+        self._flush_scores()
         logger.info(f"Rescoring complete. Scored {scored_count} papers.")
+        try:
+            self.run_summaries.record(report, "rescore", started_at)
+        except DatabaseError as e:
+            logger.warning(f"Could not record run summary: {e}")
+        return report
     
     def _save_score(self, paper_id: str, result):
-        """Save score to database."""
-        # Extract component scores
-        components = result.components
-        
-        score_data = {
-            'paper_id': paper_id,
-            'total_score': result.score,
-            'llm_score': components.get('llm_scorer', {}).get('score'),
-            'keyword_score': components.get('keyword_scorer', {}).get('score'),
-            'citation_score': components.get('citation_scorer', {}).get('score'),
-            'temporal_score': components.get('temporal_scorer', {}).get('score'),
-            'author_score': components.get('author_scorer', {}).get('score'),
-            'explanation': result.explanation,
-            'components': components,
-            'metadata': result.metadata
-        }
-        
-        # Save to database (you'd need to implement this method)
-        # self.db_manager.save_paper_score(score_data)
-        logger.info(f"Score saved for paper {paper_id}: {result.score:.3f}")
+        """Queue a score; scores are written in batches."""
+        self._pending_scores.append(score_row(paper_id, result))
+        if len(self._pending_scores) >= self.score_batch_size:
+            self._flush_scores()
+    
+    def _flush_scores(self):
+        """Write queued scores and their latest-score projection in one transaction."""
+        if not self._pending_scores:
+            return
+        saved = self.db_manager.save_paper_scores(self._pending_scores)
+        logger.info(f"Saved {saved} scores")
+        self._pending_scores = []
     
     async def rescore_recent_papers(self, days: int = 7):
         """Rescore only recent papers."""
@@ -89,15 +110,30 @@ class PaperRescorer:
         pass
 
 
-async def main():
+async def main(argv=None):
     """Main entry point for rescoring."""
+    parser = argparse.ArgumentParser(description="Rescore every paper in the database")
+    parser.add_argument('--memory-budget-mb', type=float,
+                        help="Resident memory limit for the run "
+                             "(default: MEMORY_BUDGET_MB; 0 disables it)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    
     config = Config()
+    if args.memory_budget_mb is not None:
+        config.memory_budget_mb = args.memory_budget_mb
+    configure_from_env()
     
     # You can customize the scoring config here
     scoring_config = get_default_config()
     
     rescorer = PaperRescorer(config, scoring_config)
-    await rescorer.rescore_all_papers()
+    summary_path = os.getenv('METRICS_SUMMARY_PATH')
+    with profiling.profiled_run(args, "rescore", summary_path):
+        await rescorer.rescore_all_papers()
+    metrics.write_summary(summary_path)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,39 @@
-"""Scoring module for arXiv paper relevance and quality assessment."""
+"""Scoring module for arXiv paper relevance and quality assessment.
 
-from .base import ScoringStrategy, Paper, ScoringResult
-from .composite_scorer import CompositeScorer, ScorerWeight
-from .llm_scorer import LLMScorer
-from .keyword_scorer import KeywordScorer
-from .citation_scorer import CitationScorer
-from .temporal_scorer import TemporalScorer
-from .author_scorer import AuthorScorer
-from .config import ScoringConfig, create_scorer, get_default_config
+Names are resolved on first access, so importing one scorer (or the
+package) does not import the others and their dependencies, e.g.
+``aiohttp`` for ``LLMScorer``.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import ScoringStrategy, Paper, ScoringResult
+    from .composite_scorer import CompositeScorer, ScorerWeight
+    from .llm_scorer import LLMScorer
+    from .keyword_scorer import KeywordScorer
+    from .citation_scorer import CitationScorer
+    from .temporal_scorer import TemporalScorer
+    from .author_scorer import AuthorScorer
+    from .config import ScoringConfig, create_scorer, get_default_config
+
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    'ScoringStrategy': 'base',
+    'Paper': 'base',
+    'ScoringResult': 'base',
+    'CompositeScorer': 'composite_scorer',
+    'ScorerWeight': 'composite_scorer',
+    'LLMScorer': 'llm_scorer',
+    'KeywordScorer': 'keyword_scorer',
+    'CitationScorer': 'citation_scorer',
+    'TemporalScorer': 'temporal_scorer',
+    'AuthorScorer': 'author_scorer',
+    'ScoringConfig': 'config',
+    'create_scorer': 'config',
+    'get_default_config': 'config'
+}
 
 __all__ = [
     'ScoringStrategy',
@@ -24,3 +50,16 @@ __all__ = [
     'create_scorer',
     'get_default_config'
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Paper data structure for scoring."""
     arxiv_id: str
@@ -17,6 +17,31 @@ class Paper:
     published_date: datetime
     pdf_url: str
     metadata: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_row(cls, row, metadata: Optional[Dict[str, Any]] = None) -> "Paper":
+        """Build a scoring paper from anything exposing the paper columns.
+        
+        Accepts database rows, ORM papers and domain ``PaperMetadata``, so
+        every source converts through the same attribute names.
+        
+        Args:
+            row: Object with the paper columns as attributes
+            metadata: Optional extra scoring metadata
+            
+        Returns:
+            Paper: Scoring paper sharing the row's values
+        """
+        paper = cls.__new__(cls)
+        paper.arxiv_id = row.arxiv_id
+        paper.title = row.title
+        paper.abstract = row.abstract
+        paper.authors = row.authors
+        paper.categories = row.categories
+        paper.published_date = row.published_date
+        paper.pdf_url = row.pdf_url
+        paper.metadata = metadata
+        return paper
 
 
 @dataclass
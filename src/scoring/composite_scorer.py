@@ -5,6 +5,8 @@ import asyncio
 from dataclasses import dataclass
 
 from .base import ScoringStrategy, Paper, ScoringResult
+from ..utils.metrics import metrics
+from ..utils.tracing import tracer
 
 
 @dataclass
@@ -92,7 +94,12 @@ class CompositeScorer(ScoringStrategy):
     ) -> Optional[ScoringResult]:
         """Score with a single scorer, handling failures."""
         try:
-            return await scorer.score(paper, context)
+            span_name = f"scorer.{scorer.name}"
+            with metrics.track("scorer", scorer=scorer.name), \
+                    tracer.span(span_name, arxiv_id=paper.arxiv_id, required=required) as span:
+                result = await scorer.score(paper, context)
+                span.set_attribute("score", result.score)
+                return result
         except Exception as e:
             if required:
                 raise
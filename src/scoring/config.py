@@ -5,7 +5,6 @@ from dataclasses import dataclass
 
 from .base import ScoringStrategy
 from .composite_scorer import CompositeScorer, ScorerWeight
-from .llm_scorer import LLMScorer
 from .keyword_scorer import KeywordScorer
 from .citation_scorer import CitationScorer
 from .temporal_scorer import TemporalScorer
@@ -69,6 +68,8 @@ def create_scorer(config: ScoringConfig) -> ScoringStrategy:
     
     # Add LLM scorer
     if config.use_llm and config.llm_weight > 0:
+        from .llm_scorer import LLMScorer
+        
         llm_scorer = LLMScorer(
             ollama_host=config.ollama_host,
             model=config.ollama_model
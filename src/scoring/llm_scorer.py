@@ -3,9 +3,10 @@
 import os
 import json
 from typing import Dict, Any, Optional
-import aiohttp
 
 from .base import ScoringStrategy, Paper, ScoringResult
+from ..utils.metrics import metrics
+from ..utils.tracing import tracer
 
 
 class LLMScorer(ScoringStrategy):
@@ -58,26 +59,32 @@ Response format:
 }}"""
         return prompt
     
+    @metrics.timed("external_request", service="ollama", operation="llm_score")
     async def _query_ollama(self, prompt: str) -> Dict[str, Any]:
         """Query Ollama for scoring."""
-        async with aiohttp.ClientSession() as session:
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "format": "json"
-            }
-            
-            async with session.post(
-                f"{self.ollama_host}/api/generate",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return json.loads(data.get('response', '{}'))
-                else:
-                    raise Exception(f"Ollama API error: {response.status}")
+        # aiohttp takes longer to import than the rest of the scorers together
+        import aiohttp
+        
+        with tracer.span("ollama.generate", model=self.model) as span:
+            async with aiohttp.ClientSession() as session:
+                payload = {
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "format": "json"
+                }
+                
+                async with session.post(
+                    f"{self.ollama_host}/api/generate",
+                    json=payload,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    span.set_attribute("status_code", response.status)
+                    if response.status == 200:
+                        data = await response.json()
+                        return json.loads(data.get('response', '{}'))
+                    else:
+                        raise Exception(f"Ollama API error: {response.status}")
     
     def _parse_response(self, response: Dict[str, Any]) -> ScoringResult:
         """Parse LLM response into ScoringResult."""
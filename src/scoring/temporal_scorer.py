@@ -1,6 +1,6 @@
 """Temporal scoring based on publication date and trends."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional, List
 import math
 
@@ -30,14 +30,19 @@ class TemporalScorer(ScoringStrategy):
     
     async def score(self, paper: Paper, context: Optional[Dict[str, Any]] = None) -> ScoringResult:
         """Score paper based on temporal factors."""
+        # Database rows carry a date; arXiv results a datetime
+        published_date = paper.published_date
+        if not isinstance(published_date, datetime) and isinstance(published_date, date):
+            published_date = datetime.combine(published_date, datetime.min.time())
+        
         # Calculate recency score
-        recency_score = self._calculate_recency_score(paper.published_date)
+        recency_score = self._calculate_recency_score(published_date)
         
         # Calculate trend score
         trend_score = self._calculate_trend_score(paper.title, paper.abstract)
         
         # Day of week bonus (papers published Mon-Wed often get more attention)
-        dow_bonus = self._calculate_dow_bonus(paper.published_date)
+        dow_bonus = self._calculate_dow_bonus(published_date)
         
         # Combine scores
         final_score = (
@@ -58,7 +63,7 @@ class TemporalScorer(ScoringStrategy):
                 'publication_timing': dow_bonus
             },
             metadata={
-                'days_old': (datetime.now() - paper.published_date).days,
+                'days_old': (datetime.now() - published_date).days,
                 'trending_matches': self._find_trending_matches(paper.title, paper.abstract)
             }
         )
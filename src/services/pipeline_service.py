@@ -2,14 +2,25 @@
 
 import logging
 import time
-from typing import List, Dict, Any
+from dataclasses import asdict
+from datetime import datetime
+from itertools import islice
+from typing import List, Dict, Any, Optional
 
 from ..core.config import ProcessingConfig
 from ..core.exceptions import ArxivCuratorError
+from ..infrastructure.pipeline_runs import PipelineRunStore, RunMetrics
+from ..utils.memory import MemoryBudget
+from ..utils.metrics import metrics
+from ..utils.profiling import profiler
+from ..utils.tracing import tracer
 from .curation_service import CurationService
 
 logger = logging.getLogger(__name__)
 
+# Per-paper errors kept in the results; later failures are only counted
+MAX_REPORTED_ERRORS = 100
+
 
 class PipelineService:
     """Service for running the paper curation pipeline."""
@@ -17,16 +28,20 @@ class PipelineService:
     def __init__(
         self,
         curation_service: CurationService,
-        processing_config: ProcessingConfig
+        processing_config: ProcessingConfig,
+        run_history: Optional[PipelineRunStore] = None
     ):
         """Initialize pipeline service.
         
         Args:
             curation_service: Curation service for processing papers
             processing_config: Processing configuration
+            run_history: Optional store recording every run
         """
         self.curation_service = curation_service
         self.config = processing_config
+        self.run_history = run_history
+        self.memory_budget = MemoryBudget(processing_config.memory_budget_mb)
 
     def run_pipeline(self) -> Dict[str, Any]:
         """Run the complete curation pipeline.
@@ -36,6 +51,8 @@ class PipelineService:
         """
         logger.info("Starting ArXiv curation pipeline...")
         start_time = time.time()
+        started_at = datetime.utcnow()
+        run_metrics = RunMetrics()
         
         results = {
             "total_fetched": 0,
@@ -46,37 +63,60 @@ class PipelineService:
         }
         
         try:
-            # Fetch recent papers
-            papers = self.curation_service.arxiv_client.fetch_recent_papers(
-                days_back=self.config.days_lookback
+            # Stream recent papers; the fetch stage times only the waits for them
+            arxiv_client = self.curation_service.arxiv_client
+            papers = metrics.track_iteration(
+                arxiv_client.iter_recent_papers(days_back=self.config.days_lookback),
+                "pipeline_stage", stage="fetch"
             )
-            results["total_fetched"] = len(papers)
-            logger.info(f"Fetched {len(papers)} papers from ArXiv")
             
-            # Process papers in batches
-            for i in range(0, len(papers), self.config.batch_size):
-                batch = papers[i:i + self.config.batch_size]
-                logger.info(f"Processing batch {i // self.config.batch_size + 1}")
+            # Process papers in batches, holding one batch at a time
+            batch_number = 0
+            while True:
+                batch = list(islice(papers, self.config.batch_size))
+                if not batch:
+                    break
+                batch_number += 1
+                results["total_fetched"] += len(batch)
+                logger.info(f"Processing batch {batch_number}")
                 
                 for paper_data in batch:
                     try:
-                        paper = self.curation_service.process_paper(paper_data)
+                        arxiv_id = paper_data.get("arxiv_id", "unknown")
+                        with profiler.scope(), \
+                                metrics.track("pipeline_stage", stage="process_paper"), \
+                                tracer.span("paper", arxiv_id=arxiv_id) as span:
+                            paper = self.curation_service.process_paper(paper_data)
+                            span.set_attribute("outcome", "new" if paper else "skipped")
                         if paper:
                             results["new_papers"] += 1
+                            metrics.increment("pipeline_papers_total", outcome="new")
                         else:
                             results["skipped_papers"] += 1
+                            metrics.increment("pipeline_papers_total", outcome="skipped")
                             
                     except Exception as e:
                         results["failed_papers"] += 1
-                        results["errors"].append({
-                            "arxiv_id": paper_data.get("arxiv_id", "unknown"),
-                            "error": str(e)
-                        })
+                        metrics.increment("pipeline_papers_total", outcome="failed")
+                        if len(results["errors"]) < MAX_REPORTED_ERRORS:
+                            results["errors"].append({
+                                "arxiv_id": paper_data.get("arxiv_id", "unknown"),
+                                "error": str(e)
+                            })
                         logger.error(f"Failed to process paper: {e}")
                     
+                    self.memory_budget.tick()
+                    
                     # Rate limiting between papers
-                    time.sleep(2)
+                    if self.config.paper_delay:
+                        time.sleep(self.config.paper_delay)
+                        metrics.increment(
+                            "rate_limit_sleep_seconds_total", self.config.paper_delay,
+                            component="pipeline"
+                        )
 
+            logger.info(f"Fetched {results['total_fetched']} papers from ArXiv")
+            
             # Calculate execution time
             execution_time = time.time() - start_time
             results["execution_time"] = f"{execution_time:.2f} seconds"
@@ -89,12 +129,35 @@ class PipelineService:
                 f"{results['failed_papers']} failed"
             )
             
+            self._record_run(results, started_at, run_metrics)
             return results
             
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
+            self._record_run(results, started_at, run_metrics, error=str(e))
             raise ArxivCuratorError(f"Pipeline execution failed: {e}") from e
     
+    def _record_run(self, results: Dict[str, Any], started_at: datetime, run_metrics: RunMetrics,
+                    error: Optional[str] = None) -> None:
+        """Store the run in the run history, if configured, without failing the run."""
+        if self.run_history is None:
+            return
+        try:
+            run = self.run_history.record(
+                "pipeline", started_at,
+                status="failed" if error else "completed",
+                fetched=results["total_fetched"],
+                new=results["new_papers"],
+                skipped=results["skipped_papers"],
+                failed=results["failed_papers"],
+                settings=asdict(self.config),
+                error=error,
+                **run_metrics.collect()
+            )
+            results["run_id"] = str(run.id)
+        except Exception as e:
+            logger.warning(f"Could not record pipeline run: {e}")
+    
     def run_batch_with_retry(self, papers: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process a batch of papers with retry logic.
         
@@ -115,7 +178,9 @@ class PipelineService:
             
             for attempt in range(self.config.retry_attempts):
                 try:
-                    paper = self.curation_service.process_paper(paper_data)
+                    arxiv_id = paper_data.get("arxiv_id", "unknown")
+                    with tracer.span("paper", arxiv_id=arxiv_id, retry_count=attempt):
+                        paper = self.curation_service.process_paper(paper_data)
                     if paper:
                         results["processed"] += 1
                         success = True
@@ -128,6 +193,10 @@ class PipelineService:
                             f"{paper_data.get('arxiv_id')}: {e}"
                         )
                         results["retried"] += 1
+                        metrics.increment(
+                            "rate_limit_sleep_seconds_total", self.config.retry_delay,
+                            component="pipeline_retry"
+                        )
                         time.sleep(self.config.retry_delay)
                     else:
                         logger.error(
@@ -1,11 +1,15 @@
 """
 Custom types for cross-database compatibility
 """
-from sqlalchemy import String, TypeDecorator, Text
-from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, ARRAY as PostgresARRAY
+from sqlalchemy import JSON, String, TypeDecorator, Text, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PostgresUUID, ARRAY as PostgresARRAY, JSONB
+from sqlalchemy.dialects.postgresql import array as PostgresArrayLiteral
 import uuid
 import json
 
+# JSONB on PostgreSQL, JSON text elsewhere
+JSONType = JSON().with_variant(JSONB(), 'postgresql')
+
 
 class UUID(TypeDecorator):
     """Platform-independent UUID type.
@@ -78,4 +82,55 @@ class ARRAY(TypeDecorator):
         elif dialect.name == 'postgresql':
             return value
         else:
-            return json.loads(value)
\ No newline at end of file
+            return json.loads(value)
+
+
+def _json_array_values(column):
+    """Table-valued ``json_each`` over an array stored as JSON text."""
+    return func.json_each(column).table_valued("value")
+
+
+def array_contains(column, values, dialect_name):
+    """Match rows whose array column contains every value.
+
+    Compiles to ``column @> ARRAY[...]`` on PostgreSQL so GIN indexes on
+    the column are used; falls back to ``json_each`` elsewhere.
+    """
+    values = list(values)
+    if dialect_name == 'postgresql':
+        return column.op('@>')(values)
+
+    array_values = _json_array_values(column)
+    return select(func.count(func.distinct(array_values.c.value))).where(
+        array_values.c.value.in_(values)
+    ).scalar_subquery() == len(set(values))
+
+
+def array_overlap(column, values, dialect_name):
+    """Match rows whose array column contains any of the values.
+
+    Compiles to ``column && ARRAY[...]`` on PostgreSQL; falls back to
+    ``json_each`` elsewhere.
+    """
+    values = list(values)
+    if dialect_name == 'postgresql':
+        return column.op('&&')(values)
+
+    array_values = _json_array_values(column)
+    return exists(select(1).select_from(array_values).where(array_values.c.value.in_(values)))
+
+
+def array_contains_ci(column, value, dialect_name):
+    """Case-insensitive membership test for a text array column.
+
+    On PostgreSQL this compiles to ``lower_text_array(column) @> ARRAY[lower(value)]``,
+    matching the expression index created by ``07_array_indexes.sql``.
+    """
+    if dialect_name == 'postgresql':
+        needle = PostgresArrayLiteral([func.lower(literal(value, Text))])
+        return func.lower_text_array(column).op('@>')(needle)
+
+    array_values = _json_array_values(column)
+    return exists(select(1).select_from(array_values).where(
+        func.lower(array_values.c.value) == func.lower(value)
+    ))
@@ -1,10 +1,19 @@
 """Utility modules."""
 
 from .logging import setup_logging
+from .metrics import MetricsRegistry, metrics
+from .profiling import SamplingProfiler, profiler
+from .tracing import Tracer, tracer
 from .validators import validate_arxiv_id, validate_score
 
 __all__ = [
     'setup_logging',
+    'MetricsRegistry',
+    'metrics',
+    'SamplingProfiler',
+    'profiler',
+    'Tracer',
+    'tracer',
     'validate_arxiv_id',
     'validate_score'
 ]
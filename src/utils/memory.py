@@ -0,0 +1,146 @@
+"""Memory budget for long pipeline and rescoring runs.
+
+Runs stream papers, so their footprint should not grow with the corpus.
+A ``MemoryBudget`` turns that into a checked limit: batch and chunk sizes
+are capped so a batch fits in a fraction of the budget, and every few
+papers the run's resident set size is compared with the limit. Over the
+limit, the registered release callbacks run (e.g. flushing queued
+writes), the garbage collector runs, and the pressure is counted in
+``memory_budget_pressure_total``.
+
+    budget = MemoryBudget(limit_mb=512)
+    budget.on_pressure(self._flush_scores)
+    chunk_size = budget.batch_size(500, item_kb=PAPER_ROW_KB)
+    for paper in papers:
+        ...
+        budget.tick()
+
+A limit of 0 (the default, ``MEMORY_BUDGET_MB`` unset) disables the checks.
+"""
+
+import gc
+import logging
+import os
+import sys
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Share of the budget one batch may take; the rest covers the interpreter,
+# libraries, connection pools and the batch being written
+BATCH_SHARE = 0.1
+DEFAULT_CHECK_EVERY = 50
+
+
+def rss_mb() -> Optional[float]:
+    """Current resident set size of this process, where ``/proc`` reports it."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class MemoryBudget:
+    """Caps batch sizes and checks resident memory against a limit."""
+
+    def __init__(self, limit_mb: float = 0.0, check_every: int = DEFAULT_CHECK_EVERY):
+        """Initialize budget.
+
+        Args:
+            limit_mb: Resident memory limit in MiB; 0 disables the budget
+            check_every: Papers between memory checks in ``tick``
+        """
+        if limit_mb < 0:
+            raise ValueError(f"limit_mb must not be negative, got {limit_mb}")
+        self.limit_mb = limit_mb
+        self.check_every = max(1, check_every)
+        self.pressure_events = 0
+        self._ticks = 0
+        self._releases: List[Callable[[], None]] = []
+
+    @classmethod
+    def from_env(cls, environ: Optional[Dict[str, str]] = None) -> "MemoryBudget":
+        """Budget from ``MEMORY_BUDGET_MB`` (unset or 0 disables it)."""
+        environ = os.environ if environ is None else environ
+        return cls(float(environ.get("MEMORY_BUDGET_MB", "0") or 0))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a limit is set."""
+        return self.limit_mb > 0
+
+    def on_pressure(self, release: Callable[[], None]) -> None:
+        """Register a callback that frees memory, run when the limit is exceeded."""
+        self._releases.append(release)
+
+    def batch_size(self, default: int, item_kb: float) -> int:
+        """Largest batch, up to ``default``, whose items fit in ``BATCH_SHARE`` of the budget.
+
+        Args:
+            default: Batch size without a budget
+            item_kb: Approximate size of one item in KiB
+
+        Returns:
+            int: Batch size, at least 1
+        """
+        if not self.enabled or item_kb <= 0:
+            return default
+        return max(1, min(default, int(self.limit_mb * 1024 * BATCH_SHARE / item_kb)))
+
+    def tick(self) -> bool:
+        """Count one processed item, checking memory every ``check_every`` items.
+
+        Returns:
+            bool: Whether this tick found the run over budget
+        """
+        if not self.enabled:
+            return False
+        self._ticks += 1
+        if self._ticks % self.check_every:
+            return False
+        return self.check()
+
+    def check(self) -> bool:
+        """Compare resident memory with the limit, releasing memory when over it.
+
+        Returns:
+            bool: Whether the run was over budget
+        """
+        current = rss_mb()
+        if current is None:
+            return False
+        metrics.set_gauge("memory_rss_bytes", current * 1024 * 1024)
+        if not self.enabled or current <= self.limit_mb:
+            return False
+
+        self.pressure_events += 1
+        metrics.increment("memory_budget_pressure_total")
+        for release in self._releases:
+            try:
+                release()
+            except Exception as e:
+                logger.warning(f"Memory release callback failed: {e}")
+        gc.collect()
+        # Freed memory is not always returned to the OS; warn once, then log quietly
+        log = logger.warning if self.pressure_events == 1 else logger.debug
+        log(f"Resident memory {current:.0f} MiB over the {self.limit_mb:.0f} MiB budget, "
+            f"{rss_mb() or current:.0f} MiB after release")
+        return True
@@ -0,0 +1,420 @@
+"""In-process metrics with Prometheus text export.
+
+Components record through the module-level ``metrics`` registry:
+
+    with metrics.track("external_request", service="ollama", operation="score"):
+        response = requests.post(...)
+
+``track`` observes ``<name>_seconds`` and counts ``<name>_errors_total``
+when the block raises. The web app serves ``render()`` on ``/metrics``;
+command-line entry points write ``summary()`` as a JSON run summary.
+Values are per process, so every web worker and pipeline worker
+reports its own series.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers DB round-trips up to slow LLM calls
+DEFAULT_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric:
+    """A metric family: one series per combination of label values."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str = "", labelnames: Tuple[str, ...] = ()):
+        """Initialize metric.
+
+        Args:
+            name: Full metric name
+            help: Description shown in the Prometheus export
+            labelnames: Names of the labels every sample must carry
+        """
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            ) from None
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def series(self) -> List[Tuple[Dict[str, str], Any]]:
+        """Snapshot of every series as (labels, value) pairs."""
+        with self._lock:
+            items = list(self._series.items())
+        return [(self._labels(key), value) for key, value in sorted(items)]
+
+    def clear(self) -> None:
+        """Drop every series."""
+        with self._lock:
+            self._series.clear()
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        """Add ``amount`` to the series for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        """Current value of a series (0 if never incremented)."""
+        return self._series.get(self._key(labels), 0.0)
+
+
+class Gauge(Counter):
+    """Value that can go up and down, e.g. a queue depth."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        """Replace the value of the series for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            self._series[key] = float(value)
+
+
+class HistogramSeries:
+    """Bucket counts, sum, count and maximum of one histogram series."""
+
+    __slots__ = ("buckets", "sum", "count", "max")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram(Metric):
+    """Distribution of observed values, e.g. latencies in seconds."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str = "", labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize histogram.
+
+        Args:
+            name: Full metric name
+            help: Description shown in the Prometheus export
+            labelnames: Names of the labels every sample must carry
+            buckets: Upper bounds of the buckets, ascending
+        """
+        super().__init__(name, help, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        """Record one observation in the series for ``labels``."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = HistogramSeries(len(self.bounds))
+            for i, bound in enumerate(self.bounds):
+                if value <= bound:
+                    series.buckets[i] += 1
+                    break
+            series.sum += value
+            series.count += 1
+            series.max = max(series.max, value)
+
+    def count(self, **labels) -> int:
+        """Number of observations in a series."""
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+
+class MetricsRegistry:
+    """Named metric families, created on first use."""
+
+    def __init__(self, namespace: str = "curator"):
+        """Initialize registry.
+
+        Args:
+            namespace: Prefix added to every metric name
+        """
+        self.namespace = namespace
+        self.started_at = time.time()
+        self._metrics: Dict[str, Metric] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, help: str) -> None:
+        """Set the help text of a metric, whether or not it exists yet."""
+        self._help[name] = help
+        metric = self._metrics.get(name)
+        if metric is not None:
+            metric.help = help
+
+    def counter(self, name: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get(Counter, name, labelnames)
+
+    def gauge(self, name: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get(Gauge, name, labelnames)
+
+    def histogram(self, name: str, labelnames: Tuple[str, ...] = ()) -> Histogram:
+        """Get or create a histogram with the default buckets."""
+        return self._get(Histogram, name, labelnames)
+
+    def increment(self, name: str, amount: float = 1.0, **labels) -> None:
+        """Add to a counter; by convention ``name`` ends in ``_total``."""
+        self.counter(name, tuple(labels)).inc(amount, **labels)
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Set a gauge."""
+        self.gauge(name, tuple(labels)).set(value, **labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Record a histogram observation."""
+        self.histogram(name, tuple(labels)).observe(value, **labels)
+
+    @contextmanager
+    def track(self, name: str, **labels) -> Iterator[None]:
+        """Time a block as ``<name>_seconds``, counting ``<name>_errors_total`` if it raises.
+
+        Args:
+            name: Operation family, e.g. ``external_request``
+            **labels: Label values, e.g. ``service="huggingface"``
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.increment(f"{name}_errors_total", **labels)
+            raise
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - start, **labels)
+
+    def track_iteration(self, iterable: Iterable, name: str, **labels) -> Iterator:
+        """Yield from ``iterable``, timing only the waits for its items.
+
+        Time the caller spends between items (e.g. rate-limit sleeps) is
+        excluded; the total is observed once as ``<name>_seconds`` when the
+        iteration ends.
+        """
+        iterator = iter(iterable)
+        waited = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    waited += time.perf_counter() - start
+                    return
+                except Exception:
+                    waited += time.perf_counter() - start
+                    self.increment(f"{name}_errors_total", **labels)
+                    raise
+                waited += time.perf_counter() - start
+                yield item
+        finally:
+            self.observe(f"{name}_seconds", waited, **labels)
+
+    def timed(self, name: str, **labels) -> Callable[[Callable], Callable]:
+        """Decorator form of ``track`` for plain and async functions."""
+        def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.track(name, **labels):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.track(name, **labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def render(self) -> str:
+        """Export every metric in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in self._sorted():
+            if metric.help:
+                lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, value in metric.series():
+                if isinstance(metric, Histogram):
+                    cumulative = 0
+                    for bound, count in zip(metric.bounds, value.buckets):
+                        cumulative += count
+                        bucket = _labels({**labels, 'le': _number(bound)})
+                        lines.append(f"{metric.name}_bucket{bucket} {cumulative}")
+                    bucket = _labels({**labels, 'le': '+Inf'})
+                    lines.append(f"{metric.name}_bucket{bucket} {value.count}")
+                    lines.append(f"{metric.name}_sum{_labels(labels)} {_number(value.sum)}")
+                    lines.append(f"{metric.name}_count{_labels(labels)} {value.count}")
+                else:
+                    lines.append(f"{metric.name}{_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize every metric as JSON-ready data for a run report.
+
+        Returns:
+            Dict[str, Any]: Run duration plus, per metric, one entry per
+            series with its labels and value (histograms: count, sum,
+            mean and max)
+        """
+        report: Dict[str, Any] = {
+            "started_at": self.started_at,
+            "duration_seconds": round(time.time() - self.started_at, 3),
+            "metrics": {}
+        }
+        for metric in self._sorted():
+            entries = []
+            for labels, value in metric.series():
+                if isinstance(metric, Histogram):
+                    entries.append({
+                        "labels": labels,
+                        "count": value.count,
+                        "sum": round(value.sum, 6),
+                        "mean": round(value.sum / value.count, 6) if value.count else 0.0,
+                        "max": round(value.max, 6)
+                    })
+                else:
+                    entries.append({"labels": labels, "value": value})
+            report["metrics"][metric.name] = entries
+        return report
+
+    def write_summary(self, path: Union[str, Path, None]) -> Optional[Path]:
+        """Write ``summary()`` as JSON, if a path is given.
+
+        Args:
+            path: Output file, or None to skip
+
+        Returns:
+            Optional[Path]: Written file
+        """
+        if not path:
+            return None
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2))
+        logger.info(f"Wrote metrics run summary to {path}")
+        return path
+
+    def totals(self, name: str, *by: str) -> Dict[LabelValues, Tuple[float, float]]:
+        """Count and sum of a metric's series, grouped by some of its labels.
+
+        Used to take per-run differences of the process-wide series.
+
+        Args:
+            name: Metric name without the namespace, e.g. ``external_request_seconds``
+            *by: Labels to group by; series are added up over the others
+
+        Returns:
+            Dict[LabelValues, Tuple[float, float]]: Per group, the number of
+            observations and their sum for histograms, or the value and 0
+            for counters and gauges; empty if the metric does not exist
+        """
+        metric = self._metrics.get(name)
+        if metric is None:
+            return {}
+        totals: Dict[LabelValues, Tuple[float, float]] = {}
+        for labels, value in metric.series():
+            key = tuple(labels.get(label, "") for label in by)
+            count, total = totals.get(key, (0, 0.0))
+            if isinstance(metric, Histogram):
+                totals[key] = (count + value.count, total + value.sum)
+            else:
+                totals[key] = (count + value, total)
+        return totals
+
+    def reset(self) -> None:
+        """Drop every series and restart the run clock (tests, new runs)."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+        self.started_at = time.time()
+
+    def _get(self, cls, name: str, labelnames: Tuple[str, ...]) -> Any:
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(full_name, self._help.get(name, ""), labelnames)
+                    self._metrics[name] = metric
+        if type(metric) is not cls or set(metric.labelnames) != set(labelnames):
+            raise ValueError(
+                f"Metric {full_name} is a {metric.kind} with labels {metric.labelnames}, "
+                f"not a {cls.kind} with labels {tuple(labelnames)}"
+            )
+        return metric
+
+    def _sorted(self) -> List[Metric]:
+        return sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_value(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
+
+metrics.describe("external_request_seconds", "Latency of calls to arXiv, HuggingFace and Ollama")
+metrics.describe("external_request_errors_total", "Failed calls to arXiv, HuggingFace and Ollama")
+metrics.describe("scorer_seconds", "Latency of each scorer inside the composite scorer")
+metrics.describe("scorer_errors_total", "Scorer failures inside the composite scorer")
+metrics.describe("db_operation_seconds", "Latency of database manager operations")
+metrics.describe("db_operation_errors_total", "Failed database manager operations")
+metrics.describe("pipeline_stage_seconds", "Time spent per pipeline stage")
+metrics.describe("pipeline_stage_errors_total", "Failed pipeline stages")
+metrics.describe("pipeline_papers_total", "Papers handled by the pipeline, by outcome")
+metrics.describe("rate_limit_sleep_seconds_total",
+                 "Time spent in deliberate rate-limit and retry sleeps")
+metrics.describe("db_statement_cache_total",
+                 "Lookups by compiled statement cache result (hit, miss)")
+metrics.describe("queue_tasks", "Pending and running pipeline tasks in the job queue, by status")
+metrics.describe("db_pool_connections", "Pooled database connections, by engine and state")
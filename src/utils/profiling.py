@@ -0,0 +1,320 @@
+"""Low-overhead sampling profiler for pipeline and rescoring runs.
+
+A background thread reads the stacks of profiled threads every few
+milliseconds (``sys._current_frames``), so profiled code runs unmodified
+and the cost is one stack walk per interval. Entry points accept:
+
+    --profile                 profile the run
+    --profile-sample 0.05     only sample while 5% of the papers are processed
+    --profile-interval 0.01   seconds between samples
+    --profile-output PREFIX   defaults to METRICS_SUMMARY_PATH without its suffix
+
+and write ``PREFIX.collapsed`` (one ``frame;frame;frame count`` line per
+stack, as read by flamegraph.pl and speedscope) and ``PREFIX.profile.txt``
+(hottest functions by self and total samples). Per-paper loops mark each
+paper with ``profiler.scope()``; with a sample ratio below 1 only the
+papers picked there are sampled, so production runs can keep it on.
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.01
+DEFAULT_TOP = 30
+
+
+class SamplingProfiler:
+    """Samples the stacks of the run thread, or of threads inside a sampled scope."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, sample_ratio: float = 1.0):
+        """Initialize profiler.
+
+        Args:
+            interval: Seconds between samples
+            sample_ratio: Fraction of scopes (papers) sampled; 1 samples the whole run
+        """
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._active: Dict[int, int] = {}
+        self._labels: Dict[object, str] = {}
+        self.configure(interval, sample_ratio)
+
+    def configure(self, interval: float = DEFAULT_INTERVAL, sample_ratio: float = 1.0) -> None:
+        """Replace the sampling settings and drop collected stacks.
+
+        Args:
+            interval: Seconds between samples
+            sample_ratio: Fraction of scopes (papers) sampled; 1 samples the whole run
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError(f"sample_ratio must be between 0 and 1, got {sample_ratio}")
+        if self.running:
+            raise RuntimeError("Cannot reconfigure a running profiler")
+        self.interval = interval
+        self.sample_ratio = sample_ratio
+        self.reset()
+
+    @property
+    def running(self) -> bool:
+        """Whether the sampler thread is running."""
+        return self._thread is not None
+
+    def reset(self) -> None:
+        """Drop collected stacks and counters."""
+        with self._lock:
+            self.stacks: Counter = Counter()
+            self.samples = 0
+            self.scopes_seen = 0
+            self.scopes_sampled = 0
+            self.started_at: Optional[float] = None
+            self.seconds = 0.0
+
+    def start(self) -> None:
+        """Start sampling; with a sample ratio of 1 the calling thread is sampled until ``stop``."""
+        if self.running:
+            return
+        self._stop.clear()
+        if self.sample_ratio >= 1.0:
+            self._enter(threading.get_ident())
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; collected stacks are kept."""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.seconds += time.perf_counter() - self.started_at
+        with self._lock:
+            self._active.clear()
+
+    @contextmanager
+    def scope(self) -> Iterator[bool]:
+        """Mark one unit of work, e.g. a paper, as a sampling candidate.
+
+        Below a sample ratio of 1 the current thread is sampled only inside
+        scopes picked at random; otherwise scopes are only counted.
+
+        Yields:
+            bool: Whether this scope is sampled
+        """
+        if not self.running:
+            yield False
+            return
+        self.scopes_seen += 1
+        if self.sample_ratio >= 1.0:
+            self.scopes_sampled += 1
+            yield True
+            return
+        if self.sample_ratio <= 0.0 or random.random() >= self.sample_ratio:
+            yield False
+            return
+        self.scopes_sampled += 1
+        thread_id = threading.get_ident()
+        self._enter(thread_id)
+        try:
+            yield True
+        finally:
+            self._exit(thread_id)
+
+    def collapsed(self) -> List[str]:
+        """Collected stacks in collapsed format, root frame first, most sampled first."""
+        with self._lock:
+            items = self.stacks.most_common()
+        return [f"{';'.join(stack)} {count}" for stack, count in items]
+
+    def top(self, n: int = DEFAULT_TOP) -> List[Tuple[str, int, int]]:
+        """Hottest functions.
+
+        Args:
+            n: Number of functions
+
+        Returns:
+            List[Tuple[str, int, int]]: (function, self samples, total
+            samples), by self samples then total samples
+        """
+        own: Counter = Counter()
+        total: Counter = Counter()
+        with self._lock:
+            items = list(self.stacks.items())
+        for stack, count in items:
+            own[stack[-1]] += count
+            for frame in set(stack):
+                total[frame] += count
+        ranked = sorted(total, key=lambda frame: (own[frame], total[frame]), reverse=True)
+        return [(frame, own[frame], total[frame]) for frame in ranked[:n]]
+
+    def report(self, n: int = DEFAULT_TOP) -> str:
+        """Plain-text top-N report with the run's sampling settings."""
+        samples = self.samples or 1
+        lines = [
+            f"Sampling profile: {self.samples} samples every {self.interval * 1000:g}ms "
+            f"over {self.seconds:.1f}s",
+            f"Scopes sampled: {self.scopes_sampled}/{self.scopes_seen} "
+            f"(ratio {self.sample_ratio:g})",
+            "",
+            f"{'self%':>7} {'total%':>7} {'self':>8} {'total':>8}  function"
+        ]
+        for frame, own, total in self.top(n):
+            lines.append(
+                f"{own / samples:7.1%} {total / samples:7.1%} {own:8d} {total:8d}  {frame}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, prefix: Union[str, Path], top: int = DEFAULT_TOP) -> Tuple[Path, Path]:
+        """Write the collapsed stacks and the top-N report.
+
+        Args:
+            prefix: Output path without suffix
+            top: Functions listed in the report
+
+        Returns:
+            Tuple[Path, Path]: Collapsed-stack file and report file
+        """
+        prefix = Path(prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        collapsed_path = prefix.with_name(prefix.name + ".collapsed")
+        report_path = prefix.with_name(prefix.name + ".profile.txt")
+        collapsed_path.write_text("".join(f"{line}\n" for line in self.collapsed()))
+        report_path.write_text(self.report(top))
+        logger.info(f"Wrote {self.samples} profile samples to {collapsed_path} and {report_path}")
+        return collapsed_path, report_path
+
+    def _enter(self, thread_id: int) -> None:
+        with self._lock:
+            self._active[thread_id] = self._active.get(thread_id, 0) + 1
+
+    def _exit(self, thread_id: int) -> None:
+        with self._lock:
+            depth = self._active.get(thread_id, 0) - 1
+            if depth > 0:
+                self._active[thread_id] = depth
+            else:
+                self._active.pop(thread_id, None)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        with self._lock:
+            active = list(self._active)
+        if not active:
+            return
+        frames = sys._current_frames()
+        stacks = []
+        for thread_id in active:
+            frame = frames.get(thread_id)
+            if frame is not None:
+                stacks.append(self._stack(frame))
+        with self._lock:
+            for stack in stacks:
+                self.stacks[stack] += 1
+            self.samples += len(stacks)
+
+    def _stack(self, frame) -> Tuple[str, ...]:
+        labels = self._labels
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                # Collapsed format separates frames with ';'
+                label = labels[code] = (
+                    f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                    .replace(";", ":")
+                )
+            stack.append(label)
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to the package root or site-packages, for readable frames."""
+    index = filename.rfind("site-packages" + os.sep)
+    if index >= 0:
+        return filename[index + len("site-packages" + os.sep):]
+    index = filename.rfind(os.sep + "src" + os.sep)
+    if index >= 0:
+        return filename[index + 1:]
+    return os.path.basename(filename)
+
+
+profiler = SamplingProfiler()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--profile*`` options to an entry point's parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument('--profile', action='store_true', help="Run under the sampling profiler")
+    group.add_argument('--profile-sample', type=float, default=1.0,
+                       help="Fraction of papers to sample (1 samples the whole run)")
+    group.add_argument('--profile-interval', type=float, default=DEFAULT_INTERVAL,
+                       help="Seconds between samples")
+    group.add_argument('--profile-top', type=int, default=DEFAULT_TOP,
+                       help="Functions listed in the report")
+    group.add_argument('--profile-output', type=Path,
+                       help="Output path without suffix; "
+                            "defaults to METRICS_SUMMARY_PATH without its suffix")
+
+
+def output_prefix(summary_path: Optional[Union[str, Path]], name: str) -> Path:
+    """Profile output prefix next to the run summary.
+
+    Falls back to ``<name>-profile`` in the working directory.
+    """
+    if summary_path:
+        return Path(summary_path).with_suffix("")
+    return Path(f"{name}-profile")
+
+
+@contextmanager
+def profiled_run(
+    args: argparse.Namespace, name: str, summary_path: Optional[Union[str, Path]] = None
+) -> Iterator[Optional[SamplingProfiler]]:
+    """Profile the block if ``--profile`` was given, then write the profile.
+
+    Args:
+        args: Parsed arguments from a parser set up by ``add_arguments``
+        name: Entry point name, used when there is neither an output path
+            nor a run summary path
+        summary_path: Metrics run summary path, if any
+
+    Yields:
+        Optional[SamplingProfiler]: The running module-level profiler, or
+        None when profiling is off
+    """
+    if not args.profile:
+        yield None
+        return
+    profiler.configure(args.profile_interval, args.profile_sample)
+    profiler.start()
+    logger.info(f"Sampling profiler on: every {profiler.interval * 1000:g}ms, "
+                f"{profiler.sample_ratio:.0%} of papers")
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        try:
+            prefix = args.profile_output or output_prefix(summary_path, name)
+            profiler.write(prefix, args.profile_top)
+        except OSError as e:
+            logger.warning(f"Could not write profile: {e}")
@@ -0,0 +1,511 @@
+"""Lightweight tracing with pluggable span exporters.
+
+Code opens spans through the module-level ``tracer``:
+
+    with tracer.span("paper", arxiv_id=arxiv_id) as span:
+        ...
+        span.set_attribute("outcome", "new")
+
+Spans opened inside another span (in the same thread or asyncio task)
+become its children. Sampling is decided once per trace, at the root
+span; unsampled traces and a tracer without an exporter hand out a shared
+no-op span, so instrumentation costs a context-variable lookup.
+
+Finished spans go on a bounded queue drained by a daemon export thread,
+so a slow or unreachable collector never blocks the code being traced;
+spans are dropped when the queue is full. Exporters write them in
+batches, either as JSON lines for offline analysis or as OTLP/HTTP JSON
+to a collector. Entry points call ``configure_from_env()``:
+
+    TRACING_EXPORTER=jsonl|otlp   (unset disables tracing)
+    TRACING_SAMPLE_RATIO=0.1
+    TRACING_BATCH_SIZE=64
+    TRACING_MAX_QUEUE_SIZE=2048
+    TRACING_JSONL_PATH=traces.jsonl
+    OTEL_EXPORTER_OTLP_ENDPOINT=http://collector:4318
+    OTEL_SERVICE_NAME=arxiv-curator
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+AttributeValue = Union[str, int, float, bool]
+
+
+class Span:
+    """A timed operation with attributes, part of a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status",
+        "error"
+    )
+
+    sampled = True
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str],
+                 attributes: Dict[str, Any]):
+        """Initialize span.
+
+        Args:
+            name: Operation name, e.g. ``huggingface.summarize``
+            trace_id: 32 hex digit trace ID shared by the whole trace
+            parent_id: Span ID of the parent, or None for a root span
+            attributes: Initial attributes
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Set one attribute."""
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: AttributeValue) -> None:
+        """Set several attributes."""
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException) -> None:
+        """Mark the span failed with the given exception."""
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """Duration in milliseconds, once ended."""
+        return (self.end_ns - self.start_ns) / 1e6 if self.end_ns is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready representation used by the JSONL exporter."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+
+class NoopSpan:
+    """Stand-in for spans that are not recorded."""
+
+    __slots__ = ()
+
+    sampled = False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_attributes(self, **attributes: AttributeValue) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class SpanExporter:
+    """Receives finished spans in batches."""
+
+    def export(self, spans: List[Span]) -> None:
+        """Export a batch of finished spans."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release resources; called once when the tracer shuts down."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps finished spans in a list (tests, ad-hoc inspection)."""
+
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.spans.extend(spans)
+
+
+class JsonlSpanExporter(SpanExporter):
+    """Appends one JSON object per span to a local file."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize exporter.
+
+        Args:
+            path: File to append to; parent directories are created
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class OtlpHttpSpanExporter(SpanExporter):
+    """Sends spans to an OpenTelemetry collector (OTLP/HTTP, JSON encoding)."""
+
+    def __init__(self, endpoint: str, service_name: str = "arxiv-curator",
+                 headers: Optional[Dict[str, str]] = None, timeout: float = 5.0):
+        """Initialize exporter.
+
+        Args:
+            endpoint: Collector base URL, e.g. ``http://collector:4318``
+            service_name: ``service.name`` resource attribute
+            headers: Extra HTTP headers, e.g. for authentication
+            timeout: Request timeout in seconds
+        """
+        self.url = endpoint.rstrip("/")
+        if not self.url.endswith("/v1/traces"):
+            self.url += "/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+        # Imported here: only processes exporting over OTLP need requests
+        import requests
+        self._request_error = requests.exceptions.RequestException
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json", **(headers or {})})
+
+    def export(self, spans: List[Span]) -> None:
+        try:
+            body = json.dumps(self.encode(spans))
+            response = self.session.post(self.url, data=body, timeout=self.timeout)
+            if response.status_code >= 400:
+                logger.warning(
+                    f"OTLP export failed: {response.status_code} - {response.text[:200]}"
+                )
+        except self._request_error as e:
+            # Tracing must never break the pipeline
+            logger.warning(f"OTLP export failed: {e}")
+
+    def encode(self, spans: List[Span]) -> Dict[str, Any]:
+        """Build the ``ExportTraceServiceRequest`` JSON body."""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                "scopeSpans": [{
+                    "scope": {"name": "arxiv-curator"},
+                    "spans": [
+                        {
+                            "traceId": span.trace_id,
+                            "spanId": span.span_id,
+                            **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                            "name": span.name,
+                            "kind": 1,  # SPAN_KIND_INTERNAL
+                            "startTimeUnixNano": str(span.start_ns),
+                            "endTimeUnixNano": str(span.end_ns),
+                            "attributes": _otlp_attributes(span.attributes),
+                            "status": (
+                                {"code": 2, "message": span.error} if span.status == "error"
+                                else {"code": 1}
+                            )
+                        }
+                        for span in spans
+                    ]
+                }]
+            }]
+        }
+
+    def shutdown(self) -> None:
+        self.session.close()
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            any_value = {"boolValue": value}
+        elif isinstance(value, int):
+            any_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            any_value = {"doubleValue": value}
+        else:
+            any_value = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": any_value})
+    return encoded
+
+
+class _FlushRequest:
+    """Marker asking the export thread to export what it holds, and maybe stop."""
+
+    __slots__ = ("done", "stop")
+
+    def __init__(self, stop: bool = False):
+        self.done = threading.Event()
+        self.stop = stop
+
+
+class Tracer:
+    """Creates spans and hands sampled, finished spans to an exporter."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0,
+                 batch_size: int = 64, max_queue_size: int = 2048,
+                 export_interval: float = 5.0):
+        """Initialize tracer.
+
+        Args:
+            exporter: Destination of finished spans; None disables tracing
+            sample_ratio: Fraction of traces recorded, between 0 and 1
+            batch_size: Finished spans exported together
+            max_queue_size: Finished spans waiting for export before new ones are dropped
+            export_interval: Seconds a partial batch waits before it is exported
+        """
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+        self._exit_hook = False
+        self.dropped = 0
+        self.configure(exporter, sample_ratio, batch_size, max_queue_size, export_interval)
+
+    def configure(self, exporter: Optional[SpanExporter], sample_ratio: float = 1.0,
+                  batch_size: int = 64, max_queue_size: int = 2048,
+                  export_interval: float = 5.0) -> None:
+        """Replace the exporter and its settings, exporting queued spans first.
+
+        Args:
+            exporter: Destination of finished spans; None disables tracing
+            sample_ratio: Fraction of traces recorded, between 0 and 1
+            batch_size: Finished spans exported together
+            max_queue_size: Finished spans waiting for export before new ones are dropped
+            export_interval: Seconds a partial batch waits before it is exported
+        """
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise ValueError(f"sample_ratio must be between 0 and 1, got {sample_ratio}")
+        if getattr(self, "exporter", None) is not None:
+            self.shutdown()
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+        self.batch_size = max(1, batch_size)
+        self.max_queue_size = max(self.batch_size, max_queue_size)
+        self.export_interval = export_interval
+        if exporter is not None and not self._exit_hook:
+            atexit.register(self.shutdown)
+            self._exit_hook = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any spans can be recorded."""
+        return self.exporter is not None and self.sample_ratio > 0.0
+
+    def current_span(self) -> Union[Span, NoopSpan]:
+        """The innermost open span, or the no-op span outside any recorded trace."""
+        return _current_span.get() or NOOP_SPAN
+
+    @contextmanager
+    def span(self, name: str, **attributes: AttributeValue) -> Iterator[Union[Span, NoopSpan]]:
+        """Record a block as a span, child of the current span if any.
+
+        Exceptions raised in the block mark the span failed and propagate.
+
+        Args:
+            name: Operation name
+            **attributes: Initial attributes, e.g. ``arxiv_id="2401.00001"``
+
+        Yields:
+            Union[Span, NoopSpan]: The span, for setting more attributes
+        """
+        parent = _current_span.get()
+        if parent is None:
+            sampled = self.enabled and (
+                self.sample_ratio >= 1.0 or random.random() < self.sample_ratio
+            )
+            if not sampled:
+                # Children of an unsampled root see NOOP_SPAN and skip the dice roll
+                token = _current_span.set(NOOP_SPAN)
+                try:
+                    yield NOOP_SPAN
+                finally:
+                    _current_span.reset(token)
+                return
+            span = Span(name, f"{random.getrandbits(128):032x}", None, attributes)
+        elif not parent.sampled:
+            yield NOOP_SPAN
+            return
+        else:
+            span = Span(name, parent.trace_id, parent.span_id, attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self._finish(span)
+
+    def traced(self, name: str, **attributes: AttributeValue) -> Callable[[Callable], Callable]:
+        """Decorator form of ``span`` for plain and async functions."""
+        def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name, **attributes):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **attributes):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Export queued spans now, waiting for the export thread.
+
+        Args:
+            timeout: Seconds to wait for the export
+
+        Returns:
+            bool: True if queued spans were exported in time
+        """
+        return self._request(_FlushRequest(), timeout)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Export queued spans, stop the export thread and shut the exporter down."""
+        self._request(_FlushRequest(stop=True), timeout)
+        if self.exporter is not None:
+            self.exporter.shutdown()
+
+    def _finish(self, span: Span) -> None:
+        if self._worker_pid != os.getpid():
+            self._start_worker()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start_worker(self) -> None:
+        with self._lock:
+            if self._worker_pid == os.getpid() or self.exporter is None:
+                return
+            # Threads do not survive a fork: a forked process starts its own
+            self._queue = queue.Queue(self.max_queue_size)
+            self._worker = threading.Thread(
+                target=self._run, args=(self._queue, self.exporter), name="span-exporter",
+                daemon=True
+            )
+            self._worker.start()
+            self._worker_pid = os.getpid()
+
+    def _request(self, request: _FlushRequest, timeout: float) -> bool:
+        with self._lock:
+            if self._worker_pid != os.getpid():
+                return True
+            if request.stop:
+                self._worker_pid = None
+            try:
+                self._queue.put(request, timeout=timeout)
+            except queue.Full:
+                logger.warning("Span export queue stayed full; spans not flushed")
+                return False
+        return request.done.wait(timeout)
+
+    def _run(self, spans: queue.Queue, exporter: SpanExporter) -> None:
+        """Export thread: send spans in batches of ``batch_size`` or after ``export_interval``."""
+        batch: List[Span] = []
+        deadline: Optional[float] = None
+        reported = 0
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = spans.get(timeout=wait)
+            except queue.Empty:
+                item = None
+            if isinstance(item, Span):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.export_interval
+                if len(batch) < self.batch_size:
+                    continue
+
+            if batch:
+                self._export(exporter, batch)
+                batch = []
+            deadline = None
+            if self.dropped > reported:
+                logger.warning(f"Dropped {self.dropped - reported} spans: export queue full")
+                reported = self.dropped
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+                if item.stop:
+                    return
+
+    @staticmethod
+    def _export(exporter: SpanExporter, batch: List[Span]) -> None:
+        try:
+            exporter.export(batch)
+        except Exception as e:
+            logger.warning(f"Dropped {len(batch)} spans: {e}")
+
+
+tracer = Tracer()
+
+
+def configure_from_env(environ: Optional[Dict[str, str]] = None) -> Tracer:
+    """Configure the module-level tracer from environment variables.
+
+    Args:
+        environ: Variables to read; defaults to ``os.environ``
+
+    Returns:
+        Tracer: The configured module-level tracer
+    """
+    environ = os.environ if environ is None else environ
+    kind = environ.get("TRACING_EXPORTER", "").strip().lower()
+    service_name = environ.get("OTEL_SERVICE_NAME", "arxiv-curator")
+
+    if kind in ("", "none"):
+        exporter = None
+    elif kind == "jsonl":
+        exporter = JsonlSpanExporter(environ.get("TRACING_JSONL_PATH", "traces.jsonl"))
+    elif kind == "otlp":
+        exporter = OtlpHttpSpanExporter(
+            environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"),
+            service_name=service_name
+        )
+    else:
+        raise ValueError(f"Unknown TRACING_EXPORTER: {kind} (expected jsonl, otlp or none)")
+
+    tracer.configure(
+        exporter,
+        sample_ratio=float(environ.get("TRACING_SAMPLE_RATIO", "1.0")),
+        batch_size=int(environ.get("TRACING_BATCH_SIZE", "64")),
+        max_queue_size=int(environ.get("TRACING_MAX_QUEUE_SIZE", "2048"))
+    )
+    if exporter is not None:
+        logger.info(f"Tracing {tracer.sample_ratio:.0%} of traces to {kind}")
+    return tracer
@@ -12,6 +12,10 @@ from .routes import papers_bp, api_bp
 from .auth_routes import auth_bp
 from .public_routes_flask import public_bp
 from .health import health_bp
+from .metrics_routes import metrics_bp
+from .export_routes import export_bp
+from .json_provider import FastJSONProvider
+from .compression import ResponseCompressor
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,7 @@ def create_app(config: Config = None) -> Flask:
         Flask: Configured Flask application
     """
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     
     # Load configuration
     if config is None:
@@ -33,7 +38,7 @@ def create_app(config: Config = None) -> Flask:
     
     # Configure Flask
     app.config['SECRET_KEY'] = config.secret_key
-    app.config['JSON_SORT_KEYS'] = False
+    app.config['COMPRESS_MIN_SIZE'] = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
     
     # Enhanced CORS configuration for Keycloak
     CORS(app, 
@@ -44,6 +49,9 @@ def create_app(config: Config = None) -> Flask:
          allow_headers=["Content-Type", "Authorization"],
          supports_credentials=True)
     
+    # Compress large JSON responses (gzip, or brotli when installed)
+    ResponseCompressor(app)
+    
     # Initialize services
     db_session = DatabaseSession(config.database)
     db_manager = DatabaseManager(db_session)
@@ -58,6 +66,7 @@ def create_app(config: Config = None) -> Flask:
     # Define public paths that don't require authentication
     public_paths = [
         '/health',  # Health check endpoint
+        '/metrics',  # Prometheus scrape endpoint
         '/api/auth/login',  # Login endpoint should be public
         '/api/auth/logout',  # Logout endpoint
         '/realms/',  # Keycloak metadata endpoints
@@ -78,9 +87,11 @@ def create_app(config: Config = None) -> Flask:
     
     # Register blueprints
     app.register_blueprint(health_bp)  # Health check endpoints (public)
+    app.register_blueprint(metrics_bp)  # Prometheus metrics (public)
     app.register_blueprint(papers_bp)
     app.register_blueprint(api_bp, url_prefix='/api')
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
+    app.register_blueprint(export_bp, url_prefix='/api')
     app.register_blueprint(public_bp)  # Public routes already have prefix
     
     # Error handlers
@@ -0,0 +1,123 @@
+"""Response compression with gzip/brotli content negotiation."""
+
+import gzip
+import logging
+from typing import Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "text/html",
+    "text/plain",
+}
+
+
+class ResponseCompressor:
+    """Compress responses above a size threshold.
+
+    The encoding is negotiated from the ``Accept-Encoding`` header; brotli is
+    preferred when the ``brotli`` package is installed, gzip otherwise.
+    """
+
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        min_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        """Initialize response compressor.
+
+        Args:
+            app: Flask application instance
+            min_size: Minimum body size in bytes before compressing
+            gzip_level: gzip compression level (1-9)
+            brotli_quality: brotli quality (0-11)
+        """
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        if app:
+            self.init_app(app)
+
+    @property
+    def supported_encodings(self) -> list:
+        """Encodings this server can produce, in order of preference."""
+        return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    def init_app(self, app: Flask) -> None:
+        """Initialize compressor with Flask app.
+
+        Args:
+            app: Flask application instance
+        """
+        self.min_size = app.config.get("COMPRESS_MIN_SIZE", self.min_size)
+        app.after_request(self._compress_response)
+
+    def negotiate(self, accept_encodings) -> Optional[str]:
+        """Pick the best encoding accepted by the client.
+
+        Args:
+            accept_encodings: Parsed ``Accept-Encoding`` header
+
+        Returns:
+            Optional[str]: Encoding name or None for identity
+        """
+        best, best_quality = None, 0
+        for encoding in self.supported_encodings:
+            quality = accept_encodings[encoding]
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        """Compress a payload with the given encoding.
+
+        Args:
+            data: Raw payload
+            encoding: ``br`` or ``gzip``
+
+        Returns:
+            bytes: Compressed payload
+        """
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level)
+
+    def _compress_response(self, response: Response) -> Response:
+        """Compress an outgoing response when worthwhile."""
+        if (
+            response.direct_passthrough
+            or response.is_streamed
+            or not 200 <= response.status_code < 300
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+
+        if response.content_length is not None and response.content_length < self.min_size:
+            return response
+
+        encoding = self.negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        response.set_data(self.compress(data, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,131 @@
+"""Bulk export of curated papers as NDJSON or CSV streams."""
+
+import csv
+import io
+from datetime import date
+from typing import Iterable, Iterator
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+
+from ..auth import require_auth
+from ..domain.value_objects import PaperFilter
+from .json_provider import dumps_bytes
+from .serializers import registry
+
+export_bp = Blueprint('export', __name__)
+
+EXPORT_CHUNK_SIZE = 1000
+
+export_serializer = registry.register('export_row', {
+    'arxiv_id': 'arxiv_id',
+    'title': 'title',
+    'authors': 'authors',
+    'abstract': 'abstract',
+    'published_date': 'published_date',
+    'categories': 'categories',
+    'pdf_url': 'pdf_url',
+    'summary': 'summary',
+    'key_points': 'key_points',
+    'model_used': 'model_used',
+    'total_score': 'total_score',
+    'llm_score': 'llm_score',
+    'keyword_score': 'keyword_score',
+    'citation_score': 'citation_score',
+    'temporal_score': 'temporal_score',
+    'author_score': 'author_score',
+    'scored_at': 'scored_at'
+})
+
+
+def parse_export_filter(args) -> PaperFilter:
+    """Build a paper filter from export query parameters.
+
+    Args:
+        args: Request query parameters
+
+    Returns:
+        PaperFilter: Parsed filter
+
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    date_from = args.get('date_from')
+    date_to = args.get('date_to')
+    min_score = args.get('min_score')
+    categories = [c.strip() for c in args.get('categories', '').split(',') if c.strip()]
+
+    return PaperFilter(
+        date_from=date.fromisoformat(date_from) if date_from else None,
+        date_to=date.fromisoformat(date_to) if date_to else None,
+        categories=categories,
+        min_score=float(min_score) if min_score is not None else None
+    )
+
+
+def ndjson_chunks(rows: Iterable, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Encode export rows as newline-delimited JSON, ``chunk_size`` rows per write."""
+    lines = []
+    for row in rows:
+        lines.append(dumps_bytes(export_serializer.serialize_one(row)))
+        if len(lines) == chunk_size:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def csv_chunks(rows: Iterable, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    """Encode export rows as CSV, flushing every ``chunk_size`` rows.
+
+    List columns are joined with ``;`` so every row stays one CSV record.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export_serializer.keys)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow([
+            ';'.join(value) if isinstance(value, list) else ('' if value is None else value)
+            for value in export_serializer.serialize_one(row).values()
+        ])
+        if count % chunk_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+@export_bp.route('/export', methods=['GET'])
+@require_auth
+def export_papers():
+    """Stream the curated corpus with summaries and latest scores.
+
+    Query parameters:
+    - format: ``ndjson`` (default) or ``csv``
+    - date_from / date_to: Published date bounds (YYYY-MM-DD)
+    - categories: Comma-separated categories (any match)
+    - min_score: Minimum latest total score
+    """
+    db_manager = current_app.config['db_manager']
+
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+
+    try:
+        paper_filter = parse_export_filter(request.args)
+    except ValueError as e:
+        return jsonify({'error': f'Invalid filter: {e}'}), 400
+
+    rows = db_manager.iter_export_rows(paper_filter, chunk_size=EXPORT_CHUNK_SIZE)
+
+    if export_format == 'csv':
+        body, mimetype = csv_chunks(rows), 'text/csv'
+    else:
+        body, mimetype = ndjson_chunks(rows), 'application/x-ndjson'
+
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename=papers.{export_format}'
+    return response
@@ -1,6 +1,6 @@
 """Health check endpoints."""
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 from datetime import datetime
 
 health_bp = Blueprint('health', __name__)
@@ -10,13 +10,19 @@ health_bp = Blueprint('health', __name__)
 def health_check():
     """Health check endpoint for monitoring.
     
-    This endpoint is public and doesn't require authentication.
+    This endpoint is public and doesn't require authentication. Read
+    replicas are reported as of their last background check, so the
+    endpoint itself never queries the database.
     """
-    return jsonify({
+    body = {
         'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': datetime.utcnow(),
         'service': 'arxiv-curator-backend'
-    })
+    }
+    db_manager = current_app.config.get('db_manager')
+    if db_manager is not None and db_manager.db_session.replicas:
+        body['replicas'] = db_manager.db_session.replica_status()
+    return jsonify(body)
 
 
 @health_bp.route('/readiness', methods=['GET'])
@@ -30,12 +36,12 @@ def readiness_check():
         from flask import current_app
         db_manager = current_app.config.get('db_manager')
         if db_manager:
-            # Simple query to verify database connection
-            db_manager.get_recent_papers(days=1)
+            # Single-row query to verify database connection
+            list(db_manager.iter_papers(limit=1))
         
         return jsonify({
             'status': 'ready',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'checks': {
                 'database': 'connected',
                 'keycloak': 'configured'
@@ -44,6 +50,6 @@ def readiness_check():
     except Exception as e:
         return jsonify({
             'status': 'not_ready',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'error': str(e)
         }), 503
@@ -0,0 +1,62 @@
+"""Prometheus scrape endpoint."""
+
+import logging
+from typing import Optional
+
+from flask import Blueprint, Response, current_app
+
+from ..infrastructure import engines
+from ..infrastructure.job_queue import JobQueue
+from ..utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+metrics_bp = Blueprint('metrics', __name__)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_job_queue: Optional[JobQueue] = None
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Export this process's metrics in the Prometheus text format.
+
+    Queue depth and pool usage are read at scrape time; everything else is
+    recorded as requests and pipeline runs happen. This endpoint is public
+    like ``/health``; restrict it at the proxy if needed.
+    """
+    collect_queue_depth()
+    collect_pool_stats()
+    return Response(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def get_job_queue(engine) -> JobQueue:
+    """Get the process-wide job queue read by scrapes"""
+    global _job_queue
+    if _job_queue is None or _job_queue.engine is not engine:
+        _job_queue = JobQueue(engine)
+    return _job_queue
+
+
+def collect_queue_depth() -> None:
+    """Set ``queue_tasks`` from the pending and running tasks shared by all workers."""
+    db_manager = current_app.config.get('db_manager')
+    if db_manager is None:
+        return
+    try:
+        depth = get_job_queue(db_manager.db_session.engine).depth()
+    except Exception as e:
+        # A scrape must not fail because the database is unavailable
+        logger.warning(f"Could not read job queue depth: {e}")
+        return
+    for status, count in depth.items():
+        metrics.set_gauge('queue_tasks', count, status=status)
+
+
+def collect_pool_stats() -> None:
+    """Set ``db_pool_connections`` for every engine of this process."""
+    for url, stats in engines.registry.stats().items():
+        metrics.set_gauge('db_pool_connections', stats.checked_out, url=url, state='checked_out')
+        metrics.set_gauge('db_pool_connections', stats.checked_in, url=url, state='checked_in')
+        metrics.set_gauge('db_pool_connections', stats.overflow, url=url, state='overflow')
@@ -5,11 +5,40 @@ Provides read-only access to papers and statistics.
 
 from datetime import datetime, timedelta
 from flask import Blueprint, jsonify, request
-from sqlalchemy import func, desc
+
+from ..domain.value_objects import PaperFilter
+from .serializers import registry, truncate
 
 public_bp = Blueprint('public', __name__, url_prefix='/api/public')
 
 
+def _relevance_score(paper) -> float:
+    return float(paper.relevance_score) if paper.relevance_score else 0.0
+
+
+public_paper_serializer = registry.register('public_paper_list_item', {
+    "arxiv_id": "arxiv_id",
+    "title": "title",
+    "abstract": truncate("abstract", 300),
+    "authors": "authors",
+    "published_date": "published_date",
+    "relevance_score": _relevance_score,
+    "categories": "categories"
+})
+
+public_paper_detail_serializer = registry.register('public_paper_detail', {
+    "arxiv_id": "arxiv_id",
+    "title": "title",
+    "abstract": "abstract",
+    "authors": "authors",
+    "published_date": "published_date",
+    "relevance_score": _relevance_score,
+    "categories": "categories",
+    "pdf_url": lambda paper: f"https://arxiv.org/pdf/{paper.arxiv_id}.pdf",
+    "arxiv_url": lambda paper: f"https://arxiv.org/abs/{paper.arxiv_id}"
+})
+
+
 @public_bp.route('/stats', methods=['GET'])
 def get_public_stats():
     """Get public statistics about papers."""
@@ -17,25 +46,18 @@ def get_public_stats():
     db_manager = current_app.config['db_manager']
     
     try:
-        with db_manager.session_scope() as session:
-            # Total papers count
-            total_papers = session.query(func.count(db_manager.paper_model.id)).scalar()
-            
-            # Papers from last 7 days
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            recent_papers = session.query(func.count(db_manager.paper_model.id)).filter(
-                db_manager.paper_model.published_date >= week_ago
-            ).scalar()
-            
-            # Average relevance score
-            avg_score = session.query(func.avg(db_manager.paper_model.relevance_score)).scalar()
-            
-            return jsonify({
-                "total_papers": total_papers or 0,
-                "recent_papers": recent_papers or 0,
-                "average_score": float(avg_score) if avg_score else 0.0,
-                "last_update": datetime.utcnow().isoformat()
-            })
+        # Counts and the average run in the database; no paper is loaded
+        week_ago = (datetime.utcnow() - timedelta(days=7)).date()
+        total_papers = db_manager.count_papers()
+        recent_papers = db_manager.count_papers(PaperFilter(date_from=week_ago))
+        avg_score = db_manager.average_score()
+        
+        return jsonify({
+            "total_papers": total_papers,
+            "recent_papers": recent_papers,
+            "average_score": float(avg_score) if avg_score else 0.0,
+            "last_update": datetime.utcnow()
+        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -52,36 +74,19 @@ def get_public_papers():
     min_score = float(request.args.get('min_score', 0.5))
     
     try:
-        with db_manager.session_scope() as session:
-            query = session.query(db_manager.paper_model).filter(
-                db_manager.paper_model.relevance_score >= min_score
-            )
-            
-            # Order by published date descending
-            query = query.order_by(desc(db_manager.paper_model.published_date))
-            
-            # Apply pagination
-            papers = query.offset(offset).limit(limit).all()
-            
-            # Convert to dict format
-            papers_data = []
-            for paper in papers:
-                papers_data.append({
-                    "arxiv_id": paper.arxiv_id,
-                    "title": paper.title,
-                    "abstract": paper.abstract[:300] + "..." if len(paper.abstract) > 300 else paper.abstract,
-                    "authors": paper.authors,
-                    "published_date": paper.published_date.isoformat(),
-                    "relevance_score": float(paper.relevance_score) if paper.relevance_score else 0.0,
-                    "categories": paper.categories
-                })
-            
-            return jsonify({
-                "papers": papers_data,
-                "count": len(papers_data),
-                "offset": offset,
-                "limit": limit
-            })
+        # Newest scored papers at or above min_score, one query per page
+        papers = db_manager.get_paper_details(
+            PaperFilter(min_score=min_score), limit=limit, offset=offset
+        )
+        
+        papers_data = public_paper_serializer.serialize(papers)
+        
+        return jsonify({
+            "papers": papers_data,
+            "count": len(papers_data),
+            "offset": offset,
+            "limit": limit
+        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -93,24 +98,12 @@ def get_public_paper(arxiv_id):
     db_manager = current_app.config['db_manager']
     
     try:
-        with db_manager.session_scope() as session:
-            paper = session.query(db_manager.paper_model).filter(
-                db_manager.paper_model.arxiv_id == arxiv_id
-            ).first()
-            
-            if not paper:
-                return jsonify({"error": "Paper not found"}), 404
-            
-            return jsonify({
-                "arxiv_id": paper.arxiv_id,
-                "title": paper.title,
-                "abstract": paper.abstract,
-                "authors": paper.authors,
-                "published_date": paper.published_date.isoformat(),
-                "relevance_score": float(paper.relevance_score) if paper.relevance_score else 0.0,
-                "categories": paper.categories,
-                "pdf_url": f"https://arxiv.org/pdf/{paper.arxiv_id}.pdf",
-                "arxiv_url": f"https://arxiv.org/abs/{paper.arxiv_id}"
-            })
+        # Cached lookup returning the paper row with its latest score
+        paper = db_manager.get_paper_by_arxiv_id(arxiv_id)
+        
+        if not paper:
+            return jsonify({"error": "Paper not found"}), 404
+        
+        return jsonify(public_paper_detail_serializer.serialize_one(paper))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -2,11 +2,78 @@
 
 from flask import Blueprint, render_template, jsonify, request, current_app
 from datetime import datetime, timedelta
+from typing import Optional
 from ..auth import require_auth, require_admin, get_current_user
+from ..domain.value_objects import PaperFilter
+from .serializers import registry, truncate
 
 papers_bp = Blueprint('papers', __name__)
 api_bp = Blueprint('api', __name__)
 
+def latest_summary(row):
+    """Nested latest summary of a detail row, or None if not summarized."""
+    if row.summary is None:
+        return None
+    return {
+        'summary': row.summary,
+        'key_points': row.key_points or [],
+        'model_used': row.summary_model,
+        'created_at': row.summarized_at
+    }
+
+
+def latest_score(row):
+    """Nested latest score breakdown of a detail row, or None if not scored."""
+    if row.relevance_score is None:
+        return None
+    return {
+        'total_score': row.relevance_score,
+        'components': {
+            'llm': row.llm_score,
+            'keyword': row.keyword_score,
+            'citation': row.citation_score,
+            'temporal': row.temporal_score,
+            'author': row.author_score
+        },
+        'explanation': row.score_explanation,
+        'scored_at': row.scored_at
+    }
+
+
+paper_list_serializer = registry.register('paper_list_item', {
+    'id': 'id',
+    'arxiv_id': 'arxiv_id',
+    'title': 'title',
+    'authors': 'authors',
+    'abstract': truncate('abstract', 500, always_ellipsis=True),
+    'published_date': 'published_date',
+    'categories': 'categories',
+    'pdf_url': 'pdf_url',
+    'created_at': 'created_at',
+    'relevance_score': 'relevance_score',
+    'summary': latest_summary
+})
+
+paper_detail_serializer = registry.register('paper_detail', {
+    'id': 'id',
+    'arxiv_id': 'arxiv_id',
+    'title': 'title',
+    'authors': 'authors',
+    'abstract': 'abstract',
+    'published_date': 'published_date',
+    'categories': 'categories',
+    'pdf_url': 'pdf_url',
+    'created_at': 'created_at',
+    'relevance_score': 'relevance_score',
+    'score': latest_score,
+    'summary': latest_summary
+})
+
+
+def papers_since(days: int, min_score: Optional[float] = None) -> PaperFilter:
+    """Filter matching papers ingested in the last ``days`` days."""
+    return PaperFilter(created_after=datetime.utcnow() - timedelta(days=days), min_score=min_score)
+
 
 @papers_bp.route('/')
 def index():
@@ -53,24 +120,12 @@ def get_papers():
     min_score = float(request.args.get('min_score', 0.0))
     
     try:
-        # Get recent papers
-        papers = db_manager.get_recent_papers(days=days)
+        # Papers come with their latest summary and score in one query
+        paper_filter = papers_since(days, min_score=min_score or None)
+        papers = db_manager.get_paper_details(paper_filter, limit=limit)
         
-        # Convert to JSON-serializable format
-        papers_data = []
-        for paper in papers[:limit]:
-            paper_dict = {
-                'id': str(paper.id),
-                'arxiv_id': paper.metadata.arxiv_id,
-                'title': paper.metadata.title,
-                'authors': paper.metadata.authors,
-                'abstract': paper.metadata.abstract[:500] + '...',
-                'published_date': paper.metadata.published_date.isoformat(),
-                'categories': paper.metadata.categories,
-                'pdf_url': paper.metadata.pdf_url,
-                'created_at': paper.created_at.isoformat()
-            }
-            papers_data.append(paper_dict)
+        # Dates and UUIDs are encoded natively by the app's JSON provider
+        papers_data = paper_list_serializer.serialize(papers)
         
         return jsonify({
             'papers': papers_data,
@@ -92,12 +147,11 @@ def get_paper(arxiv_id):
     db_manager = current_app.config['db_manager']
     
     try:
-        # This would need to be implemented in DatabaseManager
-        # For now, return a placeholder
-        return jsonify({
-            'error': 'Not implemented yet',
-            'arxiv_id': arxiv_id
-        }), 501
+        paper = db_manager.get_paper_detail(arxiv_id)
+        if paper is None:
+            return jsonify({'error': 'Paper not found'}), 404
+        
+        return jsonify(paper_detail_serializer.serialize_one(paper))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -111,14 +165,14 @@ def get_stats():
     
     try:
         # Get statistics
-        total_papers = len(db_manager.get_recent_papers(days=365))
-        recent_papers = len(db_manager.get_recent_papers(days=7))
+        total_papers = db_manager.count_papers(papers_since(days=365))
+        recent_papers = db_manager.count_papers(papers_since(days=7))
         
         return jsonify({
             'total_papers': total_papers,
             'recent_papers': recent_papers,
             'average_score': 0.75,  # Placeholder value
-            'last_update': datetime.utcnow().isoformat()
+            'last_update': datetime.utcnow()
         })
         
     except Exception as e:
@@ -132,13 +186,13 @@ def get_public_stats():
     
     try:
         # Get basic statistics that are safe to share publicly
-        total_papers = len(db_manager.get_recent_papers(days=365))
-        recent_papers = len(db_manager.get_recent_papers(days=7))
+        total_papers = db_manager.count_papers(papers_since(days=365))
+        recent_papers = db_manager.count_papers(papers_since(days=7))
         
         return jsonify({
             'total_papers': total_papers,
             'recent_papers': recent_papers,
-            'last_update': datetime.utcnow().isoformat()
+            'last_update': datetime.utcnow()
         })
         
     except Exception as e:
@@ -0,0 +1,125 @@
+"""Serializer registry turning ORM rows and entities into JSON output."""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from .json_provider import dumps_bytes
+
+FieldSpec = Union[str, Callable[[Any], Any]]
+
+
+class RowSerializer:
+    """Serialize objects of one type using a fixed field layout.
+
+    Field accessors are compiled once (dotted attribute paths become a
+    single ``attrgetter``), and rows are zipped straight into the encoder
+    instead of being assembled key by key in route handlers.
+    """
+
+    def __init__(self, fields: Dict[str, FieldSpec]):
+        """Initialize row serializer.
+
+        Args:
+            fields: Output key mapped to an attribute path or a callable
+        """
+        self.keys: Tuple[str, ...] = tuple(fields)
+        self._getters: Tuple[Callable[[Any], Any], ...] = tuple(
+            attrgetter(spec) if isinstance(spec, str) else spec
+            for spec in fields.values()
+        )
+
+    def serialize_one(self, row: Any) -> Dict[str, Any]:
+        """Map a single row to a JSON-ready mapping."""
+        return dict(zip(self.keys, [getter(row) for getter in self._getters]))
+
+    def serialize(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Map rows to JSON-ready mappings for embedding in a response.
+
+        Args:
+            rows: ORM instances, result rows or domain entities
+
+        Returns:
+            List[Dict[str, Any]]: One mapping per row
+        """
+        keys = self.keys
+        getters = self._getters
+        return [dict(zip(keys, [getter(row) for getter in getters])) for row in rows]
+
+    def dumps(self, rows: Iterable[Any]) -> bytes:
+        """Encode rows directly as a JSON array.
+
+        Args:
+            rows: ORM instances, result rows or domain entities
+
+        Returns:
+            bytes: Encoded JSON array
+        """
+        return dumps_bytes(self.serialize(rows))
+
+
+class SerializerRegistry:
+    """Registry of named row serializers.
+
+    Several response shapes can exist for the same model (e.g. a list
+    item and a detail view), so serializers are keyed by name.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._serializers: Dict[str, RowSerializer] = {}
+
+    def register(self, name: str, fields: Dict[str, FieldSpec]) -> RowSerializer:
+        """Register a serializer under a name.
+
+        Args:
+            name: Serializer name, e.g. ``paper_list_item``
+            fields: Output key mapped to an attribute path or a callable
+
+        Returns:
+            RowSerializer: The registered serializer
+        """
+        serializer = RowSerializer(fields)
+        self._serializers[name] = serializer
+        return serializer
+
+    def get(self, name: str) -> RowSerializer:
+        """Look up a serializer by name.
+
+        Args:
+            name: Serializer name
+
+        Returns:
+            RowSerializer: Registered serializer
+
+        Raises:
+            KeyError: If no serializer is registered under the name
+        """
+        try:
+            return self._serializers[name]
+        except KeyError:
+            raise KeyError(f"No serializer registered as {name!r}") from None
+
+
+def truncate(attr: str, length: int, always_ellipsis: bool = False) -> Callable[[Any], str]:
+    """Build an accessor returning a truncated text attribute.
+
+    Args:
+        attr: Attribute path of the text field
+        length: Maximum number of characters kept
+        always_ellipsis: Append ``...`` even when the text is short
+
+    Returns:
+        Callable[[Any], str]: Field accessor
+    """
+    getter = attrgetter(attr)
+
+    def accessor(row: Any) -> str:
+        text = getter(row)
+        if always_ellipsis or len(text) > length:
+            return text[:length] + "..."
+        return text
+
+    return accessor
+
+
+registry = SerializerRegistry()
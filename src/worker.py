@@ -0,0 +1,322 @@
+"""Pipeline worker draining the durable job queue.
+
+Run one or more of these (on one or several hosts) next to the web app:
+
+    python -m src.worker
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from datetime import date, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from .arxiv_client import ArxivClient
+from .config import Config
+from .core.exceptions import DatabaseError
+from .database import DatabaseManager
+from .hf_client import HuggingFaceClient
+from .infrastructure.engines import get_engine
+from .infrastructure.job_queue import JobQueue, PipelineJob, PipelineTask
+from .infrastructure.pipeline_runs import PipelineRunStore, RunMetrics
+from .infrastructure.progress import ProgressBus, ProgressTracker, create_progress_backend
+from .utils.metrics import metrics
+from .utils.tracing import configure_from_env, tracer
+
+logger = logging.getLogger(__name__)
+
+
+def encode_paper(paper_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Make a fetched paper JSON-serializable for a task payload."""
+    encoded = dict(paper_data)
+    if isinstance(encoded.get('published_date'), date):
+        encoded['published_date'] = encoded['published_date'].isoformat()
+    return encoded
+
+
+def decode_paper(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Restore a paper stored in a task payload."""
+    paper_data = dict(payload)
+    if isinstance(paper_data.get('published_date'), str):
+        paper_data['published_date'] = date.fromisoformat(paper_data['published_date'])
+    return paper_data
+
+
+class PipelineWorker:
+    """Claims pipeline tasks and runs them until stopped."""
+
+    def __init__(self, queue: JobQueue, db_manager: DatabaseManager, hf_client: HuggingFaceClient,
+                 bus: ProgressBus, worker_id: Optional[str] = None,
+                 arxiv_client_factory=ArxivClient, run_history: Optional[PipelineRunStore] = None):
+        """Initialize pipeline worker.
+
+        Args:
+            queue: Job queue to drain
+            db_manager: Database manager for papers and summaries
+            hf_client: Summarization client
+            bus: Progress bus for dashboard updates
+            worker_id: Unique worker identifier; defaults to host and PID
+            arxiv_client_factory: Callable building an ArXiv client from
+                categories and keywords
+            run_history: Optional store recording every finished job
+        """
+        self.queue = queue
+        self.db_manager = db_manager
+        self.hf_client = hf_client
+        self.bus = bus
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.arxiv_client_factory = arxiv_client_factory
+        self.run_history = run_history
+        self._stopping = threading.Event()
+        # Metrics of the job this worker last worked on; only one job is active at a time
+        self._job_id: Optional[UUID] = None
+        self._job_metrics: Optional[RunMetrics] = None
+
+    def stop(self) -> None:
+        """Stop after the current task."""
+        self._stopping.set()
+
+    def run(self, poll_interval: float = 5.0, once: bool = False) -> int:
+        """Process tasks until stopped.
+
+        Args:
+            poll_interval: Seconds to wait when the queue is empty
+            once: Exit as soon as the queue is empty
+
+        Returns:
+            int: Number of tasks processed
+        """
+        logger.info(f"Worker {self.worker_id} started")
+        processed = 0
+        while not self._stopping.is_set():
+            if self.run_next():
+                processed += 1
+            elif once:
+                break
+            else:
+                self._stopping.wait(poll_interval)
+        logger.info(f"Worker {self.worker_id} stopped after {processed} tasks")
+        return processed
+
+    def run_next(self) -> bool:
+        """Claim and run one task.
+
+        Returns:
+            bool: False if no task was available
+        """
+        task = self.queue.claim(self.worker_id)
+        if task is None:
+            return False
+
+        job = self.queue.get_job(task.job_id)
+        if job.id != self._job_id:
+            self._job_id, self._job_metrics = job.id, RunMetrics()
+        logger.info(f"Running {task.kind} task {task.id} of job {job.id} (attempt {task.attempts})")
+        try:
+            with metrics.track("pipeline_stage", stage=task.kind):
+                if task.kind == "fetch":
+                    self._fetch(task, job)
+                else:
+                    self._process(task, job)
+        except Exception as e:
+            logger.error(f"Task {task.id} failed: {e}", exc_info=True)
+            self.queue.fail(task, str(e))
+
+        # Queue depth is read by /metrics at scrape time, not after every task
+        self._publish_if_finished(task.job_id)
+        return True
+
+    def _fetch(self, task: PipelineTask, job: PipelineJob) -> None:
+        config = job.config
+        tracker = ProgressTracker(self.bus, run_id=str(job.id))
+        days_back = config.get('days_back', 7)
+        tracker.start_stage("fetching", f"Fetching papers from last {days_back} days...")
+
+        client = self.arxiv_client_factory(
+            config.get('categories', ['cs.CL', 'cs.AI', 'cs.LG']),
+            config.get('keywords', ['LLM', 'language model'])
+        )
+        papers = client.fetch_recent_papers(
+            max_results=config.get('max_results', 10),
+            days_back=days_back
+        )
+        logger.info(f"Fetched {len(papers)} papers from ArXiv")
+
+        encoded = [encode_paper(p) for p in papers]
+        if not self.queue.add_batches(task, encoded, config.get('batch_size', 5)):
+            return
+        if papers:
+            tracker.set_total(len(papers))
+            tracker.start_stage("processing", f"Found {len(papers)} papers. Processing...")
+
+    def _process(self, task: PipelineTask, job: PipelineJob) -> None:
+        tracker = self._tracker(job)
+        counts = {"new": 0, "skipped": 0, "failed": 0}
+
+        for payload in task.payload.get("papers", []):
+            paper_data = decode_paper(payload)
+            arxiv_id = paper_data.get('arxiv_id', 'unknown')
+            tracker.paper_started(arxiv_id, paper_data.get('title', ''))
+            # Task attempts beyond the first are retries after a crash or lost lease
+            with tracer.span("paper", arxiv_id=arxiv_id, retry_count=task.attempts - 1) as span:
+                outcome = self._process_paper(paper_data)
+                span.set_attribute("outcome", outcome)
+            counts[outcome] += 1
+            metrics.increment("pipeline_papers_total", outcome=outcome)
+            tracker.paper_finished(arxiv_id, outcome)
+
+            if not self.queue.heartbeat(task):
+                logger.warning(f"Abandoning task {task.id}: lease lost")
+                return
+
+        self.queue.complete(task, **counts)
+
+    def _process_paper(self, paper_data: Dict[str, Any]) -> str:
+        """Summarize one paper; safe to repeat after a crash.
+
+        Returns:
+            str: Outcome, one of ``new``, ``skipped`` or ``failed``
+        """
+        arxiv_id = paper_data.get('arxiv_id', 'unknown')
+        try:
+            paper = self.db_manager.get_paper_by_arxiv_id(arxiv_id)
+            if paper is not None and self.db_manager.has_summary(paper.id):
+                logger.info(f"Paper {arxiv_id} already summarized, skipping")
+                return "skipped"
+
+            # A previous attempt may have saved the paper but not its summary
+            paper = paper or self.db_manager.save_paper(paper_data)
+            if not paper:
+                logger.warning(f"Failed to save paper {arxiv_id}")
+                return "failed"
+
+            logger.info(f"Generating summary for {arxiv_id}")
+            summary_data = self.hf_client.summarize_paper(paper_data)
+            if summary_data and self.db_manager.save_summary(paper.id, summary_data):
+                logger.info(f"Summary saved for {arxiv_id}")
+                return "new"
+        except Exception as e:
+            logger.error(f"Error processing paper {arxiv_id}: {e}")
+        return "failed"
+
+    def _tracker(self, job: PipelineJob) -> ProgressTracker:
+        tracker = ProgressTracker(self.bus, run_id=str(job.id))
+        started_at = None
+        if job.started_at:
+            started_at = job.started_at.replace(tzinfo=timezone.utc).timestamp()
+        tracker.resume(
+            job.total_papers, job.new_count, job.skipped_count, job.failed_count, started_at
+        )
+        tracker.stage = "processing"
+        return tracker
+
+    def _publish_if_finished(self, job_id) -> None:
+        job = self.queue.get_job(job_id)
+        if job is None or not job.is_finished:
+            return
+
+        tracker = self._tracker(job)
+        if job.status == "failed":
+            tracker.fail(f"Pipeline error: {job.error}")
+        else:
+            tracker.complete(
+                f"Pipeline completed successfully! Processed {job.new_count} new papers "
+                f"out of {job.total_papers} found."
+            )
+        self._record_run(job)
+
+    def _record_run(self, job: PipelineJob) -> None:
+        """Add a finished job to the run history.
+
+        Stage time, external calls and cache hit rates cover this worker's
+        share of the job. A job finished concurrently by two workers is
+        recorded once; the second insert is rejected.
+        """
+        if self.run_history is None:
+            return
+        run_metrics = {}
+        if job.id == self._job_id and self._job_metrics:
+            run_metrics = self._job_metrics.collect()
+        try:
+            self.run_history.record(
+                "worker", job.started_at or job.created_at,
+                status=job.status,
+                fetched=job.total_papers,
+                new=job.new_count,
+                skipped=job.skipped_count,
+                failed=job.failed_count,
+                finished_at=job.finished_at,
+                settings=job.config,
+                error=job.error,
+                job_id=job.id,
+                **run_metrics
+            )
+        except DatabaseError as e:
+            logger.warning(f"Could not record run of job {job.id}: {e}")
+
+
+def create_worker(config: Config, worker_id: Optional[str] = None) -> PipelineWorker:
+    """Build a worker from the legacy configuration.
+
+    Args:
+        config: Pipeline configuration
+        worker_id: Optional worker identifier
+
+    Returns:
+        PipelineWorker: Worker with its queue, clients and progress bus
+    """
+    # Queue, bus and database manager share one pool
+    engine = get_engine(config.database_url)
+    queue = JobQueue(
+        engine,
+        lease_seconds=int(os.getenv('PIPELINE_LEASE_SECONDS', '300')),
+        max_attempts=int(os.getenv('PIPELINE_MAX_ATTEMPTS', '3'))
+    )
+
+    return PipelineWorker(
+        queue=queue,
+        db_manager=DatabaseManager(config.database_url),
+        hf_client=HuggingFaceClient(
+            model=config.hf_model, api_key=config.hf_token, api_url=config.hf_api_url or None
+        ),
+        bus=ProgressBus(create_progress_backend(engine)),
+        worker_id=worker_id,
+        run_history=PipelineRunStore(engine)
+    )
+
+
+def main() -> int:
+    """Worker entry point."""
+    parser = argparse.ArgumentParser(description="Run a pipeline job queue worker")
+    parser.add_argument('--worker-id', help="Unique worker identifier (default: host-pid)")
+    parser.add_argument('--poll-interval', type=float, default=5.0,
+                        help="Seconds to wait between polls of an empty queue")
+    parser.add_argument('--once', action='store_true', help="Exit when the queue is empty")
+    args = parser.parse_args()
+
+    config = Config()
+    logging.basicConfig(
+        level=getattr(logging, config.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    configure_from_env()
+    worker = create_worker(config, args.worker_id)
+
+    # Finish the current task on shutdown; an interrupted task is
+    # reclaimed by another worker once its lease expires
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop())
+
+    worker.run(poll_interval=args.poll_interval, once=args.once)
+    metrics.write_summary(os.getenv('METRICS_SUMMARY_PATH'))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
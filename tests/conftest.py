@@ -39,3 +39,12 @@ def db_session(test_config):
     session.create_tables()
     yield session
     # Cleanup would go here
+
+
+@pytest.fixture
+def sqlite_db_session(tmp_path):
+    """Create a database session backed by a temporary SQLite file."""
+    session = DatabaseSession(DatabaseConfig(url=f"sqlite:///{tmp_path / 'curator.db'}"))
+    session.create_tables()
+    yield session
+    session.engine.dispose()
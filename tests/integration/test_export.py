@@ -0,0 +1,129 @@
+"""
+Integration tests for the bulk export endpoint
+"""
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+
+from src.domain.value_objects import PaperFilter
+from src.infrastructure import DatabaseManager
+from src.infrastructure.models import PaperModel, SummaryModel
+from src.web.export_routes import export_bp
+from src.web.json_provider import FastJSONProvider
+
+
+class StubJWTService:
+    """Accepts any bearer token"""
+
+    def validate_token(self, token):
+        return {'sub': 'user-1', 'preferred_username': 'reader', 'realm_access': {'roles': ['user']}}
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """Database manager seeded with papers, summaries and rescored papers"""
+    paper_ids = []
+    with sqlite_db_session.get_session() as session:
+        for i in range(5):
+            paper = PaperModel(
+                id=uuid4(),
+                arxiv_id=f"2401.{i:05d}",
+                title=f"Paper {i}",
+                authors=[f"Author {i}"],
+                abstract="Abstract",
+                published_date=date(2024, 1, 1) + timedelta(days=i),
+                categories=["cs.CL"] if i % 2 else ["cs.CV", "cs.AI"],
+                pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}.pdf"
+            )
+            session.add(paper)
+            session.add(SummaryModel(paper_id=paper.id, summary=f"Summary {i}", key_points=["a", "b"]))
+            paper_ids.append(paper.id)
+
+    manager = DatabaseManager(sqlite_db_session)
+    # Two scoring runs: only the latest one must be exported
+    manager.save_paper_scores([
+        {'paper_id': paper_id, 'total_score': 0.1, 'created_at': datetime(2024, 2, 1)}
+        for paper_id in paper_ids
+    ])
+    manager.save_paper_scores([
+        {'paper_id': paper_id, 'total_score': i / 10, 'created_at': datetime(2024, 3, 1)}
+        for i, paper_id in enumerate(paper_ids)
+    ])
+    return manager
+
+
+@pytest.fixture
+def client(db_manager):
+    """Test client with the export blueprint"""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['db_manager'] = db_manager
+    app.config['jwt_service'] = StubJWTService()
+    app.register_blueprint(export_bp, url_prefix='/api')
+    return app.test_client()
+
+
+AUTH = {'Authorization': 'Bearer token'}
+
+
+class TestExportRows:
+    """Test the streaming export query"""
+
+    def test_one_row_per_paper_with_latest_score(self, db_manager):
+        """Rescored papers appear once, with their latest score"""
+        rows = list(db_manager.iter_export_rows(chunk_size=2))
+
+        assert len(rows) == 5
+        assert {row.arxiv_id: row.total_score for row in rows}["2401.00004"] == pytest.approx(0.4)
+        assert rows[0].published_date == date(2024, 1, 5)
+        assert rows[0].key_points == ["a", "b"]
+
+    def test_filters(self, db_manager):
+        """Date, category and score filters combine"""
+        rows = list(db_manager.iter_export_rows(PaperFilter(
+            date_from=date(2024, 1, 2),
+            categories=["cs.CL"],
+            min_score=0.3
+        )))
+
+        assert [row.arxiv_id for row in rows] == ["2401.00003"]
+
+
+class TestExportEndpoint:
+    """Test the /api/export endpoint"""
+
+    def test_requires_auth(self, client):
+        """Anonymous requests are rejected"""
+        assert client.get('/api/export').status_code == 401
+
+    def test_ndjson_stream(self, client):
+        """NDJSON is streamed one paper per line"""
+        response = client.get('/api/export?categories=cs.CV,cs.AI', headers=AUTH)
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == 'application/x-ndjson'
+        lines = [json.loads(line) for line in response.data.splitlines()]
+        assert [line['arxiv_id'] for line in lines] == ["2401.00004", "2401.00002", "2401.00000"]
+        assert lines[0]['summary'] == "Summary 4"
+        assert lines[0]['published_date'] == "2024-01-05"
+
+    def test_csv_stream(self, client):
+        """CSV has a header row and flattens list columns"""
+        response = client.get('/api/export?format=csv&date_to=2024-01-01', headers=AUTH)
+
+        records = list(csv.DictReader(io.StringIO(response.data.decode())))
+        assert response.mimetype == 'text/csv'
+        assert len(records) == 1
+        assert records[0]['categories'] == "cs.CV;cs.AI"
+
+    def test_invalid_filter(self, client):
+        """Malformed filters return 400"""
+        response = client.get('/api/export?date_from=yesterday', headers=AUTH)
+        assert response.status_code == 400
+        assert client.get('/api/export?format=xml', headers=AUTH).status_code == 400
@@ -0,0 +1,38 @@
+"""
+API latency benchmark against seeded SQLite databases
+"""
+import json
+
+import pytest
+
+from src.benchmarks.api import ENDPOINTS, main, run_benchmark
+
+pytestmark = pytest.mark.performance
+
+
+def test_every_endpoint_is_measured():
+    report = run_benchmark(sizes=[300, 1000], requests=40, concurrency=4, users=5, key_bits=1024)
+
+    assert set(report["sizes"]) == {"300", "1000"}
+    for size, measured in report["sizes"].items():
+        assert set(measured["endpoints"]) == set(ENDPOINTS)
+        for path, result in measured["endpoints"].items():
+            print(f"{size} papers {path}: {result['requests_per_sec']:.0f} req/s, p95 {result['p95_ms']:.1f}ms")
+            assert result["requests"] == 40
+            assert result["errors"] == 0
+        # Paper lists are one query per page at any database size
+        assert measured["endpoints"]["/api/papers"]["queries_per_request"] == 1
+        assert measured["endpoints"]["/api/public/papers"]["queries_per_request"] == 1
+        assert measured["endpoints"]["/health"]["queries_per_request"] == 0
+
+    # Keys are fetched once per app, not per request
+    assert report["jwks_requests"] == 2
+
+
+def test_cli_writes_report(tmp_path):
+    output = tmp_path / "bench" / "api.json"
+    assert main(["--sizes", "100", "--requests", "10", "--concurrency", "2", "--endpoint", "/health",
+                 "--key-bits", "1024", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert list(report["sizes"]["100"]["endpoints"]) == ["/health"]
@@ -0,0 +1,116 @@
+"""
+Performance tests for slotted domain entities
+
+Compares memory and construction time of the slotted entities built with
+the trusted from_row constructor against an equivalent dict-backed
+dataclass built through the validating constructor.
+"""
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import make_dataclass, fields
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.entities import Paper, PaperMetadata
+from src.scoring.base import Paper as ScoringPaper
+
+COUNT = 100_000
+
+pytestmark = pytest.mark.performance
+
+# Same fields and validation, without slots
+DictPaperMetadata = make_dataclass(
+    "DictPaperMetadata",
+    [(f.name, f.type) for f in fields(PaperMetadata)],
+    namespace={"__post_init__": PaperMetadata.__post_init__}
+)
+
+
+@pytest.fixture(scope="module")
+def rows():
+    """Database-shaped rows sharing their values, as rows from one query would"""
+    authors = ["Ada Lovelace", "Alan Turing"]
+    categories = ["cs.CL", "cs.LG"]
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            arxiv_id=f"2401.{i:05d}",
+            title="Efficient transformers",
+            authors=authors,
+            abstract="We study attention mechanisms.",
+            published_date=date(2024, 1, 1),
+            categories=categories,
+            pdf_url="https://arxiv.org/pdf/2401.00001",
+            created_at=datetime(2024, 1, 2)
+        )
+        for i in range(COUNT)
+    ]
+
+
+def validated(cls, row):
+    return cls(
+        arxiv_id=row.arxiv_id,
+        title=row.title,
+        authors=row.authors,
+        abstract=row.abstract,
+        published_date=row.published_date,
+        categories=row.categories,
+        pdf_url=row.pdf_url
+    )
+
+
+def allocated(build):
+    """Bytes allocated by build() and still alive afterwards"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def best_time(build, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class TestEntityFootprint:
+    """Test memory and construction cost of hot-path entities"""
+
+    def test_slotted_metadata_uses_less_memory(self, rows):
+        """Slotted metadata drops the per-instance __dict__"""
+        dict_backed = allocated(lambda: [validated(DictPaperMetadata, row) for row in rows])
+        slotted = allocated(lambda: [PaperMetadata.from_row(row) for row in rows])
+
+        print(f"{COUNT} metadata: dict {dict_backed / 2**20:.1f}MB, slotted {slotted / 2**20:.1f}MB")
+        assert slotted < dict_backed * 0.75
+
+    def test_from_row_is_faster_than_validating(self, rows):
+        """Trusted construction skips __init__ and __post_init__"""
+        validating = best_time(lambda: [validated(PaperMetadata, row) for row in rows])
+        trusted = best_time(lambda: [PaperMetadata.from_row(row) for row in rows])
+
+        print(f"{COUNT} metadata: validating {validating * 1000:.0f}ms, from_row {trusted * 1000:.0f}ms")
+        assert trusted < validating
+
+    def test_domain_papers_from_rows(self, rows):
+        """Domain papers share the row values instead of copying them"""
+        papers = [Paper.from_row(row) for row in rows[:10]]
+        assert all(p.metadata.authors is rows[0].authors for p in papers)
+
+    def test_scoring_papers_from_rows(self, rows):
+        """The rescoring path builds one slotted scoring paper per row"""
+        dict_backed = allocated(lambda: [validated(DictPaperMetadata, row) for row in rows])
+        scoring = allocated(lambda: [ScoringPaper.from_row(row) for row in rows])
+
+        print(f"{COUNT} scoring papers: dict {dict_backed / 2**20:.1f}MB, slotted {scoring / 2**20:.1f}MB")
+        assert scoring < dict_backed * 0.8
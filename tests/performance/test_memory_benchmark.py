@@ -0,0 +1,41 @@
+"""
+Memory budget: peak RSS of streamed runs stays flat as the corpus grows
+"""
+import json
+
+import pytest
+
+from src.benchmarks.memory import main, run_benchmark
+
+pytestmark = pytest.mark.performance
+
+# Interpreter noise and allocator fragmentation; growth is a few MiB locally
+TOLERANCE_MB = 15.0
+
+
+def test_rescore_peak_rss_is_flat():
+    report = run_benchmark("rescore", sizes=[1000, 10000], tolerance_mb=TOLERANCE_MB)
+
+    for size, result in report["sizes"].items():
+        print(f"rescore {size}: peak {result['peak_rss_mb']} MiB in {result['seconds']}s")
+        assert result["processed"] == int(size)
+    assert report["peak_growth_mb"] <= TOLERANCE_MB
+    assert report["flat"]
+
+
+def test_main_v2_peak_rss_is_flat_under_budget():
+    report = run_benchmark("main_v2", sizes=[100, 1000], memory_budget_mb=256, tolerance_mb=TOLERANCE_MB)
+
+    for size, result in report["sizes"].items():
+        print(f"main_v2 {size}: peak {result['peak_rss_mb']} MiB in {result['seconds']}s")
+        assert 0 < result["processed"] <= int(size)
+    assert report["flat"]
+
+
+def test_cli_writes_report(tmp_path):
+    output = tmp_path / "bench" / "memory.json"
+    assert main(["--workload", "rescore", "--sizes", "50", "200", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert set(report["sizes"]) == {"50", "200"}
+    assert report["workload"] == "rescore"
@@ -0,0 +1,42 @@
+"""
+End-to-end pipeline benchmark against local stubs
+"""
+import json
+
+import pytest
+
+from src.benchmarks.corpus import CorpusSpec
+from src.benchmarks.pipeline import PIPELINES, main, run_benchmark
+
+pytestmark = pytest.mark.performance
+
+
+def test_every_pipeline_is_measured():
+    spec = CorpusSpec(papers=20, max_age_days=6)
+    report = run_benchmark(spec, hf_latency=0.005, hf_warmup=1)
+
+    assert set(report["pipelines"]) == set(PIPELINES)
+    for name, result in report["pipelines"].items():
+        print(f"{name}: {result['papers_per_min']:.0f} papers/min, CPU {result['cpu_percent']:.0f}%")
+        assert result["papers"] == 20
+        assert result["papers_per_min"] > 0
+        assert result["summaries_stored"] > 0
+        assert result["stages"]["external_request_seconds"]["arxiv/search"]["count"] == 1
+        # The warm-up 503 was retried rather than losing a summary
+        assert result["stub_requests"]["huggingface"] == result["summaries_stored"] + 1
+
+    # Only the scoring pipelines call Ollama; main_v2 drops papers below its threshold
+    assert report["pipelines"]["admin_worker"]["stub_requests"]["ollama"] == 0
+    assert report["pipelines"]["main_v2"]["stages"]["scorer_seconds"]["keyword_scorer"]["count"] == 20
+    assert report["pipelines"]["pipeline_service"]["summaries_stored"] == 20
+    assert report["pipelines"]["admin_worker"]["summaries_stored"] == 20
+
+
+def test_cli_writes_report(tmp_path):
+    output = tmp_path / "bench" / "pipeline.json"
+    assert main(["--papers", "5", "--pipeline", "admin_worker", "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert list(report["pipelines"]) == ["admin_worker"]
+    assert report["stubs"]["hf_warmup"] == 1
+    assert report["pipelines"]["admin_worker"]["stages"]["pipeline_stage_seconds"]["fetch"]["count"] == 1
@@ -0,0 +1,40 @@
+"""
+Scoring throughput benchmark on a small synthetic corpus
+"""
+import json
+
+import pytest
+
+from src.benchmarks.corpus import CorpusSpec
+from src.benchmarks.scoring import main, run_benchmark
+
+pytestmark = pytest.mark.performance
+
+
+def test_every_scorer_is_measured():
+    report = run_benchmark(CorpusSpec(papers=500), llm_papers=50)
+
+    assert set(report["scorers"]) == {
+        "keyword_scorer", "citation_scorer", "temporal_scorer", "author_scorer", "llm_scorer", "default_composite"
+    }
+    for name, result in report["scorers"].items():
+        print(f"{name}: {result['papers_per_sec']:.0f} papers/s, p99 {result['p99_ms']:.3f}ms")
+        assert result["papers"] == (50 if name in ("llm_scorer", "default_composite") else 500)
+        assert 0 < result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
+    # LLM scorer and composite both reached the stub instead of falling back
+    assert report["stub_requests"] >= 100
+    assert report["corpus"]["papers"] == 500
+
+
+def test_cli_writes_report_and_compares(tmp_path):
+    output = tmp_path / "bench" / "scoring.json"
+    assert main(["--papers", "200", "--scorer", "keyword_scorer", "--output", str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert list(report["scorers"]) == ["keyword_scorer"]
+
+    # A baseline ten times faster than reality is a regression
+    report["scorers"]["keyword_scorer"]["papers_per_sec"] *= 10
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report))
+    assert main(["--papers", "200", "--scorer", "keyword_scorer", "--output", str(output),
+                 "--baseline", str(baseline)]) == 1
@@ -0,0 +1,102 @@
+"""
+Performance tests for API response serialization
+"""
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.web.routes import paper_list_serializer
+from src.web.json_provider import dumps_bytes
+
+
+def make_papers(count):
+    """Build detail rows (paper, latest score and summary) for serialization"""
+    papers = []
+    for i in range(count):
+        summarized = i % 2 == 0
+        papers.append(SimpleNamespace(
+            id=uuid.uuid4(),
+            arxiv_id=f"2401.{i:05d}",
+            title=f"Efficient transformers for long documents, part {i}",
+            authors=["Ada Lovelace", "Alan Turing", "Grace Hopper"],
+            abstract="We study attention mechanisms. " * 40,
+            published_date=date(2024, 1, 1) + timedelta(days=i % 30),
+            categories=["cs.CL", "cs.LG"],
+            pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}.pdf",
+            created_at=datetime.utcnow(),
+            relevance_score=0.5 + (i % 50) / 100,
+            summary="A short summary. " * 10 if summarized else None,
+            key_points=["First point", "Second point"] if summarized else None,
+            summary_model="gpt-4" if summarized else None,
+            summarized_at=datetime.utcnow() if summarized else None
+        ))
+    return papers
+
+
+def stdlib_serialize(papers):
+    """Hand-built dicts + stdlib encoder path"""
+    papers_data = []
+    for paper in papers:
+        summary = None
+        if paper.summary is not None:
+            summary = {
+                'summary': paper.summary,
+                'key_points': paper.key_points or [],
+                'model_used': paper.summary_model,
+                'created_at': paper.summarized_at.isoformat()
+            }
+        papers_data.append({
+            'id': str(paper.id),
+            'arxiv_id': paper.arxiv_id,
+            'title': paper.title,
+            'authors': paper.authors,
+            'abstract': paper.abstract[:500] + '...',
+            'published_date': paper.published_date.isoformat(),
+            'categories': paper.categories,
+            'pdf_url': paper.pdf_url,
+            'created_at': paper.created_at.isoformat(),
+            'relevance_score': paper.relevance_score,
+            'summary': summary
+        })
+    return json.dumps({'papers': papers_data, 'count': len(papers_data)}).encode()
+
+
+def fast_serialize(papers):
+    """Serializer registry + fast provider path"""
+    papers_data = paper_list_serializer.serialize(papers)
+    return dumps_bytes({'papers': papers_data, 'count': len(papers_data)})
+
+
+def best_of(fn, papers, repeat=5):
+    """Best wall-clock time over several runs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(papers)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.performance
+class TestSerializationPerformance:
+    """Benchmark paper list serialization"""
+
+    @pytest.mark.parametrize("count", [50, 500, 5000])
+    def test_paper_payload_serialization(self, count):
+        """Fast path produces the same document and is not slower"""
+        papers = make_papers(count)
+
+        assert json.loads(fast_serialize(papers)) == json.loads(stdlib_serialize(papers))
+
+        stdlib_time = best_of(stdlib_serialize, papers)
+        fast_time = best_of(fast_serialize, papers)
+
+        print(
+            f"{count} papers: stdlib {stdlib_time * 1000:.2f}ms, "
+            f"fast {fast_time * 1000:.2f}ms ({stdlib_time / fast_time:.1f}x)"
+        )
+        assert fast_time <= stdlib_time * 1.2
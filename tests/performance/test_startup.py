@@ -0,0 +1,42 @@
+"""
+Startup budget: import time and heavy imports of every entry point
+"""
+import json
+
+import pytest
+
+from src.benchmarks.startup import ENTRYPOINTS, main, measure, run_report
+
+pytestmark = pytest.mark.performance
+
+# Generous for CI machines; entry points import in about a third of this locally
+BUDGET_MS = 1500.0
+
+
+def test_entrypoints_within_budget():
+    report = run_report(budget_ms=BUDGET_MS, repeat=2)
+
+    assert set(report["entrypoints"]) == set(ENTRYPOINTS)
+    for module, result in report["entrypoints"].items():
+        print(f"{module}: {result['total_ms']:.0f}ms, heaviest {list(result['top_packages'])[:3]}")
+        assert result["denied"] == [], f"{module} imports {result['denied']} at startup"
+        assert result["total_ms"] <= BUDGET_MS
+        assert result["ok"]
+
+
+def test_denied_imports_are_reported():
+    # The benchmark stubs build arXiv feeds
+    result = measure("src.benchmarks.stubs", denied=("arxiv", "transformers"), repeat=1)
+    assert result.denied == ["arxiv"]
+    assert not result.ok
+    assert result.top_packages
+
+
+def test_cli_writes_report(tmp_path):
+    output = tmp_path / "bench" / "startup.json"
+    assert main(["src.maintenance", "--repeat", "1", "--output", str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert list(report["entrypoints"]) == ["src.maintenance"]
+
+    # An impossible budget fails the run
+    assert main(["src.maintenance", "--repeat", "1", "--budget-ms", "0.001", "--output", str(output)]) == 1
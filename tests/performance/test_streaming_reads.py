@@ -0,0 +1,73 @@
+"""
+Performance tests for streaming paper reads
+
+Peak memory while iterating iter_papers() must stay flat, whereas
+materialising the same rows grows with the table.
+"""
+import gc
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from memory_profiler import memory_usage
+
+from src.infrastructure import DatabaseManager
+from src.infrastructure.models import PaperModel
+
+ROW_COUNT = 20_000
+ABSTRACT = "x" * 2000
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """Database manager over a table of ROW_COUNT papers with 2KB abstracts"""
+    rows = [
+        {
+            "id": uuid4(),
+            "arxiv_id": f"2401.{i:05d}",
+            "title": f"Paper {i}",
+            "authors": ["Author One", "Author Two"],
+            "abstract": ABSTRACT,
+            "published_date": date(2024, 1, 1) + timedelta(days=i % 365),
+            "categories": ["cs.CL", "cs.AI"],
+            "pdf_url": f"https://arxiv.org/pdf/2401.{i:05d}"
+        }
+        for i in range(ROW_COUNT)
+    ]
+    with sqlite_db_session.engine.begin() as conn:
+        conn.execute(PaperModel.__table__.insert(), rows)
+    del rows
+    gc.collect()
+    return DatabaseManager(sqlite_db_session)
+
+
+def peak_growth(func):
+    """Peak RSS growth in MB while running func"""
+    gc.collect()
+    samples = memory_usage((func, (), {}), interval=0.01)
+    return max(samples) - samples[0]
+
+
+class TestStreamingReads:
+    """Test memory use of iter_papers against loading every row"""
+
+    def test_iter_papers_memory_is_flat(self, db_manager):
+        """Streaming stays within a few MB while a full load does not"""
+        def stream():
+            count = 0
+            for row in db_manager.iter_papers(chunk_size=500):
+                count += len(row.abstract) > 0
+            assert count == ROW_COUNT
+
+        def load_all():
+            rows = list(db_manager.iter_papers(chunk_size=500))
+            assert len(rows) == ROW_COUNT
+
+        streamed = peak_growth(stream)
+        loaded = peak_growth(load_all)
+
+        print(f"Peak growth: streamed {streamed:.1f}MB, loaded {loaded:.1f}MB")
+        assert streamed < 15
+        assert streamed < loaded / 2
@@ -1,11 +1,13 @@
 """Test domain entities."""
 
 import pytest
-from datetime import date
+from datetime import date, datetime
+from types import SimpleNamespace
 from uuid import uuid4
 
 from src.domain.entities import Paper, PaperMetadata, Summary, SummaryResult
 from src.domain.value_objects import ArxivId, Score, Category
+from src.scoring.base import Paper as ScoringPaper
 
 
 class TestPaperMetadata:
@@ -41,6 +43,68 @@ class TestPaperMetadata:
             )
 
 
+class TestTrustedConstructors:
+    """Test slotted entities and their from_row constructors."""
+    
+    @pytest.fixture
+    def row(self):
+        return SimpleNamespace(
+            id=uuid4(),
+            arxiv_id="2301.12345",
+            title="Test Paper",
+            authors=["Author One"],
+            abstract="This is a test abstract.",
+            published_date=date(2023, 1, 15),
+            categories=["cs.CL"],
+            pdf_url="https://arxiv.org/pdf/2301.12345.pdf",
+            created_at=datetime(2023, 1, 16)
+        )
+    
+    def test_entities_have_no_instance_dict(self, row):
+        """Test entities are slotted."""
+        paper = Paper.from_row(row)
+        assert not hasattr(paper, "__dict__")
+        assert not hasattr(paper.metadata, "__dict__")
+        assert not hasattr(ScoringPaper.from_row(row), "__dict__")
+    
+    def test_paper_from_row(self, row):
+        """Test from_row matches the validating constructor."""
+        paper = Paper.from_row(row)
+        expected = PaperMetadata(
+            arxiv_id=row.arxiv_id,
+            title=row.title,
+            authors=row.authors,
+            abstract=row.abstract,
+            published_date=row.published_date,
+            categories=row.categories,
+            pdf_url=row.pdf_url
+        )
+        assert paper.metadata == expected
+        assert paper.id == row.id
+        assert paper.created_at == row.created_at
+    
+    def test_from_row_skips_validation(self, row):
+        """Test trusted rows are not re-validated."""
+        row.authors = []
+        assert PaperMetadata.from_row(row).authors == []
+        with pytest.raises(ValueError):
+            PaperMetadata(**{name: getattr(row, name) for name in PaperMetadata.__slots__})
+    
+    def test_scoring_paper_from_domain_metadata(self, row):
+        """Test domain metadata converts to a scoring paper directly."""
+        scoring_paper = ScoringPaper.from_row(Paper.from_row(row).metadata, metadata={"source": "db"})
+        assert scoring_paper.abstract == row.abstract
+        assert scoring_paper.published_date == row.published_date
+        assert scoring_paper.metadata == {"source": "db"}
+    
+    def test_summary_result_from_row(self):
+        """Test summary results rehydrate without validation."""
+        result = SummaryResult.from_row(SimpleNamespace(
+            summary="Summary", key_points=["a"], relevance_score=0.5, model_used="model"
+        ))
+        assert result == SummaryResult("Summary", ["a"], 0.5, "model")
+
+
 class TestValueObjects:
     """Test value objects."""
     
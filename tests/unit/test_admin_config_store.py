@@ -0,0 +1,77 @@
+"""
+Unit tests for the cached admin configuration store
+"""
+import pytest
+from sqlalchemy import create_engine, event
+
+from src.admin.config_store import AdminConfigStore, DEFAULT_CONFIG
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite engine counting executed statements"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'admin.db'}")
+    engine.statements = []
+    event.listen(engine, 'before_cursor_execute',
+                 lambda conn, cursor, statement, *args: engine.statements.append(statement))
+    yield engine
+    engine.dispose()
+
+
+def make_store(engine, ttl=60.0):
+    store = AdminConfigStore(engine, ttl=ttl)
+    store.ensure_schema()
+    return store
+
+
+class TestAdminConfigStore:
+    """Test snapshot caching and versioned invalidation"""
+
+    def test_defaults_when_empty(self, engine):
+        """An empty table yields the defaults"""
+        assert make_store(engine).get() == DEFAULT_CONFIG
+
+    def test_snapshot_served_from_memory(self, engine):
+        """Reads within the TTL do not touch the database"""
+        store = make_store(engine)
+        store.get()
+        engine.statements.clear()
+
+        for _ in range(10):
+            store.get()
+        assert engine.statements == []
+
+    def test_save_is_single_upsert(self, engine):
+        """All keys are written by one statement and values round-trip"""
+        store = make_store(engine)
+        engine.statements.clear()
+        store.save({'days_back': 3, 'categories': ['cs.AI'], 'min_relevance_score': 0.7})
+
+        upserts = [s for s in engine.statements if s.startswith('INSERT INTO admin_config ')]
+        assert len(upserts) == 1
+        config = store.get()
+        assert (config['days_back'], config['categories'], config['min_relevance_score']) == (3, ['cs.AI'], 0.7)
+
+        store.save({'days_back': 5})
+        assert store.get()['days_back'] == 5
+
+    def test_other_process_sees_new_version(self, engine):
+        """A second store reloads once the version row changes"""
+        reader = make_store(engine, ttl=0)
+        writer = make_store(engine)
+        assert reader.get()['max_results'] == 10
+
+        writer.save({'max_results': 25})
+        assert reader.get()['max_results'] == 25
+
+        # Unchanged version: only the version row is read
+        engine.statements.clear()
+        reader.get()
+        assert len(engine.statements) == 1
+        assert 'admin_config_version' in engine.statements[0]
+
+    def test_returned_config_is_a_copy(self, engine):
+        """Callers cannot mutate the cached snapshot"""
+        store = make_store(engine)
+        store.get()['categories'].append('cs.XX')
+        assert 'cs.XX' not in store.get()['categories']
@@ -0,0 +1,77 @@
+"""
+Unit tests for the API benchmark helpers, the Keycloak stub and request authentication
+"""
+import pytest
+from sqlalchemy import func, select
+
+from src.benchmarks import CorpusSpec, StubKeycloakServer
+from src.benchmarks.api import QueryCounter, build_app, fire, seed_database
+from src.core.exceptions import AuthenticationError
+from src.infrastructure.engines import get_engine
+from src.infrastructure.models import PaperLatestScoreModel, PaperModel
+
+PAPERS = 200
+
+
+@pytest.fixture(scope="module")
+def keycloak():
+    with StubKeycloakServer(key_bits=1024) as stub:
+        yield stub
+
+
+@pytest.fixture(scope="module")
+def database_url(tmp_path_factory):
+    url = f"sqlite:///{tmp_path_factory.mktemp('api-bench') / 'papers.db'}"
+    assert seed_database(url, CorpusSpec(papers=PAPERS)) == PAPERS
+    yield url
+    get_engine(url).dispose()
+
+
+@pytest.fixture(scope="module")
+def app(database_url, keycloak):
+    return build_app(database_url, keycloak)
+
+
+class TestStubKeycloakServer:
+    """Test minted tokens against the real JWT validation"""
+
+    def test_minted_token_validates(self, app, keycloak):
+        claims = app.config['jwt_service'].validate_token(keycloak.mint_token("alice", roles=("admin",)))
+        assert claims["preferred_username"] == "alice"
+        assert claims["realm_access"]["roles"] == ["admin"]
+        assert claims["iss"] == keycloak.issuer
+
+    def test_expired_token_is_rejected(self, app, keycloak):
+        with pytest.raises(AuthenticationError):
+            app.config['jwt_service'].validate_token(keycloak.mint_token(lifetime=-60))
+
+    def test_protected_endpoint(self, app, keycloak):
+        client = app.test_client()
+        assert client.get('/api/papers').status_code == 401
+        expired = {'Authorization': f'Bearer {keycloak.mint_token(lifetime=-60)}'}
+        assert client.get('/api/papers', headers=expired).status_code == 401
+
+
+class TestApiBenchmark:
+    """Test seeding and the load driver"""
+
+    def test_seeded_database(self, database_url):
+        with get_engine(database_url).connect() as conn:
+            assert conn.execute(select(func.count(PaperModel.id))).scalar_one() == PAPERS
+            scored = conn.execute(select(func.count(PaperLatestScoreModel.paper_id))).scalar_one()
+        assert 0 < scored < PAPERS
+
+    def test_fire_counts_requests_errors_and_queries(self, app, keycloak):
+        counter = QueryCounter()
+        tokens = [keycloak.mint_token(f"researcher{i}") for i in range(3)]
+        with counter.listening():
+            result = fire(app, '/api/public/papers', 10, 3, counter=counter)
+            protected = fire(app, '/api/papers', 5, 2, tokens, counter)
+            rejected = fire(app, '/api/papers', 4, 2, counter=counter)
+
+        assert (result.requests, result.errors) == (10, 0)
+        assert result.queries_per_request == 1
+        assert result.p50_ms <= result.p99_ms <= result.max_ms
+        assert (protected.requests, protected.errors) == (5, 0)
+        assert rejected.errors == 4
+        assert counter.take() == 0
@@ -56,14 +56,15 @@ class TestArxivClient:
         mock_paper2.categories = ['cs.CV']
         mock_paper2.pdf_url = 'https://arxiv.org/pdf/2401.00002v1.pdf'
         
-        # Setup mock search
-        mock_search_instance = Mock()
-        mock_search_instance.results.return_value = [mock_paper1, mock_paper2]
-        mock_search_class.return_value = mock_search_instance
+        # Setup mock arxiv client
+        mock_arxiv_client = Mock()
+        mock_arxiv_client.results.return_value = [mock_paper1, mock_paper2]
         
-        client = ArxivClient(['cs.CL', 'cs.AI'], ['LLM', 'language model'])
+        client = ArxivClient(['cs.CL', 'cs.AI'], ['LLM', 'language model'], client=mock_arxiv_client)
         papers = client.fetch_recent_papers(max_results=10, days_back=7)
         
+        mock_arxiv_client.results.assert_called_once_with(mock_search_class.return_value)
+        
         # Should return all papers (no keyword filtering in current implementation)
         assert len(papers) == 2
         assert papers[0]['arxiv_id'] == '2401.00001v1'
@@ -0,0 +1,82 @@
+"""
+Unit tests for the synthetic corpus generator and benchmark helpers
+"""
+import asyncio
+import json
+import urllib.request
+from datetime import datetime
+
+import pytest
+
+from src.benchmarks import CorpusSpec, StubOllamaServer, generate_corpus
+from src.benchmarks.scoring import ScorerResult, compare, percentile
+from src.scoring import LLMScorer
+
+NOW = datetime(2024, 6, 1)
+
+
+class TestCorpus:
+    """Test corpus determinism and shape"""
+
+    def test_same_seed_same_papers(self):
+        spec = CorpusSpec(papers=50, seed=7)
+        first = list(generate_corpus(spec, now=NOW))
+        assert first == list(generate_corpus(spec, now=NOW))
+        assert first != list(generate_corpus(CorpusSpec(papers=50, seed=8), now=NOW))
+        assert len({paper.arxiv_id for paper in first}) == 50
+
+    def test_spec_shapes_papers(self):
+        spec = CorpusSpec(papers=200, abstract_words=(30, 40), authors=(2, 3), keyword_density=0.5)
+        for paper in generate_corpus(spec, now=NOW):
+            words = paper.abstract.split()
+            assert 30 <= len(words)
+            assert 2 <= len(paper.authors) <= 3
+            assert 0 <= (NOW - paper.published_date).days <= spec.max_age_days
+
+        sparse = " ".join(p.abstract for p in generate_corpus(CorpusSpec(papers=200, keyword_density=0.0), now=NOW))
+        dense = " ".join(p.abstract for p in generate_corpus(CorpusSpec(papers=200, keyword_density=0.3), now=NOW))
+        assert dense.count("transformer") > 10 * max(1, sparse.count("transformer"))
+
+    @pytest.mark.parametrize("kwargs", [
+        {"papers": -1}, {"abstract_words": (10, 5)}, {"authors": (0, 2)}, {"keyword_density": 1.5}
+    ])
+    def test_invalid_spec(self, kwargs):
+        with pytest.raises(ValueError):
+            CorpusSpec(**kwargs)
+
+
+class TestBenchmarkHelpers:
+    """Test percentiles, regression comparison and the Ollama stub"""
+
+    def test_percentile(self):
+        ordered = [i / 100 for i in range(1, 101)]
+        assert percentile(ordered, 50) == 0.5
+        assert percentile(ordered, 99) == 0.99
+        assert percentile([0.2], 99) == 0.2
+
+        result = ScorerResult.from_latencies([0.002, 0.001, 0.003], seconds=0.006)
+        assert result.papers == 3
+        assert result.papers_per_sec == 500.0
+        assert result.p50_ms == 2.0
+
+    def test_compare_flags_throughput_drops(self):
+        baseline = {"scorers": {"keyword_scorer": {"papers_per_sec": 1000.0},
+                                "citation_scorer": {"papers_per_sec": 1000.0}}}
+        current = {"scorers": {"keyword_scorer": {"papers_per_sec": 850.0},
+                               "citation_scorer": {"papers_per_sec": 950.0},
+                               "llm_scorer": {"papers_per_sec": 10.0}}}
+        assert compare(baseline, current, tolerance=0.1) == ["keyword_scorer: 1000 -> 850 papers/s (-15%)"]
+
+    def test_ollama_stub_serves_both_clients(self):
+        paper = next(generate_corpus(CorpusSpec(papers=1), now=NOW))
+        with StubOllamaServer() as stub:
+            result = asyncio.run(LLMScorer(ollama_host=stub.url, model="stub").score(paper))
+            request = urllib.request.Request(
+                f"{stub.url}/api/generate", data=json.dumps({"prompt": "Score this"}).encode(), method="POST"
+            )
+            with urllib.request.urlopen(request) as response:
+                plain = json.loads(response.read())
+            assert stub.requests == 2
+
+        assert result.metadata == {"model": "stub"}
+        assert 0.0 <= float(plain["response"]) <= 1.0
@@ -0,0 +1,86 @@
+"""
+Unit tests for the arXiv and HuggingFace benchmark stubs and the clients they exercise
+"""
+from datetime import date
+
+import requests
+
+from src.arxiv_client import ArxivClient as LegacyArxivClient
+from src.benchmarks import CorpusSpec, StubArxivServer, StubHuggingFaceServer
+from src.core.config import ArxivConfig, HuggingFaceConfig
+from src.hf_client import HuggingFaceClient as LegacyHuggingFaceClient
+from src.infrastructure import ArxivClient, HuggingFaceClient
+
+PAPER = {
+    "arxiv_id": "2401.00001", "title": "Efficient transformer inference", "authors": ["Alice Chen"],
+    "abstract": "We propose a method. It improves throughput. Results show gains on every benchmark."
+}
+
+
+class TestStubArxivServer:
+    """Test the Atom feed through both ArXiv clients"""
+
+    def test_legacy_client_pages_through_the_corpus(self):
+        spec = CorpusSpec(papers=25, max_age_days=3)
+        with StubArxivServer(spec) as stub:
+            client = LegacyArxivClient(["cs.CL"], ["LLM"], client=stub.client_for(page_size=10))
+            papers = client.fetch_recent_papers(max_results=25)
+            assert stub.requests == 3
+            assert stub.entries_served == 25
+
+        assert len({paper["arxiv_id"] for paper in papers}) == 25
+        dates = [paper["published_date"] for paper in papers]
+        assert dates == sorted(dates, reverse=True)
+        first = papers[0]
+        assert first["arxiv_id"].endswith("v1")
+        assert first["pdf_url"] == f"http://arxiv.org/pdf/{first['arxiv_id']}"
+        assert first["authors"] and first["categories"]
+        assert isinstance(first["published_date"], date)
+
+    def test_fetch_by_id(self):
+        with StubArxivServer(CorpusSpec(papers=5)) as stub:
+            client = ArxivClient(ArxivConfig(categories=["cs.CL"], keywords=["LLM"], rate_limit_delay=0))
+            client.client = stub.client_for()
+            paper = client.fetch_paper_by_id("2401.00003")
+
+        assert paper["arxiv_id"] == "2401.00003v1"
+        assert paper["title"] == stub._by_id["2401.00003"].title
+
+
+class TestStubHuggingFaceServer:
+    """Test the 503 warm-up and how each client rides it out"""
+
+    def test_warmup_replies_then_summaries(self):
+        with StubHuggingFaceServer(warmup_requests=1, estimated_time=1.5) as stub:
+            url = f"{stub.url}/models/facebook/bart-large-cnn"
+            loading = requests.post(url, json={"inputs": "Title: A\n\nAbstract: B"})
+            ready = requests.post(url, json={"inputs": "Title: A\n\nAbstract: B"})
+
+        assert loading.status_code == 503
+        assert loading.headers["Retry-After"] == "2"
+        assert loading.json()["estimated_time"] == 1.5
+        assert ready.status_code == 200
+        assert ready.json()[0]["summary_text"].startswith("Title: A Abstract: B")
+
+    def test_client_retries_loading_model(self):
+        with StubHuggingFaceServer(warmup_requests=1) as stub:
+            client = HuggingFaceClient(HuggingFaceConfig(
+                api_key="token", model="facebook/bart-large-cnn", api_url=f"{stub.url}/models/{{model}}"
+            ))
+            result = client.summarize_paper(PAPER)
+            assert stub.requests == 2
+
+        assert "Efficient transformer inference" in result.summary
+
+    def test_legacy_client_waits_for_estimated_time(self):
+        # The default wait would be 20 seconds
+        with StubHuggingFaceServer(warmup_requests=1, estimated_time=0.0) as stub:
+            client = LegacyHuggingFaceClient(
+                model="facebook/bart-large-cnn", api_key="token", api_url=f"{stub.url}/models/{{model}}"
+            )
+            assert client.api_url == f"{stub.url}/models/facebook/bart-large-cnn"
+            result = client.summarize_paper(PAPER)
+            assert stub.requests == 2
+
+        assert result["summary"]
+        assert result["model_used"] == "facebook/bart-large-cnn"
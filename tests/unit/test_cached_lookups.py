@@ -0,0 +1,82 @@
+"""
+Unit tests for cached single-paper lookups
+"""
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+from sqlalchemy.engine.default import CacheStats
+
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.infrastructure import DatabaseManager
+from src.infrastructure.models import PaperModel, SummaryModel
+from src.infrastructure.queries import PAPER_BY_ARXIV_ID
+from src.infrastructure.scores import score_row
+from src.web.json_provider import FastJSONProvider
+from src.web.public_routes_flask import public_bp
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """Database manager with one scored and one unscored paper"""
+    ids = [uuid4(), uuid4()]
+    with sqlite_db_session.get_session() as session:
+        for paper_id, arxiv_id in zip(ids, ["2401.00001", "2401.00002"]):
+            session.add(PaperModel(
+                id=paper_id, arxiv_id=arxiv_id, title=f"Paper {arxiv_id}", authors=["Author"],
+                abstract="Abstract", published_date=date(2024, 1, 1), categories=["cs.CL"],
+                pdf_url=f"https://arxiv.org/pdf/{arxiv_id}"
+            ))
+        session.add(SummaryModel(paper_id=ids[0], summary="Summary", key_points=[], relevance_score=0.5))
+    manager = DatabaseManager(sqlite_db_session)
+    manager.save_paper_scores([score_row(ids[0], SimpleNamespace(
+        score=0.8, components={}, explanation="", metadata={}
+    ))])
+    return manager
+
+
+class TestCachedLookups:
+    """Test prebuilt lookups on both managers"""
+
+    def test_lookups_hit_the_compiled_cache(self, db_manager):
+        """After the first call the prebuilt statement is not recompiled"""
+        engine = db_manager.db_session.engine
+        with engine.connect() as conn:
+            conn.execute(PAPER_BY_ARXIV_ID, {"arxiv_id": "2401.00001"})
+            result = conn.execute(PAPER_BY_ARXIV_ID, {"arxiv_id": "2401.00002"})
+            assert result.context.cache_hit == CacheStats.CACHE_HIT
+
+    def test_cached_statement_binds_new_values(self, db_manager):
+        """Repeated calls reuse the statement but not the parameter"""
+        assert db_manager.paper_exists("2401.00001")
+        assert db_manager.paper_exists("2401.00002")
+        assert not db_manager.paper_exists("2401.99999")
+
+    def test_get_paper_by_arxiv_id(self, db_manager):
+        scored = db_manager.get_paper_by_arxiv_id("2401.00001")
+        assert scored.title == "Paper 2401.00001"
+        assert scored.relevance_score == pytest.approx(0.8)
+        assert db_manager.get_paper_by_arxiv_id("2401.00002").relevance_score is None
+        assert db_manager.get_paper_by_arxiv_id("2401.99999") is None
+
+    def test_legacy_lookups(self, db_manager, sqlite_db_session):
+        legacy = LegacyDatabaseManager(str(sqlite_db_session.engine.url))
+        paper = legacy.get_paper_by_arxiv_id("2401.00001")
+        assert legacy.paper_exists("2401.00002")
+        assert not legacy.paper_exists("2401.99999")
+        assert legacy.has_summary(paper.id)
+        assert not legacy.has_summary(legacy.get_paper_by_arxiv_id("2401.00002").id)
+
+    def test_public_paper_detail(self, db_manager):
+        app = Flask(__name__)
+        app.json = FastJSONProvider(app)
+        app.config['db_manager'] = db_manager
+        app.register_blueprint(public_bp)
+        client = app.test_client()
+
+        response = client.get('/api/public/papers/2401.00001')
+        assert response.status_code == 200
+        assert response.get_json()["relevance_score"] == pytest.approx(0.8)
+        assert client.get('/api/public/papers/2401.99999').status_code == 404
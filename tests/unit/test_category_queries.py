@@ -0,0 +1,86 @@
+"""
+Unit tests for array-aware category and author queries
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.database import DatabaseManager
+from src.infrastructure.engines import get_engine
+from src.maintenance import migrate
+from src.models import Paper
+from src.types import array_contains, array_contains_ci, array_overlap
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """Legacy DatabaseManager on SQLite with a few papers"""
+    url = f"sqlite:///{tmp_path / 'papers.db'}"
+    migrate(get_engine(url))
+    db = DatabaseManager(url)
+    papers = [
+        ('2401.00001', ['cs.CL', 'cs.AI'], ['Ada Lovelace'], date(2024, 1, 20)),
+        ('2401.00002', ['cs.CV', 'cs.LG'], ['Alan Turing'], date(2024, 1, 19)),
+        ('2401.00003', ['cs.CL'], ['alan turing', 'Grace Hopper'], date(2024, 1, 18)),
+        ('2401.00004', ['stat.ML'], ['Grace Hopper'], date(2024, 1, 17)),
+    ]
+    for arxiv_id, categories, authors, published in papers:
+        db.save_paper({
+            'arxiv_id': arxiv_id,
+            'title': f'Paper {arxiv_id}',
+            'authors': authors,
+            'abstract': 'Abstract',
+            'published_date': published,
+            'categories': categories,
+            'pdf_url': f'https://arxiv.org/pdf/{arxiv_id}'
+        })
+    yield db
+    db.engine.dispose()
+
+
+def arxiv_ids(papers):
+    return [p.arxiv_id for p in papers]
+
+
+class TestLegacyCategoryQueries:
+    """Test category and author lookups on the SQLite fallback"""
+
+    def test_single_category(self, legacy_db):
+        """Only exact category members are returned, newest first"""
+        assert arxiv_ids(legacy_db.get_papers_by_category('cs.CL')) == ['2401.00001', '2401.00003']
+        # cs.C must not match cs.CL / cs.CV as a substring would
+        assert legacy_db.get_papers_by_category('cs.C') == []
+
+    def test_any_and_all_categories(self, legacy_db):
+        """OR and AND semantics over several categories"""
+        assert arxiv_ids(legacy_db.get_papers_by_categories(['cs.AI', 'cs.LG'])) == ['2401.00001', '2401.00002']
+        assert arxiv_ids(legacy_db.get_papers_by_categories(['cs.CL', 'cs.AI'], match_all=True)) == ['2401.00001']
+        assert legacy_db.get_papers_by_categories([]) == []
+
+    def test_pagination(self, legacy_db):
+        """Pages are stable and do not overlap"""
+        first = legacy_db.get_papers_by_categories(['cs.CL', 'cs.CV', 'stat.ML'], limit=2)
+        second = legacy_db.get_papers_by_categories(['cs.CL', 'cs.CV', 'stat.ML'], limit=2, offset=2)
+        assert arxiv_ids(first) == ['2401.00001', '2401.00002']
+        assert arxiv_ids(second) == ['2401.00003', '2401.00004']
+
+    def test_author_case_insensitive(self, legacy_db):
+        """Author names match regardless of case"""
+        assert arxiv_ids(legacy_db.get_papers_by_author('ALAN TURING')) == ['2401.00002', '2401.00003']
+
+
+class TestPostgresCompilation:
+    """The PostgreSQL predicates use index-friendly operators"""
+
+    def compile(self, clause):
+        return str(select(Paper.id).where(clause).compile(dialect=postgresql.dialect()))
+
+    def test_array_operators(self):
+        assert 'papers.categories && ' in self.compile(array_overlap(Paper.categories, ['cs.CL'], 'postgresql'))
+        assert 'papers.categories @> ' in self.compile(array_contains(Paper.categories, ['cs.CL'], 'postgresql'))
+
+    def test_author_expression_matches_index(self):
+        sql = self.compile(array_contains_ci(Paper.authors, 'Ada', 'postgresql'))
+        assert 'lower_text_array(papers.authors) @> ARRAY[lower(' in sql
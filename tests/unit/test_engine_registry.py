@@ -0,0 +1,102 @@
+"""
+Unit tests for the shared engine registry and the migration step
+"""
+import pytest
+from sqlalchemy import inspect, text
+
+from src.core.config import DatabaseConfig
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.infrastructure import DatabaseSession
+from src.infrastructure.engines import EngineRegistry, display_url, get_engine
+from src.maintenance import migrate
+
+
+@pytest.fixture
+def registry():
+    registry = EngineRegistry(pool_recycle=60, statement_timeout_ms=5000, prepare_threshold=3)
+    yield registry
+    registry.dispose()
+
+
+class TestEngineRegistry:
+    """Test engine sharing, options and counters"""
+
+    def test_engines_are_shared_by_url(self, registry, tmp_path):
+        first = registry.get(f"sqlite:///{tmp_path / 'a.db'}")
+        assert registry.get(f"sqlite:///{tmp_path / 'a.db'}") is first
+        assert registry.get(f"sqlite:///{tmp_path / 'b.db'}") is not first
+
+    def test_entry_points_share_one_engine(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'shared.db'}"
+        db_session = DatabaseSession(DatabaseConfig(url=url))
+        assert LegacyDatabaseManager(url).engine is db_session.engine is get_engine(url)
+
+    def test_pool_options(self, registry, tmp_path):
+        engine = registry.get(f"sqlite:///{tmp_path / 'a.db'}", pool_size=3)
+        assert engine.pool._pre_ping
+        assert engine.pool._recycle == 60
+        assert engine.pool.size() == 3
+        # In-memory SQLite has no sizable pool
+        registry.get("sqlite://", pool_size=3)
+
+    def test_postgres_statement_timeout(self, registry):
+        assert registry.connect_args("postgresql+psycopg2://user:secret@db/curator") == {
+            "options": "-c statement_timeout=5000"
+        }
+        assert registry.connect_args("postgresql+psycopg2://user:secret@db/maintenance",
+                                     statement_timeout_ms=0) == {}
+        assert registry.connect_args("sqlite:///curator.db") == {}
+
+    def test_psycopg3_prepares_server_side(self, registry):
+        connect_args = registry.connect_args("postgresql+psycopg://user:secret@db/curator",
+                                             statement_timeout_ms=0)
+        assert connect_args == {"prepare_threshold": 3}
+
+    def test_statement_timeout_gets_its_own_engine(self, registry, tmp_path):
+        # Without a server-side timeout the option is ignored
+        url = f"sqlite:///{tmp_path / 'a.db'}"
+        assert registry.get(url, statement_timeout_ms=0) is registry.get(url)
+
+        pytest.importorskip("psycopg2")
+        # Engines connect lazily, so no server is needed
+        default = registry.get("postgresql://user:secret@db/curator")
+        untimed = registry.get("postgresql://user:secret@db/curator", statement_timeout_ms=0)
+        assert untimed is not default
+        assert registry.get("postgresql://user:secret@db/curator", statement_timeout_ms=5000) is default
+        assert {"postgresql://user:***@db/curator",
+                "postgresql://user:***@db/curator (statement_timeout=0ms)"} <= set(registry.stats())
+
+    def test_connection_counters(self, registry, tmp_path):
+        engine = registry.get(f"sqlite:///{tmp_path / 'a.db'}")
+        for _ in range(3):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        stats = registry.stats()[str(engine.url)]
+        assert stats.connects == 1
+        assert stats.checkouts == 3
+        assert stats.checked_out == 0
+        assert stats.checked_in == 1
+
+    def test_urls_hide_passwords(self):
+        assert display_url("postgresql://user:secret@db/curator") == "postgresql://user:***@db/curator"
+
+
+class TestMigrate:
+    """Test the explicit schema migration step"""
+
+    def test_managers_do_not_create_tables(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'empty.db'}"
+        LegacyDatabaseManager(url)
+        assert inspect(get_engine(url)).get_table_names() == []
+
+    def test_migrate_creates_all_tables(self, tmp_path):
+        engine = get_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+        migrate(engine)
+        migrate(engine)  # idempotent
+
+        tables = set(inspect(engine).get_table_names())
+        assert {
+            "papers", "summaries", "paper_scores", "paper_latest_score",
+            "pipeline_jobs", "pipeline_tasks", "admin_config", "admin_config_version"
+        } <= tables
@@ -0,0 +1,255 @@
+"""
+Unit tests for the pipeline job queue and worker
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.infrastructure.job_queue import JobQueue
+from src.infrastructure.models import PipelineJobModel, PipelineTaskModel
+from src.infrastructure.pipeline_runs import PipelineRunStore
+from src.infrastructure.progress import ProgressBus, InMemoryProgressBackend
+from src.worker import PipelineWorker, encode_paper, decode_paper
+
+CONFIG = {'categories': ['cs.CL'], 'keywords': ['LLM'], 'max_results': 5, 'days_back': 7, 'batch_size': 2}
+
+
+def make_papers(count):
+    """Papers as returned by the ArXiv client"""
+    return [
+        {
+            'arxiv_id': f'2401.{i:05d}',
+            'title': f'Paper {i}',
+            'authors': ['Author'],
+            'abstract': 'Abstract',
+            'published_date': date(2024, 1, 15),
+            'categories': ['cs.CL'],
+            'pdf_url': f'https://arxiv.org/pdf/2401.{i:05d}'
+        }
+        for i in range(count)
+    ]
+
+
+class FakeArxivClient:
+    """ArXiv client returning a fixed list of papers"""
+
+    papers = []
+
+    def __init__(self, categories, keywords):
+        pass
+
+    def fetch_recent_papers(self, max_results, days_back):
+        return list(self.papers)
+
+
+class FakeHFClient:
+    """Summarizer that can fail for chosen papers"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def summarize_paper(self, paper):
+        self.calls.append(paper['arxiv_id'])
+        if paper['arxiv_id'] in self.failing:
+            return None
+        return {'summary': 'Summary', 'key_points': ['point'], 'model_used': 'fake'}
+
+
+@pytest.fixture
+def queue(sqlite_db_session):
+    """Job queue on a temporary SQLite database"""
+    return JobQueue(sqlite_db_session.engine, lease_seconds=60, max_attempts=2)
+
+
+@pytest.fixture
+def worker_factory(queue, sqlite_db_session):
+    """Build workers sharing the queue and database"""
+    db_manager = LegacyDatabaseManager(str(sqlite_db_session.engine.url))
+    bus = ProgressBus(InMemoryProgressBackend())
+
+    def factory(hf_client=None, worker_id='worker-1', run_history=None):
+        return PipelineWorker(queue, db_manager, hf_client or FakeHFClient(), bus,
+                              worker_id=worker_id, arxiv_client_factory=FakeArxivClient, run_history=run_history)
+
+    yield factory
+    db_manager.engine.dispose()
+
+
+class TestJobQueue:
+    """Test enqueueing, claiming and leases"""
+
+    def test_only_one_active_job(self, queue):
+        """A second trigger returns the active job instead of queueing"""
+        job, created = queue.enqueue(CONFIG)
+        again, created_again = queue.enqueue(CONFIG)
+
+        assert created and not created_again
+        assert again.id == job.id
+        assert queue.active_job().id == job.id
+
+    def test_claim_marks_job_running(self, queue):
+        """Claiming the fetch task starts the job; the task is not handed out twice"""
+        job, _ = queue.enqueue(CONFIG)
+        task = queue.claim('worker-1')
+
+        assert task.kind == 'fetch'
+        assert task.attempts == 1
+        assert queue.claim('worker-2') is None
+        assert queue.get_job(job.id).status == 'running'
+
+    def test_expired_lease_is_reclaimed(self, queue, sqlite_db_session):
+        """A task held by a crashed worker is claimed again"""
+        queue.enqueue(CONFIG)
+        stale = queue.claim('crashed')
+        with sqlite_db_session.engine.begin() as conn:
+            conn.execute(
+                update(PipelineTaskModel)
+                .where(PipelineTaskModel.id == stale.id)
+                .values(locked_at=datetime.utcnow() - timedelta(minutes=5))
+            )
+
+        task = queue.claim('worker-2')
+        assert task.id == stale.id
+        assert task.attempts == 2
+        # The crashed worker can no longer complete it
+        assert not queue.add_batches(stale, [], 2)
+
+    def test_fetch_gives_up_after_max_attempts(self, queue):
+        """A fetch task failing every attempt fails the job and frees the slot"""
+        job, _ = queue.enqueue(CONFIG)
+        for _ in range(2):
+            queue.fail(queue.claim('worker-1'), 'ArXiv unavailable')
+
+        finished = queue.get_job(job.id)
+        assert finished.status == 'failed'
+        assert finished.error == 'ArXiv unavailable'
+        assert queue.active_job() is None
+
+    def test_depth_counts_active_tasks(self, queue, worker_factory):
+        """Finished tasks drop out of the depth and keep no payload"""
+        FakeArxivClient.papers = make_papers(3)
+        queue.enqueue(CONFIG)
+        worker = worker_factory()
+        assert worker.run_next()  # fetch
+        assert queue.depth() == {'pending': 2, 'running': 0}
+
+        worker.run(once=True)
+        assert queue.depth() == {'pending': 0, 'running': 0}
+        with queue.SessionLocal() as session:
+            payloads = session.execute(select(PipelineTaskModel.payload)).scalars().all()
+        assert payloads == [{}, {}, {}]
+
+    def test_purge_finished_jobs(self, queue, worker_factory, sqlite_db_session):
+        """Old finished jobs are deleted with their tasks; recent and active ones stay"""
+        FakeArxivClient.papers = make_papers(3)
+        old, _ = queue.enqueue(CONFIG)
+        worker_factory().run(once=True)
+        with sqlite_db_session.engine.begin() as conn:
+            conn.execute(
+                update(PipelineJobModel)
+                .where(PipelineJobModel.id == old.id)
+                .values(finished_at=datetime.utcnow() - timedelta(days=40))
+            )
+        recent, _ = queue.enqueue(CONFIG)
+        worker_factory().run(once=True)
+        active, _ = queue.enqueue(CONFIG)
+
+        assert queue.purge_finished(timedelta(days=30)) == 1
+        assert queue.get_job(old.id) is None
+        assert queue.get_job(recent.id) is not None
+        assert queue.get_job(active.id).status == 'queued'
+        with queue.SessionLocal() as session:
+            orphans = session.execute(
+                select(func.count()).select_from(PipelineTaskModel)
+                .where(PipelineTaskModel.job_id == old.id)
+            ).scalar()
+        assert orphans == 0
+
+
+class TestPipelineWorker:
+    """Test draining a run with workers"""
+
+    def test_drains_run_in_batches(self, queue, worker_factory):
+        """The run is split into batches that several workers share"""
+        FakeArxivClient.papers = make_papers(5)
+        hf_client = FakeHFClient(failing={'2401.00003'})
+        job, _ = queue.enqueue(CONFIG)
+
+        first = worker_factory(hf_client, 'worker-1')
+        second = worker_factory(hf_client, 'worker-2')
+        assert first.run_next()  # fetch
+        while first.run_next() | second.run_next():
+            pass
+
+        finished = queue.get_job(job.id)
+        assert finished.status == 'completed'
+        assert (finished.total_papers, finished.new_count, finished.failed_count) == (5, 4, 1)
+        assert first.bus.latest().status == 'completed'
+        assert queue.active_job() is None
+
+    def test_rerun_is_idempotent(self, queue, worker_factory):
+        """Papers already summarized are skipped; unsummarized ones are resumed"""
+        FakeArxivClient.papers = make_papers(3)
+        queue.enqueue(CONFIG)
+        worker_factory(FakeHFClient(failing={'2401.00001'})).run(once=True)
+
+        hf_client = FakeHFClient()
+        job, _ = queue.enqueue(CONFIG)
+        worker_factory(hf_client).run(once=True)
+
+        finished = queue.get_job(job.id)
+        assert (finished.new_count, finished.skipped_count) == (1, 2)
+        assert hf_client.calls == ['2401.00001']
+
+    def test_finished_job_is_recorded(self, queue, worker_factory, sqlite_db_session):
+        """The worker finishing a job adds it to the run history"""
+        FakeArxivClient.papers = make_papers(3)
+        run_history = PipelineRunStore(sqlite_db_session.engine)
+        job, _ = queue.enqueue(CONFIG)
+        worker_factory(FakeHFClient(failing={'2401.00001'}), run_history=run_history).run(once=True)
+
+        run = run_history.recent(source="worker")[0]
+        assert run.job_id == job.id
+        assert (run.status, run.fetched, run.new_count, run.failed_count) == ("completed", 3, 2, 1)
+        assert run.settings == CONFIG
+        assert set(run.stage_seconds) == {"fetch", "process"}
+
+    def test_empty_fetch_completes(self, queue, worker_factory):
+        """A run without papers completes straight after fetching"""
+        FakeArxivClient.papers = []
+        job, _ = queue.enqueue(CONFIG)
+        worker_factory().run(once=True)
+
+        assert queue.get_job(job.id).status == 'completed'
+
+    def test_payload_round_trip(self):
+        """Dates survive the JSON task payload"""
+        paper = make_papers(1)[0]
+        assert decode_paper(encode_paper(paper)) == paper
+
+
+class TestTriggerEndpoint:
+    """Test queueing runs from the admin API"""
+
+    def test_trigger_queues_job(self, queue, monkeypatch):
+        """Triggering accepts the run and returns the job to poll"""
+        from flask import Flask
+        from src.admin import routes
+
+        monkeypatch.setattr(routes, "_job_queue", queue)
+        monkeypatch.setattr(routes, "_progress_bus", ProgressBus(InMemoryProgressBackend()))
+        monkeypatch.setattr(routes, "get_admin_config", lambda: CONFIG)
+        app = Flask(__name__)
+        app.register_blueprint(routes.admin_bp)
+        client = app.test_client()
+
+        response = client.post('/admin/trigger-pipeline')
+        again = client.post('/admin/trigger-pipeline')
+
+        assert response.status_code == 202
+        assert response.get_json()["message"] == "Pipeline queued"
+        assert response.get_json()["job_id"] == str(queue.active_job().id)
+        assert again.status_code == 400
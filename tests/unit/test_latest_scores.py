@@ -0,0 +1,102 @@
+"""
+Unit tests for batched score writes and the latest-score projection
+"""
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from src.infrastructure import DatabaseManager
+from src.infrastructure.models import PaperModel, PaperScoreModel, PaperLatestScoreModel
+from src.infrastructure.scores import score_row
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """Database manager with three papers"""
+    with sqlite_db_session.get_session() as session:
+        for i in range(3):
+            session.add(PaperModel(
+                id=uuid4(),
+                arxiv_id=f"2401.{i:05d}",
+                title=f"Paper {i}",
+                authors=["Author"],
+                abstract="Abstract",
+                published_date=date(2024, 1, 1 + i),
+                categories=["cs.CL"],
+                pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}"
+            ))
+    return DatabaseManager(sqlite_db_session)
+
+
+def paper_ids(db_manager):
+    with db_manager.db_session.get_session() as session:
+        return session.execute(select(PaperModel.id).order_by(PaperModel.arxiv_id)).scalars().all()
+
+
+def latest(db_manager):
+    with db_manager.db_session.get_session() as session:
+        rows = session.execute(select(PaperLatestScoreModel)).scalars().all()
+        return {row.paper_id: (row.total_score, row.scored_at) for row in rows}
+
+
+class TestLatestScoreProjection:
+    """Test that the projection tracks the newest run per paper"""
+
+    def test_one_row_per_paper(self, db_manager):
+        """Several runs in one batch keep only the newest in the projection"""
+        first, second, _ = paper_ids(db_manager)
+        saved = db_manager.save_paper_scores([
+            {'paper_id': first, 'total_score': 0.2, 'created_at': datetime(2024, 2, 1)},
+            {'paper_id': first, 'total_score': 0.9, 'created_at': datetime(2024, 3, 1)},
+            {'paper_id': second, 'total_score': 0.5, 'created_at': datetime(2024, 2, 1)},
+        ])
+
+        assert saved == 3
+        assert latest(db_manager) == {
+            first: (0.9, datetime(2024, 3, 1)),
+            second: (0.5, datetime(2024, 2, 1)),
+        }
+        with db_manager.db_session.get_session() as session:
+            assert session.execute(select(func.count()).select_from(PaperScoreModel)).scalar() == 3
+
+    def test_older_run_does_not_replace_newer(self, db_manager):
+        """A late write of an older run keeps history but not the projection"""
+        first = paper_ids(db_manager)[0]
+        db_manager.save_paper_scores([{'paper_id': first, 'total_score': 0.8, 'created_at': datetime(2024, 3, 1)}])
+        db_manager.save_paper_scores([{'paper_id': first, 'total_score': 0.1, 'created_at': datetime(2024, 1, 1)}])
+
+        assert latest(db_manager)[first] == (0.8, datetime(2024, 3, 1))
+
+    def test_string_paper_ids_are_projected(self, db_manager):
+        """Paper IDs given as strings reach the projection like UUIDs"""
+        first = paper_ids(db_manager)[0]
+        db_manager.save_paper_scores([{'paper_id': str(first), 'total_score': 0.6, 'created_at': datetime(2024, 3, 1)}])
+
+        assert latest(db_manager) == {first: (0.6, datetime(2024, 3, 1))}
+
+    def test_top_scored_order(self, db_manager):
+        """Top papers are ordered by latest score, then newest first"""
+        first, second, third = paper_ids(db_manager)
+        db_manager.save_paper_scores([
+            {'paper_id': first, 'total_score': 0.7},
+            {'paper_id': second, 'total_score': 0.9},
+            {'paper_id': third, 'total_score': 0.7},
+        ])
+
+        top = db_manager.get_top_scored_papers(limit=3)
+        assert [row.arxiv_id for row in top] == ['2401.00001', '2401.00002', '2401.00000']
+        assert [row.arxiv_id for row in db_manager.get_top_scored_papers(min_score=0.8)] == ['2401.00001']
+
+    def test_score_row_from_result(self):
+        """Component scores are read from the composite result"""
+        result = SimpleNamespace(
+            score=0.6,
+            explanation='ok',
+            components={'llm_scorer': {'score': 0.5}, 'keyword_scorer': 0.7},
+            metadata={}
+        )
+        row = score_row('paper', result)
+        assert (row['total_score'], row['llm_score'], row['keyword_score'], row['author_score']) == (0.6, 0.5, 0.7, None)
@@ -0,0 +1,53 @@
+"""
+Unit tests for lazily resolved package attributes
+"""
+import subprocess
+import sys
+
+import pytest
+
+import src.infrastructure
+import src.scoring
+
+
+def imported_after(statement):
+    """Top-level packages loaded by running ``statement`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"],
+        capture_output=True, text=True, check=True
+    )
+    return {name.split(".")[0] for name in completed.stdout.split()}
+
+
+class TestLazyAttributes:
+    """Test that packages import their heavy members on first access only"""
+
+    def test_scoring_package_skips_llm_scorer(self):
+        loaded = imported_after("from src.scoring import KeywordScorer, create_scorer, get_default_config")
+        assert "aiohttp" not in loaded
+
+    def test_creating_default_scorer_skips_aiohttp(self):
+        loaded = imported_after("from src.scoring import create_scorer, get_default_config; "
+                                "create_scorer(get_default_config())")
+        assert "aiohttp" not in loaded
+
+    def test_database_only_import_skips_clients(self):
+        loaded = imported_after("from src.infrastructure import DatabaseManager")
+        assert not {"arxiv", "feedparser"} & loaded
+
+    def test_attributes_resolve(self):
+        from src.scoring.llm_scorer import LLMScorer
+        from src.infrastructure.arxiv import ArxivClient
+
+        assert src.scoring.LLMScorer is LLMScorer
+        assert src.infrastructure.ArxivClient is ArxivClient
+        assert set(src.scoring.__all__) <= set(dir(src.scoring))
+
+    def test_all_lists_every_lazy_attribute(self):
+        assert src.scoring.__all__ == list(src.scoring._LAZY_ATTRIBUTES)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            src.scoring.MissingScorer
+        with pytest.raises(AttributeError):
+            src.infrastructure.MissingClient
@@ -0,0 +1,151 @@
+"""
+Unit tests for the memory budget, the streaming curation report and streamed pipeline batches
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import ProcessingConfig
+from src.domain.report import CurationReport, component_score
+from src.services import pipeline_service
+from src.services.pipeline_service import PipelineService
+from src.utils import memory
+from src.utils.memory import BATCH_SHARE, MemoryBudget
+from src.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class TestMemoryBudget:
+    """Test batch sizing and the periodic resident memory check"""
+
+    def test_disabled_by_default(self):
+        budget = MemoryBudget()
+        assert not budget.enabled
+        assert budget.batch_size(500, item_kb=4) == 500
+        with patch.object(memory, "rss_mb", return_value=10_000.0):
+            assert not any(budget.tick() for _ in range(200))
+        assert budget.pressure_events == 0
+
+    def test_batch_size_fits_share_of_budget(self):
+        budget = MemoryBudget(limit_mb=10)
+        assert budget.batch_size(500, item_kb=4) == int(10 * 1024 * BATCH_SHARE / 4)
+        assert MemoryBudget(limit_mb=1000).batch_size(500, item_kb=4) == 500
+        assert MemoryBudget(limit_mb=0.001).batch_size(500, item_kb=4) == 1
+
+    def test_from_env(self):
+        assert MemoryBudget.from_env({"MEMORY_BUDGET_MB": "256"}).limit_mb == 256
+        assert not MemoryBudget.from_env({}).enabled
+        with pytest.raises(ValueError):
+            MemoryBudget(limit_mb=-1)
+
+    def test_tick_checks_every_n_items(self):
+        budget = MemoryBudget(limit_mb=100, check_every=10)
+        with patch.object(memory, "rss_mb", return_value=50.0) as rss:
+            for _ in range(25):
+                assert budget.tick() is False
+        assert rss.call_count == 2
+        assert metrics.gauge("memory_rss_bytes").value() == 50.0 * 1024 * 1024
+
+    def test_pressure_runs_release_callbacks(self):
+        released = []
+        budget = MemoryBudget(limit_mb=100, check_every=1)
+        budget.on_pressure(lambda: released.append("flush"))
+        budget.on_pressure(lambda: 1 / 0)
+        with patch.object(memory, "rss_mb", return_value=150.0):
+            assert budget.tick() is True
+            assert budget.tick() is True
+        assert released == ["flush", "flush"]
+        assert budget.pressure_events == 2
+        assert metrics.counter("memory_budget_pressure_total").value() == 2
+
+
+class TestCurationReport:
+    """Test the bounded top-K and running means"""
+
+    def test_top_matches_full_sort(self):
+        report = CurationReport(top_k=5)
+        scores = [(i * 37 % 101) / 100 for i in range(200)]
+        for i, score in enumerate(scores):
+            report.add(f"2401.{i:05d}", f"Paper {i}", score)
+
+        assert [entry.score for entry in report.top()] == sorted(scores, reverse=True)[:5]
+        assert report.count == 200
+        assert report.mean_score == pytest.approx(sum(scores) / 200)
+
+    def test_ties_keep_earliest(self):
+        report = CurationReport(top_k=2)
+        for arxiv_id in ("a", "b", "c"):
+            report.add(arxiv_id, arxiv_id, 0.5)
+        assert [entry.arxiv_id for entry in report.top()] == ["a", "b"]
+
+    def test_component_means(self):
+        report = CurationReport()
+        report.add("a", "A", 0.6, components={"keyword": 0.4, "llm": {"score": 0.8, "reasoning": "ok"}})
+        report.add("b", "B", 0.4, components={"keyword": 0.2})
+
+        assert report.component_means() == pytest.approx({"keyword": 0.3, "llm": 0.8})
+        assert report.top()[0].components == {"keyword": 0.4, "llm": 0.8}
+        assert component_score({"reasoning": "missing"}) == 0.0
+
+    def test_empty_and_disabled_top(self):
+        assert CurationReport().mean_score == 0.0
+        report = CurationReport(top_k=0)
+        report.add("a", "A", 1.0)
+        assert report.top() == [] and report.count == 1
+
+
+class FakeArxivClient:
+    """Yields papers lazily and records how far it was consumed."""
+
+    def __init__(self, papers):
+        self.papers = papers
+        self.yielded = 0
+
+    def iter_recent_papers(self, days_back=7):
+        for i in range(self.papers):
+            self.yielded += 1
+            yield {"arxiv_id": f"2401.{i:05d}"}
+
+
+class TestPipelineStreaming:
+    """Test that the pipeline holds one batch of fetched papers at a time"""
+
+    def test_batches_are_pulled_lazily(self):
+        arxiv = FakeArxivClient(12)
+        consumed = []
+
+        def process_paper(paper_data):
+            consumed.append(arxiv.yielded)
+            return object()
+
+        service = PipelineService(
+            SimpleNamespace(arxiv_client=arxiv, process_paper=process_paper),
+            ProcessingConfig(batch_size=5, paper_delay=0)
+        )
+        results = service.run_pipeline()
+
+        assert results["total_fetched"] == 12
+        assert results["new_papers"] == 12
+        # Papers of a batch are processed before the next batch is fetched
+        assert consumed == [5] * 5 + [10] * 5 + [12] * 2
+
+    def test_reported_errors_are_capped(self):
+        def process_paper(paper_data):
+            raise RuntimeError("boom")
+
+        service = PipelineService(
+            SimpleNamespace(arxiv_client=FakeArxivClient(30), process_paper=process_paper),
+            ProcessingConfig(batch_size=10, paper_delay=0)
+        )
+        with patch.object(pipeline_service, "MAX_REPORTED_ERRORS", 3):
+            results = service.run_pipeline()
+
+        assert results["failed_papers"] == 30
+        assert len(results["errors"]) == 3
@@ -0,0 +1,188 @@
+"""
+Unit tests for the metrics registry and its instrumentation
+"""
+import asyncio
+import json
+import time
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from src.infrastructure import DatabaseManager
+from src.infrastructure.job_queue import JobQueue
+from src.scoring.base import Paper, ScoringResult, ScoringStrategy
+from src.scoring.composite_scorer import CompositeScorer, ScorerWeight
+from src.utils.metrics import MetricsRegistry, metrics
+from src.web import metrics_routes
+from src.web.metrics_routes import metrics_bp
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class FixedScorer(ScoringStrategy):
+    def __init__(self, name, score=0.5, fail=False):
+        self._name = name
+        self._score = score
+        self._fail = fail
+
+    async def score(self, paper, context=None):
+        if self._fail:
+            raise RuntimeError("scorer down")
+        return ScoringResult(score=self._score, explanation="fixed", components={}, metadata={})
+
+    @property
+    def name(self):
+        return self._name
+
+
+class TestRegistry:
+    """Test recording and exporting metrics"""
+
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.describe("requests_total", "Handled requests")
+        registry.increment("requests_total", service="arxiv")
+        registry.increment("requests_total", 2, service="arxiv")
+        registry.set_gauge("queue_tasks", 4, status="pending")
+        registry.observe("latency_seconds", 0.02, service="ollama")
+        registry.observe("latency_seconds", 3.0, service="ollama")
+
+        text = registry.render()
+        assert "# HELP curator_requests_total Handled requests\n" in text
+        assert "# TYPE curator_requests_total counter\n" in text
+        assert 'curator_requests_total{service="arxiv"} 3\n' in text
+        assert 'curator_queue_tasks{status="pending"} 4\n' in text
+        assert "# TYPE curator_latency_seconds histogram\n" in text
+        assert 'curator_latency_seconds_bucket{service="ollama",le="0.025"} 1\n' in text
+        assert 'curator_latency_seconds_bucket{service="ollama",le="5"} 2\n' in text
+        assert 'curator_latency_seconds_bucket{service="ollama",le="+Inf"} 2\n' in text
+        assert 'curator_latency_seconds_sum{service="ollama"} 3.02\n' in text
+        assert 'curator_latency_seconds_count{service="ollama"} 2\n' in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.increment("errors_total", reason='bad "quote"\n')
+        assert 'curator_errors_total{reason="bad \\"quote\\"\\n"} 1' in registry.render()
+
+    def test_labels_must_match(self):
+        registry = MetricsRegistry()
+        registry.increment("requests_total", service="arxiv")
+        with pytest.raises(ValueError):
+            registry.increment("requests_total", operation="search")
+        with pytest.raises(ValueError):
+            registry.set_gauge("requests_total", 1, service="arxiv")
+
+    def test_track_counts_errors(self):
+        registry = MetricsRegistry()
+        with registry.track("external_request", service="hf"):
+            pass
+        with pytest.raises(RuntimeError):
+            with registry.track("external_request", service="hf"):
+                raise RuntimeError("503")
+
+        assert registry.histogram("external_request_seconds", ("service",)).count(service="hf") == 2
+        assert registry.counter("external_request_errors_total", ("service",)).value(service="hf") == 1
+
+    def test_track_iteration_excludes_consumer_time(self):
+        registry = MetricsRegistry()
+        for _ in registry.track_iteration(range(3), "search", service="arxiv"):
+            time.sleep(0.05)
+
+        summary = registry.summary()["metrics"]["curator_search_seconds"]
+        assert summary[0]["count"] == 1
+        assert summary[0]["sum"] < 0.05
+
+    def test_timed_async(self):
+        registry = MetricsRegistry()
+
+        @registry.timed("external_request", service="ollama")
+        async def query():
+            return "ok"
+
+        assert asyncio.run(query()) == "ok"
+        assert registry.histogram("external_request_seconds", ("service",)).count(service="ollama") == 1
+
+    def test_write_summary(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.observe("scorer_seconds", 0.5, scorer="keyword_scorer")
+        registry.observe("scorer_seconds", 1.5, scorer="keyword_scorer")
+
+        assert registry.write_summary(None) is None
+        path = registry.write_summary(tmp_path / "runs" / "summary.json")
+        report = json.loads(path.read_text())
+        assert report["duration_seconds"] >= 0
+        assert report["metrics"]["curator_scorer_seconds"] == [{
+            "labels": {"scorer": "keyword_scorer"}, "count": 2, "sum": 2.0, "mean": 1.0, "max": 1.5
+        }]
+
+    def test_totals_group_series(self):
+        registry = MetricsRegistry()
+        registry.observe("external_request_seconds", 0.2, service="ollama", operation="score")
+        registry.observe("external_request_seconds", 0.4, service="ollama", operation="analyze")
+        registry.observe("external_request_seconds", 1.0, service="huggingface", operation="summarize")
+        registry.increment("db_statement_cache_total", operation="paper_exists", result="hit")
+
+        totals = registry.totals("external_request_seconds", "service")
+        assert totals[("ollama",)] == (2, pytest.approx(0.6))
+        assert totals[("huggingface",)] == (1, 1.0)
+        assert registry.totals("db_statement_cache_total", "result") == {("hit",): (1.0, 0.0)}
+        assert registry.totals("missing_seconds", "service") == {}
+
+
+class TestInstrumentation:
+    """Test metrics recorded by scorers, database and web app"""
+
+    def test_composite_scorer_times_each_scorer(self):
+        scorer = CompositeScorer([
+            ScorerWeight(FixedScorer("keyword_scorer"), 0.5),
+            ScorerWeight(FixedScorer("llm_scorer", fail=True), 0.5, required=False)
+        ])
+        paper = Paper(
+            arxiv_id="2401.00001", title="Title", abstract="Abstract", authors=["Author"],
+            categories=["cs.CL"], published_date=datetime(2024, 1, 1), pdf_url="https://arxiv.org/pdf/2401.00001"
+        )
+        asyncio.run(scorer.score(paper))
+
+        seconds = metrics.histogram("scorer_seconds", ("scorer",))
+        assert seconds.count(scorer="keyword_scorer") == 1
+        assert seconds.count(scorer="llm_scorer") == 1
+        errors = metrics.counter("scorer_errors_total", ("scorer",))
+        assert errors.value(scorer="llm_scorer") == 1
+        assert errors.value(scorer="keyword_scorer") == 0
+
+    def test_database_operations_are_timed(self, sqlite_db_session):
+        manager = DatabaseManager(sqlite_db_session)
+        manager.paper_exists("2401.00001")
+        manager.count_papers()
+
+        seconds = metrics.histogram("db_operation_seconds", ("operation",))
+        assert seconds.count(operation="paper_exists") == 1
+        assert seconds.count(operation="count_papers") == 1
+
+    def test_metrics_endpoint(self, sqlite_db_session):
+        JobQueue(sqlite_db_session.engine).enqueue({"categories": ["cs.CL"]})
+        metrics.increment("pipeline_papers_total", outcome="new")
+        app = Flask(__name__)
+        app.config['db_manager'] = DatabaseManager(sqlite_db_session)
+        app.register_blueprint(metrics_bp)
+
+        response = app.test_client().get('/metrics')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/plain'
+        text = response.get_data(as_text=True)
+        assert "# HELP curator_pipeline_papers_total Papers handled by the pipeline, by outcome\n" in text
+        assert 'curator_pipeline_papers_total{outcome="new"} 1\n' in text
+        assert 'curator_queue_tasks{status="pending"} 1\n' in text
+        assert 'curator_queue_tasks{status="running"} 0\n' in text
+        assert 'status="failed"' not in text
+
+        # Later scrapes reuse the process-wide queue
+        queue = metrics_routes._job_queue
+        assert app.test_client().get('/metrics').status_code == 200
+        assert metrics_routes._job_queue is queue
@@ -0,0 +1,199 @@
+"""
+Unit tests for papers fetched with their latest summary and score
+"""
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from src.domain.value_objects import PaperFilter
+from src.infrastructure import DatabaseManager
+from src.infrastructure.models import PaperModel, SummaryModel
+from src.infrastructure.scores import score_row
+from src.web.json_provider import FastJSONProvider
+from src.web.public_routes_flask import public_bp
+from src.web.routes import api_bp
+
+PAPERS = 12
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect the statements executed on an engine"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """PAPERS papers; even ones have two summaries, every third one a score"""
+    ids = [uuid4() for _ in range(PAPERS)]
+    created = datetime.utcnow()
+    with sqlite_db_session.get_session() as session:
+        for i, paper_id in enumerate(ids):
+            session.add(PaperModel(
+                id=paper_id, arxiv_id=f"2401.{i:05d}", title=f"Paper {i}", authors=["Author"],
+                abstract="Abstract", published_date=date(2024, 1, 1 + i), categories=["cs.CL"],
+                pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}"
+            ))
+            if i % 2 == 0:
+                session.add(SummaryModel(
+                    paper_id=paper_id, summary="Old summary", key_points=["old"],
+                    model_used="old-model", created_at=created - timedelta(days=1)
+                ))
+                session.add(SummaryModel(
+                    paper_id=paper_id, summary=f"Summary {i}", key_points=["point"],
+                    model_used="new-model", created_at=created
+                ))
+    manager = DatabaseManager(sqlite_db_session)
+    manager.save_paper_scores([
+        score_row(paper_id, SimpleNamespace(
+            score=0.5 + i / 100, components={"llm_scorer": 0.9}, explanation="Relevant", metadata={}
+        ))
+        for i, paper_id in enumerate(ids) if i % 3 == 0
+    ])
+    return manager
+
+
+@pytest.fixture
+def client(db_manager):
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['db_manager'] = db_manager
+    app.register_blueprint(api_bp, url_prefix='/api')
+    with patch("src.auth.decorators.get_jwt_service"), \
+            patch("src.auth.decorators.extract_user_context"):
+        yield app.test_client()
+
+
+@pytest.fixture
+def public_client(db_manager):
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['db_manager'] = db_manager
+    app.register_blueprint(public_bp)
+    return app.test_client()
+
+
+AUTH = {'Authorization': 'Bearer token'}
+
+
+class TestPaperDetails:
+    """Test repository methods returning papers with summary and score"""
+
+    def test_detail_has_latest_summary_and_score(self, db_manager):
+        paper = db_manager.get_paper_detail("2401.00000")
+        assert paper.summary == "Summary 0"
+        assert paper.summary_model == "new-model"
+        assert paper.relevance_score == pytest.approx(0.5)
+        assert paper.llm_score == pytest.approx(0.9)
+
+    def test_detail_without_summary_or_score(self, db_manager):
+        paper = db_manager.get_paper_detail("2401.00001")
+        assert paper.title == "Paper 1"
+        assert paper.summary is None
+        assert paper.relevance_score is None
+        assert db_manager.get_paper_detail("2401.99999") is None
+
+    def test_list_has_one_row_per_paper(self, db_manager):
+        papers = db_manager.get_paper_details()
+        assert [p.arxiv_id for p in papers] == [f"2401.{i:05d}" for i in reversed(range(PAPERS))]
+        assert {p.summary for p in papers if p.summary} == {f"Summary {i}" for i in range(0, PAPERS, 2)}
+
+    def test_list_filters_and_limits(self, db_manager):
+        papers = db_manager.get_paper_details(PaperFilter(min_score=0.55), limit=2)
+        assert [p.arxiv_id for p in papers] == ["2401.00009", "2401.00006"]
+
+    def test_list_offset(self, db_manager):
+        papers = db_manager.get_paper_details(limit=3, offset=2)
+        assert [p.arxiv_id for p in papers] == ["2401.00009", "2401.00008", "2401.00007"]
+
+    def test_single_query_regardless_of_page_size(self, db_manager):
+        engine = db_manager.db_session.engine
+        for limit in (1, PAPERS):
+            with count_queries(engine) as statements:
+                assert len(db_manager.get_paper_details(limit=limit)) == limit
+            assert len(statements) == 1
+        with count_queries(engine) as statements:
+            db_manager.get_paper_detail("2401.00000")
+        assert len(statements) == 1
+
+
+class TestPaperEndpoints:
+    """Test the list and detail endpoints built on the detail rows"""
+
+    def test_paper_detail_endpoint(self, client, db_manager):
+        with count_queries(db_manager.db_session.engine) as statements:
+            response = client.get('/api/paper/2401.00000', headers=AUTH)
+        assert len(statements) == 1
+        assert response.status_code == 200
+
+        paper = response.get_json()
+        assert paper['arxiv_id'] == "2401.00000"
+        assert paper['published_date'] == "2024-01-01"
+        assert paper['relevance_score'] == pytest.approx(0.5)
+        assert paper['score']['components']['llm'] == pytest.approx(0.9)
+        assert paper['summary']['summary'] == "Summary 0"
+        assert paper['summary']['key_points'] == ["point"]
+        assert paper['summary']['model_used'] == "new-model"
+
+    def test_paper_detail_without_summary(self, client):
+        paper = client.get('/api/paper/2401.00001', headers=AUTH).get_json()
+        assert paper['summary'] is None
+        assert paper['score'] is None
+
+    def test_paper_detail_not_found(self, client):
+        assert client.get('/api/paper/2401.99999', headers=AUTH).status_code == 404
+
+    def test_paper_list_endpoint(self, client, db_manager):
+        with count_queries(db_manager.db_session.engine) as statements:
+            response = client.get('/api/papers?limit=50', headers=AUTH)
+        assert len(statements) == 1
+
+        papers = response.get_json()['papers']
+        assert len(papers) == PAPERS
+        by_id = {paper['arxiv_id']: paper for paper in papers}
+        assert by_id["2401.00006"]['relevance_score'] == pytest.approx(0.56)
+        assert by_id["2401.00006"]['summary']['summary'] == "Summary 6"
+        assert by_id["2401.00001"]['summary'] is None
+
+    def test_paper_list_min_score(self, client):
+        papers = client.get('/api/papers?min_score=0.55', headers=AUTH).get_json()['papers']
+        assert [paper['arxiv_id'] for paper in papers] == ["2401.00009", "2401.00006"]
+
+
+class TestPublicEndpoints:
+    """Test the unauthenticated list and stats endpoints"""
+
+    def test_public_paper_list_pages(self, public_client, db_manager):
+        with count_queries(db_manager.db_session.engine) as statements:
+            response = public_client.get('/api/public/papers?min_score=0.55&limit=1&offset=1')
+        assert len(statements) == 1
+        assert response.status_code == 200
+
+        body = response.get_json()
+        assert [paper['arxiv_id'] for paper in body['papers']] == ["2401.00006"]
+        assert body['papers'][0]['relevance_score'] == pytest.approx(0.56)
+        assert (body['count'], body['offset'], body['limit']) == (1, 1, 1)
+
+    def test_public_stats(self, public_client):
+        response = public_client.get('/api/public/stats')
+        assert response.status_code == 200
+
+        stats = response.get_json()
+        assert stats['total_papers'] == PAPERS
+        assert stats['recent_papers'] == 0
+        assert stats['average_score'] == pytest.approx(sum(0.5 + i / 100 for i in range(0, PAPERS, 3)) / 4)
@@ -0,0 +1,105 @@
+"""
+Unit tests for streaming paper reads and counts
+"""
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Row
+
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.domain.value_objects import PaperFilter
+from src.infrastructure import DatabaseManager
+from src.infrastructure.engines import get_engine
+from src.infrastructure.models import PaperModel
+from src.infrastructure.scores import score_row
+from src.maintenance import migrate
+
+
+@pytest.fixture
+def db_manager(sqlite_db_session):
+    """Database manager with four papers, one ingested long ago"""
+    now = datetime.utcnow()
+    with sqlite_db_session.get_session() as session:
+        for i, categories in enumerate([["cs.CL"], ["cs.CV"], ["cs.CL", "cs.AI"], ["stat.ML"]]):
+            session.add(PaperModel(
+                id=uuid4(),
+                arxiv_id=f"2401.{i:05d}",
+                title=f"Paper {i}",
+                authors=["Author"],
+                abstract="Abstract",
+                published_date=date(2024, 1, 1 + i),
+                categories=categories,
+                pdf_url=f"https://arxiv.org/pdf/2401.{i:05d}",
+                created_at=now - timedelta(days=400 if i == 0 else i)
+            ))
+    return DatabaseManager(sqlite_db_session)
+
+
+def arxiv_ids(rows):
+    return [row.arxiv_id for row in rows]
+
+
+class TestIterPapers:
+    """Test the infrastructure iterator"""
+
+    def test_streams_newest_first_across_chunks(self, db_manager):
+        """Chunk size does not change which rows come back or their order"""
+        rows = db_manager.iter_papers(chunk_size=1)
+        assert arxiv_ids(rows) == ["2401.00003", "2401.00002", "2401.00001", "2401.00000"]
+
+    def test_yields_rows_not_orm_objects(self, db_manager):
+        """Rows are named tuples, not mapped PaperModel instances"""
+        row = next(iter(db_manager.iter_papers(limit=1)))
+        assert isinstance(row, Row)
+        assert not isinstance(row, PaperModel)
+        assert row.categories == ["stat.ML"]
+
+    def test_filters(self, db_manager):
+        """Category, date, ingestion and score filters are applied"""
+        assert arxiv_ids(db_manager.iter_papers(PaperFilter(categories=["cs.CL"]))) == ["2401.00002", "2401.00000"]
+        assert arxiv_ids(db_manager.iter_papers(PaperFilter(date_to=date(2024, 1, 2)))) == ["2401.00001", "2401.00000"]
+        recent = PaperFilter(created_after=datetime.utcnow() - timedelta(days=365))
+        assert "2401.00000" not in arxiv_ids(db_manager.iter_papers(recent))
+
+        paper = next(iter(db_manager.iter_papers(limit=1)))
+        db_manager.save_paper_scores([score_row(paper.id, SimpleNamespace(
+            score=0.9, components={}, explanation="", metadata={}
+        ))])
+        assert arxiv_ids(db_manager.iter_papers(PaperFilter(min_score=0.5))) == [paper.arxiv_id]
+
+    def test_count_papers(self, db_manager):
+        """Counts match the iterator without loading rows"""
+        assert db_manager.count_papers() == 4
+        recent = PaperFilter(created_after=datetime.utcnow() - timedelta(days=365))
+        assert db_manager.count_papers(recent) == 3
+        assert db_manager.count_papers(PaperFilter(min_score=0.1)) == 0
+
+    def test_recent_papers_are_built_from_rows(self, db_manager):
+        """get_recent_papers keeps its domain objects and honours limit"""
+        papers = db_manager.get_recent_papers(days=365, limit=2)
+        assert [p.metadata.arxiv_id for p in papers] == ["2401.00003", "2401.00002"]
+
+
+class TestLegacyIterPapers:
+    """Test the legacy manager shares the same queries"""
+
+    def test_iter_and_count(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'papers.db'}"
+        migrate(get_engine(url))
+        db = LegacyDatabaseManager(url)
+        for i in range(5):
+            db.save_paper({
+                'arxiv_id': f'2402.{i:05d}',
+                'title': f'Paper {i}',
+                'authors': ['Author'],
+                'abstract': 'Abstract',
+                'published_date': date(2024, 2, 1 + i),
+                'categories': ['cs.LG'] if i % 2 else ['cs.CL'],
+                'pdf_url': f'https://arxiv.org/pdf/2402.{i:05d}'
+            })
+
+        assert arxiv_ids(db.iter_papers(PaperFilter(categories=['cs.LG']), chunk_size=1)) == ['2402.00003', '2402.00001']
+        assert db.count_papers() == 5
+        db.engine.dispose()
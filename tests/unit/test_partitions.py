@@ -0,0 +1,51 @@
+"""
+Unit tests for paper_scores partition maintenance planning
+"""
+from datetime import date
+
+from sqlalchemy import create_engine
+
+from src.infrastructure.partitions import (
+    PartitionManager, RetentionReport, add_months, partition_month
+)
+
+
+class TestMonthArithmetic:
+    """Test month helpers"""
+
+    def test_add_months_across_years(self):
+        assert add_months(date(2024, 11, 30), 3) == date(2025, 2, 1)
+        assert add_months(date(2024, 1, 15), -1) == date(2023, 12, 1)
+        assert add_months(date(2024, 1, 15), -24) == date(2022, 1, 1)
+
+    def test_partition_month(self):
+        assert partition_month('paper_scores_2024_03') == date(2024, 3, 1)
+        assert partition_month('paper_scores_default') is None
+
+
+class TestPartitionPlanning:
+    """Test which partitions are created and archived"""
+
+    def setup_method(self):
+        self.manager = PartitionManager(create_engine('sqlite://'), months_ahead=2, archive_after_months=12)
+
+    def test_months_to_create(self):
+        assert self.manager.months_to_create(date(2024, 12, 10)) == [
+            date(2024, 12, 1), date(2025, 1, 1), date(2025, 2, 1)
+        ]
+
+    def test_cold_partitions(self):
+        """Only months entirely before the window are archived, oldest first"""
+        partitions = [
+            ('paper_scores_2023_06', date(2023, 6, 1)),
+            ('paper_scores_2023_05', date(2023, 5, 1)),
+            ('paper_scores_2023_04', date(2023, 4, 1)),
+        ]
+        assert self.manager.cold_partitions(partitions, date(2024, 5, 20)) == [
+            'paper_scores_2023_04'
+        ]
+
+    def test_non_postgres_is_noop(self):
+        """SQLite has no partitions; retention does nothing"""
+        assert not self.manager.supported
+        assert self.manager.run_retention(date(2024, 5, 1)) == RetentionReport()
@@ -0,0 +1,150 @@
+"""
+Unit tests for the pipeline run history
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from src.core.config import ProcessingConfig
+from src.core.exceptions import ArxivCuratorError, DatabaseError
+from src.infrastructure.job_queue import JobQueue
+from src.infrastructure.pipeline_runs import PipelineRunStore, RunMetrics
+from src.services.pipeline_service import PipelineService
+from src.utils.metrics import MetricsRegistry, metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def store(sqlite_db_session):
+    return PipelineRunStore(sqlite_db_session.engine)
+
+
+class TestRunMetrics:
+    """Test per-run differences of the process metrics"""
+
+    def test_collect_counts_only_the_run(self):
+        registry = MetricsRegistry()
+        registry.observe("external_request_seconds", 5.0, service="ollama", operation="score")
+        run_metrics = RunMetrics(registry)
+
+        registry.observe("external_request_seconds", 0.2, service="ollama", operation="score")
+        registry.observe("external_request_seconds", 0.4, service="ollama", operation="analyze")
+        registry.increment("external_request_errors_total", service="ollama", operation="score")
+        registry.observe("pipeline_stage_seconds", 1.5, stage="fetch")
+        for result in ("hit", "hit", "hit", "miss"):
+            registry.increment("db_statement_cache_total", operation="paper_exists", result=result)
+
+        collected = run_metrics.collect()
+        assert collected["external_calls"] == {
+            "ollama": {"count": 2, "seconds": 0.6, "mean_ms": 300.0, "errors": 1}
+        }
+        assert collected["stage_seconds"] == {"fetch": 1.5}
+        assert collected["cache_hit_rates"] == {"paper_exists": 0.75}
+
+    def test_idle_run(self):
+        registry = MetricsRegistry()
+        registry.observe("pipeline_stage_seconds", 1.0, stage="fetch")
+        run_metrics = RunMetrics(registry)
+        assert run_metrics.collect() == {"stage_seconds": {}, "external_calls": {}, "cache_hit_rates": {}}
+
+
+class TestPipelineRunStore:
+    """Test recording, listing and trends"""
+
+    def test_record_and_trends(self, store):
+        start = datetime.utcnow() - timedelta(hours=3)
+        for i, (hf_ms, batch_size) in enumerate([(800.0, 5), (400.0, 10)]):
+            store.record(
+                "pipeline", start + timedelta(hours=i), status="completed", fetched=20, new=15, skipped=3,
+                failed=2, finished_at=start + timedelta(hours=i, minutes=2),
+                external_calls={"huggingface": {"count": 15, "seconds": hf_ms * 15 / 1000, "mean_ms": hf_ms, "errors": 0}},
+                settings={"batch_size": batch_size, "paper_delay": 0.5}
+            )
+
+        runs = store.recent()
+        assert [run.settings["batch_size"] for run in runs] == [10, 5]
+        assert runs[0].papers_per_minute == 10.0
+        assert runs[0].to_dict()["duration_seconds"] == 120.0
+
+        trends = store.trends()
+        assert trends["runs"] == 2
+        assert [point["huggingface_latency_ms"] for point in trends["points"]] == [800.0, 400.0]
+        assert trends["points"][0]["ollama_latency_ms"] is None
+        assert trends["averages"] == {"papers_per_minute": 10.0, "huggingface_latency_ms": 600.0,
+                                      "ollama_latency_ms": None}
+
+    def test_job_is_recorded_once(self, store, sqlite_db_session):
+        job, _ = JobQueue(sqlite_db_session.engine).enqueue({"batch_size": 5})
+        store.record("worker", datetime.utcnow(), job_id=job.id)
+        with pytest.raises(DatabaseError):
+            store.record("worker", datetime.utcnow(), job_id=job.id)
+        assert len(store.recent(source="worker")) == 1
+
+    def test_admin_endpoints(self, store, monkeypatch):
+        from src.admin import routes
+
+        store.record("pipeline", datetime.utcnow() - timedelta(minutes=1), new=6)
+        monkeypatch.setattr(routes, "_pipeline_runs", store)
+        app = Flask(__name__)
+        app.register_blueprint(routes.admin_bp)
+        client = app.test_client()
+
+        runs = client.get('/admin/pipeline-runs?source=pipeline').get_json()["runs"]
+        assert runs[0]["new"] == 6 and runs[0]["status"] == "completed"
+        trends = client.get('/admin/pipeline-runs/trends?limit=10').get_json()
+        assert trends["points"][0]["papers_per_minute"] == pytest.approx(6.0, rel=0.05)
+
+
+class StreamingArxivClient:
+    def __init__(self, papers, fail=False):
+        self.papers = papers
+        self.fail = fail
+
+    def iter_recent_papers(self, days_back=7):
+        for i in range(self.papers):
+            yield {"arxiv_id": f"2401.{i:05d}"}
+        if self.fail:
+            raise RuntimeError("arXiv unavailable")
+
+
+class TestRecordedRuns:
+    """Test that pipeline runs and worker jobs land in the history"""
+
+    def test_pipeline_service_records_run(self, store):
+        def process_paper(paper_data):
+            with metrics.track("external_request", service="huggingface", operation="summarize"):
+                pass
+            return object()
+
+        service = PipelineService(
+            SimpleNamespace(arxiv_client=StreamingArxivClient(4), process_paper=process_paper),
+            ProcessingConfig(batch_size=2, paper_delay=0), run_history=store
+        )
+        results = service.run_pipeline()
+
+        run = store.recent()[0]
+        assert results["run_id"] == str(run.id)
+        assert (run.status, run.fetched, run.new_count) == ("completed", 4, 4)
+        assert run.external_calls["huggingface"]["count"] == 4
+        assert set(run.stage_seconds) >= {"fetch", "process_paper"}
+        assert run.settings["batch_size"] == 2
+
+    def test_failed_pipeline_is_recorded(self, store):
+        service = PipelineService(
+            SimpleNamespace(arxiv_client=StreamingArxivClient(1, fail=True), process_paper=lambda paper: None),
+            ProcessingConfig(batch_size=5, paper_delay=0), run_history=store
+        )
+        with pytest.raises(ArxivCuratorError):
+            service.run_pipeline()
+
+        run = store.recent()[0]
+        assert run.status == "failed"
+        assert "arXiv unavailable" in run.error
@@ -0,0 +1,135 @@
+"""
+Unit tests for the sampling profiler and its entry point options
+"""
+import argparse
+import time
+
+import pytest
+
+from src.utils import profiling
+from src.utils.profiling import SamplingProfiler, output_prefix, profiled_run, profiler
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def parse(*argv):
+    parser = argparse.ArgumentParser()
+    profiling.add_arguments(parser)
+    return parser.parse_args(argv)
+
+
+@pytest.fixture(autouse=True)
+def idle_profiler():
+    yield
+    profiler.stop()
+    profiler.configure()
+
+
+class TestSamplingProfiler:
+    """Test sampling, collapsed stacks and the top-N report"""
+
+    def test_whole_run_samples_calling_thread(self):
+        sampler = SamplingProfiler(interval=0.001)
+        sampler.start()
+        busy(0.1)
+        sampler.stop()
+
+        assert sampler.samples > 10
+        lines = sampler.collapsed()
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert any("busy (" in line for line in lines)
+        assert not any("sampling-profiler" in line or "_run (" in line for line in lines)
+
+    def test_top_ranks_self_time(self):
+        sampler = SamplingProfiler(interval=0.001)
+        sampler.start()
+        busy(0.1)
+        sampler.stop()
+
+        frame, own, total = sampler.top(1)[0]
+        assert frame.startswith("busy (")
+        assert 0 < own <= total <= sampler.samples
+        assert "busy (" in sampler.report(5)
+
+    def test_sampled_scopes_only(self):
+        sampler = SamplingProfiler(interval=0.001, sample_ratio=0.5)
+        sampler.start()
+        busy(0.05)
+        for _ in range(20):
+            with sampler.scope() as sampled:
+                if sampled:
+                    busy(0.005)
+        sampler.stop()
+
+        assert sampler.scopes_seen == 20
+        assert 0 < sampler.scopes_sampled < 20
+        # Outside scopes nothing is sampled; the busy wait before the loop is skipped
+        assert all("test_sampled_scopes_only" in line for line in sampler.collapsed())
+        assert sampler.samples < 0.05 / 0.001
+
+    def test_zero_ratio_samples_nothing(self):
+        sampler = SamplingProfiler(interval=0.001, sample_ratio=0.0)
+        sampler.start()
+        with sampler.scope() as sampled:
+            busy(0.02)
+        sampler.stop()
+        assert sampled is False
+        assert sampler.samples == 0
+
+    def test_scope_without_profiler(self):
+        with profiler.scope() as sampled:
+            assert sampled is False
+        assert profiler.scopes_seen == 0
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval=0)
+        with pytest.raises(ValueError):
+            SamplingProfiler(sample_ratio=1.5)
+
+    def test_write(self, tmp_path):
+        sampler = SamplingProfiler(interval=0.001)
+        sampler.start()
+        busy(0.05)
+        sampler.stop()
+
+        collapsed, report = sampler.write(tmp_path / "runs" / "last-run")
+        assert collapsed.name == "last-run.collapsed"
+        assert report.name == "last-run.profile.txt"
+        lines = collapsed.read_text().splitlines()
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sampler.samples
+        assert report.read_text().startswith(f"Sampling profile: {sampler.samples} samples")
+
+
+class TestProfiledRun:
+    """Test the --profile options shared by the entry points"""
+
+    def test_off_by_default(self, tmp_path):
+        with profiled_run(parse(), "pipeline", tmp_path / "summary.json") as running:
+            assert running is None
+        assert not profiler.running
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writes_next_to_run_summary(self, tmp_path):
+        args = parse("--profile", "--profile-interval", "0.001", "--profile-top", "5")
+        with profiled_run(args, "pipeline", tmp_path / "last-run.json") as running:
+            assert running is profiler and profiler.running
+            busy(0.05)
+        assert not profiler.running
+        assert (tmp_path / "last-run.collapsed").read_text()
+        assert "busy (" in (tmp_path / "last-run.profile.txt").read_text()
+
+    def test_output_and_sample_options(self, tmp_path):
+        args = parse("--profile", "--profile-sample", "0.25", "--profile-output", str(tmp_path / "rescore"))
+        with profiled_run(args, "rescore"):
+            assert profiler.sample_ratio == 0.25
+        assert (tmp_path / "rescore.collapsed").exists()
+
+    def test_output_prefix(self, tmp_path):
+        assert output_prefix(tmp_path / "last-run.json", "rescore") == tmp_path / "last-run"
+        assert str(output_prefix(None, "rescore")) == "rescore-profile"
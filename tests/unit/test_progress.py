@@ -0,0 +1,205 @@
+"""
+Unit tests for pipeline progress events
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine, text
+
+from src.infrastructure import progress
+from src.infrastructure.progress import (
+    ProgressBus, ProgressEvent, ProgressTracker, InMemoryProgressBackend,
+    LocalSocketProgressBackend, PostgresProgressBackend, create_progress_backend
+)
+from src.maintenance import migrate
+
+
+@pytest.fixture
+def bus():
+    """Progress bus on the in-memory backend"""
+    return ProgressBus(InMemoryProgressBackend())
+
+
+class TestProgressTracker:
+    """Test counters and progress reported by the tracker"""
+
+    def test_counters_and_progress(self, bus):
+        """Outcomes are counted and progress moves through the processing band"""
+        tracker = ProgressTracker(bus, run_id="run-1")
+        tracker.start("Starting")
+        tracker.start_stage("fetching", "Fetching")
+        tracker.set_total(4)
+        tracker.start_stage("processing", "Processing")
+
+        for arxiv_id, outcome in [("a", "new"), ("b", "skipped")]:
+            tracker.paper_started(arxiv_id, "Title")
+            event = tracker.paper_finished(arxiv_id, outcome)
+
+        assert (event.processed, event.new, event.skipped, event.failed) == (2, 1, 1, 0)
+        assert event.progress == 65
+        assert event.throughput > 0
+        assert event.eta_seconds is not None
+        assert bus.latest().run_id == "run-1"
+        assert bus.latest().is_active()
+
+        tracker.complete("Done")
+        latest = bus.latest()
+        assert latest.status == "completed"
+        assert latest.progress == 100
+        assert not latest.is_active()
+
+    def test_fail_resets_progress(self, bus):
+        """A failed run reports zero progress and is no longer active"""
+        tracker = ProgressTracker(bus)
+        tracker.start_stage("fetching", "Fetching")
+        event = tracker.fail("boom")
+
+        assert event.status == "error"
+        assert event.progress == 0
+        assert not bus.latest().is_active()
+
+
+class TestProgressBus:
+    """Test publishing and subscribing"""
+
+    def test_latest_defaults_to_idle(self, bus):
+        """No published events means the pipeline is idle"""
+        assert bus.latest().status == "idle"
+
+    def test_in_memory_subscribe(self, bus):
+        """Subscribers receive published events and idle markers"""
+        stream = bus.subscribe(timeout=0.01)
+        assert next(stream) is None
+
+        ProgressTracker(bus, run_id="run-2").start("Starting")
+        event = next(stream)
+        stream.close()
+
+        assert event.run_id == "run-2"
+        assert event.status == "starting"
+
+    def test_socket_round_trip(self, tmp_path):
+        """Events cross the local socket backend and the latest is persisted"""
+        bus = ProgressBus(LocalSocketProgressBackend(str(tmp_path)))
+        stream = bus.subscribe(timeout=1.0)
+        received = []
+        reader = threading.Thread(target=lambda: received.append(next(stream)))
+        reader.start()
+
+        # Wait for the subscriber socket before publishing
+        for _ in range(100):
+            if list(tmp_path.glob("*.sock")):
+                break
+            threading.Event().wait(0.01)
+        ProgressTracker(bus, run_id="run-3").start("Starting")
+        reader.join(timeout=2)
+        stream.close()
+
+        assert received and received[0].run_id == "run-3"
+        assert bus.latest().run_id == "run-3"
+        assert not list(tmp_path.glob("*.sock"))
+
+    def test_backend_selection(self):
+        """Unknown backends are rejected"""
+        assert isinstance(create_progress_backend(kind="memory"), InMemoryProgressBackend)
+        with pytest.raises(ValueError):
+            create_progress_backend(kind="carrier-pigeon")
+
+    def test_database_backend_after_migrate(self, tmp_path):
+        """migrate creates the table the database backend keeps the latest event in"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'progress.db'}")
+        migrate(engine)
+        bus = ProgressBus(PostgresProgressBackend(engine))
+
+        bus.publish(ProgressEvent(run_id="run-4", status="running", stage="processing"))
+        bus.publish(ProgressEvent(run_id="run-4", status="completed", stage="completed"))
+
+        assert bus.latest().status == "completed"
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM pipeline_progress")).scalar() == 1
+
+    def test_database_subscribers_share_one_connection(self, monkeypatch):
+        """Subscribers are fed by one psycopg 3 connection opened outside the pool"""
+        monkeypatch.setattr(progress, "LISTEN_POLL_SECONDS", 0.01)
+        rounds = [[SimpleNamespace(payload="first"), SimpleNamespace(payload="second")]]
+
+        def notifies(timeout):
+            # Deliver once both subscribers are listening
+            deadline = time.monotonic() + 5
+            while backend._subscribers.count("progress") < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(timeout)
+            return iter(rounds.pop(0) if rounds else [])
+
+        dbapi_conn = MagicMock()
+        dbapi_conn.notifies.side_effect = notifies
+        connect = MagicMock(return_value=dbapi_conn)
+        engine = SimpleNamespace(
+            url="postgresql+psycopg://db",
+            dialect=SimpleNamespace(
+                driver="psycopg", create_connect_args=lambda url: ([], {}), connect=connect
+            )
+        )
+        backend = PostgresProgressBackend(engine)
+
+        streams = [backend.subscribe("progress", timeout=5) for _ in range(2)]
+        with ThreadPoolExecutor(2) as pool:
+            received = list(pool.map(lambda stream: [next(stream), next(stream)], streams))
+        for stream in streams:
+            stream.close()
+
+        assert received == [["first", "second"], ["first", "second"]]
+        connect.assert_called_once_with()
+        assert dbapi_conn.autocommit is True
+        dbapi_conn.cursor().__enter__().execute.assert_called_with('LISTEN "progress"')
+        # The listener lets go of its connection once nobody is subscribed
+        deadline = time.monotonic() + 5
+        while not dbapi_conn.close.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        dbapi_conn.close.assert_called_once()
+
+    def test_database_subscribe_rejects_other_drivers(self):
+        """Drivers without LISTEN support fail with a clear error"""
+        engine = SimpleNamespace(dialect=SimpleNamespace(driver="pg8000"))
+        with pytest.raises(ValueError, match="pg8000"):
+            next(PostgresProgressBackend(engine).subscribe("progress", timeout=0.5))
+
+
+class TestPipelineEvents:
+    """Test the admin SSE endpoint"""
+
+    def test_stream_starts_with_snapshot(self, bus, monkeypatch):
+        """The stream opens with the latest event, then heartbeats"""
+        from src.admin import routes
+
+        monkeypatch.setattr(routes, "_progress_bus", bus)
+        monkeypatch.setattr(routes, "SSE_HEARTBEAT_SECONDS", 0.01)
+        ProgressTracker(bus, run_id="run-4").start("Starting")
+
+        app = Flask(__name__)
+        app.register_blueprint(routes.admin_bp)
+        response = app.test_client().get('/admin/pipeline-events')
+        chunks = response.response
+        first, second = next(chunks), next(chunks)
+        response.close()
+
+        assert response.mimetype == 'text/event-stream'
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert first.startswith(b'event: progress\ndata: ')
+        assert ProgressEvent.from_json(first.split(b'data: ', 1)[1].strip()).run_id == "run-4"
+        assert second == b': keep-alive\n\n'
+
+    def test_status_endpoint(self, bus, monkeypatch):
+        """The polling endpoint returns the latest event"""
+        from src.admin import routes
+
+        monkeypatch.setattr(routes, "_progress_bus", bus)
+        app = Flask(__name__)
+        app.register_blueprint(routes.admin_bp)
+
+        assert app.test_client().get('/admin/pipeline-status').get_json()['status'] == 'idle'
@@ -0,0 +1,156 @@
+"""
+Unit tests for read-replica routing in DatabaseSession
+
+Each "server" is a separate SQLite file holding one marker paper, so the
+paper a session sees tells which database it was routed to.
+"""
+import time
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from flask import Flask
+from sqlalchemy import select, text
+
+from src.core.config import DatabaseConfig
+from src.core.exceptions import DatabaseError
+from src.infrastructure import DatabaseManager, DatabaseSession
+from src.infrastructure.models import PaperModel
+from src.web.health import health_bp
+
+
+def make_database(path, marker):
+    """Create a SQLite database whose only paper is ``marker``"""
+    session = DatabaseSession(DatabaseConfig(url=f"sqlite:///{path}"))
+    session.create_tables()
+    with session.get_session() as s:
+        s.add(PaperModel(
+            id=uuid4(), arxiv_id=marker, title=marker, authors=["Author"], abstract="Abstract",
+            published_date=date(2024, 1, 1), categories=["cs.CL"], pdf_url="https://arxiv.org/pdf/x"
+        ))
+    session.dispose()
+    return f"sqlite:///{path}"
+
+
+def routed_to(db_session, readonly=True):
+    with db_session.session_scope(readonly=readonly) as session:
+        return session.execute(select(PaperModel.arxiv_id)).scalar_one()
+
+
+@pytest.fixture
+def databases(tmp_path):
+    return {name: make_database(tmp_path / f"{name}.db", name) for name in ("primary", "replica1", "replica2")}
+
+
+def session_for(databases, replicas, **overrides):
+    return DatabaseSession(DatabaseConfig(
+        url=databases["primary"],
+        replica_urls=[databases.get(name, name) for name in replicas],
+        **overrides
+    ))
+
+
+class TestReplicaRouting:
+    """Test routing of read-only and read-write sessions"""
+
+    def test_without_replicas_reads_use_primary(self, databases):
+        db_session = session_for(databases, [])
+        assert routed_to(db_session) == "primary"
+        db_session.dispose()
+
+    def test_reads_round_robin_and_writes_stay_on_primary(self, databases):
+        db_session = session_for(databases, ["replica1", "replica2"])
+        assert [routed_to(db_session) for _ in range(4)] == ["replica1", "replica2", "replica1", "replica2"]
+        assert routed_to(db_session, readonly=False) == "primary"
+        db_session.dispose()
+
+    def test_readonly_sessions_are_rolled_back(self, databases):
+        db_session = session_for(databases, ["replica1"])
+        with db_session.session_scope(readonly=True) as session:
+            session.execute(PaperModel.__table__.delete())
+        assert routed_to(db_session) == "replica1"
+        db_session.dispose()
+
+    def test_unreachable_replica_is_skipped(self, databases, tmp_path):
+        missing = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+        db_session = session_for(databases, [missing, "replica1"])
+        assert [routed_to(db_session) for _ in range(3)] == ["replica1"] * 3
+        assert not db_session.replicas[0].healthy
+        db_session.dispose()
+
+    def test_falls_back_to_primary_and_recovers(self, databases, tmp_path):
+        path = tmp_path / "late" / "replica.db"
+        db_session = session_for(databases, [f"sqlite:///{path}"], replica_retry_seconds=3600)
+        assert routed_to(db_session) == "primary"
+        assert not db_session.replicas[0].healthy
+
+        # The replica comes up; a health check brings it back before the retry delay
+        path.parent.mkdir()
+        make_database(path, "late")
+        assert list(db_session.check_replicas().values()) == [True]
+        assert routed_to(db_session) == "late"
+        db_session.dispose()
+
+    def test_failed_read_marks_replica_down_until_it_recovers(self, databases):
+        db_session = session_for(
+            databases, ["replica1"], replica_retry_seconds=3600, replica_check_seconds=0.05
+        )
+        with pytest.raises(DatabaseError):
+            with db_session.session_scope(readonly=True) as session:
+                session.execute(text("SELECT * FROM missing_table"))
+        assert not db_session.replicas[0].healthy
+        assert routed_to(db_session) == "primary"
+
+        # The background check finds the replica answering and re-admits it
+        deadline = time.monotonic() + 5
+        while not db_session.replicas[0].healthy and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert routed_to(db_session) == "replica1"
+        assert db_session.replicas[0].error is None
+        db_session.dispose()
+
+    def test_lagging_replica_is_skipped(self, databases, monkeypatch):
+        db_session = session_for(databases, ["replica1"], replica_max_lag_seconds=30)
+        monkeypatch.setattr(db_session, "_replica_lag", lambda conn: 120.0)
+        assert list(db_session.check_replicas().values()) == [False]
+        assert routed_to(db_session) == "primary"
+
+        monkeypatch.setattr(db_session, "_replica_lag", lambda conn: 2.0)
+        assert list(db_session.check_replicas().values()) == [True]
+        assert routed_to(db_session) == "replica1"
+        db_session.dispose()
+
+    def test_health_reports_replicas(self, databases, tmp_path):
+        missing = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+        db_session = session_for(databases, ["replica1", missing])
+        db_session.check_replicas()
+        app = Flask(__name__)
+        app.config['db_manager'] = DatabaseManager(db_session)
+        app.register_blueprint(health_bp)
+
+        replicas = app.test_client().get('/health').get_json()['replicas']
+        assert replicas[databases["replica1"]] == {'healthy': True, 'lag_seconds': 0.0, 'error': None}
+        assert not replicas[missing]['healthy']
+        assert replicas[missing]['error']
+        db_session.dispose()
+
+    def test_pool_sizes_are_per_role(self, tmp_path):
+        # Fresh URLs: pool options apply when the registry first creates an engine
+        db_session = DatabaseSession(DatabaseConfig(
+            url=f"sqlite:///{tmp_path / 'sized.db'}",
+            replica_urls=[f"sqlite:///{tmp_path / 'sized_replica.db'}"],
+            pool_size=2,
+            replica_pool_size=7
+        ))
+        assert db_session.engine.pool.size() == 2
+        assert db_session.replicas[0].engine.pool.size() == 7
+        db_session.dispose()
+
+    def test_manager_reads_from_replica(self, databases):
+        db_session = session_for(databases, ["replica1"])
+        manager = DatabaseManager(db_session)
+        assert [row.arxiv_id for row in manager.iter_papers()] == ["replica1"]
+        assert manager.count_papers() == 1
+        # Deduplication checks see the primary
+        assert manager.paper_exists("primary")
+        db_session.dispose()
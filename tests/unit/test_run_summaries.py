@@ -0,0 +1,148 @@
+"""
+Unit tests for streaming report statistics and the scoring run history
+"""
+import asyncio
+import random
+import statistics
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from src.config import Config
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.domain.report import CurationReport, RunningStats
+from src.infrastructure.engines import get_engine
+from src.infrastructure.run_summaries import RunSummaryStore
+from src.maintenance import migrate
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'runs.db'}"
+    migrate(get_engine(url))
+    yield url
+    get_engine(url).dispose()
+
+
+def sample_report(scores, categories=("cs.CL",)):
+    report = CurationReport(top_k=3)
+    for i, score in enumerate(scores):
+        report.add(f"2401.{i:05d}", f"Paper {i}", score, components={"keyword": score / 2}, categories=categories)
+    return report
+
+
+class TestRunningStats:
+    """Test Welford mean/variance and histogram quantiles"""
+
+    def test_matches_exact_statistics(self):
+        rng = random.Random(7)
+        values = [rng.random() for _ in range(2000)]
+        stats = RunningStats()
+        for value in values:
+            stats.add(value)
+
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.stddev == pytest.approx(statistics.stdev(values))
+        assert (stats.min, stats.max) == (min(values), max(values))
+        ordered = sorted(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            assert stats.quantile(q) == pytest.approx(ordered[int(q * len(values)) - 1], abs=0.011)
+
+    def test_degenerate_inputs(self):
+        stats = RunningStats()
+        assert stats.quantile(0.5) == 0.0 and stats.variance == 0.0
+        stats.add(0.7)
+        assert stats.quantile(0.5) == 0.7 and stats.stddev == 0.0
+        stats.add(1.5)
+        assert stats.quantile(1.0) == 1.5
+
+    def test_to_dict(self):
+        stats = RunningStats()
+        for value in (0.2, 0.4, 0.6):
+            stats.add(value)
+        summary = stats.to_dict()
+        assert summary["count"] == 3
+        assert summary["mean"] == pytest.approx(0.4)
+        assert set(summary) == {"count", "mean", "stddev", "min", "max", "p50", "p90", "p99"}
+
+
+class TestReportSummary:
+    """Test category counts and the compact summary"""
+
+    def test_summary(self):
+        report = sample_report([0.2, 0.9, 0.5, 0.7], categories=("cs.CL", "cs.AI"))
+        report.add("2401.99999", "Vision", 0.1, categories=["cs.CV"])
+
+        summary = report.summary()
+        assert summary["papers"] == 5
+        assert summary["categories"] == {"cs.CL": 4, "cs.AI": 4, "cs.CV": 1}
+        assert [paper["score"] for paper in summary["top"]] == [0.9, 0.7, 0.5]
+        assert summary["components"]["keyword"]["count"] == 4
+        assert summary["score"]["mean"] == pytest.approx(0.48)
+
+
+class TestRunSummaryStore:
+    """Test recording and listing run summaries"""
+
+    def test_record_and_recent(self, database_url):
+        store = RunSummaryStore(get_engine(database_url))
+        now = datetime.utcnow()
+        store.record(sample_report([0.4, 0.6]), "rescore", now - timedelta(hours=2), now - timedelta(hours=1))
+        stored = store.record(sample_report([0.8]), "main_v2", now - timedelta(minutes=5), now)
+
+        assert [run.source for run in store.recent()] == ["main_v2", "rescore"]
+        assert [run.source for run in store.recent(source="rescore")] == ["rescore"]
+        latest = store.latest()
+        assert latest.id == stored.id
+        assert latest.papers == 1 and latest.mean_score == pytest.approx(0.8)
+        assert latest.top_papers[0]["arxiv_id"] == "2401.00000"
+        assert latest.to_dict()["duration_seconds"] == pytest.approx(300, abs=1)
+
+    def test_empty_report(self, database_url):
+        store = RunSummaryStore(get_engine(database_url))
+        run = store.record(CurationReport(), "main_v2", datetime.utcnow())
+        assert run.papers == 0 and run.mean_score is None
+        assert store.latest(source="rescore") is None
+
+    def test_admin_endpoint(self, database_url, monkeypatch):
+        from src.admin import routes
+
+        store = RunSummaryStore(get_engine(database_url))
+        for _ in range(3):
+            store.record(sample_report([0.5]), "rescore", datetime.utcnow())
+        monkeypatch.setattr(routes, "_run_summaries", store)
+        app = Flask(__name__)
+        app.register_blueprint(routes.admin_bp)
+
+        runs = app.test_client().get('/admin/run-summaries?limit=2').get_json()["runs"]
+        assert len(runs) == 2
+        assert runs[0]["categories"] == {"cs.CL": 1}
+
+
+def test_rescoring_records_summary(database_url):
+    from src.rescore_papers import PaperRescorer
+    from src.scoring import get_default_config
+
+    db = LegacyDatabaseManager(database_url)
+    for i in range(4):
+        db.save_paper({
+            'arxiv_id': f'2403.{i:05d}',
+            'title': f'Large language model paper {i}',
+            'authors': ['Author'],
+            'abstract': 'We study transformers.',
+            'published_date': date.today(),
+            'categories': ['cs.CL'] if i % 2 else ['cs.LG'],
+            'pdf_url': f'https://arxiv.org/pdf/2403.{i:05d}'
+        })
+
+    scoring_config = replace(get_default_config(), use_llm=False, llm_weight=0.0, keyword_weight=0.5)
+    report = asyncio.run(PaperRescorer(Config(database_url=database_url), scoring_config).rescore_all_papers())
+
+    run = RunSummaryStore(get_engine(database_url)).latest()
+    assert report.count == run.papers == 4
+    assert run.source == "rescore"
+    assert run.categories == {"cs.CL": 2, "cs.LG": 2}
+    assert run.mean_score == pytest.approx(report.mean_score, abs=1e-4)
@@ -0,0 +1,134 @@
+"""
+Unit tests for the embedded SQLite backend
+"""
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, text
+
+from src.core.config import DatabaseConfig
+from src.database import DatabaseManager as LegacyDatabaseManager
+from src.domain.value_objects import PaperFilter
+from src.infrastructure import DatabaseManager, DatabaseSession
+from src.infrastructure.engines import EngineRegistry, get_engine
+from src.infrastructure.models import PaperCategoryModel, PaperModel
+from src.infrastructure.queries import select_papers
+from src.infrastructure.scores import score_row
+from src.maintenance import migrate
+
+
+def categories_of(engine):
+    with engine.connect() as conn:
+        return sorted(conn.execute(select(PaperCategoryModel.category)).scalars())
+
+
+@pytest.fixture
+def url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'curator.db'}"
+    migrate(get_engine(url))
+    return url
+
+
+@pytest.fixture
+def legacy(url):
+    return LegacyDatabaseManager(url)
+
+
+def paper_data(arxiv_id, categories):
+    return {
+        'arxiv_id': arxiv_id, 'title': arxiv_id, 'authors': ["Author"], 'abstract': "Abstract",
+        'published_date': date(2024, 1, 1), 'categories': categories,
+        'pdf_url': f"https://arxiv.org/pdf/{arxiv_id}"
+    }
+
+
+class TestConnectionSettings:
+    """Test the PRAGMAs applied to SQLite connections"""
+
+    def test_file_database_uses_wal(self, tmp_path):
+        registry = EngineRegistry()
+        engine = registry.get(f"sqlite:///{tmp_path / 'wal.db'}")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        registry.dispose()
+
+    def test_memory_database_keeps_its_journal(self):
+        registry = EngineRegistry()
+        with registry.get("sqlite://").connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        registry.dispose()
+
+
+class TestCategoryTable:
+    """Test that paper_categories follows every write to papers"""
+
+    def test_insert_update_delete(self, url, legacy):
+        legacy.save_paper(paper_data("2401.00001", ["cs.CL", "cs.LG", "cs.CL"]))
+        assert categories_of(legacy.engine) == ["cs.CL", "cs.LG"]
+
+        session = legacy.get_session()
+        paper = legacy.get_paper_by_arxiv_id("2401.00001")
+        session.execute(PaperModel.__table__.update().values(categories=["cs.AI"]))
+        session.commit()
+        assert categories_of(legacy.engine) == ["cs.AI"]
+
+        session.execute(PaperModel.__table__.delete().where(PaperModel.id == paper.id))
+        session.commit()
+        session.close()
+        assert categories_of(legacy.engine) == []
+
+    def test_migrate_backfills_existing_papers(self, url, legacy):
+        legacy.save_paper(paper_data("2401.00001", ["cs.CL"]))
+        with legacy.engine.begin() as conn:
+            conn.execute(text("DROP TABLE paper_categories"))
+
+        migrate(legacy.engine)
+        assert categories_of(legacy.engine) == ["cs.CL"]
+        legacy.save_paper(paper_data("2401.00002", ["cs.IR"]))
+        assert categories_of(legacy.engine) == ["cs.CL", "cs.IR"]
+
+    def test_category_filter_uses_index(self, url):
+        stmt = select_papers(PaperFilter(categories=["cs.CL"]), "sqlite")
+        with get_engine(url).connect() as conn:
+            compiled = stmt.compile(conn, compile_kwargs={"literal_binds": True})
+            plan = " ".join(row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+        assert "idx_paper_categories_category" in plan
+        assert "json_each" not in str(compiled)
+
+
+class TestManagersOnSQLite:
+    """Test both managers end to end on a SQLite file"""
+
+    def test_filters_by_category(self, url, legacy):
+        for i, categories in enumerate([["cs.CL"], ["cs.CL", "cs.LG"], ["cs.CV"]]):
+            legacy.save_paper(paper_data(f"2401.0000{i}", categories))
+
+        assert {p.arxiv_id for p in legacy.get_papers_by_categories(["cs.LG", "cs.CV"])} == {
+            "2401.00001", "2401.00002"
+        }
+        assert [p.arxiv_id for p in legacy.get_papers_by_categories(["cs.CL", "cs.LG"], match_all=True)] == [
+            "2401.00001"
+        ]
+
+        manager = DatabaseManager(DatabaseSession(DatabaseConfig(url=url)))
+        assert manager.count_papers(PaperFilter(categories=["cs.CL"])) == 2
+
+    def test_large_score_batch(self, url, legacy):
+        """Latest-score upserts are executemany, not one statement with every row"""
+        ids = [uuid4() for _ in range(4000)]
+        with legacy.engine.begin() as conn:
+            conn.execute(PaperModel.__table__.insert(), [
+                {**paper_data(f"2401.{i:05d}", ["cs.CL"]), 'id': paper_id, 'created_at': datetime.utcnow()}
+                for i, paper_id in enumerate(ids)
+            ])
+        result = SimpleNamespace(score=0.5, components={}, explanation="", metadata={})
+
+        assert legacy.save_paper_scores([score_row(paper_id, result) for paper_id in ids]) == 4000
+        manager = DatabaseManager(DatabaseSession(DatabaseConfig(url=url)))
+        assert manager.count_papers(PaperFilter(min_score=0.5)) == 4000
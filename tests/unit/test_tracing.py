@@ -0,0 +1,292 @@
+"""
+Unit tests for tracing spans, sampling and exporters
+"""
+import asyncio
+import json
+import random
+import threading
+import time
+from datetime import date, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import HuggingFaceConfig
+from src.domain.entities import Paper as DomainPaper
+from src.infrastructure import DatabaseManager, HuggingFaceClient
+from src.scoring.base import Paper, ScoringResult, ScoringStrategy
+from src.scoring.composite_scorer import CompositeScorer, ScorerWeight
+from src.utils.tracing import (
+    NOOP_SPAN, InMemorySpanExporter, JsonlSpanExporter, OtlpHttpSpanExporter, SpanExporter, Tracer,
+    configure_from_env, tracer
+)
+
+
+@pytest.fixture
+def spans():
+    """Record every trace of the module-level tracer in memory"""
+    exporter = InMemorySpanExporter()
+    tracer.configure(exporter, sample_ratio=1.0, batch_size=1)
+    yield exporter.spans
+    tracer.configure(None)
+
+
+def by_name(spans):
+    return {span.name: span for span in spans}
+
+
+class BlockingExporter(SpanExporter):
+    """Exporter stuck in ``export`` until released, like an unreachable collector"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.batches = []
+
+    def export(self, spans):
+        self.release.wait(5)
+        self.batches.append(len(spans))
+
+
+class FixedScorer(ScoringStrategy):
+    def __init__(self, name, score=0.5, fail=False):
+        self._name = name
+        self._score = score
+        self._fail = fail
+
+    async def score(self, paper, context=None):
+        await asyncio.sleep(0)
+        if self._fail:
+            raise RuntimeError("scorer down")
+        return ScoringResult(score=self._score, explanation="fixed", components={}, metadata={})
+
+    @property
+    def name(self):
+        return self._name
+
+
+class TestTracer:
+    """Test span nesting, errors and sampling"""
+
+    def test_child_spans_share_the_trace(self, spans):
+        with tracer.span("paper", arxiv_id="2401.00001") as root:
+            with tracer.span("db.paper_exists") as child:
+                child.set_attribute("cache_hit", True)
+            assert tracer.current_span() is root
+        assert tracer.current_span() is NOOP_SPAN
+
+        tracer.flush()
+        child, root = spans
+        assert root.parent_id is None
+        assert child.parent_id == root.span_id
+        assert child.trace_id == root.trace_id
+        assert root.attributes == {"arxiv_id": "2401.00001"}
+        assert child.attributes == {"cache_hit": True}
+        assert root.duration_ms >= child.duration_ms >= 0
+
+    def test_error_marks_span_failed(self, spans):
+        with pytest.raises(ValueError):
+            with tracer.span("huggingface.summarize"):
+                raise ValueError("503")
+        tracer.flush()
+        assert spans[0].status == "error"
+        assert spans[0].error == "ValueError: 503"
+
+    def test_disabled_tracer_records_nothing(self):
+        local = Tracer()
+        with local.span("paper") as span:
+            span.set_attribute("arxiv_id", "2401.00001")
+        assert span is NOOP_SPAN
+        assert not local.enabled
+
+    def test_sampling_is_decided_per_trace(self):
+        exporter = InMemorySpanExporter()
+        local = Tracer(exporter, sample_ratio=0.25, batch_size=1)
+        random.seed(7)
+        for _ in range(400):
+            with local.span("paper"):
+                with local.span("scorer.keyword_scorer"):
+                    pass
+        local.flush()
+
+        roots = [span for span in exporter.spans if span.parent_id is None]
+        assert 60 < len(roots) < 140
+        # Children are kept exactly when their root is
+        assert len(exporter.spans) == 2 * len(roots)
+
+    def test_invalid_sample_ratio(self):
+        with pytest.raises(ValueError):
+            Tracer(InMemorySpanExporter(), sample_ratio=1.5)
+
+    def test_spans_are_batched(self):
+        exporter = BlockingExporter()
+        exporter.release.set()
+        local = Tracer(exporter, batch_size=3, export_interval=60)
+        for _ in range(4):
+            with local.span("paper"):
+                pass
+        assert local.flush()
+        assert exporter.batches == [3, 1]
+
+    def test_partial_batch_is_exported_after_interval(self):
+        exporter = InMemorySpanExporter()
+        local = Tracer(exporter, batch_size=64, export_interval=0.05)
+        with local.span("paper"):
+            pass
+        deadline = time.monotonic() + 5
+        while not exporter.spans and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(exporter.spans) == 1
+
+    def test_slow_exporter_does_not_block_spans(self):
+        exporter = BlockingExporter()
+        local = Tracer(exporter, batch_size=1)
+        try:
+            started = time.perf_counter()
+            for _ in range(20):
+                with local.span("paper"):
+                    pass
+            assert time.perf_counter() - started < 1.0
+            assert exporter.batches == []
+        finally:
+            exporter.release.set()
+        assert local.flush()
+        assert sum(exporter.batches) == 20
+
+    def test_full_queue_drops_spans(self):
+        exporter = BlockingExporter()
+        local = Tracer(exporter, batch_size=1, max_queue_size=4)
+        try:
+            for _ in range(50):
+                with local.span("paper"):
+                    pass
+            assert local.dropped > 0
+        finally:
+            exporter.release.set()
+        local.flush()
+        assert sum(exporter.batches) + local.dropped == 50
+
+
+class TestExporters:
+    """Test the JSONL and OTLP exporters"""
+
+    def test_jsonl_exporter(self, tmp_path):
+        path = tmp_path / "traces" / "spans.jsonl"
+        local = Tracer(JsonlSpanExporter(path), batch_size=10)
+        with local.span("paper", arxiv_id="2401.00001"):
+            with local.span("ollama.score", model="gemma3:4b"):
+                pass
+        local.shutdown()
+
+        child, root = [json.loads(line) for line in path.read_text().splitlines()]
+        assert child["parent_id"] == root["span_id"]
+        assert child["attributes"] == {"model": "gemma3:4b"}
+        assert root["status"] == "ok"
+
+    def test_otlp_exporter(self):
+        exporter = OtlpHttpSpanExporter("http://collector:4318/", service_name="curator-test")
+        exporter.session.post = Mock(return_value=Mock(status_code=200))
+        local = Tracer(exporter, batch_size=10)
+        with pytest.raises(RuntimeError):
+            with local.span("paper", arxiv_id="2401.00001", retry_count=2, cache_hit=False):
+                raise RuntimeError("boom")
+        local.flush()
+
+        url = exporter.session.post.call_args.args[0]
+        body = json.loads(exporter.session.post.call_args.kwargs["data"])
+        assert url == "http://collector:4318/v1/traces"
+        resource_spans = body["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "curator-test"}}
+        ]
+        span = resource_spans["scopeSpans"][0]["spans"][0]
+        assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+        assert "parentSpanId" not in span
+        assert span["attributes"] == [
+            {"key": "arxiv_id", "value": {"stringValue": "2401.00001"}},
+            {"key": "retry_count", "value": {"intValue": "2"}},
+            {"key": "cache_hit", "value": {"boolValue": False}}
+        ]
+        assert span["status"] == {"code": 2, "message": "RuntimeError: boom"}
+
+    def test_configure_from_env(self, tmp_path):
+        try:
+            configured = configure_from_env({
+                "TRACING_EXPORTER": "jsonl", "TRACING_JSONL_PATH": str(tmp_path / "spans.jsonl"),
+                "TRACING_SAMPLE_RATIO": "0.1"
+            })
+            assert isinstance(configured.exporter, JsonlSpanExporter)
+            assert configured.sample_ratio == 0.1
+            assert not configure_from_env({}).enabled
+            with pytest.raises(ValueError):
+                configure_from_env({"TRACING_EXPORTER": "zipkin"})
+        finally:
+            tracer.configure(None)
+
+
+class TestInstrumentation:
+    """Test spans recorded by the pipeline components"""
+
+    def test_each_scorer_is_a_child_span(self, spans):
+        scorer = CompositeScorer([
+            ScorerWeight(FixedScorer("keyword_scorer", 0.7), 0.5),
+            ScorerWeight(FixedScorer("llm_scorer", fail=True), 0.5, required=False)
+        ])
+        paper = Paper(
+            arxiv_id="2401.00001", title="Title", abstract="Abstract", authors=["Author"],
+            categories=["cs.CL"], published_date=datetime(2024, 1, 1), pdf_url="https://arxiv.org/pdf/2401.00001"
+        )
+        with tracer.span("paper", arxiv_id=paper.arxiv_id):
+            asyncio.run(scorer.score(paper))
+        tracer.flush()
+
+        recorded = by_name(spans)
+        root = recorded["paper"]
+        keyword, llm = recorded["scorer.keyword_scorer"], recorded["scorer.llm_scorer"]
+        assert keyword.parent_id == llm.parent_id == root.span_id
+        assert keyword.attributes["score"] == 0.7
+        assert keyword.attributes["arxiv_id"] == "2401.00001"
+        assert llm.status == "error"
+
+    def test_database_spans(self, spans, sqlite_db_session):
+        manager = DatabaseManager(sqlite_db_session)
+        paper = DomainPaper.from_arxiv_data({
+            "arxiv_id": "2401.00001", "title": "Title", "authors": ["Author"], "abstract": "Abstract",
+            "published_date": date(2024, 1, 1), "categories": ["cs.CL"], "pdf_url": "https://arxiv.org/pdf/2401.00001"
+        })
+        with tracer.span("paper", arxiv_id="2401.00001"):
+            manager.paper_exists("2401.00001")
+            manager.save_paper(paper)
+            manager.paper_exists("2401.00001")
+        tracer.flush()
+
+        first, saved, second, root = spans
+        assert [first.name, saved.name, second.name] == ["db.paper_exists", "db.save_paper", "db.paper_exists"]
+        assert {first.parent_id, saved.parent_id, second.parent_id} == {root.span_id}
+        assert first.attributes["exists"] is False
+        assert second.attributes == {"arxiv_id": "2401.00001", "exists": True, "cache_hit": True}
+
+    def test_huggingface_span(self, spans):
+        client = HuggingFaceClient(HuggingFaceConfig(api_key="token", model="facebook/bart-large-cnn"))
+        client.session.post = Mock(return_value=Mock(
+            status_code=200, raw=None, json=Mock(return_value=[{"summary_text": "A summary of the paper."}])
+        ))
+        client.summarize_paper({"arxiv_id": "2401.00001", "title": "Title", "abstract": "Abstract"})
+        tracer.flush()
+
+        span = by_name(spans)["huggingface.summarize"]
+        assert span.attributes == {
+            "model": "facebook/bart-large-cnn", "arxiv_id": "2401.00001", "status_code": 200, "retry_count": 0
+        }
+
+    def test_unsampled_trace_skips_children(self):
+        exporter = InMemorySpanExporter()
+        tracer.configure(exporter, sample_ratio=0.0)
+        try:
+            with tracer.span("paper") as root:
+                with tracer.span("db.paper_exists") as child:
+                    pass
+            assert root is child is NOOP_SPAN
+            tracer.flush()
+            assert exporter.spans == []
+        finally:
+            tracer.configure(None)
@@ -0,0 +1,113 @@
+"""
+Unit tests for the JSON provider, serializer registry and compression
+"""
+import gzip
+import json
+import uuid
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, jsonify
+
+from src.web.compression import ResponseCompressor
+from src.web.json_provider import FastJSONProvider, dumps_bytes
+from src.web.serializers import SerializerRegistry, truncate
+
+
+@pytest.fixture
+def app():
+    """Minimal app with the fast provider and compression enabled"""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['COMPRESS_MIN_SIZE'] = 256
+    ResponseCompressor(app)
+
+    @app.route('/small')
+    def small():
+        return jsonify({'ok': True})
+
+    @app.route('/large')
+    def large():
+        return jsonify({'items': ['x' * 50] * 100})
+
+    return app
+
+
+class TestJSONProvider:
+    """Test native encoding of UUID and temporal values"""
+
+    def test_native_types(self):
+        """UUID, date and datetime are encoded without pre-formatting"""
+        paper_id = uuid.uuid4()
+        payload = json.loads(dumps_bytes({
+            'id': paper_id,
+            'published_date': date(2024, 1, 15),
+            'created_at': datetime(2024, 1, 15, 10, 30)
+        }))
+
+        assert payload['id'] == str(paper_id)
+        assert payload['published_date'] == '2024-01-15'
+        assert payload['created_at'] == '2024-01-15T10:30:00'
+
+    def test_jsonify_uses_provider(self, app):
+        """jsonify goes through the fast provider"""
+        with app.test_request_context():
+            response = jsonify({'day': date(2024, 2, 1)})
+        assert response.get_json() == {'day': '2024-02-01'}
+
+
+class TestSerializerRegistry:
+    """Test the serializer registry"""
+
+    def test_dotted_paths_and_callables(self):
+        """Fields accept dotted attribute paths and callables"""
+        registry = SerializerRegistry()
+        serializer = registry.register('item', {
+            'arxiv_id': 'metadata.arxiv_id',
+            'abstract': truncate('metadata.abstract', 5),
+            'upper': lambda row: row.metadata.arxiv_id.upper()
+        })
+        row = SimpleNamespace(metadata=SimpleNamespace(arxiv_id='abc', abstract='0123456789'))
+
+        assert registry.get('item') is serializer
+        assert serializer.serialize([row]) == [
+            {'arxiv_id': 'abc', 'abstract': '01234...', 'upper': 'ABC'}
+        ]
+        assert json.loads(serializer.dumps([row]))[0]['arxiv_id'] == 'abc'
+
+    def test_unknown_serializer(self):
+        """Looking up an unregistered name raises KeyError"""
+        with pytest.raises(KeyError):
+            SerializerRegistry().get('missing')
+
+
+class TestCompression:
+    """Test response compression negotiation"""
+
+    def test_gzip_above_threshold(self, app):
+        """Large responses are gzip-compressed when accepted"""
+        response = app.test_client().get('/large', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert json.loads(gzip.decompress(response.data))['items'][0] == 'x' * 50
+
+    def test_small_response_not_compressed(self, app):
+        """Responses below the threshold are sent as-is"""
+        response = app.test_client().get('/small', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+
+    def test_identity_when_not_accepted(self, app):
+        """Clients that do not accept compression get plain bodies"""
+        response = app.test_client().get('/large', headers={'Accept-Encoding': 'identity'})
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_json()['items'][0] == 'x' * 50
+
+    def test_negotiation_honours_quality(self):
+        """A zero quality value disables an encoding"""
+        from werkzeug.http import parse_accept_header
+
+        compressor = ResponseCompressor()
+        assert compressor.negotiate(parse_accept_header('gzip;q=0')) is None
+        assert compressor.negotiate(parse_accept_header('gzip, deflate')) == 'gzip'